@@ -142,28 +142,10 @@ class AttentionAction:
             items: List of attention data items to process
         """
         try:
-            for item in items:
-                self._processAttentionDataItem(item)
+            self.db.attention.storeAttentionDataBatch(items)
                 
         except Exception as e:
             logger.error(f"Failed to process attention data batch: {str(e)}")
-    
-    def _processAttentionDataItem(self, item: AttentionData) -> None:
-        """
-        Process a single attention data item
-        
-        Args:
-            item: The attention data item to process
-        """
-        try:
-            logger.info(f"Updating token registry for token: {item.name}")
-            self.db.attention.updateTokenRegistry(item)
-            
-            logger.info(f"Storing raw data for token: {item.name}")
-            self.db.attention.storeCurrentAttentionData(item)
-            
-        except Exception as e:
-            logger.error(f"Failed to process attention data item {item.name}: {str(e)}")
 
     def persistAttentionDataForSolFromAPI(self, cookie: str) -> Optional[List[AttentionData]]:
         """
@@ -0,0 +1,240 @@
+from config.Config import get_config
+"""
+Crawl executor for cookie-authenticated ChainEdge jobs.
+
+The items of a job (tokens, wallets) go into one shared queue and every valid
+cookie gets a worker thread that pulls from it, so N cookies split the list
+instead of each one walking all of it. Each cookie keeps its own token bucket
+at the job's configured interval, which is the per-cookie rate the old fixed
+sleeps produced; a full pass therefore takes about 1/N of the time without any
+cookie sending requests faster than before.
+
+A task signals throttling by raising CrawlThrottledError (429 / 5xx). The
+cookie's rate is then halved and it pauses for a jittered backoff (at least
+Retry-After, at most THROTTLE_BACKOFF_CAP_SECONDS); the item goes back on the
+queue for any cookie to pick up. A paused cookie wakes up early once the last
+item is done, so a long backoff never holds up the end of a run.
+Each success afterwards moves the rate back towards the configured one.
+"""
+
+from actions.DexScreenerClient import BACKOFF_BASE_SECONDS, RETRYABLE_STATUSES, TokenBucket
+from logs.logger import get_logger
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import queue
+import random
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Longest pause of a throttled cookie; waits grow up to this with repeated 429s
+THROTTLE_BACKOFF_CAP_SECONDS = 300.0
+
+# A throttled cookie never drops below this fraction of its configured rate
+MIN_RATE_FRACTION = 0.125
+
+
+class CrawlThrottledError(Exception):
+    """Raised by a crawl task when the upstream answered 429 or 5xx"""
+
+    def __init__(self, status: Optional[int], retryAfter: Optional[str] = None):
+        super().__init__(f"Upstream throttled the request (status {status})")
+        self.status = status
+        self.retryAfter = retryAfter
+
+    @staticmethod
+    def isRetryable(status: Optional[int]) -> bool:
+        return status in RETRYABLE_STATUSES
+
+
+class CookieLane:
+    """Rate limit and backoff state of one cookie"""
+
+    def __init__(self, cookie: str, intervalSeconds: float):
+        self.cookie = cookie
+        self.baseRate = 1.0 / max(intervalSeconds, 0.001)
+        # Capacity 1: no bursts, one request per interval at most
+        self.bucket = TokenBucket(self.baseRate, 1)
+        self.pausedUntil = 0.0
+        self.consecutiveThrottles = 0
+        self.processed = 0
+        self.failed = 0
+        self.throttled = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.cookie[:15]}..."
+
+    def waitOutPause(self, finished: threading.Event) -> None:
+        """
+        Sleep until a backoff pause is over; called before taking an item so others can have it.
+        Returns early when `finished` is set, i.e. no items are left for this cookie to take.
+        """
+        pause = self.pausedUntil - time.monotonic()
+        if pause > 0:
+            finished.wait(pause)
+
+    def onSuccess(self) -> None:
+        # Additive recovery: each success restores an eighth of the configured rate
+        self.consecutiveThrottles = 0
+        self.bucket.rate = min(self.baseRate, self.bucket.rate + self.baseRate * MIN_RATE_FRACTION)
+
+    def onThrottled(self, retryAfter: Optional[str]) -> float:
+        """
+        Halve the cookie's rate and pause it.
+
+        Returns:
+            float: Seconds the cookie is paused for
+        """
+        self.throttled += 1
+        self.consecutiveThrottles += 1
+        self.bucket.rate = max(self.baseRate * MIN_RATE_FRACTION, self.bucket.rate / 2)
+
+        interval = 1.0 / self.baseRate
+        ceiling = min(THROTTLE_BACKOFF_CAP_SECONDS, max(BACKOFF_BASE_SECONDS, interval) * 2 ** self.consecutiveThrottles)
+        delay = random.uniform(ceiling / 2, ceiling)
+        if retryAfter:
+            try:
+                # Honour Retry-After, but never pause longer than the cap
+                delay = min(THROTTLE_BACKOFF_CAP_SECONDS, max(delay, float(retryAfter)))
+            except ValueError:
+                pass
+        self.pausedUntil = time.monotonic() + delay
+        return delay
+
+
+class CrawlExecutor:
+    """
+    Runs a task over a list of items, sharded across cookies.
+
+    Args:
+        name: Job name used in logs
+        cookies: Valid cookies; one worker thread each
+        task: Callable(cookie, item) doing one request; raises CrawlThrottledError on 429 / 5xx
+        intervalSeconds: Minimum spacing of requests per cookie
+        maxAttempts: Times an item is tried before it is given up on after throttling
+        describe: Callable(item) -> str for log lines
+    """
+
+    def __init__(
+        self,
+        name: str,
+        cookies: List[str],
+        task: Callable[[str, Any], Any],
+        intervalSeconds: float,
+        maxAttempts: int = 3,
+        describe: Optional[Callable[[Any], str]] = None,
+    ):
+        self.name = name
+        self.lanes = [CookieLane(cookie, intervalSeconds) for cookie in cookies]
+        self.task = task
+        self.maxAttempts = max(1, maxAttempts)
+        self.describe = describe or str
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._givenUp = 0
+        # Set once every item of the current run is done; wakes paused cookies
+        self._finished = threading.Event()
+
+    def run(self, items: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Process every item and wait for the workers to finish. May be called
+        again with the next batch of items.
+
+        Returns:
+            Dict: processed / failed / given up counts, per-cookie stats and elapsed seconds
+        """
+        startTime = time.time()
+        # Counters are per run; lane rates carry over so a throttled cookie stays slowed down
+        for lane in self.lanes:
+            lane.processed = lane.failed = lane.throttled = 0
+        self._givenUp = 0
+        self._finished.clear()
+        for item in items:
+            self._queue.put((item, 1))
+            self._pending += 1
+        total = self._pending
+
+        if not self.lanes or not total:
+            return self._summary(total, startTime)
+
+        logger.info(f"{self.name}: crawling {total} items with {len(self.lanes)} cookies")
+        workers = [
+            threading.Thread(target=self._work, args=(lane,), name=f"{self.name}-crawl-{index}", daemon=True)
+            for index, lane in enumerate(self.lanes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        summary = self._summary(total, startTime)
+        logger.info(
+            f"{self.name}: crawl finished in {summary['elapsedSeconds']}s - "
+            f"{summary['processed']} processed, {summary['failed']} failed, {summary['givenUp']} given up"
+        )
+        return summary
+
+    def _done(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            if self._pending <= 0:
+                self._finished.set()
+
+    def _work(self, lane: CookieLane) -> None:
+        while True:
+            lane.waitOutPause(self._finished)
+            if self._finished.is_set():
+                return
+            try:
+                item, attempt = self._queue.get(timeout=1)
+            except queue.Empty:
+                with self._lock:
+                    if self._pending <= 0:
+                        return
+                # Another cookie may still requeue a throttled item
+                continue
+
+            lane.bucket.acquire()
+            try:
+                self.task(lane.cookie, item)
+                lane.processed += 1
+                lane.onSuccess()
+                self._done()
+            except CrawlThrottledError as e:
+                delay = lane.onThrottled(e.retryAfter)
+                logger.warning(
+                    f"{self.name}: cookie {lane.label} throttled (status {e.status}) on {self.describe(item)}, "
+                    f"pausing {delay:.1f}s at {lane.bucket.rate * 60:.2f} requests/min"
+                )
+                if attempt < self.maxAttempts:
+                    self._queue.put((item, attempt + 1))
+                else:
+                    logger.error(f"{self.name}: giving up on {self.describe(item)} after {attempt} throttled attempts")
+                    with self._lock:
+                        self._givenUp += 1
+                    self._done()
+            except Exception as e:
+                lane.failed += 1
+                logger.error(f"{self.name}: failed to process {self.describe(item)}: {str(e)}")
+                self._done()
+
+    def _summary(self, total: int, startTime: float) -> Dict[str, Any]:
+        return {
+            "items": total,
+            "processed": sum(lane.processed for lane in self.lanes),
+            "failed": sum(lane.failed for lane in self.lanes),
+            "givenUp": self._givenUp,
+            "elapsedSeconds": round(time.time() - startTime, 2),
+            "cookies": [
+                {
+                    "cookie": lane.label,
+                    "processed": lane.processed,
+                    "failed": lane.failed,
+                    "throttled": lane.throttled,
+                    "requestsPerMinute": round(lane.bucket.rate * 60, 2),
+                }
+                for lane in self.lanes
+            ],
+        }
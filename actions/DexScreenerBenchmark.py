@@ -0,0 +1,124 @@
+"""
+Measures DexScreenerAction.getBatchTokenPrices against a local stub server.
+
+The stub serves the batch endpoint (/tokens/v1/{chain}/{addresses}) with a fixed
+latency, omits a share of tokens (to exercise negative results) and answers a
+share of requests with 429 (to exercise backoff). Each worker count is timed on a
+cold cache, and the results are checked against the serial run.
+
+Usage:
+    python -m actions.DexScreenerBenchmark --tokens 1000
+    python -m actions.DexScreenerBenchmark --tokens 1000 --latency-ms 250 --workers 1 4 8
+"""
+
+from actions.DexscrennerAction import DexScreenerAction
+from actions.DexScreenerClient import DexScreenerClient
+from actions.DexScreenerPriceCache import PriceCache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves synthetic pairs for /tokens/v1/{chain}/{comma separated addresses}"""
+
+    latency = 0.15
+    missingRate = 0.05
+    throttleRate = 0.0
+    requests = 0
+    counterLock = threading.Lock()
+
+    def do_GET(self):
+        with StubHandler.counterLock:
+            StubHandler.requests += 1
+        time.sleep(self.latency)
+
+        if random.random() < self.throttleRate:
+            self.send_response(429)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        addresses = self.path.rstrip("/").split("/")[-1].split(",")
+        pairs = [
+            {
+                "dexId": "raydium",
+                "baseToken": {"address": address, "name": f"Token {address}", "symbol": address[:4].upper()},
+                "priceUsd": str(1 + int(address.split("-")[-1]) / 1000),
+                "fdv": 1000000,
+                "marketCap": 900000,
+            }
+            for address in addresses
+            # The same tokens are missing on every run, so results are comparable
+            if hash(address) % 1000 >= self.missingRate * 1000
+        ]
+        body = json.dumps(pairs).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def runOnce(baseUrl: str, tokens: List[str], workers: int, requestsPerMinute: int) -> tuple:
+    """Time one cold-cache getBatchTokenPrices call"""
+    action = DexScreenerAction()
+    action.batchBaseUrl = baseUrl
+    action.client = DexScreenerClient(maxWorkers=workers, requestsPerMinute=requestsPerMinute, maxRetries=3)
+    action.batchPriceCache = PriceCache("benchmark", ttlSeconds=0, negativeTtlSeconds=0, maxEntries=1)
+
+    StubHandler.requests = 0
+    start = time.perf_counter()
+    result = action.getBatchTokenPrices(tokens)
+    elapsed = time.perf_counter() - start
+    action.client.executor.shutdown()
+    return elapsed, StubHandler.requests, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent DexScreener batch fetching")
+    parser.add_argument("--tokens", type=int, default=1000, help="Token addresses to resolve")
+    parser.add_argument("--latency-ms", type=float, default=150, help="Stub response latency")
+    parser.add_argument("--throttle-rate", type=float, default=0.02, help="Share of requests answered with 429")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8], help="Worker counts to compare")
+    parser.add_argument("--rpm", type=int, default=6000, help="Token bucket requests per minute")
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency_ms / 1000
+    StubHandler.throttleRate = args.throttle_rate
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    baseUrl = f"http://127.0.0.1:{server.server_address[1]}/tokens/v1"
+
+    tokens = [f"token-{i}" for i in range(args.tokens)]
+    baseline = None
+    consistent = True
+    try:
+        for workers in args.workers:
+            elapsed, requestCount, result = runOnce(baseUrl, tokens, workers, args.rpm)
+            found = sum(1 for price in result.values() if price is not None)
+            ordered = list(result) == tokens
+            if baseline is None:
+                baseline = result
+            matches = result == baseline
+            consistent = consistent and ordered and matches
+            print(
+                f"workers={workers:<3} {elapsed * 1000:9.1f} ms  requests={requestCount:<4} "
+                f"found={found}/{len(tokens)}  ordered={ordered}  matchesFirstRun={matches}"
+            )
+    finally:
+        server.shutdown()
+
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
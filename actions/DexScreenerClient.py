@@ -0,0 +1,150 @@
+from config.Config import get_config
+from logs.logger import get_logger
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Iterable, List, Optional
+import random
+import requests
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Statuses worth retrying; anything else is returned to the caller as is
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Backoff before retry n is uniform in [0, min(cap, base * 2**n)] ("full jitter")
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_CAP_SECONDS = 8.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, bursting up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updatedAt = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updatedAt) * self.rate)
+                self._updatedAt = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class DexScreenerClient:
+    """
+    HTTP client shared by every DexScreenerAction in the process.
+
+    Key features:
+    - One keep-alive requests.Session with a connection pool sized to the workers
+    - A token bucket holding all callers to DexScreener's per-minute request limit
+    - Retries of 429 / 5xx / timeouts / connection errors with jittered exponential
+      backoff, honouring Retry-After
+    - A bounded worker pool for fanning out independent requests
+    """
+
+    _shared: Optional["DexScreenerClient"] = None
+    _lock = threading.Lock()
+
+    def __init__(self, maxWorkers: int, requestsPerMinute: int, maxRetries: int):
+        self.maxWorkers = max(1, maxWorkers)
+        self.maxRetries = max(0, maxRetries)
+        self.bucket = TokenBucket(rate=max(1, requestsPerMinute) / 60.0, capacity=self.maxWorkers)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.maxWorkers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix="dexscreener")
+
+    @classmethod
+    def shared(cls) -> "DexScreenerClient":
+        """Get (creating on first use) the process-wide client"""
+        if cls._shared is not None:
+            return cls._shared
+        with cls._lock:
+            if cls._shared is None:
+                config = get_config()
+                cls._shared = cls(
+                    maxWorkers=config.DEXSCREENER_MAX_WORKERS,
+                    requestsPerMinute=config.DEXSCREENER_REQUESTS_PER_MINUTE,
+                    maxRetries=config.DEXSCREENER_MAX_RETRIES,
+                )
+            return cls._shared
+
+    def get(self, url: str, timeout: float = 30) -> requests.Response:
+        """
+        GET a URL under the rate limit, retrying transient failures.
+
+        Returns:
+            requests.Response: The last response, which may still be an error status
+
+        Raises:
+            requests.exceptions.RequestException: If the final attempt failed to connect
+                or timed out
+        """
+        for attempt in range(self.maxRetries + 1):
+            self.bucket.acquire()
+            try:
+                response = self.session.get(url, timeout=timeout)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if attempt == self.maxRetries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"DexScreener request failed ({e}), retry {attempt + 1}/{self.maxRetries} in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRYABLE_STATUSES or attempt == self.maxRetries:
+                return response
+
+            delay = self._backoff(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                f"DexScreener returned {response.status_code}, retry {attempt + 1}/{self.maxRetries} in {delay:.2f}s"
+            )
+            time.sleep(delay)
+
+        return response
+
+    @staticmethod
+    def _backoff(attempt: int, retryAfter: Optional[str] = None) -> float:
+        delay = random.uniform(0, min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+        if retryAfter:
+            try:
+                delay = max(delay, float(retryAfter))
+            except ValueError:
+                pass
+        return delay
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Apply fn to every item on the worker pool.
+
+        Returns:
+            List: Results in the order of items
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+        return list(self.executor.map(fn, items))
@@ -0,0 +1,268 @@
+from config.Config import get_config
+from logs.logger import get_logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# How long a caller waits on another thread's in-flight fetch before giving up
+COALESCE_WAIT_SECONDS = 60
+
+
+class PriceCache:
+    """
+    Thread-safe TTL cache for token prices keyed by (chain, token address).
+
+    Key features:
+    - Found prices live for ttlSeconds, tokens the API returned nothing for live
+      for negativeTtlSeconds, so dead tokens are not re-queried on every call
+    - Single-flight: concurrent misses for the same key are fetched once; other
+      callers block until the owner stores the result
+    - Failed fetches are never cached; callers get None, as without the cache
+    - Hit / miss / coalesced counters for the health API
+    """
+
+    def __init__(self, name: str, ttlSeconds: float, negativeTtlSeconds: float, maxEntries: int):
+        self.name = name
+        self.ttlSeconds = ttlSeconds
+        self.negativeTtlSeconds = negativeTtlSeconds
+        self.maxEntries = maxEntries
+
+        self._lock = threading.Lock()
+        # key -> (value, expiresAt monotonic); value None is a negative entry
+        self._entries: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        # key -> event set once the owning fetch has finished
+        self._inflight: Dict[Tuple[str, str], threading.Event] = {}
+
+        self._hits = 0
+        self._negativeHits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._fetches = 0
+        self._fetchErrors = 0
+        self._evictions = 0
+
+        # Called with (chainId, {address: price}) for every fetch that resolved prices
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttlSeconds > 0
+
+    def getMany(
+        self,
+        chainId: str,
+        tokenAddresses: List[str],
+        fetch: Callable[[List[str]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Resolve prices from the cache, fetching only the keys nobody else is fetching.
+
+        Args:
+            chainId: Chain the addresses belong to
+            tokenAddresses: Addresses to resolve
+            fetch: Called with the missing addresses; returns address -> price, or
+                address -> None when the API answered without that token. Addresses
+                left out of the result (e.g. their request failed) are not cached.
+
+        Returns:
+            Dict mapping every requested address to its price or None
+        """
+        if not self.enabled:
+            fetched = self._fetch(fetch, list(dict.fromkeys(tokenAddresses)))
+            self._notify(chainId, fetched)
+            return {address: fetched.get(address) for address in tokenAddresses}
+
+        result: Dict[str, Any] = {}
+        owned: List[str] = []
+        waiting: Dict[str, threading.Event] = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for address in dict.fromkeys(tokenAddresses):
+                key = (chainId, address)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    result[address] = entry[0]
+                    if entry[0] is None:
+                        self._negativeHits += 1
+                    else:
+                        self._hits += 1
+                    continue
+
+                event = self._inflight.get(key)
+                if event is not None:
+                    waiting[address] = event
+                    self._coalesced += 1
+                    continue
+
+                self._inflight[key] = threading.Event()
+                owned.append(address)
+                self._misses += 1
+
+        if owned:
+            fetched: Dict[str, Any] = {}
+            try:
+                fetched = self._fetch(fetch, owned)
+            finally:
+                self._store(chainId, owned, fetched)
+            self._notify(chainId, fetched)
+            for address in owned:
+                result[address] = fetched.get(address)
+
+        for address, event in waiting.items():
+            if not event.wait(COALESCE_WAIT_SECONDS):
+                logger.warning(f"{self.name} price cache: timed out waiting for in-flight fetch of {address}")
+            with self._lock:
+                entry = self._entries.get((chainId, address))
+            result[address] = entry[0] if entry is not None else None
+
+        return {address: result.get(address) for address in tokenAddresses}
+
+    def _fetch(self, fetch: Callable[[List[str]], Dict[str, Any]], addresses: List[str]) -> Dict[str, Any]:
+        with self._lock:
+            self._fetches += 1
+        try:
+            return fetch(addresses) or {}
+        except Exception as e:
+            with self._lock:
+                self._fetchErrors += 1
+            logger.error(f"{self.name} price cache: fetch of {len(addresses)} tokens failed: {str(e)}")
+            return {}
+
+    def addListener(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Receive every freshly fetched price (cache hits are not repeated).
+
+        Args:
+            listener: Called on the fetching thread with (chainId, {address: price});
+                tokens the API had no price for are left out
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def _notify(self, chainId: str, fetched: Dict[str, Any]) -> None:
+        if not self._listeners:
+            return
+        prices = {address: value for address, value in fetched.items() if value is not None}
+        if not prices:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(chainId, prices)
+            except Exception as e:
+                logger.error(f"{self.name} price cache: listener failed: {str(e)}")
+
+    def _store(self, chainId: str, owned: List[str], fetched: Dict[str, Any]) -> None:
+        """Cache what the fetch resolved and release every waiter on the owned keys"""
+        now = time.monotonic()
+        with self._lock:
+            for address in owned:
+                key = (chainId, address)
+                if address in fetched:
+                    value = fetched[address]
+                    ttl = self.ttlSeconds if value is not None else self.negativeTtlSeconds
+                    if ttl > 0:
+                        self._entries[key] = (value, now + ttl)
+                event = self._inflight.pop(key, None)
+                if event is not None:
+                    event.set()
+
+            if len(self._entries) > self.maxEntries:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the soonest-expiring ones until under maxEntries"""
+        expired = [key for key, (_, expiresAt) in self._entries.items() if expiresAt <= now]
+        for key in expired:
+            del self._entries[key]
+        overflow = len(self._entries) - self.maxEntries
+        if overflow > 0:
+            for key in sorted(self._entries, key=lambda k: self._entries[k][1])[:overflow]:
+                del self._entries[key]
+        self._evictions += len(expired) + max(0, overflow)
+
+    def clear(self) -> None:
+        """Forget every cached price"""
+        with self._lock:
+            self._entries.clear()
+
+    def getMetrics(self) -> Dict:
+        """
+        Snapshot of cache usage.
+
+        Returns:
+            Dict: entry counts, hit / miss counters and hit ratio
+        """
+        with self._lock:
+            lookups = self._hits + self._negativeHits + self._misses + self._coalesced
+            return {
+                "ttlSeconds": self.ttlSeconds,
+                "negativeTtlSeconds": self.negativeTtlSeconds,
+                "maxEntries": self.maxEntries,
+                "entries": len(self._entries),
+                "inflight": len(self._inflight),
+                "hits": self._hits,
+                "negativeHits": self._negativeHits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "fetches": self._fetches,
+                "fetchErrors": self._fetchErrors,
+                "evictions": self._evictions,
+                "hitRatio": round((self._hits + self._negativeHits) / lookups, 4) if lookups else 0.0,
+            }
+
+
+class PriceCacheRegistry:
+    """
+    Process-wide registry of named price caches.
+
+    DexScreenerAction is constructed ad hoc all over the codebase (per request,
+    per job, per parser call); resolving caches here lets every instance share
+    the same warm prices.
+    """
+
+    _caches: Dict[str, PriceCache] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_cache(cls, name: str) -> PriceCache:
+        """
+        Get (creating on first use) the shared cache with the given name.
+
+        Args:
+            name: Cache name, one per kind of price lookup
+
+        Returns:
+            PriceCache: Cache shared by the whole process
+        """
+        cache = cls._caches.get(name)
+        if cache is not None:
+            return cache
+
+        with cls._lock:
+            cache = cls._caches.get(name)
+            if cache is None:
+                config = get_config()
+                cache = PriceCache(
+                    name=name,
+                    ttlSeconds=config.DEXSCREENER_PRICE_TTL_SECONDS,
+                    negativeTtlSeconds=config.DEXSCREENER_NEGATIVE_TTL_SECONDS,
+                    maxEntries=config.DEXSCREENER_PRICE_CACHE_MAX_ENTRIES,
+                )
+                cls._caches[name] = cache
+            return cache
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Dict]:
+        """
+        Metrics for every cache created in this process.
+
+        Returns:
+            Dict: cache name -> cache metrics
+        """
+        with cls._lock:
+            caches = dict(cls._caches)
+        return {name: cache.getMetrics() for name, cache in caches.items()}
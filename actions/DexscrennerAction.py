@@ -4,12 +4,14 @@ Fetches token price information from DexScreener API and returns price details f
 the Raydium pool
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import requests
 from datetime import datetime
 from decimal import Decimal
 from logs.logger import get_logger
+from actions.DexScreenerClient import DexScreenerClient
+from actions.DexScreenerPriceCache import PriceCacheRegistry
 
 logger = get_logger(__name__)
 
@@ -29,6 +31,13 @@ class DexScreenerAction:
         self.config = get_config()
         """Initialize action with base URL"""
         self.baseUrl = "https://api.dexscreener.com/latest/dex/tokens"
+        self.batchBaseUrl = "https://api.dexscreener.com/tokens/v1"
+        # Shared session, rate limiter and worker pool
+        self.client = DexScreenerClient.shared()
+        # Process-wide caches: the pool lookup and the batch endpoint pick pairs
+        # differently, so their prices are kept apart
+        self.poolPriceCache = PriceCacheRegistry.get_cache("pool")
+        self.batchPriceCache = PriceCacheRegistry.get_cache("batch")
 
     def makeRequest(self, tokenAddress: str) -> Optional[Dict[str, Any]]:
         """
@@ -42,7 +51,7 @@ class DexScreenerAction:
         """
         try:
             url = f"{self.baseUrl}/{tokenAddress}"
-            response = requests.get(url)
+            response = self.client.get(url, timeout=30)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -58,7 +67,8 @@ class DexScreenerAction:
             chainId: Chain ID (default: solana)
             
         Returns:
-            API response as list of dictionaries or None if request failed
+            API response as list of dictionaries (empty when no token has a pair), or
+            None if request failed
         """
         if not tokenAddresses:
             logger.warning("No token addresses provided for batch request")
@@ -67,11 +77,12 @@ class DexScreenerAction:
         try:
             # The new API endpoint for batch requests
             token_addresses_str = ','.join(tokenAddresses)
-            batch_url = f"https://api.dexscreener.com/tokens/v1/{chainId}/{token_addresses_str}"
+            batch_url = f"{self.batchBaseUrl}/{chainId}/{token_addresses_str}"
             
             logger.info(f"Making batch request to {batch_url}")
             
-            response = requests.get(batch_url, timeout=30)  # Add timeout
+            # Rate limited, retried on 429/5xx with backoff
+            response = self.client.get(batch_url, timeout=30)
             
             if response.status_code != 200:
                 logger.error(f"Batch API request failed with status code {response.status_code}: {response.text}")
@@ -145,7 +156,7 @@ class DexScreenerAction:
 
     def getTokenPrice(self, tokenAddress: str) -> Optional[TokenPrice]:
         """
-        Get token price from DexScreener
+        Get token price from DexScreener, served from the shared price cache when warm
         
         Args:
             tokenAddress: Token address to query
@@ -153,90 +164,174 @@ class DexScreenerAction:
         Returns:
             TokenPrice object with price information or None if not found
         """
+        return self.poolPriceCache.getMany("solana", [tokenAddress], self._fetchTokenPrices)[tokenAddress]
+
+    def _fetchTokenPrices(self, tokenAddresses: List[str]) -> Dict[str, Optional[TokenPrice]]:
+        """
+        Fetch Raydium/Pumpswap pool prices, one request per token on the worker pool
+        
+        Returns:
+            Dictionary of resolved tokens; tokens whose request failed are left out
+        """
+        result = {}
+        for tokenAddress, (resolved, price) in zip(tokenAddresses, self.client.map(self._fetchTokenPrice, tokenAddresses)):
+            if resolved:
+                result[tokenAddress] = price
+        return result
+
+    def _fetchTokenPrice(self, tokenAddress: str) -> Tuple[bool, Optional[TokenPrice]]:
+        """Returns (False, None) if the request failed, else (True, price or None)"""
         try:
             response = self.makeRequest(tokenAddress)
             if not response or 'pairs' not in response or not response['pairs']:
-                return None
+                return True, None
                 
             # Parse response to find Raydium pool data
-            return self.parseResponseForRaydium(response['pairs'])
+            return True, self.parseResponseForRaydium(response['pairs'])
         except Exception as e:
             logger.error(f"Failed to get token price: {str(e)}")
-            return None
+            return False, None
 
-    def getBatchTokenPrices(self, tokenAddresses: List[str], chainId: str = "solana") -> Dict[str, Optional[TokenPrice]]:
+    def getBatchPoolPrices(self, tokenAddresses: List[str], chainId: str = "solana") -> Dict[str, Optional[TokenPrice]]:
         """
-        Get token prices for multiple tokens in batches
+        Batched getTokenPrice: the same Raydium/Pumpswap pool selection, but fetched
+        30 tokens per request through the batch endpoint. Shares getTokenPrice's cache
         
         Args:
             tokenAddresses: List of token addresses to query
             chainId: Chain ID (default: solana)
             
         Returns:
-            Dictionary mapping token addresses to TokenPrice objects
+            Dictionary mapping token addresses to TokenPrice objects or None
+        """
+        if not tokenAddresses:
+            return {}
+
+        return self.poolPriceCache.getMany(
+            chainId, tokenAddresses, lambda missing: self._fetchBatchPoolPrices(missing, chainId)
+        )
+
+    def _fetchBatchPoolPrices(self, tokenAddresses: List[str], chainId: str) -> Dict[str, Optional[TokenPrice]]:
         """
+        Request the batch endpoint in concurrent chunks of 30 and pick each token's pool
+        
+        Returns:
+            Dictionary of resolved tokens; tokens of failed batches are left out
+        """
+        batches = [tokenAddresses[i:i+30] for i in range(0, len(tokenAddresses), 30)]
         result = {}
+        for batchResult in self.client.map(lambda batch: self._fetchPoolBatch(batch, chainId), batches):
+            result.update(batchResult)
+        return result
+
+    def _fetchPoolBatch(self, batch: List[str], chainId: str) -> Dict[str, Optional[TokenPrice]]:
+        """Fetch one batch of up to 30 tokens and select each token's pool from its pairs"""
+        response = self.makeBatchRequest(batch, chainId)
+        if response is None:
+            logger.error(f"Batch request failed for {len(batch)} tokens")
+            return {}
+        # An empty list is an answer: none of the tokens has a pair, cached as None below
+
+        pairsByToken: Dict[str, List[Dict[str, Any]]] = {}
+        for pairData in response:
+            if pairData and 'baseToken' in pairData:
+                pairsByToken.setdefault(pairData['baseToken'].get('address'), []).append(pairData)
+
+        return {
+            tokenAddress: self.parseResponseForRaydium(pairsByToken[tokenAddress])
+            if tokenAddress in pairsByToken else None
+            for tokenAddress in batch
+        }
+
+    def getBatchTokenPrices(self, tokenAddresses: List[str], chainId: str = "solana") -> Dict[str, Optional[TokenPrice]]:
+        """
+        Get token prices for multiple tokens in batches. Prices cached by earlier
+        calls in this process are reused; only the rest are requested
         
+        Args:
+            tokenAddresses: List of token addresses to query
+            chainId: Chain ID (default: solana)
+            
+        Returns:
+            Dictionary mapping token addresses to TokenPrice objects
+        """
         if not tokenAddresses:
             logger.warning("No token addresses provided for batch price fetching")
-            return result
-            
-        logger.info(f"Fetching prices for {len(tokenAddresses)} tokens in batches of 30")
+            return {}
+
+        result = self.batchPriceCache.getMany(
+            chainId, tokenAddresses, lambda missing: self._fetchBatchTokenPrices(missing, chainId)
+        )
+        logger.info(f"Completed fetching prices for {len(tokenAddresses)} tokens, found data for {sum(1 for v in result.values() if v is not None)} tokens")
+        return result
+
+    def _fetchBatchTokenPrices(self, tokenAddresses: List[str], chainId: str) -> Dict[str, Optional[TokenPrice]]:
+        """
+        Request prices from the batch endpoint in chunks of 30, fetched concurrently
+        on the shared worker pool
+        
+        Returns:
+            Dictionary of resolved tokens in request order: TokenPrice, or None when the
+            response had no pair for the token. Tokens of failed batches are left out
+        """
+        batches = [tokenAddresses[i:i+30] for i in range(0, len(tokenAddresses), 30)]
+        logger.info(f"Fetching prices for {len(tokenAddresses)} tokens in {len(batches)} batches of up to 30")
+
+        result = {}
+        # map keeps batch order, so later pairs still override earlier ones as before
+        for batchResult in self.client.map(lambda batch: self._fetchBatch(batch, chainId), batches):
+            result.update(batchResult)
+        return result
+
+    def _fetchBatch(self, batch: List[str], chainId: str) -> Dict[str, Optional[TokenPrice]]:
+        """Fetch and parse one batch of up to 30 tokens"""
+        result = {}
+        batchSize = len(batch)
         
-        # Process in batches of 30 tokens (API limit)
-        for i in range(0, len(tokenAddresses), 30):
-            batch = tokenAddresses[i:i+30]
-            batchSize = len(batch)
+        try:
+            response = self.makeBatchRequest(batch, chainId)
             
-            logger.info(f"Processing batch {i//30 + 1} with {batchSize} tokens")
+            if response is None:
+                logger.error(f"Batch request failed for {batchSize} tokens")
+                return result
+            # An empty list falls through: every token of the batch is cached as not found
             
-            try:
-                response = self.makeBatchRequest(batch, chainId)
-                
-                if not response:
-                    logger.error(f"Batch request failed for {batchSize} tokens")
-                    # If batch request fails, mark all tokens in this batch as None
-                    for tokenAddress in batch:
-                        result[tokenAddress] = None
+            # Process each token in the response
+            processedTokens = set()
+            for pairData in response:
+                if not pairData or 'baseToken' not in pairData:
                     continue
-                
-                # Process each token in the response
-                processedTokens = set()
-                for pairData in response:
-                    if not pairData or 'baseToken' not in pairData:
-                        continue
-                        
-                    tokenAddress = pairData['baseToken']['address']
-                    processedTokens.add(tokenAddress)
                     
-                    # Create TokenPrice object from the pair data
-                    price = float(pairData.get('priceUsd', 0))
-                    fdv = float(pairData.get('fdv', 0))
-                    market_cap = float(pairData.get('marketCap', 0))
-                    
-                    result[tokenAddress] = TokenPrice(
-                        price=price,
-                        fdv=fdv,
-                        marketCap=market_cap,
-                        name=pairData.get('baseToken', {}).get('name', ''),
-                        symbol=pairData.get('baseToken', {}).get('symbol', '')
-                    )
+                tokenAddress = pairData['baseToken']['address']
+                processedTokens.add(tokenAddress)
                 
-                # Check for missing tokens in the response
-                tokensNotFound = set(batch) - processedTokens
-                if tokensNotFound:
-                    logger.warning(f"Missing price data for {len(tokensNotFound)} tokens in batch")
-                    for tokenAddress in tokensNotFound:
-                        result[tokenAddress] = None
-                        
-                logger.info(f"Successfully processed batch with {len(processedTokens)} tokens")
+                # Create TokenPrice object from the pair data
+                price = float(pairData.get('priceUsd', 0))
+                fdv = float(pairData.get('fdv', 0))
+                market_cap = float(pairData.get('marketCap', 0))
                 
-            except Exception as e:
-                logger.error(f"Failed to process batch token prices: {str(e)}")
-                # Mark all tokens in this batch as None on error
-                for tokenAddress in batch:
-                    if tokenAddress not in result:
-                        result[tokenAddress] = None
+                result[tokenAddress] = TokenPrice(
+                    price=price,
+                    fdv=fdv,
+                    marketCap=market_cap,
+                    name=pairData.get('baseToken', {}).get('name', ''),
+                    symbol=pairData.get('baseToken', {}).get('symbol', '')
+                )
+            
+            # Check for missing tokens in the response
+            tokensNotFound = set(batch) - processedTokens
+            if tokensNotFound:
+                logger.warning(f"Missing price data for {len(tokensNotFound)} tokens in batch")
+                for tokenAddress in tokensNotFound:
+                    result[tokenAddress] = None
+                    
+            logger.info(f"Successfully processed batch with {len(processedTokens)} tokens")
+            
+        except Exception as e:
+            logger.error(f"Failed to process batch token prices: {str(e)}")
+            # Leave the rest of this batch unresolved so it is retried next call
+            for tokenAddress in batch:
+                if result.get(tokenAddress) is None:
+                    result.pop(tokenAddress, None)
         
-        logger.info(f"Completed fetching prices for {len(tokenAddresses)} tokens, found data for {sum(1 for v in result.values() if v is not None)} tokens")
-        return result 
\ No newline at end of file
+        return result
@@ -0,0 +1,379 @@
+from config.Config import get_config
+"""
+Staged pipeline refreshing the investment details of high PNL wallets' tokens.
+
+Every wallet / token pair used to go through its steps one after the other
+(DB lookup, DB count, Solscan count, Cielo history, DB update), so a run took
+the sum of all of them for every pair. The pipeline runs them as stages joined
+by bounded queues:
+
+    1. read    leased pairs and their stored transaction counts, one query per batch
+    2. count   Solscan transaction counts, several workers sharing one rate limit
+    3. fetch   investment details (Cielo by default), only for pairs whose count grew
+    4. write   counts and amounts in one UPDATE per batch, leases completed together
+
+A full queue blocks the stage feeding it, so a slow upstream holds back the
+leasing instead of letting leased pairs pile up in memory until their leases
+expire. Each stage records its items, busy / blocked time and throughput; the
+figures of the last run are served by /health/investmentpipeline.
+"""
+
+from actions.DexScreenerClient import TokenBucket
+from database.auth.ServiceCredentialsEnum import ServiceCredentials
+from database.job.RefreshQueueHandler import JOB_TOP_PNL_TOKEN_DETAILS
+from database.operations.PortfolioDB import PortfolioDB
+from logs.logger import get_logger
+from services.CieloServiceHandler import CieloServiceHandler
+from services.SolscanServiceHandler import SolscanServiceHandler
+from typing import Any, Dict, Iterable, List, Optional
+import queue
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Marks the end of a stage's input
+_END = object()
+
+# The writer flushes a partial batch once its input has been idle this long
+WRITE_IDLE_FLUSH_SECONDS = 1.0
+
+
+class StageMetrics:
+    """Throughput counters of one pipeline stage"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busySeconds = 0.0
+        self.rateLimitedSeconds = 0.0  # waiting for the upstream rate limit
+        self.blockedSeconds = 0.0  # waiting on a full downstream queue
+        self.startedAt: Optional[float] = None
+        self.finishedAt: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.startedAt is None:
+                self.startedAt = time.monotonic()
+
+    def finish(self) -> None:
+        with self._lock:
+            self.finishedAt = time.monotonic()
+
+    def record(self, busySeconds: float, items: int = 1, rateLimitedSeconds: float = 0.0) -> None:
+        with self._lock:
+            self.items += items
+            self.busySeconds += busySeconds
+            self.rateLimitedSeconds += rateLimitedSeconds
+
+    def recordBlocked(self, seconds: float) -> None:
+        with self._lock:
+            self.blockedSeconds += seconds
+
+    def toDict(self) -> Dict[str, Any]:
+        with self._lock:
+            if self.startedAt is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self.finishedAt or time.monotonic()) - self.startedAt
+            return {
+                "stage": self.name,
+                "workers": self.workers,
+                "items": self.items,
+                "elapsedSeconds": round(elapsed, 2),
+                "busySeconds": round(self.busySeconds, 2),
+                "rateLimitedSeconds": round(self.rateLimitedSeconds, 2),
+                "blockedSeconds": round(self.blockedSeconds, 2),
+                "itemsPerSecond": round(self.items / elapsed, 3) if elapsed > 0 else 0.0,
+                # Share of the workers' wall time spent working; low values point at the bottleneck being elsewhere
+                "utilisation": round(self.busySeconds / (elapsed * self.workers), 3) if elapsed > 0 else 0.0,
+            }
+
+
+class InvestmentDetailsPipeline:
+    """
+    Runs leased wallet / token pairs of the top PNL token details job through the stages.
+
+    Args:
+        db: Database instance
+        solscanService: Used for the transaction counts (and the details when service is not Cielo)
+        cieloService: Used for the investment details
+        cookie: Valid Solscan cookie
+        service: Service the investment details are fetched from
+    """
+
+    _lastRun: Optional[Dict[str, Any]] = None
+    _lastRunLock = threading.Lock()
+
+    def __init__(
+        self,
+        db: PortfolioDB,
+        solscanService: SolscanServiceHandler,
+        cieloService: CieloServiceHandler,
+        cookie: str,
+        service: ServiceCredentials = ServiceCredentials.CIELO,
+    ):
+        config = get_config()
+        self.db = db
+        self.solscanService = solscanService
+        self.cieloService = cieloService
+        self.cookie = cookie
+        self.service = service
+
+        self.countWorkers = max(1, config.INVESTMENT_PIPELINE_COUNT_WORKERS)
+        self.fetchWorkers = max(1, config.INVESTMENT_PIPELINE_FETCH_WORKERS)
+        self.writeBatchSize = max(1, config.INVESTMENT_PIPELINE_WRITE_BATCH_SIZE)
+        queueSize = max(1, config.INVESTMENT_PIPELINE_QUEUE_SIZE)
+        # Capacity 1: the count workers share one cookie, so no bursts above the configured rate
+        self.solscanBucket = TokenBucket(max(config.SOLSCAN_REQUESTS_PER_MINUTE, 1) / 60.0, 1)
+
+        self._countQueue: "queue.Queue" = queue.Queue(maxsize=queueSize)
+        self._fetchQueue: "queue.Queue" = queue.Queue(maxsize=queueSize)
+        self._writeQueue: "queue.Queue" = queue.Queue(maxsize=queueSize)
+
+        self.metrics = {
+            "read": StageMetrics("read", 1),
+            "count": StageMetrics("count", self.countWorkers),
+            "fetch": StageMetrics("fetch", self.fetchWorkers),
+            "write": StageMetrics("write", 1),
+        }
+        self._lock = threading.Lock()
+        self._remaining = {"count": self.countWorkers, "fetch": self.fetchWorkers}
+        self._updated = 0
+        self._unchanged = 0
+        self._failed = 0
+
+    @classmethod
+    def getLastRunMetrics(cls) -> Optional[Dict[str, Any]]:
+        """Summary of the last finished run in this process, None before the first one"""
+        with cls._lastRunLock:
+            return cls._lastRun
+
+    def run(self, batches: Iterable[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Push every leased batch through the stages and wait for the last write.
+
+        Args:
+            batches: Leases (entitykey and payload with walletAddress, tokenId, name), batch by batch
+
+        Returns:
+            Dict: updated / unchanged / failed counts, elapsed seconds and per-stage metrics
+        """
+        startTime = time.monotonic()
+        threads = (
+            [threading.Thread(target=self._countWorker, name=f"investment-count-{index}", daemon=True)
+             for index in range(self.countWorkers)]
+            + [threading.Thread(target=self._fetchWorker, name=f"investment-fetch-{index}", daemon=True)
+               for index in range(self.fetchWorkers)]
+            + [threading.Thread(target=self._writeWorker, name="investment-write", daemon=True)]
+        )
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._read(batches)
+        except Exception as e:
+            logger.error(f"Investment details pipeline stopped reading leases: {str(e)}")
+        finally:
+            self.metrics["read"].finish()
+            for _ in range(self.countWorkers):
+                self._countQueue.put(_END)
+
+        for thread in threads:
+            thread.join()
+
+        summary = {
+            "items": self._updated + self._unchanged + self._failed,
+            "updated": self._updated,
+            "unchanged": self._unchanged,
+            "failed": self._failed,
+            "elapsedSeconds": round(time.monotonic() - startTime, 2),
+            "finishedAt": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "stages": [metrics.toDict() for metrics in self.metrics.values()],
+        }
+        logger.info(
+            f"Investment details pipeline finished in {summary['elapsedSeconds']}s - "
+            f"{summary['updated']} updated, {summary['unchanged']} unchanged, {summary['failed']} failed; "
+            + ", ".join(f"{stage['stage']} {stage['itemsPerSecond']}/s" for stage in summary["stages"])
+        )
+        with InvestmentDetailsPipeline._lastRunLock:
+            InvestmentDetailsPipeline._lastRun = summary
+        return summary
+
+    def _put(self, target: "queue.Queue", item: Dict[str, Any], metrics: StageMetrics) -> None:
+        startedAt = time.monotonic()
+        target.put(item)
+        metrics.recordBlocked(time.monotonic() - startedAt)
+
+    def _stageDone(self, stage: str, nextQueue: "queue.Queue", nextWorkers: int) -> None:
+        """Called by each worker of a stage on its end marker; the last one ends the next stage's input"""
+        with self._lock:
+            self._remaining[stage] -= 1
+            last = self._remaining[stage] == 0
+        if last:
+            self.metrics[stage].finish()
+            for _ in range(nextWorkers):
+                nextQueue.put(_END)
+
+    def _read(self, batches: Iterable[List[Dict[str, Any]]]) -> None:
+        """Stage 1: stored transaction counts of each leased batch in one query"""
+        metrics = self.metrics["read"]
+        for batch in batches:
+            metrics.start()
+            startedAt = time.monotonic()
+            pairs = [(lease["payload"]["walletAddress"], lease["payload"]["tokenId"]) for lease in batch]
+            error = None
+            try:
+                counts = self.db.smWalletTopPNLToken.getTransactionCounts(pairs)
+            except Exception as e:
+                counts, error = {}, f"Failed to read transaction count: {str(e)}"
+            metrics.record(time.monotonic() - startedAt, len(batch))
+
+            for lease, pair in zip(batch, pairs):
+                item = {
+                    "entityKey": lease["entitykey"],
+                    "walletAddress": pair[0],
+                    "tokenId": pair[1],
+                    "name": lease["payload"].get("name"),
+                    "dbCount": counts.get(pair),
+                }
+                if pair in counts:
+                    self._put(self._countQueue, item, metrics)
+                else:
+                    item["error"] = error or "No token found for wallet"
+                    self._put(self._writeQueue, item, metrics)
+
+    def _countWorker(self) -> None:
+        """Stage 2: Solscan transaction count, rate limited across the workers"""
+        metrics = self.metrics["count"]
+        while True:
+            item = self._countQueue.get()
+            if item is _END:
+                self._stageDone("count", self._fetchQueue, self.fetchWorkers)
+                return
+
+            metrics.start()
+            waited = self.solscanBucket.acquire()
+            startedAt = time.monotonic()
+            try:
+                apiCount = self.solscanService.getTransactionCountFromAPI(
+                    self.cookie, item["walletAddress"], item["tokenId"]
+                )
+                apiCount = int(apiCount) if apiCount is not None else None
+            except Exception as e:
+                logger.error(f"Failed to get transaction count for {item['walletAddress']} and token {item['tokenId']}: {str(e)}")
+                apiCount = None
+            metrics.record(time.monotonic() - startedAt, rateLimitedSeconds=waited)
+
+            if apiCount is None:
+                item["error"] = "Transaction count unavailable"
+                self._put(self._writeQueue, item, metrics)
+                continue
+
+            item["apiCount"] = apiCount
+            if item["dbCount"] and item["dbCount"] >= apiCount:
+                logger.info(f"No new transactions for {item['walletAddress']} and token {item['tokenId']}. DB: {item['dbCount']}, API: {apiCount}")
+                item["unchanged"] = True
+                self._put(self._writeQueue, item, metrics)
+            else:
+                self._put(self._fetchQueue, item, metrics)
+
+    def _fetchWorker(self) -> None:
+        """Stage 3: investment details of pairs with new transactions"""
+        metrics = self.metrics["fetch"]
+        while True:
+            item = self._fetchQueue.get()
+            if item is _END:
+                self._stageDone("fetch", self._writeQueue, 1)
+                return
+
+            metrics.start()
+            startedAt = time.monotonic()
+            try:
+                if self.service == ServiceCredentials.CIELO:
+                    result = self.cieloService.getInvestmentDetails(
+                        walletAddress=item["walletAddress"],
+                        tokenId=item["tokenId"]
+                    )
+                else:
+                    result = self.solscanService.getInvestmentDetails(
+                        cookie=self.cookie,
+                        walletAddress=item["walletAddress"],
+                        tokenAddress=item["tokenId"],
+                        totalTransactions=item["apiCount"]
+                    )
+                if not result:
+                    item["error"] = "Investment details not found"
+            except Exception as e:
+                result = None
+                item["error"] = str(e)
+            metrics.record(time.monotonic() - startedAt)
+
+            item["result"] = result
+            self._put(self._writeQueue, item, metrics)
+
+    def _writeWorker(self) -> None:
+        """Stage 4: batched database writes and lease completion"""
+        pending: List[Dict[str, Any]] = []
+        ended = False
+        while not ended:
+            try:
+                item = self._writeQueue.get(timeout=WRITE_IDLE_FLUSH_SECONDS)
+            except queue.Empty:
+                item = None
+
+            if item is _END:
+                ended = True
+            elif item is not None:
+                self.metrics["write"].start()
+                pending.append(item)
+
+            if pending and (ended or item is None or len(pending) >= self.writeBatchSize):
+                self._flush(pending)
+                pending = []
+        self.metrics["write"].finish()
+
+    def _flush(self, items: List[Dict[str, Any]]) -> None:
+        startedAt = time.monotonic()
+
+        # Pairs that reached the fetch stage always get their new count, even when the
+        # details call failed, so the count stays in sync with Solscan
+        written = [item for item in items if item.get("apiCount") is not None and not item.get("unchanged")]
+        updates = []
+        for item in written:
+            result = item.get("result")
+            updates.append({
+                "walletAddress": item["walletAddress"],
+                "tokenId": item["tokenId"],
+                "transactionsCount": item["apiCount"],
+                "amountInvested": result.totalInvested if result else None,
+                "amountTakenOut": result.totalTakenOut if result else None,
+                "remainingCoins": result.totalCoins if result else None,
+            })
+        try:
+            self.db.smWalletTopPNLToken.updateInvestmentDataBatch(updates)
+        except Exception as e:
+            for item in written:
+                item.setdefault("error", f"Failed to write investment data: {str(e)}")
+
+        succeeded = [item for item in items if not item.get("error")]
+        failed = [item for item in items if item.get("error")]
+        try:
+            self.db.refreshQueue.completeBatch(JOB_TOP_PNL_TOKEN_DETAILS, [item["entityKey"] for item in succeeded])
+        except Exception as e:
+            logger.error(f"Failed to complete {len(succeeded)} refresh queue entries: {str(e)}")
+        for item in failed:
+            logger.warning(f"Failed to process token {item['tokenId']} ({item['name']}) for wallet {item['walletAddress']}: {item['error']}")
+            try:
+                self.db.refreshQueue.release(JOB_TOP_PNL_TOKEN_DETAILS, item["entityKey"], item["error"])
+            except Exception as e:
+                logger.error(f"Failed to release refresh queue entry {item['entityKey']}: {str(e)}")
+
+        with self._lock:
+            unchanged = sum(1 for item in succeeded if item.get("unchanged"))
+            self._unchanged += unchanged
+            self._updated += len(succeeded) - unchanged
+            self._failed += len(failed)
+        self.metrics["write"].record(time.monotonic() - startedAt, len(items))
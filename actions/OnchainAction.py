@@ -3,6 +3,8 @@ from typing import Optional, Dict, Any, List, Union
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import OnchainInfo
 import parsers.OnchainParser as onchainParsers
+from actions.DexscrennerAction import DexScreenerAction
+from actions.TokenPriceEnrichment import enrichTokenPrices
 import requests
 from decimal import Decimal
 import time
@@ -55,6 +57,9 @@ class OnchainAction:
                 logger.error("No valid items found in response")
                 return False
 
+            # Overlay DexScreener prices with one batched, cached lookup
+            enrichTokenPrices(onchainTokens, DexScreenerAction().getBatchTokenPrices)
+
             # Persist to database and get successfully persisted tokens
             persistedTokens = self.persistTokens(onchainTokens)
                 
@@ -133,13 +138,11 @@ class OnchainAction:
         """
         successfulTokens = []
         
-        for token in onchainTokens:
-            try:
-                self.db.onchain.insertTokenData(token)
-                successfulTokens.append(token)
-            except Exception as token_error:
-                logger.error(f"Failed to persist token {token.tokenid}: {str(token_error)}")
-                continue
+        # The whole response is persisted atomically in one transaction
+        if self.db.onchain.insertTokenDataBatch(onchainTokens):
+            successfulTokens = list({token.tokenid: token for token in onchainTokens}.values())
+        else:
+            logger.error(f"Failed to persist batch of {len(onchainTokens)} onchain tokens")
         
         if successfulTokens:
             try:
@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any, List
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import PumpFunToken
 import parsers.PumpfunParser as pumpfunParsers
+from actions.DexscrennerAction import DexScreenerAction
+from actions.TokenPriceEnrichment import enrichTokenPrices
 import requests
 from datetime import datetime
 from logs.logger import get_logger
@@ -58,6 +60,9 @@ class PumpFunAction:
                 logger.error("No valid items found in response")
                 return False
 
+            # Overlay DexScreener prices with one batched, cached lookup
+            enrichTokenPrices(pumpFunTokens, DexScreenerAction().getBatchPoolPrices)
+
             # Persist to database and get successfully persisted tokens
             persistedTokens = self.persistTokens(pumpFunTokens)
                             
@@ -130,13 +135,13 @@ class PumpFunAction:
         """
         successfulTokens = []
         
-        for token in pumpFunTokens:
-            try:
-                self.db.pumpfun.insertTokenData(token)
-                successfulTokens.append(token)
-            except Exception as token_error:
-                logger.error(f"Failed to persist token {token.tokenid}: {str(token_error)}")
-                continue
+        # The whole response is persisted in one transaction; change detection runs in SQL
+        try:
+            stats = self.db.pumpfun.insertTokenDataBatch(pumpFunTokens)
+            successfulTokens = list({token.tokenid: token for token in pumpFunTokens}.values())
+            logger.info(f"Pump fun tokens inserted: {stats['inserted']}, updated: {stats['updated']}, unchanged or stale: {stats['skipped']}")
+        except Exception as batch_error:
+            logger.error(f"Failed to persist batch of {len(pumpFunTokens)} pump fun tokens: {str(batch_error)}")
                     
         logger.info(f"Successfully persisted {len(successfulTokens)} pump fun tokens")
         return successfulTokens
@@ -168,6 +173,10 @@ class PumpFunAction:
             # Initialize analytics handler and push token API
             pushTokenAPI = PushTokenAPI()
             
+            # State and info for every token: written through by persistTokens, so
+            # normally served without a database round trip
+            snapshots = self.db.pumpfun.getTokenSnapshots([token.tokenid for token in pumpFunTokens])
+
             # Process each token
             successCount = 0
             filteredCount = 0
@@ -192,20 +201,12 @@ class PumpFunAction:
                         filteredCount += 1
                         continue
                         
-                    # Get the current state of the token from the database
-                    tokenState = self.db.pumpfun.getTokenState(token.tokenid)
-                    if not tokenState:
-                        logger.warning(f"Token state not found for {token.tokenid}, skipping")
+                    # Token state combined with info, as persisted by this cycle
+                    snapshot = snapshots.get(token.tokenid)
+                    if not snapshot:
+                        logger.warning(f"Token state or info not found for {token.tokenid}, skipping")
                         continue
-                        
-                    # Get token info
-                    tokenInfo = self.db.pumpfun.getTokenInfo(token.tokenid)
-                    if not tokenInfo:
-                        logger.warning(f"Token info not found for {token.tokenid}, skipping")
-                        continue
-                    
-                    # Combine token state and info into a single dictionary
-                    combinedTokenData = {**tokenState, **tokenInfo}
+                    combinedTokenData = dict(snapshot)
                     
                     # Add rug count if available
                     if hasattr(token, 'rugcount'):
@@ -5,6 +5,8 @@ Takes all the smart wallets and stores them in the database
 
 from typing import Optional, Dict, Any, List
 import requests
+from actions.CrawlExecutor import CrawlThrottledError
+from api.utils.responsecache import TAG_SMARTMONEY, invalidate_tags
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import SMWalletTopPnlToken
 from datetime import datetime
@@ -43,7 +45,7 @@ class SMWalletTopPNLTokenAction:
             'x-requested-with': 'XMLHttpRequest'
         }
 
-    def persistAllTopPNLTokensForASMWallet(self, cookie: str, walletAddress: str, lookbackDays: int = 180) -> Optional[List[SMWalletTopPnlToken]]:
+    def persistAllTopPNLTokensForASMWallet(self, cookie: str, walletAddress: str, lookbackDays: int = 180, raiseOnThrottle: bool = False, raiseOnFailure: bool = False) -> Optional[List[SMWalletTopPnlToken]]:
         """
         Get all top PNL tokens for a smart money wallet
         
@@ -51,6 +53,9 @@ class SMWalletTopPNLTokenAction:
             cookie: Valid cookie for API access
             walletAddress: Wallet address to analyze
             lookbackDays: Number of days to look back (default: 180)
+            raiseOnThrottle: Raise CrawlThrottledError on 429 / 5xx instead of returning None (crawl executor)
+            raiseOnFailure: Re-raise any other failure instead of returning None, so callers
+                can tell a failed request from a wallet without tokens (refresh queue)
             
         Returns:
             Optional[List[TopPnlToken]]: Parsed and validated top PNL token data
@@ -89,6 +94,8 @@ class SMWalletTopPNLTokenAction:
                 # Handle JSON parsing errors more gracefully
                 logger.error(f"JSON parsing error for wallet {walletAddress}: {str(json_err)}")
                 logger.error(f"Response content: {response.text[:500]}...")
+                if raiseOnFailure:
+                    raise
                 return None
                 
             if data:
@@ -102,10 +109,20 @@ class SMWalletTopPNLTokenAction:
             
             return None
 
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if raiseOnThrottle and CrawlThrottledError.isRetryable(status):
+                raise CrawlThrottledError(status, e.response.headers.get("Retry-After")) from e
+            logger.error(f"Failed to analyze top PNL tokens for wallet {walletAddress}: {str(e)}")
+            if raiseOnFailure:
+                raise
+            return None
         except Exception as e:
             logger.error(f"Failed to analyze top PNL tokens for wallet {walletAddress}: {str(e)}")
             executionTime = time.time() - startTime
             logger.error(f"Action failed after {executionTime:.2f} seconds")
+            if raiseOnFailure:
+                raise
             return None
 
     def persistSMWalletTopPNLTokensData(self, items: List[SMWalletTopPnlToken]):
@@ -136,6 +153,10 @@ class SMWalletTopPNLTokenAction:
                         logger.error(f"Failed to persist token {item.tokenid} for wallet {item.walletaddress}: {str(e)}")
                         continue
 
+            # Keep the per-wallet win rate used by the performance report in step
+            self.db.smWalletTopPNLToken.refreshWalletStats([item.walletaddress for item in items])
+            invalidate_tags(TAG_SMARTMONEY)
+
         except Exception as e:
             logger.error(f"Database operation failed: {str(e)}")
             raise 
\ No newline at end of file
@@ -5,6 +5,8 @@ for a particular token
 """
 from typing import List, Dict, Optional
 from decimal import Decimal
+from actions.InvestmentDetailsPipeline import InvestmentDetailsPipeline
+from database.job.RefreshQueueHandler import JOB_TOP_PNL_TOKEN_DETAILS
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import InvestmentDetails
 from logs.logger import get_logger
@@ -24,6 +26,7 @@ class SMWalletTopPNLTokensInvestmentDetailsAction:
         self.db = db
         self.solscan_service = SolscanServiceHandler(db)
         self.cielo_service = CieloServiceHandler(db)
+        self.lastPipelineMetrics: Optional[Dict] = None
 
     def filter_tokens_by_performance(self, tokens, top_percent=0.3, bottom_percent=0.2):
         """
@@ -61,63 +64,30 @@ class SMWalletTopPNLTokensInvestmentDetailsAction:
     
     def handleInvestmentDetailsOfAllHighPNLSMWallets(self, cookie: str, 
                                                     service: ServiceCredentials = ServiceCredentials.CIELO) -> bool:
-        """Process investment details for tokens of high PNL wallets"""
+        """
+        Process investment details for tokens of high PNL wallets
+
+        Tokens not analysed yet are taken from the refresh queue in priority order
+        (largest PNL first), so an interrupted run resumes with what it had not reached.
+        The leased pairs go through InvestmentDetailsPipeline: batched count reads,
+        concurrent Solscan counts and Cielo fetches, batched writes.
+        """
         try:
-            # Step 1: Get high PNL wallets
-            highPnlWallets = self.db.smartMoneyWallets.getAllHighPnlSmartMoneyWallets()
-            if not highPnlWallets:
-                logger.warning("No high PNL wallets found")
+            queued = self.db.refreshQueue.syncJob(JOB_TOP_PNL_TOKEN_DETAILS)
+            if not queued:
+                logger.warning("No tokens of high PNL wallets to process")
                 return False
             
-            logger.info(f"Found {len(highPnlWallets)} high PNL wallets")
+            logger.info(f"Found {queued} tokens of high PNL wallets to process")
             
-            # Step 2: Iterate through each wallet
-            totalProcessed = 0
-            for wallet in highPnlWallets:
-                try:
-                    walletAddress = wallet.get('walletAddress')
-                    logger.info(f"Processing wallet: {walletAddress}")
-                    
-                    # Step 3: Get all tokens invested by this wallet
-                    tokens = self.db.smWalletTopPNLToken.getTokensForWallet(walletAddress)
-                    if not tokens:
-                        logger.warning(f"No tokens found for wallet {walletAddress}")
-                        continue
-                    
-                    logger.info(f"Found {len(tokens)} tokens for wallet {walletAddress}")
-                    
-                    # Step 4: Filter tokens to get top 30% and bottom 20% by unprocessedpnl
-                    # filteredTokens = self.filter_tokens_by_performance(tokens)
-                    filteredTokens = tokens
-                    # Step 5: Process each filtered token
-                    for token in filteredTokens:
-                        try:
-                            logger.info(f"Processing token: {token.name} (PNL: {token.unprocessedpnl}) for wallet {walletAddress}")
-                            success = self.findInvestmentDataForToken(
-                                walletAddress=walletAddress,
-                                tokenId=token.tokenid,
-                                cookie=cookie,
-                                service=service
-                            )
-                            
-                            if success:
-                                totalProcessed += 1
-                                logger.info(f"Successfully processed token {token.tokenid} ({token.name}) for wallet {walletAddress}")
-                            else:
-                                logger.info(f"Failed to process token {token.tokenid} ({token.name}) for wallet {walletAddress}")
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to process token {token.tokenid} for wallet {walletAddress}: {str(e)}")
-                            continue
-                    
-                    # Sleep between wallets
-                    # delay = random.uniform(1, 5)
-                    # logger.info(f"Completed wallet {walletAddress}. Sleeping for {delay} seconds before next wallet")
-                    # time.sleep(delay)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to process wallet {wallet.get('walletaddress', 'unknown')}: {str(e)}")
-                    continue
+            pipeline = InvestmentDetailsPipeline(
+                self.db, self.solscan_service, self.cielo_service, cookie, service
+            )
+            summary = pipeline.run(
+                self.db.refreshQueue.leaseBatches(JOB_TOP_PNL_TOKEN_DETAILS, get_config().REFRESH_QUEUE_BATCH_SIZE)
+            )
+            self.lastPipelineMetrics = summary
+            totalProcessed = summary['updated'] + summary['unchanged']
             
             logger.info(f"Total tokens processed successfully: {totalProcessed}")
             return totalProcessed > 0
@@ -173,8 +143,14 @@ class SMWalletTopPNLTokensInvestmentDetailsAction:
             return False
 
     def findInvestmentDataForToken(self, walletAddress: str, tokenId: str, 
-                                 cookie: str, service: ServiceCredentials = ServiceCredentials.CIELO) -> bool:
-        """Process a specific wallet-token combination"""
+                                 cookie: str, service: ServiceCredentials = ServiceCredentials.CIELO,
+                                 fullResync: bool = False) -> bool:
+        """
+        Process a specific wallet-token combination
+
+        Args:
+            fullResync: Recount the whole swap history instead of only the swaps since the last sync (Cielo)
+        """
         try:
             # Get token data from database
             token = self.db.smWalletTopPNLToken.getSMWalletTopPNLToken(walletAddress, tokenId)
@@ -199,7 +175,7 @@ class SMWalletTopPNLTokensInvestmentDetailsAction:
             
 
             # Skip if no new transactions
-            if dbTransactionsCount and dbTransactionsCount >= apiTransactionsCount:
+            if not fullResync and dbTransactionsCount and dbTransactionsCount >= apiTransactionsCount:
                 logger.info(f"No new transactions for {walletAddress} and token {tokenId}. DB: {dbTransactionsCount}, API: {apiTransactionsCount}")
                 return True
             
@@ -221,7 +197,8 @@ class SMWalletTopPNLTokensInvestmentDetailsAction:
             if service == ServiceCredentials.CIELO:
                 result = self.cielo_service.getInvestmentDetails(
                     walletAddress=walletAddress,
-                    tokenId=tokenId
+                    tokenId=tokenId,
+                    fullResync=fullResync
                 )
             else:  # default to solscan
                 result = self.solscan_service.getInvestmentDetails(
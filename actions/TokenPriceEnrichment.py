@@ -0,0 +1,54 @@
+from config.Config import get_config
+"""
+Overlays DexScreener prices on parsed bot tokens.
+
+Parsers fill price and marketcap from the bot API response; this stage resolves
+every token of a response with one batched, cached lookup and replaces those
+values where DexScreener has the token.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence
+from decimal import Decimal
+from actions.DexscrennerAction import TokenPrice
+from logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def enrichTokenPrices(
+    tokens: Sequence,
+    priceLookup: Callable[[List[str]], Dict[str, Optional[TokenPrice]]],
+) -> int:
+    """
+    Replace price and marketcap (and fdv, where the token has one) with DexScreener data
+
+    Args:
+        tokens: Parsed VolumeToken, PumpFunToken or OnchainInfo objects, updated in place
+        priceLookup: Batched lookup, e.g. DexScreenerAction().getBatchPoolPrices
+
+    Returns:
+        int: Number of tokens that received DexScreener data
+    """
+    if not tokens:
+        return 0
+
+    tokenIds = list(dict.fromkeys(token.tokenid for token in tokens))
+    try:
+        prices = priceLookup(tokenIds)
+    except Exception as e:
+        logger.warning(f"DexScreener lookup failed for {len(tokenIds)} tokens, keeping API prices: {str(e)}")
+        return 0
+
+    enriched = 0
+    for token in tokens:
+        priceData = prices.get(token.tokenid)
+        if not priceData:
+            continue
+        token.price = Decimal(str(priceData.price))
+        token.marketcap = Decimal(str(priceData.marketCap))
+        if hasattr(token, "fdv"):
+            token.fdv = Decimal(str(priceData.fdv))
+        enriched += 1
+
+    logger.info(f"Enriched {enriched}/{len(tokens)} tokens with DexScreener data")
+    return enriched
@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any, List, Union
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import VolumeToken
 import parsers.VolumebotParser as volumeParsers
+from actions.DexscrennerAction import DexScreenerAction
+from actions.TokenPriceEnrichment import enrichTokenPrices
 import requests
 from decimal import Decimal
 import time
@@ -59,6 +61,9 @@ class VolumebotAction:
                 logger.error("No valid items found in response")
                 return False
 
+            # Overlay DexScreener prices with one batched, cached lookup
+            enrichTokenPrices(volumeTokens, DexScreenerAction().getBatchPoolPrices)
+
             # Persist to database and get successfully persisted tokens
             persistedTokens = self.persistTokens(volumeTokens)
         
@@ -131,13 +136,13 @@ class VolumebotAction:
         """
         successfulTokens = []
         
-        for token in volumeTokens:
-            try:
-                self.db.volume.insertTokenData(token)
-                successfulTokens.append(token)
-            except Exception as token_error:
-                logger.error(f"Failed to persist token {token.name}: {str(token_error)}")
-                continue
+        # The whole response is persisted in one transaction; change detection runs in SQL
+        try:
+            stats = self.db.volume.insertTokenDataBatch(volumeTokens)
+            successfulTokens = list({token.tokenid: token for token in volumeTokens}.values())
+            logger.info(f"Volume tokens inserted: {stats['inserted']}, updated: {stats['updated']}, unchanged or stale: {stats['skipped']}")
+        except Exception as batch_error:
+            logger.error(f"Failed to persist batch of {len(volumeTokens)} volume tokens: {str(batch_error)}")
                     
         logger.info(f"Successfully persisted {len(successfulTokens)} volume tokens")
         return successfulTokens
@@ -168,6 +173,10 @@ class VolumebotAction:
             # Initialize analytics handler and push token API
             pushTokenAPI = PushTokenAPI()
             
+            # State and info for every token: written through by persistTokens, so
+            # normally served without a database round trip
+            snapshots = self.db.volume.getTokenSnapshots([token.tokenid for token in volumeTokens])
+
             # Process each token
             successCount = 0
             filteredCount = 0
@@ -192,20 +201,12 @@ class VolumebotAction:
                         filteredCount += 1
                         continue
                         
-                    # Get the current state of the token from the database
-                    tokenState = self.db.volume.getTokenState(token.tokenid)
-                    if not tokenState:
-                        logger.warning(f"Token state not found for {token.tokenname}, skipping")
+                    # Token state combined with info, as persisted by this cycle
+                    snapshot = snapshots.get(token.tokenid)
+                    if not snapshot:
+                        logger.warning(f"Token state or info not found for {token.tokenname}, skipping")
                         continue
-                        
-                    # Get token info
-                    tokenInfo = self.db.volume.getTokenInfo(token.tokenid)
-                    if not tokenInfo:
-                        logger.warning(f"Token info not found for {token.tokenname}, skipping")
-                        continue
-                    
-                    # Combine token state and info into a single dictionary
-                    combinedTokenData = {**tokenState, **tokenInfo}
+                    combinedTokenData = dict(snapshot)
                     
                     # Convert to VolumeTokenData
                     tokenData = PushTokenAPI.mapVolumeTokenData(combinedTokenData)
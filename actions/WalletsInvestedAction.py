@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any, List
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.schema import WalletsInvested, WalletInvestedStatusEnum
 import requests
+from actions.CrawlExecutor import CrawlThrottledError
 from datetime import datetime
 import time
 import parsers.WalletsInvestedParser as WalletsInvestedParser
@@ -12,6 +13,12 @@ from logs.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Existing row for a (token, wallet) pair; served by UNIQUE(tokenid, walletaddress)
+EXISTING_WALLET_INVESTED_QUERY = """
+    SELECT * FROM walletsinvested 
+    WHERE tokenid = %s AND walletaddress = %s
+"""
+
 class WalletsInvestedAction:
     """Handles complete token analysis request workflow"""
     
@@ -59,8 +66,15 @@ class WalletsInvestedAction:
             'pageType': 'TokenPageL2'
         }
 
-    def fetchAndPersistWalletsInvestedInASpecificToken(self, cookie: str, tokenId: str, portsummaryId: int) -> Optional[Dict[str, Any]]:
-        """Execute token analysis request with retry on failure"""
+    def fetchAndPersistWalletsInvestedInASpecificToken(self, cookie: str, tokenId: str, portsummaryId: int, raiseOnThrottle: bool = False, raiseOnFailure: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Execute token analysis request
+
+        Args:
+            raiseOnThrottle: Raise CrawlThrottledError on 429 / 5xx instead of returning None (crawl executor)
+            raiseOnFailure: Re-raise any other failure instead of returning None, so callers
+                can tell a failed request from a token without data (refresh queue)
+        """
         startTime = time.time()
         try:
             payload = self.buildPayload(tokenId)
@@ -109,9 +123,19 @@ class WalletsInvestedAction:
             else:
                 logger.warning(f"No valid analysis data for token {tokenId}")
                 return None
-                
+
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if raiseOnThrottle and CrawlThrottledError.isRetryable(status):
+                raise CrawlThrottledError(status, e.response.headers.get("Retry-After")) from e
+            logger.error(f"Failed to execute token analysis: {str(e)}")
+            if raiseOnFailure:
+                raise
+            return None
         except Exception as e:
             logger.error(f"Failed to execute token analysis: {str(e)}")
+            if raiseOnFailure:
+                raise
             return None
 
     def persistWalletsInvestedData(self, items: List[WalletsInvested]):
@@ -122,10 +146,7 @@ class WalletsInvestedAction:
             with self.db.transaction() as cursor:
                 for item in items:
                     # Get existing record
-                    cursor.execute("""
-                        SELECT * FROM walletsinvested 
-                        WHERE tokenid = %s AND walletaddress = %s
-                    """, (item.tokenid, item.walletaddress))
+                    cursor.execute(EXISTING_WALLET_INVESTED_QUERY, (item.tokenid, item.walletaddress))
                     existing = cursor.fetchone()
 
                     if existing:
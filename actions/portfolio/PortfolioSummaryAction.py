@@ -285,64 +285,27 @@ class PortfolioSummaryAction:
             
         try:
             tokenIds = [item.tokenid for item in items]
-            existingRecords = self.db.portfolio.getTokenData(tokenIds)
-            existingMap = {record.tokenid: record for record in existingRecords}
             currentTime = datetime.now()
-            
-            updatedCount = 0
-            insertedCount = 0
-            reactivatedCount = 0
 
+            # A token listed twice in one response would make the upsert touch the
+            # same row twice; keep the last occurrence as the per-item loop effectively did
+            uniqueItems: Dict[str, PortfolioSummary] = {}
+            for item in items:
+                item.status = PortfolioStatus.ACTIVE.statuscode
+                uniqueItems[item.tokenid] = item
+
+            # History, inserts and updates for the whole batch go out as one statement
             with self.db.transaction() as cursor:
-                for item in items:
-                    try:
-                        # Ensure status is set to ACTIVE
-                        item.status = PortfolioStatus.ACTIVE.statuscode
-                        
-                        # Ensure createdat and updatedat are set
-                        if not hasattr(item, 'createdat') or item.createdat is None:
-                            item.createdat = currentTime
-                        if not hasattr(item, 'updatedat') or item.updatedat is None:
-                            item.updatedat = currentTime
-                        
-                        if item.tokenid in existingMap:
-                            # Insert history record first
-                            existingItem = existingMap[item.tokenid]
-                            
-                            # Check if we're reactivating an inactive token
-                            wasInactive = hasattr(existingItem, 'status') and existingItem.status != PortfolioStatus.ACTIVE.statuscode
-                            
-                            # Preserve original createdat from existing record
-                            if hasattr(existingItem, 'createdat') and existingItem.createdat is not None:
-                                item.createdat = existingItem.createdat
-                                
-                            self.db.portfolio.insertHistory(existingItem, cursor)
-                            
-                            # Then update current record
-                            self.db.portfolio.updateSummary(item, cursor)
-                            
-                            if wasInactive:
-                                reactivatedCount += 1
-                                logger.info(f"Reactivated existing record for token {item.tokenid} with name {item.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}")
-                            else:
-                                updatedCount += 1
-                                logger.info(f"Updated existing record for token {item.tokenid} with name {item.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}")
-                        else:
-                            # Insert new record
-                            self.db.portfolio.insertSummary(item, cursor)
-                            insertedCount += 1
-                            logger.info(f"Inserted new record for token {item.tokenid} with name {item.name} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}")
-                    except Exception as e:
-                        logger.error(f"Failed to persist item {item.tokenid} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}: {str(e)}")
-                        raise
+                stats = self.db.portfolio.upsertSummaries(list(uniqueItems.values()), cursor, currentTime)
 
-            logger.info(f"Successfully persisted {len(items)} items (updated: {updatedCount}, inserted: {insertedCount}, reactivated: {reactivatedCount}) at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}")
+            logger.debug(f"Persisted tokens {list(uniqueItems)} with market age {marketAge}")
+            logger.info(f"Successfully persisted {len(items)} items (updated: {stats['updated']}, inserted: {stats['inserted']}, reactivated: {stats['reactivated']}) at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} with market age {marketAge}")
             return {
                 "tokenIds": tokenIds,
                 "processed": len(items),
-                "updated": updatedCount, 
-                "inserted": insertedCount, 
-                "reactivated": reactivatedCount
+                "updated": stats["updated"],
+                "inserted": stats["inserted"],
+                "reactivated": stats["reactivated"]
             }
             
         except Exception as e:
@@ -1,14 +1,18 @@
 from config.Config import get_config
 from flask import Blueprint, jsonify, request
+from api.utils.responsecache import TAG_ATTENTION, cached_response
 from database.operations.PortfolioDB import PortfolioDB
 from database.attention.AttentionReportHandler import AttentionReportHandler
 from logs.logger import get_logger
+from api.utils.pagination import get_page_params
+from database.operations.ReportQuery import InvalidCursorError
 
 logger = get_logger(__name__)
 
 attention_report_bp = Blueprint('attention_report', __name__)
 
 @attention_report_bp.route('/api/reports/attention', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_ATTENTION, ttlSeconds=300)
 def get_attention_report():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -24,6 +28,14 @@ def get_attention_report():
         sortBy = request.args.get('sortBy', 'attentioncount')
         sortOrder = request.args.get('sortOrder', 'desc')
 
+        try:
+            limit, cursor = get_page_params()
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': f'Invalid pagination parameter: {str(e)}'
+            }), 400
+
         # Use the handler to get the data
         db = PortfolioDB()
         handler = AttentionReportHandler(db)
@@ -36,7 +48,7 @@ def get_attention_report():
                 'message': "Handler 'attention_report' not found"
             }), 500
                 
-        attentionData = handler.getAttentionReport(
+        page = handler.getAttentionReport(
             tokenId=tokenId,
             name=name,
             chain=chain,
@@ -44,17 +56,26 @@ def get_attention_report():
             minAttentionCount=minAttentionCount,
             maxAttentionCount=maxAttentionCount,
             sortBy=sortBy,
-            sortOrder=sortOrder
+            sortOrder=sortOrder,
+            limit=limit,
+            cursor=cursor
         )
+        attentionData = page.rows
 
         # Create standardized success response
         return jsonify({
             'status': 'success',
             'data': attentionData,
             'count': len(attentionData) if attentionData else 0,
+            'pagination': page.toDict(),
             'timestamp': db.get_current_timestamp()
         })
 
+    except InvalidCursorError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error in attention report API: {str(e)}")
         return jsonify({
@@ -63,6 +84,7 @@ def get_attention_report():
         }), 500
 
 @attention_report_bp.route('/api/reports/attention/history/<tokenId>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_ATTENTION, ttlSeconds=300)
 def get_attention_history(tokenId):
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -107,6 +129,7 @@ def get_attention_history(tokenId):
         }), 500
 
 @attention_report_bp.route('/api/reports/attention/filters', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_ATTENTION, ttlSeconds=300)
 def get_attention_filters():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
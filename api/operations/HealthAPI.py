@@ -1,6 +1,15 @@
 from config.Config import get_config
 from flask import Blueprint, jsonify
 from logs.logger import get_logger
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.PortfolioDB import PortfolioDB
+from actions.DexScreenerPriceCache import PriceCacheRegistry
+from api.utils.responsecache import ResponseCache
+from database.auth.ApiKeyLedger import ApiKeyLedger
+from actions.InvestmentDetailsPipeline import InvestmentDetailsPipeline
+from database.operations.TokenSnapshotCache import TokenSnapshotCache
+from framework.analyticsframework.StrategyConfigCache import StrategyConfigCache
+from framework.analyticsframework.PriceTriggerEngine import PriceTriggerEngine
 import time
 
 logger = get_logger(__name__)
@@ -33,4 +42,79 @@ def health_check():
             "database": "operational",
             "scheduler": "running" if _job_runner.scheduler.running else "stopped"
         }
-    }) 
\ No newline at end of file
+    })
+
+@health_bp.route('/health/dbpool', methods=['GET'])
+def db_pool_metrics():
+    """Expose shared database connection pool metrics (in-use, idle, wait time)"""
+    metrics = DatabaseConnectionManager().get_pool_metrics()
+    return jsonify({
+        "status": "initialized" if metrics else "not_initialized",
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "pool": metrics or {}
+    })
+
+@health_bp.route('/health/pricecache', methods=['GET'])
+def price_cache_metrics():
+    """Expose shared DexScreener price cache metrics (entries, hits, misses, coalesced)"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "caches": PriceCacheRegistry.get_metrics()
+    })
+
+@health_bp.route('/health/strategycache', methods=['GET'])
+def strategy_cache_metrics():
+    """Expose cached strategy configs and the check order of their compiled entry predicates"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cache": StrategyConfigCache.get_metrics()
+    })
+
+@health_bp.route('/health/pricetriggers', methods=['GET'])
+def price_trigger_metrics():
+    """Expose the price trigger index size, trigger counts and dispatch latency"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "engine": PriceTriggerEngine.shared().getMetrics()
+    })
+
+@health_bp.route('/health/snapshotcache', methods=['GET'])
+def snapshot_cache_metrics():
+    """Expose token snapshot cache metrics (entries, hits, misses, writes)"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cache": TokenSnapshotCache.shared().getMetrics()
+    })
+
+@health_bp.route('/health/responsecache', methods=['GET'])
+def response_cache_metrics():
+    """Expose report response cache metrics (hits, misses, 304s, invalidations)"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cache": ResponseCache.shared().getMetrics()
+    })
+
+@health_bp.route('/health/refreshqueue', methods=['GET'])
+def refresh_queue_metrics():
+    """Expose refresh queue depth per job (entities, never refreshed, leased, failing, oldest refresh)"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "jobs": PortfolioDB().refreshQueue.getQueueStats()
+    })
+
+@health_bp.route('/health/apikeyledger', methods=['GET'])
+def api_key_ledger_metrics():
+    """Expose API key ledger balances (by key id), hand-outs, rejections and flushes"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "enabled": bool(get_config().API_KEY_LEDGER_ENABLED),
+        "ledger": ApiKeyLedger.shared().getMetrics() if get_config().API_KEY_LEDGER_ENABLED else {}
+    })
+
+@health_bp.route('/health/investmentpipeline', methods=['GET'])
+def investment_pipeline_metrics():
+    """Expose the per-stage throughput of the last investment details pipeline run"""
+    return jsonify({
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "lastRun": InvestmentDetailsPipeline.getLastRunMetrics()
+    })
@@ -1,8 +1,11 @@
 from config.Config import get_config
 from flask import Blueprint, jsonify, request
+from api.utils.responsecache import TAG_PORTSUMMARY, cached_response
 from database.operations.PortfolioDB import PortfolioDB
 from database.portsummary.PortSummaryReportHandler import PortSummaryReportHandler
 from logs.logger import get_logger
+from api.utils.pagination import get_page_params
+from database.operations.ReportQuery import InvalidCursorError
 from datetime import datetime
 from actions.DexscrennerAction import DexScreenerAction
 import time
@@ -12,6 +15,7 @@ logger = get_logger(__name__)
 port_summary_report_bp = Blueprint('port_summary_report', __name__)
 
 @port_summary_report_bp.route('/api/reports/portsummary', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_PORTSUMMARY, ttlSeconds=30)
 def get_port_summary():
     if request.method == 'OPTIONS':
         return jsonify({}), 200
@@ -29,6 +33,14 @@ def get_port_summary():
         sortOrder = request.args.get('sort_order', 'desc')
         selectedTags = request.args.getlist('selected_tags')  # Get list of selected tags
         
+        try:
+            limit, cursor = get_page_params()
+        except ValueError as e:
+            return jsonify({
+                'status': 'error',
+                'message': f'Invalid pagination parameter: {str(e)}'
+            }), 400
+        
         # Log selected tags to help debugging
         if selectedTags:
             logger.info(f"Filtering by tags: {selectedTags}")
@@ -45,7 +57,7 @@ def get_port_summary():
                     'message': "Handler 'port_summary_report' not found"
                 }), 500
                 
-            portSummaryData = handler.getPortSummaryReport(
+            page = handler.getPortSummaryReport(
                 tokenId=tokenId,
                 name=name,
                 chainName=chainName,
@@ -55,8 +67,11 @@ def get_port_summary():
                 maxTokenAge=maxTokenAge,
                 sortBy=sortBy,
                 sortOrder=sortOrder,
-                selectedTags=selectedTags if selectedTags else None  # Pass selected tags to handler
+                selectedTags=selectedTags if selectedTags else None,  # Pass selected tags to handler
+                limit=limit,
+                cursor=cursor
             )
+            portSummaryData = page.rows
             
             # Initialize DexScreener action to fetch current prices
             dexScreener = DexScreenerAction()
@@ -111,9 +126,15 @@ def get_port_summary():
         # Return data as JSON
         return jsonify({
             "status": "success",
-            "data": portSummaryData
+            "data": portSummaryData,
+            "pagination": page.toDict()
         })
 
+    except InvalidCursorError as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error in port summary report API: {str(e)}", exc_info=True)
         return jsonify({
@@ -122,6 +143,7 @@ def get_port_summary():
         }), 500
 
 @port_summary_report_bp.route('/api/reports/portsummary/history/<token_id>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_PORTSUMMARY, ttlSeconds=300)
 def get_token_history(token_id):
     """Get historical data for a specific token to display in the overlay chart."""
     if request.method == 'OPTIONS':
@@ -49,7 +49,8 @@ def persistInvestmentDetailsForAllTopPNLTokens():
             logger.info("Successfully updated investment details for top/bottom performing tokens")
             return jsonify({
                 'status': 'success',
-                'message': 'Successfully updated investment details for top and bottom performing tokens of high PNL wallets'
+                'message': 'Successfully updated investment details for top and bottom performing tokens of high PNL wallets',
+                'metrics': action.lastPipelineMetrics
             })
         
         logger.error("Failed to update investment details for tokens")
@@ -122,7 +123,14 @@ def persistInvestmentDetailsForAllTopPNLTokensForASpecificWallet():
 
 @smwallet_top_pnl_token_investment_bp.route('/api/smwallettoppnltokeninvestment/persist/wallet/token', methods=['POST', 'OPTIONS'])
 def persistInvestmentDetailsForASpecificTokenHeldByASMWallet():
-    """Update a specific token for a specific wallet"""
+    """
+    Update a specific token for a specific wallet
+
+    Request Body:
+        wallet_address: Wallet address
+        token_address: Token address
+        full_resync: Recount the whole swap history instead of only new swaps (optional, default false)
+    """
     if request.method == 'OPTIONS':
         return jsonify({}), 200
         
@@ -130,6 +138,7 @@ def persistInvestmentDetailsForASpecificTokenHeldByASMWallet():
         data = request.get_json()
         walletAddress = data.get('wallet_address')
         tokenAddress = data.get('token_address')
+        fullResync = bool(data.get('full_resync', False))
         
         if not walletAddress or not tokenAddress:
             logger.warning("Wallet or token address missing in token investment details request")
@@ -154,7 +163,7 @@ def persistInvestmentDetailsForASpecificTokenHeldByASMWallet():
         db = PortfolioDB()
         action = SMWalletTopPNLTokensInvestmentDetailsAction(db)
         
-        success = action.findInvestmentDataForToken(walletAddress, tokenAddress, cookie=validCookies[0])
+        success = action.findInvestmentDataForToken(walletAddress, tokenAddress, cookie=validCookies[0], fullResync=fullResync)
         
         if success:
             logger.info(f"Successfully updated token {tokenAddress} for wallet {walletAddress}")
@@ -1,5 +1,6 @@
 from config.Config import get_config
 from flask import Blueprint, request, jsonify
+from api.utils.responsecache import TAG_SMARTMONEY, cached_response
 from database.operations.PortfolioDB import PortfolioDB
 from logs.logger import get_logger
 from api.utils.cors import add_cors_headers
@@ -10,6 +11,7 @@ logger = get_logger(__name__)
 smartMoneyPerformanceReportBp = Blueprint('smartMoneyPerformanceReport', __name__)
 
 @smartMoneyPerformanceReportBp.route('/api/reports/smartmoneyperformance', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_SMARTMONEY, ttlSeconds=300)
 def get_smart_money_performance():
     """
     Get Smart Money Performance Report with optional filters
@@ -23,6 +25,8 @@ def get_smart_money_performance():
         min_invested_amount: Minimum invested amount for win rate calculation (optional)
         sort_by: Field to sort by (default: profitandloss)
         sort_order: Sort order (asc or desc, default: desc)
+        limit: Maximum number of wallets to return (optional, default: all)
+        offset: Number of wallets to skip (default: 0)
         
     Returns:
         JSON response with report data
@@ -40,6 +44,8 @@ def get_smart_money_performance():
         min_invested_amount = request.args.get('min_invested_amount')
         sort_by = request.args.get('sort_by', 'profitandloss')
         sort_order = request.args.get('sort_order', 'desc')
+        limit = request.args.get('limit')
+        offset = request.args.get('offset', 0)
         
         # Convert numeric parameters
         try:
@@ -53,6 +59,9 @@ def get_smart_money_performance():
                 max_trade_count = int(max_trade_count)
             if min_invested_amount is not None:
                 min_invested_amount = float(min_invested_amount)
+            if limit is not None:
+                limit = int(limit)
+            offset = int(offset)
         except (ValueError, TypeError) as e:
             logger.error(f"Parameter conversion error: {str(e)}")
             return add_cors_headers(jsonify({
@@ -72,7 +81,9 @@ def get_smart_money_performance():
             maxTradeCount=max_trade_count,
             minInvestedAmount=min_invested_amount,
             sortBy=sort_by,
-            sortOrder=sort_order
+            sortOrder=sort_order,
+            limit=limit,
+            offset=offset
         )
         
         # Return response
@@ -86,6 +97,7 @@ def get_smart_money_performance():
         }), 500)
 
 @smartMoneyPerformanceReportBp.route('/api/reports/smartmoneyperformance/top', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_SMARTMONEY, ttlSeconds=300)
 def get_top_performers():
     """
     Get top performing wallets
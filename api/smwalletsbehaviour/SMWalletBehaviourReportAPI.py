@@ -3,6 +3,7 @@ from config.Config import get_config
 from flask import Blueprint, jsonify, request
 from database.operations.PortfolioDB import PortfolioDB
 from database.smwalletsbehaviour.SmartMoneyWalletBehaviourReportHandler import SmartMoneyWalletBehaviourReportHandler
+from database.operations.ReportQuery import InvalidCursorError
 from logs.logger import get_logger
 import time
 
@@ -65,9 +66,11 @@ def getAllWalletsBehaviourSummary():
     
     # Get pagination parameters from query string
     limit = request.args.get('limit', default=100, type=int)
-    offset = request.args.get('offset', default=0, type=int)
+    cursor = request.args.get('cursor') or None
+    # Older clients page with offset; it is still honoured when no cursor is given
+    offset = request.args.get('offset', default=None, type=int)
     
-    logger.info(f"Request received for all wallets behaviour summaries (limit: {limit}, offset: {offset})")
+    logger.info(f"Request received for all wallets behaviour summaries (limit: {limit}, cursor: {cursor}, offset: {offset})")
     
     try:
         # Initialize database connection and report handler
@@ -75,7 +78,8 @@ def getAllWalletsBehaviourSummary():
         report_handler = SmartMoneyWalletBehaviourReportHandler(db.conn_manager)
         
         # Get wallet behaviour summaries
-        wallet_summaries = report_handler.getAllWalletsBehaviourSummary(limit, offset)
+        page = report_handler.getAllWalletsBehaviourSummary(limit, cursor, offset)
+        wallet_summaries = page.rows
         executionTime = time.time() - startTime
         
         # Return successful response with wallet behaviour summaries
@@ -85,12 +89,19 @@ def getAllWalletsBehaviourSummary():
             "data": {
                 "summaries": wallet_summaries,
                 "count": len(wallet_summaries),
-                "limit": limit,
-                "offset": offset
+                "limit": page.limit,
+                "offset": offset or 0,
+                "nextCursor": page.nextCursor,
+                "totalEstimate": page.totalEstimate
             },
             "executionTime": f"{executionTime:.2f}s"
         })
         
+    except InvalidCursorError as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 400
     except Exception as e:
         executionTime = time.time() - startTime
         errorMessage = f"Failed to retrieve wallet behaviour summaries: {str(e)}"
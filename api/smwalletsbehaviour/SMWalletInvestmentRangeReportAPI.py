@@ -1,5 +1,6 @@
 from config.Config import get_config
 from flask import Blueprint, jsonify, request
+from api.utils.responsecache import TAG_SMARTMONEY, cached_response
 from database.operations.PortfolioDB import PortfolioDB
 from database.smwalletsbehaviour.SMWalletInvestmentRangeReportHandler import SMWalletInvestmentRangeReportHandler
 from logs.logger import get_logger
@@ -10,6 +11,7 @@ logger = get_logger(__name__)
 smwallet_investment_range_report_bp = Blueprint('smwallet_investment_range_report', __name__)
 
 @smwallet_investment_range_report_bp.route('/api/smwalletbehaviour/investmentrange/<wallet_address>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_SMARTMONEY, ttlSeconds=300)
 def get_wallet_investment_range_report(wallet_address):
     """
     Get investment range report for a specific wallet.
@@ -57,6 +59,7 @@ def get_wallet_investment_range_report(wallet_address):
         }), 500
 
 @smwallet_investment_range_report_bp.route('/api/smwalletbehaviour/investment-range-reports/top/<int:limit>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_SMARTMONEY, ttlSeconds=300)
 def get_top_wallets_investment_range_reports(limit):
     """
     Get investment range reports for top wallets by total PNL.
@@ -187,6 +190,7 @@ def get_batch_investment_range_reports():
         }), 500
 
 @smwallet_investment_range_report_bp.route('/api/smwalletbehaviour/tokens-by-range/<wallet_address>/<range_id>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_SMARTMONEY, ttlSeconds=300)
 def get_tokens_by_range(wallet_address, range_id):
     """
     Get tokens for a specific wallet and investment range.
@@ -1,8 +1,11 @@
 from config.Config import get_config
 from flask import Blueprint, request, jsonify
+from api.utils.responsecache import TAG_STRATEGY, cached_response
 from database.strategyreport.StrategyPerformanceHandler import StrategyPerformanceHandler
 from database.operations.PortfolioDB import PortfolioDB
 from logs.logger import get_logger
+from api.utils.pagination import get_page_params
+from database.operations.ReportQuery import InvalidCursorError
 import time
 from decimal import Decimal
 from typing import Dict, Any, Tuple, Optional, List, Callable
@@ -127,6 +130,7 @@ def ensure_pnl_calculations(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 # Route handlers
 @strategyperformance_bp.route('/api/reports/strategyperformance/config', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_STRATEGY, ttlSeconds=30)
 def strategy_config_report():
     """Endpoint to get strategy configuration report with performance metrics."""
     if request.method == "OPTIONS":
@@ -174,6 +178,7 @@ def strategy_config_report():
         }), 500
 
 @strategyperformance_bp.route('/api/reports/strategyperformance/executions', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_STRATEGY, ttlSeconds=30)
 def strategy_executions():
     """Endpoint to get all strategy executions."""
     if request.method == "OPTIONS":
@@ -184,13 +189,20 @@ def strategy_executions():
     try:
         # Extract query parameters
         params = extract_query_params()
+        try:
+            limit, cursor = get_page_params()
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "message": f"Invalid pagination parameter: {str(e)}"
+            }), 400
         
         # Connect to database and get handler
         with PortfolioDB() as db:
             handler = StrategyPerformanceHandler(db)
             
             # Use getAllExecutions instead of getStrategyExecutions for all executions with filters
-            executions = handler.getAllExecutions(
+            page = handler.getAllExecutions(
                 strategy_name=params["strategy_name"],
                 source=params["source"],
                 token_id=params["token_id"],
@@ -198,11 +210,13 @@ def strategy_executions():
                 min_realized_pnl=params["min_realized_pnl"],
                 min_total_pnl=params["min_total_pnl"],
                 sortBy=params["sort_by"] or DEFAULT_EXECUTION_SORT_BY,
-                sortOrder=params["sort_order"]
+                sortOrder=params["sort_order"],
+                limit=limit,
+                cursor=cursor
             )
             
             # Fix PNL calculations if needed
-            executions = ensure_pnl_calculations(executions)
+            executions = ensure_pnl_calculations(page.rows)
             
             # Return response
             processing_time = (time.time() - start_time) * 1000  # Convert to ms
@@ -212,9 +226,15 @@ def strategy_executions():
                 "status": "success",
                 "data": executions,
                 "count": len(executions),
+                "pagination": page.toDict(),
                 "timing": f"{processing_time:.2f}ms"
             })
             
+    except InvalidCursorError as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 400
     except Exception as e:
         logger.error(f"Error generating strategy executions report: {str(e)}", exc_info=True)
         return jsonify({
@@ -223,6 +243,7 @@ def strategy_executions():
         }), 500
 
 @strategyperformance_bp.route('/api/reports/strategyperformance/config/<int:strategy_id>/executions', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_STRATEGY, ttlSeconds=30)
 def strategy_executions_by_id(strategy_id):
     """Endpoint to get executions for a specific strategy by ID."""
     if request.method == "OPTIONS":
@@ -268,6 +289,7 @@ def strategy_executions_by_id(strategy_id):
         }), 500
 
 @strategyperformance_bp.route('/api/reports/strategyperformance/config/<int:strategy_id>', methods=['GET', 'OPTIONS'])
+@cached_response(TAG_STRATEGY, ttlSeconds=30)
 def strategy_config_by_id(strategy_id):
     """Endpoint to get strategy configuration details by ID."""
     if request.method == "OPTIONS":
@@ -0,0 +1,30 @@
+from config.Config import get_config
+from flask import request
+from typing import Optional, Tuple
+
+
+def get_page_params() -> Tuple[Optional[int], Optional[str]]:
+    """
+    Read keyset pagination parameters from the query string
+
+    Query Parameters:
+        limit: Page size (optional; without it the whole report is returned)
+        cursor: nextCursor returned with the previous page (optional)
+
+    Returns:
+        Tuple of (limit, cursor)
+
+    Raises:
+        ValueError: If limit is not a positive integer
+    """
+    limit = request.args.get('limit')
+    cursor = request.args.get('cursor') or None
+
+    if limit is not None and limit != '':
+        limit = int(limit)
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+    else:
+        limit = None
+
+    return limit, cursor
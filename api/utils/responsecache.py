@@ -0,0 +1,272 @@
+from config.Config import get_config
+"""
+Response cache for read-only report endpoints.
+
+A cached view stores its JSON body under (endpoint tag, tag generation, path,
+normalized query string) with a per-endpoint TTL, and answers If-None-Match with
+304 when the client already holds the current body. Ingest jobs call
+invalidate_tags once they have committed data; that bumps the tag's generation
+so every response built from older data stops matching, in every worker sharing
+the backend.
+
+Backends implement ResponseCacheBackend. The in-memory backend is per process;
+the Redis backend (optional `redis` package) is shared across gunicorn workers.
+"""
+
+from collections import OrderedDict
+from flask import Response, make_response, request
+from functools import wraps
+from logs.logger import get_logger
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import hashlib
+import json
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Tags invalidated by the ingest jobs; each names the data a report is built from
+TAG_PORTSUMMARY = "portsummary"
+TAG_ATTENTION = "attention"
+TAG_SMARTMONEY = "smartmoney"
+TAG_STRATEGY = "strategy"
+
+
+class ResponseCacheBackend:
+    """Storage for cached responses and per-tag generation counters"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttlSeconds: float) -> None:
+        raise NotImplementedError
+
+    def generation(self, tag: str) -> int:
+        raise NotImplementedError
+
+    def bumpGeneration(self, tag: str) -> int:
+        raise NotImplementedError
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Per-process backend: insertion-ordered dict with TTL and an entry limit"""
+
+    def __init__(self, maxEntries: int):
+        self.maxEntries = maxEntries
+        self._lock = threading.Lock()
+        # key -> (value, expiresAt monotonic), oldest first
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttlSeconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttlSeconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxEntries:
+                self._entries.popitem(last=False)
+
+    def generation(self, tag: str) -> int:
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def bumpGeneration(self, tag: str) -> int:
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            # Entries of older generations can no longer be read
+            prefix = f"{tag}:"
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+            return self._generations[tag]
+
+    def size(self) -> Optional[int]:
+        with self._lock:
+            return len(self._entries)
+
+
+class RedisResponseCacheBackend(ResponseCacheBackend):
+    """Backend shared by every worker; entries expire through Redis TTLs"""
+
+    KEY_PREFIX = "responsecache:"
+
+    def __init__(self, url: str):
+        import redis  # optional dependency, only needed for this backend
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttlSeconds: float) -> None:
+        self.client.set(self.KEY_PREFIX + key, value, ex=max(1, int(ttlSeconds)))
+
+    def generation(self, tag: str) -> int:
+        value = self.client.get(f"{self.KEY_PREFIX}generation:{tag}")
+        return int(value) if value else 0
+
+    def bumpGeneration(self, tag: str) -> int:
+        return int(self.client.incr(f"{self.KEY_PREFIX}generation:{tag}"))
+
+
+class ResponseCache:
+    """Process-wide response cache in front of the configured backend"""
+
+    _shared: Optional["ResponseCache"] = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, backend: ResponseCacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._notModified = 0
+        self._stores = 0
+        self._errors = 0
+        self._invalidations: Dict[str, int] = {}
+
+    @classmethod
+    def shared(cls) -> "ResponseCache":
+        """Get (creating from config on first use) the process-wide cache"""
+        if cls._shared is not None:
+            return cls._shared
+        with cls._sharedLock:
+            if cls._shared is None:
+                config = get_config()
+                backend: ResponseCacheBackend = InMemoryResponseCacheBackend(config.RESPONSE_CACHE_MAX_ENTRIES)
+                if config.RESPONSE_CACHE_BACKEND == "redis":
+                    try:
+                        backend = RedisResponseCacheBackend(config.RESPONSE_CACHE_REDIS_URL)
+                    except Exception as e:
+                        logger.warning(f"Redis response cache unavailable, using in-memory cache: {str(e)}")
+                cls._shared = cls(backend, enabled=bool(config.RESPONSE_CACHE_ENABLED))
+            return cls._shared
+
+    @staticmethod
+    def requestKey() -> str:
+        """Path plus query parameters sorted by name and value"""
+        args = sorted((name, sorted(request.args.getlist(name))) for name in request.args.keys())
+        return f"{request.path}?{json.dumps(args, separators=(',', ':'))}"
+
+    def _key(self, tag: str) -> str:
+        digest = hashlib.sha1(self.requestKey().encode("utf-8")).hexdigest()
+        return f"{tag}:{self.backend.generation(tag)}:{digest}"
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def serve(self, tag: str, ttlSeconds: float, view: Callable, *args, **kwargs) -> Response:
+        """Answer a GET from the cache, or run the view and cache a 200 response"""
+        try:
+            key = self._key(tag)
+            cached = self.backend.get(key)
+        except Exception as e:
+            # The cache must never take the report down
+            self._count("_errors")
+            logger.warning(f"Response cache lookup failed for {request.path}: {str(e)}")
+            return make_response(view(*args, **kwargs))
+
+        if cached is not None:
+            entry = json.loads(cached)
+            self._count("_hits")
+            return self._respond(entry, "HIT")
+
+        self._count("_misses")
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.direct_passthrough:
+            return response
+
+        body = response.get_data()
+        entry = {
+            "etag": hashlib.sha1(body).hexdigest(),
+            "body": body.decode("utf-8"),
+            "mimetype": response.mimetype,
+        }
+        try:
+            self.backend.set(key, json.dumps(entry).encode("utf-8"), ttlSeconds)
+            self._count("_stores")
+        except Exception as e:
+            self._count("_errors")
+            logger.warning(f"Failed to cache response for {request.path}: {str(e)}")
+        return self._respond(entry, "MISS")
+
+    def _respond(self, entry: Dict[str, Any], status: str) -> Response:
+        if request.if_none_match.contains(entry["etag"]):
+            self._count("_notModified")
+            response = Response(status=304)
+        else:
+            response = Response(entry["body"], mimetype=entry["mimetype"])
+        response.set_etag(entry["etag"])
+        # Browsers may keep the body but must revalidate it
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Cache"] = status
+        return response
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            try:
+                self.backend.bumpGeneration(tag)
+                with self._lock:
+                    self._invalidations[tag] = self._invalidations.get(tag, 0) + 1
+            except Exception as e:
+                self._count("_errors")
+                logger.warning(f"Failed to invalidate cached responses for {tag}: {str(e)}")
+
+    def getMetrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of cache usage.
+
+        Returns:
+            Dict: backend, entry count, hit / miss / 304 counters and invalidations per tag
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "backend": type(self.backend).__name__,
+                "entries": self.backend.size(),
+                "hits": self._hits,
+                "misses": self._misses,
+                "notModified": self._notModified,
+                "stores": self._stores,
+                "errors": self._errors,
+                "invalidations": dict(self._invalidations),
+                "hitRatio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def cached_response(tag: str, ttlSeconds: float):
+    """
+    Cache a GET view's 200 responses with ETag support
+
+    Args:
+        tag: Data the response is built from; invalidate_tags(tag) drops it
+        ttlSeconds: Longest time a response is served without rebuilding it
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache = ResponseCache.shared()
+            if request.method != "GET" or not cache.enabled or ttlSeconds <= 0:
+                return view(*args, **kwargs)
+            return cache.serve(tag, ttlSeconds, view, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def invalidate_tags(*tags: str) -> None:
+    """Drop every cached response built from the given data; call after the commit"""
+    ResponseCache.shared().invalidate(tags)
+    logger.info(f"Invalidated cached report responses for {', '.join(tags)}")
@@ -31,23 +31,7 @@ from logs.logger import get_logger
 from scheduler.JobRunner import JobRunner
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
-
-# Handler imports
-from database.attention.AttentionHandler import AttentionHandler
-from database.auth.CredentialsHandler import CredentialsHandler
-from database.auth.TokenHandler import TokenHandler
-from database.job.job_handler import JobHandler
-from database.notification.NotificationHandler import NotificationHandler
-from database.portsummary.PortfolioHandler import PortfolioHandler
-from database.pumpfun.PumpfunHandler import PumpFunHandler
-from database.smartmoneywallets.SMWalletTopPNLTokenHandler import SMWalletTopPNLTokenHandler
-from database.smartmoneywallets.SmartMoneyPerformanceReportHandler import SmartMoneyPerformanceReportHandler
-from database.smartmoneywallets.SmartMoneyWalletsHandler import SmartMoneyWalletsHandler
-from database.smwalletsbehaviour.SmartMoneyWalletBehaviourHandler import SmartMoneyWalletBehaviourHandler
-from database.volume.VolumeHandler import VolumeHandler
-from database.onchain.OnchainHandler import OnchainHandler
-from database.walletinvested.WalletsInvestedHandler import WalletsInvestedHandler
-from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
+from database.migrations.MigrationRunner import MigrationRunner
 
 # Blueprint imports
 from api.walletsinvested.WalletsInvestedAPI import wallets_invested_bp
@@ -86,73 +70,15 @@ logger = get_logger(__name__)
 
 def initialize_database():
     """
-    Initialize all database tables for job tracking and application data in a centralized manner.
-    
-    Creates:
-    - Job tracking tables: `job_locks`, `job_executions`
-    - Application-specific tables via handlers
+    Bring the database schema up to date in a centralized manner.
+
+    Applies every pending versioned migration from database/migrations/versions
+    exactly once (recorded in `schemaversion`). Handlers no longer run DDL on
+    construction, so this is the only place tables and indexes are created.
     """
-    config_instance = get_config()
     try:
-        # Initialize job tracking tables
-        conn = psycopg2.connect(
-            user=config_instance.DB_USER,
-            password=config_instance.DB_PASSWORD,
-            host=config_instance.DB_HOST,
-            port=config_instance.DB_PORT,
-            dbname=config_instance.DB_NAME,
-            sslmode=config_instance.DB_SSLMODE,
-            gssencmode=config_instance.DB_GSSENCMODE
-        )
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS job_locks (
-                    job_id TEXT PRIMARY KEY,
-                    locked_at TIMESTAMP NOT NULL,
-                    timeout INTEGER NOT NULL
-                )
-            """)
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS job_executions (
-                    id SERIAL PRIMARY KEY,
-                    job_id TEXT NOT NULL,
-                    start_time TIMESTAMP NOT NULL,
-                    end_time TIMESTAMP,
-                    status TEXT NOT NULL,
-                    error_message TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-        conn.commit()
-        conn.close()
-        logger.info("Job storage tables initialized successfully")
-
-        # Initialize application-specific tables
-        conn_manager = DatabaseConnectionManager()
-        handlers = {
-            'PortfolioHandler': PortfolioHandler,
-            'WalletsInvestedHandler': WalletsInvestedHandler,
-            'JobHandler': JobHandler,
-            'SmartMoneyWalletsHandler': SmartMoneyWalletsHandler,
-            'SMWalletTopPNLTokenHandler': SMWalletTopPNLTokenHandler,
-            'SmartMoneyPerformanceReportHandler': SmartMoneyPerformanceReportHandler,
-            'AttentionHandler': AttentionHandler,
-            'VolumeHandler': VolumeHandler,
-            'OnchainHandler': OnchainHandler,
-            'PumpFunHandler': PumpFunHandler,
-            'TokenHandler': TokenHandler,
-            'CredentialsHandler': CredentialsHandler,
-            'AnalyticsHandler': AnalyticsHandler,
-            'NotificationHandler': NotificationHandler,
-            'SmartMoneyWalletBehaviourHandler': SmartMoneyWalletBehaviourHandler
-        }
-        for name, handler_class in handlers.items():
-            try:
-                handler_class(conn_manager)
-                logger.info(f"{name} initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize {name}: {e}")
-        logger.info("Database initialization completed")
+        applied = MigrationRunner(DatabaseConnectionManager()).applyPendingMigrations()
+        logger.info(f"Database initialization completed ({len(applied)} migration(s) applied)")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         logger.warning("Continuing with limited functionality")
@@ -181,6 +107,7 @@ class PortfolioApp:
 
         # Setup database and scheduler
         initialize_database()
+        self.conn_manager = DatabaseConnectionManager()
         self.job_runner = JobRunner() if self._init_job_runner() else None
         self.is_shutting_down = threading.Event()
 
@@ -219,11 +146,10 @@ class PortfolioApp:
         """Configure request middleware for database connection management."""
         @self.app.before_request
         def ensure_db_connection():
-            """Ensure database connection pool is active before each request."""
-            conn_manager = DatabaseConnectionManager()
-            if conn_manager.is_pool_closed():
+            """Ensure the shared database connection pool is active before each request."""
+            if self.conn_manager.is_pool_closed():
                 logger.warning("Reinitializing closed connection pool")
-                conn_manager.reinitialize_pool_if_closed()
+                self.conn_manager.reinitialize_pool_if_closed()
 
     def _setup_healthcheck(self):
         """Add healthcheck endpoint for system monitoring."""
@@ -83,6 +83,16 @@ class Config:
     except ValueError:
         DB_POOL_RECYCLE = 1800
 
+    _DB_POOL_HEALTHCHECK_INTERVAL = os.getenv("DB_POOL_HEALTHCHECK_INTERVAL", "30")
+    try:
+        DB_POOL_HEALTHCHECK_INTERVAL = (
+            int(_DB_POOL_HEALTHCHECK_INTERVAL)
+            if _DB_POOL_HEALTHCHECK_INTERVAL and _DB_POOL_HEALTHCHECK_INTERVAL.strip()
+            else 30
+        )
+    except ValueError:
+        DB_POOL_HEALTHCHECK_INTERVAL = 30
+
     _DB_CONNECT_TIMEOUT = os.getenv("DB_CONNECT_TIMEOUT", "10")
     try:
         DB_CONNECT_TIMEOUT = (
@@ -117,6 +127,310 @@ class Config:
         "pump_fun_analysis": {"minute": "*/1"}
     }
 
+    # Token time-series retention (days); 0 keeps data forever.
+    # Raw history rows are only pruned once they have been folded into rollups.
+    _TIMESERIES_RAW_RETENTION_DAYS = os.getenv("TIMESERIES_RAW_RETENTION_DAYS", "0")
+    try:
+        TIMESERIES_RAW_RETENTION_DAYS = (
+            int(_TIMESERIES_RAW_RETENTION_DAYS)
+            if _TIMESERIES_RAW_RETENTION_DAYS and _TIMESERIES_RAW_RETENTION_DAYS.strip()
+            else 0
+        )
+    except ValueError:
+        TIMESERIES_RAW_RETENTION_DAYS = 0
+
+    # Applies to the 1m and 5m rollups; 1h rollups are kept
+    _TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS = os.getenv("TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS", "30")
+    try:
+        TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS = (
+            int(_TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS)
+            if _TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS and _TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS.strip()
+            else 30
+        )
+    except ValueError:
+        TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS = 30
+
+    # Rollups only fold history ids seen at least this long ago, so rows whose
+    # transaction commits after a higher id are not skipped; 0 disables the lag
+    _TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS = os.getenv("TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS", "300")
+    try:
+        TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS = (
+            int(_TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS)
+            if _TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS and _TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS.strip()
+            else 300
+        )
+    except ValueError:
+        TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS = 300
+
+    # DexScreener price cache (seconds); a TTL of 0 disables caching.
+    # Tokens the API returns nothing for are cached for the negative TTL.
+    _DEXSCREENER_PRICE_TTL_SECONDS = os.getenv("DEXSCREENER_PRICE_TTL_SECONDS", "30")
+    try:
+        DEXSCREENER_PRICE_TTL_SECONDS = (
+            int(_DEXSCREENER_PRICE_TTL_SECONDS)
+            if _DEXSCREENER_PRICE_TTL_SECONDS and _DEXSCREENER_PRICE_TTL_SECONDS.strip()
+            else 30
+        )
+    except ValueError:
+        DEXSCREENER_PRICE_TTL_SECONDS = 30
+
+    _DEXSCREENER_NEGATIVE_TTL_SECONDS = os.getenv("DEXSCREENER_NEGATIVE_TTL_SECONDS", "120")
+    try:
+        DEXSCREENER_NEGATIVE_TTL_SECONDS = (
+            int(_DEXSCREENER_NEGATIVE_TTL_SECONDS)
+            if _DEXSCREENER_NEGATIVE_TTL_SECONDS and _DEXSCREENER_NEGATIVE_TTL_SECONDS.strip()
+            else 120
+        )
+    except ValueError:
+        DEXSCREENER_NEGATIVE_TTL_SECONDS = 120
+
+    _DEXSCREENER_PRICE_CACHE_MAX_ENTRIES = os.getenv("DEXSCREENER_PRICE_CACHE_MAX_ENTRIES", "50000")
+    try:
+        DEXSCREENER_PRICE_CACHE_MAX_ENTRIES = (
+            int(_DEXSCREENER_PRICE_CACHE_MAX_ENTRIES)
+            if _DEXSCREENER_PRICE_CACHE_MAX_ENTRIES and _DEXSCREENER_PRICE_CACHE_MAX_ENTRIES.strip()
+            else 50000
+        )
+    except ValueError:
+        DEXSCREENER_PRICE_CACHE_MAX_ENTRIES = 50000
+
+    # DexScreener HTTP client: concurrent batch requests, the shared per-minute
+    # request budget (DexScreener allows 300/min on the token endpoints) and retries
+    _DEXSCREENER_MAX_WORKERS = os.getenv("DEXSCREENER_MAX_WORKERS", "4")
+    try:
+        DEXSCREENER_MAX_WORKERS = (
+            int(_DEXSCREENER_MAX_WORKERS)
+            if _DEXSCREENER_MAX_WORKERS and _DEXSCREENER_MAX_WORKERS.strip()
+            else 4
+        )
+    except ValueError:
+        DEXSCREENER_MAX_WORKERS = 4
+
+    _DEXSCREENER_REQUESTS_PER_MINUTE = os.getenv("DEXSCREENER_REQUESTS_PER_MINUTE", "300")
+    try:
+        DEXSCREENER_REQUESTS_PER_MINUTE = (
+            int(_DEXSCREENER_REQUESTS_PER_MINUTE)
+            if _DEXSCREENER_REQUESTS_PER_MINUTE and _DEXSCREENER_REQUESTS_PER_MINUTE.strip()
+            else 300
+        )
+    except ValueError:
+        DEXSCREENER_REQUESTS_PER_MINUTE = 300
+
+    _DEXSCREENER_MAX_RETRIES = os.getenv("DEXSCREENER_MAX_RETRIES", "3")
+    try:
+        DEXSCREENER_MAX_RETRIES = (
+            int(_DEXSCREENER_MAX_RETRIES)
+            if _DEXSCREENER_MAX_RETRIES and _DEXSCREENER_MAX_RETRIES.strip()
+            else 3
+        )
+    except ValueError:
+        DEXSCREENER_MAX_RETRIES = 3
+
+    # Execution monitor: the schedule interval a cycle should fit in (a slower
+    # cycle is logged as a warning) and workers for pending investments
+    _EXECUTION_MONITOR_INTERVAL_SECONDS = os.getenv("EXECUTION_MONITOR_INTERVAL_SECONDS", "60")
+    try:
+        EXECUTION_MONITOR_INTERVAL_SECONDS = (
+            int(_EXECUTION_MONITOR_INTERVAL_SECONDS)
+            if _EXECUTION_MONITOR_INTERVAL_SECONDS and _EXECUTION_MONITOR_INTERVAL_SECONDS.strip()
+            else 60
+        )
+    except ValueError:
+        EXECUTION_MONITOR_INTERVAL_SECONDS = 60
+
+    _EXECUTION_MONITOR_MAX_WORKERS = os.getenv("EXECUTION_MONITOR_MAX_WORKERS", "4")
+    try:
+        EXECUTION_MONITOR_MAX_WORKERS = (
+            int(_EXECUTION_MONITOR_MAX_WORKERS)
+            if _EXECUTION_MONITOR_MAX_WORKERS and _EXECUTION_MONITOR_MAX_WORKERS.strip()
+            else 4
+        )
+    except ValueError:
+        EXECUTION_MONITOR_MAX_WORKERS = 4
+
+    # Settle stop losses and profit targets from price updates (PriceTriggerEngine)
+    # instead of the execution monitor's per-cycle evaluation (1 = on, 0 = off)
+    _PRICE_TRIGGER_ENGINE_ENABLED = os.getenv("PRICE_TRIGGER_ENGINE_ENABLED", "1")
+    try:
+        PRICE_TRIGGER_ENGINE_ENABLED = (
+            int(_PRICE_TRIGGER_ENGINE_ENABLED)
+            if _PRICE_TRIGGER_ENGINE_ENABLED and _PRICE_TRIGGER_ENGINE_ENABLED.strip()
+            else 1
+        )
+    except ValueError:
+        PRICE_TRIGGER_ENGINE_ENABLED = 1
+
+    # Token snapshot cache written through by the volume / pump.fun ingest
+    # (seconds, entries); a TTL of 0 disables it
+    _TOKEN_SNAPSHOT_TTL_SECONDS = os.getenv("TOKEN_SNAPSHOT_TTL_SECONDS", "300")
+    try:
+        TOKEN_SNAPSHOT_TTL_SECONDS = (
+            int(_TOKEN_SNAPSHOT_TTL_SECONDS)
+            if _TOKEN_SNAPSHOT_TTL_SECONDS and _TOKEN_SNAPSHOT_TTL_SECONDS.strip()
+            else 300
+        )
+    except ValueError:
+        TOKEN_SNAPSHOT_TTL_SECONDS = 300
+
+    _TOKEN_SNAPSHOT_MAX_ENTRIES = os.getenv("TOKEN_SNAPSHOT_MAX_ENTRIES", "20000")
+    try:
+        TOKEN_SNAPSHOT_MAX_ENTRIES = (
+            int(_TOKEN_SNAPSHOT_MAX_ENTRIES)
+            if _TOKEN_SNAPSHOT_MAX_ENTRIES and _TOKEN_SNAPSHOT_MAX_ENTRIES.strip()
+            else 20000
+        )
+    except ValueError:
+        TOKEN_SNAPSHOT_MAX_ENTRIES = 20000
+
+    # Report API response cache: "memory" (per process) or "redis" (shared by
+    # every gunicorn worker); entries above the limit are evicted oldest first
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_REDIS_URL = os.getenv("RESPONSE_CACHE_REDIS_URL", "redis://localhost:6379/0")
+
+    _RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "1")
+    try:
+        RESPONSE_CACHE_ENABLED = (
+            int(_RESPONSE_CACHE_ENABLED)
+            if _RESPONSE_CACHE_ENABLED and _RESPONSE_CACHE_ENABLED.strip()
+            else 1
+        )
+    except ValueError:
+        RESPONSE_CACHE_ENABLED = 1
+
+    _RESPONSE_CACHE_MAX_ENTRIES = os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2000")
+    try:
+        RESPONSE_CACHE_MAX_ENTRIES = (
+            int(_RESPONSE_CACHE_MAX_ENTRIES)
+            if _RESPONSE_CACHE_MAX_ENTRIES and _RESPONSE_CACHE_MAX_ENTRIES.strip()
+            else 2000
+        )
+    except ValueError:
+        RESPONSE_CACHE_MAX_ENTRIES = 2000
+
+    # Cookie-sharded crawls: seconds between requests of one cookie
+    _WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS = os.getenv("WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS", "20")
+    try:
+        WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS = (
+            int(_WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS)
+            if _WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS and _WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS.strip()
+            else 20
+        )
+    except ValueError:
+        WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS = 20
+
+    _SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS = os.getenv("SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS", "35")
+    try:
+        SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS = (
+            int(_SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS)
+            if _SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS and _SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS.strip()
+            else 35
+        )
+    except ValueError:
+        SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS = 35
+
+    _CRAWL_MAX_ATTEMPTS = os.getenv("CRAWL_MAX_ATTEMPTS", "3")
+    try:
+        CRAWL_MAX_ATTEMPTS = (
+            int(_CRAWL_MAX_ATTEMPTS)
+            if _CRAWL_MAX_ATTEMPTS and _CRAWL_MAX_ATTEMPTS.strip()
+            else 3
+        )
+    except ValueError:
+        CRAWL_MAX_ATTEMPTS = 3
+
+    # Refresh queue: entities leased per batch (per cookie for crawls) and lease length
+    _REFRESH_QUEUE_BATCH_SIZE = os.getenv("REFRESH_QUEUE_BATCH_SIZE", "20")
+    try:
+        REFRESH_QUEUE_BATCH_SIZE = (
+            int(_REFRESH_QUEUE_BATCH_SIZE)
+            if _REFRESH_QUEUE_BATCH_SIZE and _REFRESH_QUEUE_BATCH_SIZE.strip()
+            else 20
+        )
+    except ValueError:
+        REFRESH_QUEUE_BATCH_SIZE = 20
+
+    _REFRESH_QUEUE_LEASE_SECONDS = os.getenv("REFRESH_QUEUE_LEASE_SECONDS", "1800")
+    try:
+        REFRESH_QUEUE_LEASE_SECONDS = (
+            int(_REFRESH_QUEUE_LEASE_SECONDS)
+            if _REFRESH_QUEUE_LEASE_SECONDS and _REFRESH_QUEUE_LEASE_SECONDS.strip()
+            else 1800
+        )
+    except ValueError:
+        REFRESH_QUEUE_LEASE_SECONDS = 1800
+
+    # API key credit ledger: hand out keys in process, write spent credits back in batches
+    _API_KEY_LEDGER_ENABLED = os.getenv("API_KEY_LEDGER_ENABLED", "1")
+    try:
+        API_KEY_LEDGER_ENABLED = (
+            int(_API_KEY_LEDGER_ENABLED)
+            if _API_KEY_LEDGER_ENABLED and _API_KEY_LEDGER_ENABLED.strip()
+            else 1
+        )
+    except ValueError:
+        API_KEY_LEDGER_ENABLED = 1
+
+    _API_KEY_LEDGER_FLUSH_SECONDS = os.getenv("API_KEY_LEDGER_FLUSH_SECONDS", "15")
+    try:
+        API_KEY_LEDGER_FLUSH_SECONDS = (
+            int(_API_KEY_LEDGER_FLUSH_SECONDS)
+            if _API_KEY_LEDGER_FLUSH_SECONDS and _API_KEY_LEDGER_FLUSH_SECONDS.strip()
+            else 15
+        )
+    except ValueError:
+        API_KEY_LEDGER_FLUSH_SECONDS = 15
+
+    # Investment details pipeline: stage concurrency, queue bound between stages, Solscan rate
+    _INVESTMENT_PIPELINE_COUNT_WORKERS = os.getenv("INVESTMENT_PIPELINE_COUNT_WORKERS", "4")
+    try:
+        INVESTMENT_PIPELINE_COUNT_WORKERS = (
+            int(_INVESTMENT_PIPELINE_COUNT_WORKERS)
+            if _INVESTMENT_PIPELINE_COUNT_WORKERS and _INVESTMENT_PIPELINE_COUNT_WORKERS.strip()
+            else 4
+        )
+    except ValueError:
+        INVESTMENT_PIPELINE_COUNT_WORKERS = 4
+
+    _INVESTMENT_PIPELINE_FETCH_WORKERS = os.getenv("INVESTMENT_PIPELINE_FETCH_WORKERS", "4")
+    try:
+        INVESTMENT_PIPELINE_FETCH_WORKERS = (
+            int(_INVESTMENT_PIPELINE_FETCH_WORKERS)
+            if _INVESTMENT_PIPELINE_FETCH_WORKERS and _INVESTMENT_PIPELINE_FETCH_WORKERS.strip()
+            else 4
+        )
+    except ValueError:
+        INVESTMENT_PIPELINE_FETCH_WORKERS = 4
+
+    _INVESTMENT_PIPELINE_QUEUE_SIZE = os.getenv("INVESTMENT_PIPELINE_QUEUE_SIZE", "50")
+    try:
+        INVESTMENT_PIPELINE_QUEUE_SIZE = (
+            int(_INVESTMENT_PIPELINE_QUEUE_SIZE)
+            if _INVESTMENT_PIPELINE_QUEUE_SIZE and _INVESTMENT_PIPELINE_QUEUE_SIZE.strip()
+            else 50
+        )
+    except ValueError:
+        INVESTMENT_PIPELINE_QUEUE_SIZE = 50
+
+    _INVESTMENT_PIPELINE_WRITE_BATCH_SIZE = os.getenv("INVESTMENT_PIPELINE_WRITE_BATCH_SIZE", "25")
+    try:
+        INVESTMENT_PIPELINE_WRITE_BATCH_SIZE = (
+            int(_INVESTMENT_PIPELINE_WRITE_BATCH_SIZE)
+            if _INVESTMENT_PIPELINE_WRITE_BATCH_SIZE and _INVESTMENT_PIPELINE_WRITE_BATCH_SIZE.strip()
+            else 25
+        )
+    except ValueError:
+        INVESTMENT_PIPELINE_WRITE_BATCH_SIZE = 25
+
+    _SOLSCAN_REQUESTS_PER_MINUTE = os.getenv("SOLSCAN_REQUESTS_PER_MINUTE", "60")
+    try:
+        SOLSCAN_REQUESTS_PER_MINUTE = (
+            int(_SOLSCAN_REQUESTS_PER_MINUTE)
+            if _SOLSCAN_REQUESTS_PER_MINUTE and _SOLSCAN_REQUESTS_PER_MINUTE.strip()
+            else 60
+        )
+    except ValueError:
+        SOLSCAN_REQUESTS_PER_MINUTE = 60
+
     VOLUME_COOKIE = os.getenv("VOLUME_COOKIE", "default_volume_cookie")
     PUMPFUN_COOKIE = os.getenv("PUMPFUN_COOKIE", "default_pump_fun_cookie")
 
@@ -171,6 +485,7 @@ class Config:
             "DB_MAX_OVERFLOW": self.DB_MAX_OVERFLOW,
             "DB_POOL_TIMEOUT": self.DB_POOL_TIMEOUT,
             "DB_POOL_RECYCLE": self.DB_POOL_RECYCLE,
+            "DB_POOL_HEALTHCHECK_INTERVAL": self.DB_POOL_HEALTHCHECK_INTERVAL,
             "API_HOST": self.API_HOST,
             "API_PORT": self.API_PORT,
             "API_BASE_URL": self.API_BASE_URL,
@@ -178,6 +493,35 @@ class Config:
             "LOG_LEVEL": self.LOG_LEVEL,
             "LOG_FILE": self.LOG_FILE,
             "JOBS_DB_PATH": self.JOBS_DB_PATH,
+            "TIMESERIES_RAW_RETENTION_DAYS": self.TIMESERIES_RAW_RETENTION_DAYS,
+            "TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS": self.TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS,
+            "TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS": self.TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS,
+            "DEXSCREENER_PRICE_TTL_SECONDS": self.DEXSCREENER_PRICE_TTL_SECONDS,
+            "DEXSCREENER_NEGATIVE_TTL_SECONDS": self.DEXSCREENER_NEGATIVE_TTL_SECONDS,
+            "DEXSCREENER_PRICE_CACHE_MAX_ENTRIES": self.DEXSCREENER_PRICE_CACHE_MAX_ENTRIES,
+            "DEXSCREENER_MAX_WORKERS": self.DEXSCREENER_MAX_WORKERS,
+            "DEXSCREENER_REQUESTS_PER_MINUTE": self.DEXSCREENER_REQUESTS_PER_MINUTE,
+            "DEXSCREENER_MAX_RETRIES": self.DEXSCREENER_MAX_RETRIES,
+            "EXECUTION_MONITOR_INTERVAL_SECONDS": self.EXECUTION_MONITOR_INTERVAL_SECONDS,
+            "EXECUTION_MONITOR_MAX_WORKERS": self.EXECUTION_MONITOR_MAX_WORKERS,
+            "PRICE_TRIGGER_ENGINE_ENABLED": self.PRICE_TRIGGER_ENGINE_ENABLED,
+            "TOKEN_SNAPSHOT_TTL_SECONDS": self.TOKEN_SNAPSHOT_TTL_SECONDS,
+            "TOKEN_SNAPSHOT_MAX_ENTRIES": self.TOKEN_SNAPSHOT_MAX_ENTRIES,
+            "RESPONSE_CACHE_BACKEND": self.RESPONSE_CACHE_BACKEND,
+            "RESPONSE_CACHE_ENABLED": self.RESPONSE_CACHE_ENABLED,
+            "RESPONSE_CACHE_MAX_ENTRIES": self.RESPONSE_CACHE_MAX_ENTRIES,
+            "WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS": self.WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS,
+            "SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS": self.SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS,
+            "CRAWL_MAX_ATTEMPTS": self.CRAWL_MAX_ATTEMPTS,
+            "REFRESH_QUEUE_BATCH_SIZE": self.REFRESH_QUEUE_BATCH_SIZE,
+            "REFRESH_QUEUE_LEASE_SECONDS": self.REFRESH_QUEUE_LEASE_SECONDS,
+            "API_KEY_LEDGER_ENABLED": self.API_KEY_LEDGER_ENABLED,
+            "API_KEY_LEDGER_FLUSH_SECONDS": self.API_KEY_LEDGER_FLUSH_SECONDS,
+            "INVESTMENT_PIPELINE_COUNT_WORKERS": self.INVESTMENT_PIPELINE_COUNT_WORKERS,
+            "INVESTMENT_PIPELINE_FETCH_WORKERS": self.INVESTMENT_PIPELINE_FETCH_WORKERS,
+            "INVESTMENT_PIPELINE_QUEUE_SIZE": self.INVESTMENT_PIPELINE_QUEUE_SIZE,
+            "INVESTMENT_PIPELINE_WRITE_BATCH_SIZE": self.INVESTMENT_PIPELINE_WRITE_BATCH_SIZE,
+            "SOLSCAN_REQUESTS_PER_MINUTE": self.SOLSCAN_REQUESTS_PER_MINUTE,
         }
 
 
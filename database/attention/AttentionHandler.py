@@ -9,6 +9,7 @@ from database.operations.schema import AttentionData, AttentionStatusEnum
 import pytz
 import json
 from sqlalchemy import text
+from psycopg2.extras import execute_values
 
 logger = get_logger(__name__)
 
@@ -23,165 +24,7 @@ class AttentionHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._createTables()
     
-    def _createTables(self):
-        """Creates all required tables for attention tracking"""
-        try:
-            config = get_config()
-            
-            # Create registry table
-            self._createAttentionRegistryTable()
-            
-            # Create attention data table
-            self._createAttentionDataTable()
-            
-            # Create history table
-            self._createAttentionHistoryTable()
-            
-        except Exception as e:
-            logger.error(f"Error creating attention tables: {e}")
-            # Don't re-raise to allow initialization to continue
-    
-    def _createAttentionRegistryTable(self):
-        """Create the attention token registry table"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                config = get_config()
-                
-                if config.DB_TYPE == 'postgres':
-                    # PostgreSQL syntax
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiontokenregistry (
-                            id SERIAL PRIMARY KEY,
-                            tokenid TEXT NOT NULL UNIQUE,
-                            name TEXT NOT NULL,
-                            chain TEXT NOT NULL,
-                            firstseenat TIMESTAMP NOT NULL,
-                            lastseenat TIMESTAMP NOT NULL,
-                            currentstatus VARCHAR(20) DEFAULT 'NEW',
-                            attentioncount INT DEFAULT 1,
-                            createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    '''))
-                else:
-                    # SQLite syntax
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiontokenregistry (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            tokenid VARCHAR(255) UNIQUE,
-                            name VARCHAR(100),
-                            chain VARCHAR(50),
-                            firstseenat TIMESTAMP NOT NULL,
-                            lastseenat TIMESTAMP NOT NULL,
-                            currentstatus VARCHAR(20) DEFAULT 'NEW',
-                            attentioncount INT DEFAULT 1,
-                            createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    '''))
-        except Exception as e:
-            logger.error(f"Error creating attention registry table: {e}")
-    
-    def _createAttentionDataTable(self):
-        """Create the attention data table"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                config = get_config()
-                
-                if config.DB_TYPE == 'postgres':
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiondata (
-                            id SERIAL PRIMARY KEY,
-                            tokenid TEXT NOT NULL,
-                            name TEXT,
-                            chain TEXT,
-                            attentionscore NUMERIC NOT NULL,
-                            change1hbps INTEGER,
-                            change1dbps INTEGER,
-                            change7dbps INTEGER,
-                            change30dbps INTEGER,
-                            recordedat TIMESTAMP NOT NULL,
-                            datasource VARCHAR(50),
-                            registryid INTEGER,
-                            createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            FOREIGN KEY (tokenid) REFERENCES attentiontokenregistry(tokenid) ON DELETE CASCADE
-                        )
-                    '''))
-                else:
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiondata (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            tokenid VARCHAR(255),
-                            name VARCHAR(100),
-                            chain VARCHAR(50),
-                            attentionscore TEXT NOT NULL,
-                            change1hbps INTEGER,
-                            change1dbps INTEGER,
-                            change7dbps INTEGER,
-                            change30dbps INTEGER,
-                            recordedat TIMESTAMP NOT NULL,
-                            datasource VARCHAR(50),
-                            registryid INTEGER,
-                            createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            FOREIGN KEY (registryid) REFERENCES attentiontokenregistry(id)
-                        )
-                    '''))
-        except Exception as e:
-            logger.error(f"Error creating attention data table: {e}")
-    
-    def _createAttentionHistoryTable(self):
-        """Create the attention history table"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                config = get_config()
-                
-                if config.DB_TYPE == 'postgres':
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiondatahistory (
-                            historyid SERIAL PRIMARY KEY,
-                            attentiondataid INTEGER NOT NULL,
-                            tokenid TEXT NOT NULL,
-                            name TEXT,
-                            chain TEXT,
-                            attentionscore NUMERIC NOT NULL,
-                            change1hbps INTEGER,
-                            change1dbps INTEGER,
-                            change7dbps INTEGER,
-                            change30dbps INTEGER,
-                            recordedat TIMESTAMP NOT NULL,
-                            datasource VARCHAR(50),
-                            createdat TIMESTAMP NOT NULL,
-                            updatedat TIMESTAMP NOT NULL,
-                            FOREIGN KEY (tokenid) REFERENCES attentiontokenregistry(tokenid) ON DELETE CASCADE
-                        )
-                    '''))
-                else:
-                    cursor.execute(text('''
-                        CREATE TABLE IF NOT EXISTS attentiondatahistory (
-                            historyid INTEGER PRIMARY KEY AUTOINCREMENT,
-                            attentiondataid INTEGER NOT NULL,
-                            tokenid VARCHAR(255),
-                            name VARCHAR(100),
-                            chain VARCHAR(50),
-                            attentionscore TEXT NOT NULL,
-                            change1hbps INTEGER,
-                            change1dbps INTEGER,
-                            change7dbps INTEGER,
-                            change30dbps INTEGER,
-                            recordedat TIMESTAMP NOT NULL,
-                            datasource VARCHAR(50),
-                            createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            FOREIGN KEY (attentiondataid) REFERENCES attentiondata(id)
-                        )
-                    '''))
-        except Exception as e:
-            logger.error(f"Error creating attention history table: {e}")
-
     def updateTokenRegistry(self, data: AttentionData) -> Optional[int]:
         """
         Update or create token registry entry
@@ -302,176 +145,153 @@ class AttentionHandler(BaseDBHandler):
         Args:
             data: Attention data to store
         """
-        try:
-            config = get_config()
-            currentTime = datetime.now()
+        self.storeAttentionDataBatch([data])
+
+    def storeAttentionDataBatch(self, items: List[AttentionData]) -> Dict[str, int]:
+        """
+        Register tokens and store current attention data for a whole batch in one transaction
+        
+        For every token: the registry entry is created or refreshed (count + 1,
+        INACTIVE tokens go back to NEW), the previous attentiondata row is copied
+        to history and overwritten with the new score and its hourly change, or a
+        new row is inserted when the token has none yet.
+        
+        Args:
+            items: Attention data items; items without a tokenid are skipped and
+                   a token listed twice keeps its last occurrence
             
+        Returns:
+            Dict: inserted, updated and skipped counts
+        """
+        uniqueItems = {item.tokenid: item for item in items if item.tokenid}
+        skipped = len(items) - len(uniqueItems)
+        if skipped:
+            logger.warning(f"Skipping {skipped} attention items without a token ID or repeated in the batch")
+        if not uniqueItems:
+            return {"inserted": 0, "updated": 0, "skipped": skipped}
+
+        currentTime = datetime.now()
+        tokenIds = list(uniqueItems)
+
+        try:
             with self.conn_manager.transaction() as cursor:
-                # Step 1: Update or create token registry entry to get registry ID
-                registry_id = None
-                if data.tokenid:
-                    registry_id = self.updateTokenRegistry(data)
-                
-                # Step 2: Get the last record for this token (for change calculation)
-                lastRecord = None
-                if data.tokenid:
-                    lastRecord = self._getLastAttentionRecord(cursor, data.tokenid)
-                
-                # Step 3: Calculate hourly change if previous record exists
-                change1hbps = self._calculateHourlyChange(lastRecord, data.attentionscore)
-                
-                # Step 4: If we have a previous record, store it in history
-                if lastRecord:
-                    self._persistRecordToHistory(cursor, lastRecord)
-                    logger.info(f"Stored previous record (ID: {lastRecord['id']}) in history for token {data.tokenid or data.name}")
-                    
-                    # Step 5a: Update the existing record
-                    if config.DB_TYPE == 'postgres':
-                        cursor.execute(text("""
-                            UPDATE attentiondata SET
-                                attentionscore = %s,
-                                change1hbps = %s,
-                                change1dbps = %s,
-                                change7dbps = %s,
-                                change30dbps = %s,
-                                datasource = %s,
-                                registryid = %s,
-                                updatedat = %s
-                            WHERE id = %s
-                        """), (
-                            str(data.attentionscore), 
-                            change1hbps,
-                            data.change1dbps, 
-                            data.change7dbps,
-                            data.change30dbps, 
-                            data.datasource,
-                            registry_id,
-                            currentTime,
-                            lastRecord['id']
-                        ))
-                    else:
-                        cursor.execute("""
-                            UPDATE attentiondata SET
-                                attentionscore = ?,
-                                change1hbps = ?,
-                                change1dbps = ?,
-                                change7dbps = ?,
-                                change30dbps = ?,
-                                datasource = ?,
-                                registryid = ?,
-                                updatedat = ?
-                            WHERE id = ?
-                        """, (
-                            str(data.attentionscore), 
-                            change1hbps,
-                            data.change1dbps, 
-                            data.change7dbps,
-                            data.change30dbps, 
-                            data.datasource,
-                            registry_id,
-                            currentTime,
-                            lastRecord['id']
-                        ))
-                    
-                    logger.info(f"Updated existing record (ID: {lastRecord['id']}) for token {data.tokenid or data.name}")
-                else:
-                    # Step 5b: Insert a new record if no previous record exists
-                    if config.DB_TYPE == 'postgres':
-                        cursor.execute(text("""
-                            INSERT INTO attentiondata (
-                                tokenid, name, chain,
-                                attentionscore, change1hbps,
-                                change1dbps, change7dbps,
-                                change30dbps, recordedat,
-                                datasource, registryid,
-                                createdat, updatedat
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """), (
-                            data.tokenid if data.tokenid else None, 
-                            data.name if data.name else None, 
-                            data.chain if data.chain else None,
-                            str(data.attentionscore), 
-                            change1hbps,
-                            data.change1dbps, 
-                            data.change7dbps,
-                            data.change30dbps, 
-                            data.recordedat,
-                            data.datasource,
-                            registry_id,
-                            currentTime,
-                            currentTime
+                registryIds = self._upsertTokenRegistryBatch(cursor, uniqueItems.values(), currentTime)
+
+                # Latest record of every token in one pass over the index
+                cursor.execute("""
+                    SELECT DISTINCT ON (tokenid) *
+                    FROM attentiondata
+                    WHERE tokenid = ANY(%s)
+                    ORDER BY tokenid, recordedat DESC
+                """, (tokenIds,))
+                lastRecords = {row['tokenid']: dict(row) for row in cursor.fetchall()}
+
+                updateRows = []
+                insertRows = []
+                for tokenId, data in uniqueItems.items():
+                    lastRecord = lastRecords.get(tokenId)
+                    change1hbps = self._calculateHourlyChange(lastRecord, data.attentionscore)
+                    if lastRecord:
+                        updateRows.append((
+                            lastRecord['id'], str(data.attentionscore), change1hbps,
+                            data.change1dbps, data.change7dbps, data.change30dbps,
+                            data.datasource, registryIds.get(tokenId)
                         ))
                     else:
-                        cursor.execute("""
-                            INSERT INTO attentiondata (
-                                tokenid, name, chain,
-                                attentionscore, change1hbps,
-                                change1dbps, change7dbps,
-                                change30dbps, recordedat,
-                                datasource, registryid,
-                                createdat, updatedat
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            data.tokenid if data.tokenid else None, 
-                            data.name if data.name else None, 
-                            data.chain if data.chain else None,
-                            str(data.attentionscore), 
-                            change1hbps,
-                            data.change1dbps, 
-                            data.change7dbps,
-                            data.change30dbps, 
-                            data.recordedat,
-                            data.datasource,
-                            registry_id,
-                            currentTime,
-                            currentTime
+                        insertRows.append((
+                            tokenId, data.name or None, data.chain or None,
+                            str(data.attentionscore), change1hbps,
+                            data.change1dbps, data.change7dbps, data.change30dbps,
+                            data.recordedat, data.datasource, registryIds.get(tokenId),
+                            currentTime, currentTime
                         ))
-                    
-                    logger.info(f"Inserted new record for token {data.tokenid or data.name}")
-                
+
+                if updateRows:
+                    # Archive the rows about to be overwritten
+                    cursor.execute("""
+                        INSERT INTO attentiondatahistory (
+                            attentiondataid, tokenid, name, chain,
+                            attentionscore, change1hbps,
+                            change1dbps, change7dbps,
+                            change30dbps, recordedat,
+                            datasource, createdat, updatedat
+                        )
+                        SELECT id, tokenid, name, chain,
+                               attentionscore, change1hbps,
+                               change1dbps, change7dbps,
+                               change30dbps, recordedat,
+                               datasource, %s, %s
+                        FROM attentiondata
+                        WHERE id = ANY(%s)
+                    """, (currentTime, currentTime, [row[0] for row in updateRows]))
+
+                    execute_values(cursor, """
+                        UPDATE attentiondata a SET
+                            attentionscore = v.attentionscore,
+                            change1hbps = v.change1hbps,
+                            change1dbps = v.change1dbps,
+                            change7dbps = v.change7dbps,
+                            change30dbps = v.change30dbps,
+                            datasource = v.datasource,
+                            registryid = v.registryid,
+                            updatedat = v.updatedat
+                        FROM (VALUES %s) AS v (
+                            id, attentionscore, change1hbps, change1dbps, change7dbps,
+                            change30dbps, datasource, registryid, updatedat
+                        )
+                        WHERE a.id = v.id
+                    """, [row + (currentTime,) for row in updateRows],
+                        template="(%s, %s::numeric, %s::integer, %s::integer, %s::integer, %s::integer, %s::varchar, %s::integer, %s::timestamp)",
+                        page_size=len(updateRows))
+
+                if insertRows:
+                    execute_values(cursor, """
+                        INSERT INTO attentiondata (
+                            tokenid, name, chain,
+                            attentionscore, change1hbps,
+                            change1dbps, change7dbps,
+                            change30dbps, recordedat,
+                            datasource, registryid,
+                            createdat, updatedat
+                        ) VALUES %s
+                    """, insertRows, page_size=len(insertRows))
+
+            logger.info(f"Stored attention data for {len(uniqueItems)} tokens "
+                        f"(updated: {len(updateRows)}, inserted: {len(insertRows)})")
+            return {"inserted": len(insertRows), "updated": len(updateRows), "skipped": skipped}
+
         except Exception as e:
-            logger.error(f"Failed to store attention data for {data.tokenid or data.name}: {str(e)}")
+            logger.error(f"Failed to store attention data batch of {len(items)} items: {str(e)}")
             raise
 
-    def _getLastAttentionRecord(self, cursor, tokenid: str) -> Optional[Dict]:
+    def _upsertTokenRegistryBatch(self, cursor, items, currentTime: datetime) -> Dict[str, int]:
         """
-        Get the most recent record for a token
+        Create or refresh registry entries for a batch, same rules as updateTokenRegistry
         
-        Args:
-            cursor: Database cursor
-            tokenid: Token ID to look up
-            
         Returns:
-            Optional[Dict]: Most recent record or None
+            Dict[str, int]: tokenid -> registry ID
         """
-        config = get_config()
-        
-        if not tokenid:
-            return None
-        
-        try:
-            if config.DB_TYPE == 'postgres':
-                cursor.execute(text("""
-                    SELECT * 
-                    FROM attentiondata 
-                    WHERE tokenid = %s 
-                    ORDER BY recordedat DESC 
-                    LIMIT 1
-                """), (tokenid,))
-            else:
-                cursor.execute("""
-                    SELECT * 
-                    FROM attentiondata 
-                    WHERE tokenid = ? 
-                    ORDER BY recordedat DESC 
-                    LIMIT 1
-                """, (tokenid,))
-                
-            row = cursor.fetchone()
-            return dict(row) if row else None
-        except Exception as e:
-            logger.error(f"Error getting last attention record: {e}")
-            return None
+        rows = [
+            (data.tokenid, data.name, data.chain, currentTime, currentTime,
+             AttentionStatusEnum.NEW.value, currentTime, currentTime)
+            for data in items
+        ]
+        results = execute_values(cursor, """
+            INSERT INTO attentiontokenregistry
+            (tokenid, name, chain, firstseenat, lastseenat, currentstatus, createdat, updatedat)
+            VALUES %s
+            ON CONFLICT (tokenid) DO UPDATE SET
+                lastseenat = EXCLUDED.lastseenat,
+                updatedat = EXCLUDED.updatedat,
+                attentioncount = attentiontokenregistry.attentioncount + 1,
+                currentstatus = CASE
+                    WHEN attentiontokenregistry.currentstatus = '""" + AttentionStatusEnum.INACTIVE.value + """'
+                    THEN '""" + AttentionStatusEnum.NEW.value + """'
+                    ELSE attentiontokenregistry.currentstatus
+                END
+            RETURNING id, tokenid
+        """, rows, page_size=len(rows), fetch=True)
+        return {row['tokenid']: row['id'] for row in results}
 
     def _calculateHourlyChange(self, lastRecord, currentScore: Decimal) -> Optional[int]:
         """Calculate hourly change in basis points"""
@@ -484,69 +304,6 @@ class AttentionHandler(BaseDBHandler):
             
         return int((currentScore - prevScore) * 10000 / prevScore)
 
-    def _persistRecordToHistory(self, cursor, record: Dict) -> None:
-        """
-        Store an existing record in the history table
-        
-        Args:
-            cursor: Database cursor
-            record: Record to store in history
-        """
-        config = get_config()
-        currentTime = datetime.now()
-        
-        try:
-            if config.DB_TYPE == 'postgres':
-                cursor.execute(text("""
-                    INSERT INTO attentiondatahistory (
-                        attentiondataid, tokenid, name, chain,
-                        attentionscore, change1hbps,
-                        change1dbps, change7dbps,
-                        change30dbps, recordedat,
-                        datasource, createdat, updatedat
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """), (
-                    record['id'], 
-                    record['tokenid'], 
-                    record.get('name'),
-                    record.get('chain'),
-                    record['attentionscore'], 
-                    record.get('change1hbps'),
-                    record.get('change1dbps'), 
-                    record.get('change7dbps'),
-                    record.get('change30dbps'), 
-                    record['recordedat'],
-                    record.get('datasource'),
-                    currentTime,
-                    currentTime
-                ))
-            else:
-                cursor.execute("""
-                    INSERT INTO attentiondatahistory (
-                        attentiondataid, tokenid, name, chain,
-                        attentionscore, change1hbps,
-                        change1dbps, change7dbps,
-                        change30dbps, recordedat,
-                        datasource, createdat, updatedat
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    record['id'], 
-                    record['tokenid'], 
-                    record.get('name'),
-                    record.get('chain'),
-                    record['attentionscore'], 
-                    record.get('change1hbps'),
-                    record.get('change1dbps'), 
-                    record.get('change7dbps'),
-                    record.get('change30dbps'), 
-                    record['recordedat'],
-                    record.get('datasource'),
-                    currentTime,
-                    currentTime
-                ))
-        except Exception as e:
-            logger.error(f"Error persisting record to history: {e}")
-
     def updateInactiveTokens(self) -> None:
         """
         Update status of tokens that haven't been seen for more than 1 day
@@ -732,6 +489,59 @@ class AttentionHandler(BaseDBHandler):
             logger.error(f"Failed to get attention info for token {tokenid}: {str(e)}")
             return None
 
+    def getAttentionInfoBatch(self, tokenids: List[str]) -> Dict[str, Dict]:
+        """
+        getAttentionInfo for many tokens in one query
+
+        Args:
+            tokenids: Token identifiers
+
+        Returns:
+            Dict mapping tokenid to its attention info; tokens without attention data are absent
+        """
+        if not tokenids:
+            return {}
+
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute("""
+                    SELECT DISTINCT ON (a.tokenid)
+                        a.tokenid,
+                        a.attentionscore,
+                        a.change1hbps,
+                        a.change1dbps,
+                        a.change7dbps,
+                        a.change30dbps,
+                        r.currentstatus,
+                        r.attentioncount,
+                        r.firstseenat,
+                        r.lastseenat
+                    FROM attentiondata a
+                    INNER JOIN attentiontokenregistry r ON a.tokenid = r.tokenid
+                    WHERE a.tokenid = ANY(%s)
+                    ORDER BY a.tokenid, a.updatedat DESC
+                """, (list(tokenids),))
+
+                return {
+                    row['tokenid']: {
+                        'attentionscore': float(row['attentionscore']) if row['attentionscore'] else 0,
+                        'change1hbps': row['change1hbps'],
+                        'change1dbps': row['change1dbps'],
+                        'change7dbps': row['change7dbps'],
+                        'change30dbps': row['change30dbps'],
+                        'currentstatus': row['currentstatus'],
+                        'attentioncount': row['attentioncount'],
+                        'firstseenat': row['firstseenat'],
+                        'lastseenat': row['lastseenat'],
+                        'consecutiverecords': row['attentioncount']  # Using attentioncount from registry
+                    }
+                    for row in cursor.fetchall()
+                }
+
+        except Exception as e:
+            logger.error(f"Failed to get attention info for {len(tokenids)} tokens: {str(e)}")
+            return {}
+
     # For backward compatibility
     def register_token(self, token_id: str, name: str, chain: str) -> Optional[int]:
         """
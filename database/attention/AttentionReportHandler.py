@@ -4,6 +4,7 @@ from typing import List, Dict, Optional, Any
 from logs.logger import get_logger
 import json
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.ReportQuery import ReportPage, ReportQuery
 
 
 logger = get_logger(__name__)
@@ -33,7 +34,9 @@ class AttentionReportHandler(BaseDBHandler):
                          minAttentionCount: int = None,
                          maxAttentionCount: int = None,
                          sortBy: str = "attentioncount",
-                         sortOrder: str = "desc") -> List[Dict[str, Any]]:
+                         sortOrder: str = "desc",
+                         limit: Optional[int] = None,
+                         cursor: Optional[str] = None) -> ReportPage:
         """
         Get attention report data with optional filters.
         
@@ -46,95 +49,78 @@ class AttentionReportHandler(BaseDBHandler):
             maxAttentionCount: Maximum attention count filter
             sortBy: Field to sort by (default: attentioncount)
             sortOrder: Sort order (asc or desc, default: desc)
+            limit: Page size (optional, default: every row)
+            cursor: nextCursor of the previous page (optional)
             
         Returns:
-            List of attention data dictionaries
+            ReportPage of attention data dictionaries
         """
-        # Build the base query - join with attentiondata to get the latest attention score
-        query = """
-            SELECT 
-                r.id,
-                r.tokenid,
-                r.name,
-                r.chain,
-                r.currentstatus,
-                r.attentioncount,
-                a.attentionscore,
-                r.firstseenat,
-                r.lastseenat
-            FROM attentiontokenregistry r
-            LEFT JOIN (
-                SELECT tokenid, attentionscore
+        # Latest attention score per token, looked up only for the rows of the page
+        query = ReportQuery(
+            source="""attentiontokenregistry r
+            LEFT JOIN LATERAL (
+                SELECT attentionscore
                 FROM attentiondata
-                WHERE (tokenid, recordedat) IN (
-                    SELECT tokenid, MAX(recordedat)
-                    FROM attentiondata
-                    GROUP BY tokenid
-                )
-            ) a ON r.tokenid = a.tokenid
-            WHERE 1=1
-        """
-        params = []
+                WHERE tokenid = r.tokenid
+                ORDER BY recordedat DESC
+                LIMIT 1
+            ) a ON TRUE""",
+            columns=[
+                "r.id", "r.tokenid", "r.name", "r.chain", "r.currentstatus",
+                "r.attentioncount", "a.attentionscore", "r.firstseenat", "r.lastseenat"
+            ],
+            sortFields={
+                "id": "r.id",
+                "tokenid": "r.tokenid",
+                "name": "r.name",
+                "chain": "r.chain",
+                "currentstatus": "COALESCE(r.currentstatus, '')",
+                "attentioncount": "COALESCE(r.attentioncount, 0)",
+                "attentionscore": "COALESCE(a.attentionscore, 0)",
+                "firstseenat": "r.firstseenat",
+                "lastseenat": "r.lastseenat"
+            },
+            idColumn="r.id",
+            defaultSort="attentioncount"
+        )
 
         # Add filters based on parameters
         if tokenId:
-            query += " AND r.tokenid LIKE ?"
-            params.append(f"%{tokenId}%")
+            query.where("r.tokenid LIKE %s", f"%{tokenId}%")
         
         if name:
-            query += " AND r.name LIKE ?"
-            params.append(f"%{name}%")
+            query.where("r.name LIKE %s", f"%{name}%")
         
         if chain:
-            query += " AND r.chain LIKE ?"
-            params.append(f"%{chain}%")
+            query.where("r.chain LIKE %s", f"%{chain}%")
         
         if currentStatus:
-            query += " AND LOWER(r.currentstatus) = LOWER(?)"
-            params.append(currentStatus)
+            query.where("LOWER(r.currentstatus) = LOWER(%s)", currentStatus)
         
         if minAttentionCount is not None:
-            query += " AND r.attentioncount >= ?"
-            params.append(minAttentionCount)
+            query.where("r.attentioncount >= %s", minAttentionCount)
         
         if maxAttentionCount is not None:
-            query += " AND r.attentioncount <= ?"
-            params.append(maxAttentionCount)
-            
-        # Validate sort parameters
-        valid_sort_fields = ["id", "tokenid", "name", "chain", "currentstatus", "attentioncount", "attentionscore", "firstseenat", "lastseenat"]
-        valid_sort_orders = ["asc", "desc"]
-        
-        if sortBy not in valid_sort_fields:
-            sortBy = "attentioncount"
-        
-        if sortOrder.lower() not in valid_sort_orders:
-            sortOrder = "desc"
-            
-        # Add sorting
-        query += f" ORDER BY r.{sortBy} {sortOrder.upper()}"
-
-        # Execute query
-        with self.transaction() as cursor:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+            query.where("r.attentioncount <= %s", maxAttentionCount)
 
-            # Convert results to list of dictionaries
-            attentionData = []
-            for row in results:
-                attentionData.append({
-                    'id': row[0],
-                    'tokenId': row[1],
-                    'name': row[2],
-                    'chain': row[3],
-                    'currentStatus': row[4],
-                    'attentionCount': row[5],
-                    'attentionScore': float(row[6]) if row[6] else None,
-                    'firstSeenAt': row[7],
-                    'lastSeenAt': row[8]
-                })
+        with self.transaction() as dbCursor:
+            page = query.fetchPage(dbCursor, sortBy, sortOrder, limit, cursor)
 
-        return attentionData
+        page.rows = [
+            {
+                'id': row['id'],
+                'tokenId': row['tokenid'],
+                'name': row['name'],
+                'chain': row['chain'],
+                'currentStatus': row['currentstatus'],
+                'attentionCount': row['attentioncount'],
+                'attentionScore': float(row['attentionscore']) if row['attentionscore'] else None,
+                'firstSeenAt': row['firstseenat'],
+                'lastSeenAt': row['lastseenat']
+            }
+            for row in page.rows
+        ]
+        return page
     
     def getAttentionHistoryById(self, tokenId: str) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,254 @@
+from config.Config import get_config
+"""
+In-process ledger of credit-metered API keys.
+
+Paging through a credit-metered feed (Cielo) used to cost two database
+transactions per HTTP call: pick the least recently used key with enough
+credits, then deduct the credits. The ledger loads a service's keys and
+balances once and hands keys out least recently used first, reserving the
+credits of the call with a local decrement under a lock, so threads sharing a
+key can never overdraw it. Spent credits are written back in one batched UPDATE
+every API_KEY_LEDGER_FLUSH_SECONDS, after which the balances are reloaded; that
+reconcile also picks up keys added, topped up or spent by other processes.
+
+A key the service rejects with 402 (out of credits) or 429 (throttled) is taken
+out of rotation at once. A 402 also zeroes its credits in the database; a 429
+key comes back at the next reconcile. Calls that fail or are rejected hand
+their reserved credits back with refund().
+"""
+
+from database.auth.CredentialsHandler import CredentialsHandler
+from logs.logger import get_logger
+from typing import Any, Dict, Optional
+import atexit
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Statuses meaning the key cannot be used right now
+KEY_EXHAUSTED_STATUSES = {402, 429}
+
+
+class ApiKeyExhaustedError(Exception):
+    """Raised by a service call when the API key was rejected for credits or rate (402 / 429)"""
+
+    def __init__(self, status: int):
+        super().__init__(f"API key rejected with status {status}")
+        self.status = status
+
+
+class LedgerKey:
+    """Local balance of one API key"""
+
+    def __init__(self, keyId: int, apiKey: str, available: int):
+        self.id = keyId
+        self.apiKey = apiKey
+        self.available = available
+        self.pending = 0  # credits spent since the last flush
+        self.lastUsed = 0  # ledger sequence number of the last hand-out
+        self.paused = False  # rejected by the service until the next reconcile
+
+
+class ApiKeyLedger:
+    """Process-wide, thread-safe ledger of API key credits"""
+
+    _shared: Optional["ApiKeyLedger"] = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, credentials: CredentialsHandler, flushSeconds: float):
+        self.credentials = credentials
+        self.flushSeconds = flushSeconds
+
+        self._lock = threading.Lock()
+        # serviceName -> key id -> LedgerKey
+        self._keys: Dict[str, Dict[int, LedgerKey]] = {}
+        self._sequence = 0
+
+        self._acquired = 0
+        self._misses = 0
+        self._rejections = 0
+        self._refunds = 0
+        self._flushes = 0
+        self._flushFailures = 0
+        self._lastFlushAt: Optional[float] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def shared(cls) -> "ApiKeyLedger":
+        """Get (creating and starting on first use) the process-wide ledger"""
+        if cls._shared is not None:
+            return cls._shared
+        with cls._sharedLock:
+            if cls._shared is None:
+                ledger = cls(CredentialsHandler(), get_config().API_KEY_LEDGER_FLUSH_SECONDS)
+                ledger.start()
+                atexit.register(ledger.close)
+                cls._shared = ledger
+            return cls._shared
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="apikey-ledger-flush", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stop the flush thread and write back the credits still pending"""
+        self._stop.set()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flushSeconds):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"API key ledger flush failed: {str(e)}")
+
+    def acquire(self, serviceName: str, requiredCredits: int) -> Optional[Dict[str, Any]]:
+        """
+        Hand out the least recently used key with enough credits and charge the call to it
+
+        Args:
+            serviceName: Name of the service (e.g., 'cielo')
+            requiredCredits: Credits the call costs
+
+        Returns:
+            Optional[Dict]: id, apikey and remaining availablecredits, None if no key can pay
+        """
+        if serviceName not in self._keys:
+            # First use in this process: start from the database balances
+            self.reconcile(serviceName)
+
+        with self._lock:
+            candidates = [
+                key for key in self._keys.get(serviceName, {}).values()
+                if not key.paused and key.available >= requiredCredits
+            ]
+            if not candidates:
+                self._misses += 1
+                return None
+            key = min(candidates, key=lambda candidate: candidate.lastUsed)
+            key.available -= requiredCredits
+            key.pending += requiredCredits
+            self._sequence += 1
+            key.lastUsed = self._sequence
+            self._acquired += 1
+            return {"id": key.id, "apikey": key.apiKey, "availablecredits": key.available}
+
+    def refund(self, serviceName: str, keyId: int, credits: int) -> None:
+        """
+        Give back the credits reserved by acquire() for a call that failed or was rejected
+
+        Pending usage may go negative when the charge was flushed in the meantime;
+        the next flush then adds the credits back in the database.
+
+        Args:
+            serviceName: Name of the service (e.g., 'cielo')
+            keyId: ID of the key the call was made with
+            credits: Credits reserved for the call
+        """
+        with self._lock:
+            key = self._keys.get(serviceName, {}).get(keyId)
+            if key:
+                key.available += credits
+                key.pending -= credits
+                self._refunds += 1
+
+    def markExhausted(self, serviceName: str, keyId: int, status: int) -> None:
+        """
+        Take a key out of rotation after the service rejected it
+
+        Args:
+            status: 402 zeroes the key's credits in the database as well; 429 only pauses it
+        """
+        with self._lock:
+            key = self._keys.get(serviceName, {}).get(keyId)
+            if key:
+                key.paused = True
+                if status == 402:
+                    # The database balance is zeroed below; unflushed usage or refunds are moot
+                    key.available = 0
+                    key.pending = 0
+            self._rejections += 1
+        logger.warning(f"{serviceName} API key {keyId} rejected with status {status}, taken out of rotation")
+        if status == 402:
+            self.credentials.markApiKeyExhausted(keyId)
+
+    def flush(self) -> None:
+        """Write the credits spent since the last flush back in one batch, then reconcile"""
+        with self._lock:
+            usage: Dict[int, int] = {}
+            for keys in self._keys.values():
+                for key in keys.values():
+                    if key.pending:
+                        usage[key.id] = usage.get(key.id, 0) + key.pending
+                        key.pending = 0
+            services = list(self._keys.keys())
+
+        if usage and not self.credentials.applyApiKeyUsage(usage):
+            # Keep the usage for the next attempt
+            with self._lock:
+                for keys in self._keys.values():
+                    for key in keys.values():
+                        if key.id in usage:
+                            key.pending += usage.pop(key.id)
+                self._flushFailures += 1
+            return
+
+        for serviceName in services:
+            self.reconcile(serviceName)
+        with self._lock:
+            self._flushes += 1
+            self._lastFlushAt = time.time()
+
+    def reconcile(self, serviceName: str) -> None:
+        """Reload a service's keys and balances from the database, keeping unflushed usage"""
+        rows = self.credentials.getApiKeyBalances(serviceName)
+        with self._lock:
+            current = self._keys.get(serviceName, {})
+            keys: Dict[int, LedgerKey] = {}
+            for row in rows:
+                key = current.get(row["id"]) or LedgerKey(row["id"], row["apikey"], 0)
+                key.apiKey = row["apikey"]
+                key.available = int(row["availablecredits"]) - key.pending
+                key.paused = False
+                keys[key.id] = key
+            # Deactivated keys stay until their last usage is flushed, but are never handed out
+            for keyId, key in current.items():
+                if keyId not in keys and key.pending:
+                    key.paused = True
+                    keys[keyId] = key
+            self._keys[serviceName] = keys
+
+    def getMetrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of the ledger.
+
+        Returns:
+            Dict: per-service key balances (by id), hand-outs, misses, rejections, refunds and flushes
+        """
+        with self._lock:
+            return {
+                "services": {
+                    serviceName: [
+                        {
+                            "id": key.id,
+                            "available": key.available,
+                            "pending": key.pending,
+                            "paused": key.paused,
+                        }
+                        for key in keys.values()
+                    ]
+                    for serviceName, keys in self._keys.items()
+                },
+                "acquired": self._acquired,
+                "misses": self._misses,
+                "rejections": self._rejections,
+                "refunds": self._refunds,
+                "flushes": self._flushes,
+                "flushFailures": self._flushFailures,
+                "flushSeconds": self.flushSeconds,
+                "lastFlushAt": self._lastFlushAt,
+            }
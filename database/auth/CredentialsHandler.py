@@ -1,7 +1,7 @@
 from config.Config import get_config
 from database.auth.ServiceCredentialsEnum import ServiceCredentials
 from database.operations.BaseDBHandler import BaseDBHandler
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 from logs.logger import get_logger
 import json
@@ -21,65 +21,6 @@ class CredentialsHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._createTables()
-
-    def _createTables(self):
-        """Creates the credentials tables"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-
-            if config.DB_TYPE == "postgres":
-                # PostgreSQL syntax
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS servicecredentials (
-                        id SERIAL PRIMARY KEY,
-                        servicename VARCHAR(100) NOT NULL,
-                        credentialtype VARCHAR(20) NOT NULL,
-                        isactive INTEGER DEFAULT 1,
-                        metadata TEXT,
-                        apikey TEXT,   
-                        apisecret TEXT,
-                        availablecredits INTEGER,
-                        username TEXT,
-                        password TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        lastusedat TIMESTAMP,
-                        expiresat TIMESTAMP,                    
-                        UNIQUE(servicename, apikey),
-                        UNIQUE(servicename, username)
-                    )
-                """
-                    )
-                )
-            else:
-                # SQLite syntax
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS servicecredentials (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        servicename VARCHAR(100) NOT NULL,
-                        credentialtype VARCHAR(20) NOT NULL,
-                        isactive BOOLEAN DEFAULT 1,
-                        metadata TEXT,
-                        apikey TEXT,   
-                        apisecret TEXT,
-                        availablecredits INTEGER,
-                        username TEXT,
-                        password TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        lastusedat TIMESTAMP,
-                        expiresat TIMESTAMP,                    
-                        UNIQUE(servicename, apikey),
-                        UNIQUE(servicename, username)
-                    )
-                """
-                    )
-                )
 
     def storeApiCredentials(
         self,
@@ -593,6 +534,93 @@ class CredentialsHandler(BaseDBHandler):
             logger.error(f"Failed to update API key credits for key {keyId}: {str(e)}")
             return False
 
+    def getApiKeyBalances(self, serviceName: str) -> List[Dict[str, Any]]:
+        """
+        Get every active, credit-tracked API key of a service (used by ApiKeyLedger)
+
+        Args:
+            serviceName: Name of the service (e.g., 'cielo')
+
+        Returns:
+            List[Dict]: id, apikey and availablecredits of each key
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(
+                text(
+                    """
+                SELECT id, apikey, availablecredits
+                FROM servicecredentials
+                WHERE servicename = %s
+                AND credentialtype = 'API_KEY'
+                AND isactive = 1
+                AND availablecredits IS NOT NULL
+                ORDER BY lastusedat ASC NULLS FIRST, id
+            """
+                ),
+                (serviceName,),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def applyApiKeyUsage(self, usage: Dict[int, int]) -> bool:
+        """
+        Deduct the credits spent on several API keys in one statement
+
+        Args:
+            usage: Key ID -> credits used since the last call
+
+        Returns:
+            bool: True if update successful, False otherwise
+        """
+        if not usage:
+            return True
+        try:
+            keyIds = list(usage.keys())
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    text(
+                        """
+                    UPDATE servicecredentials AS s
+                    SET availablecredits = GREATEST(s.availablecredits - u.used, 0),
+                        lastusedat = %s
+                    FROM unnest(%s::int[], %s::int[]) AS u(id, used)
+                    WHERE s.id = u.id
+                """
+                    ),
+                    (datetime.now(), keyIds, [usage[keyId] for keyId in keyIds]),
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to apply API key usage for keys {list(usage.keys())}: {str(e)}")
+            return False
+
+    def markApiKeyExhausted(self, keyId: int) -> bool:
+        """
+        Set an API key's credits to zero (the service reported them used up)
+
+        Args:
+            keyId: ID of the API key
+
+        Returns:
+            bool: True if update successful, False otherwise
+        """
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    text(
+                        """
+                    UPDATE servicecredentials
+                    SET availablecredits = 0,
+                        updatedat = %s
+                    WHERE id = %s
+                """
+                    ),
+                    (datetime.now(), keyId),
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to mark API key {keyId} exhausted: {str(e)}")
+            return False
+
     def storeCredentialWithType(
         self,
         serviceName: str,
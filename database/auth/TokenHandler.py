@@ -21,51 +21,6 @@ class TokenHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._createTables()
-
-    def _createTables(self):
-        """Creates the auth tokens table"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-
-            if config.DB_TYPE == "postgres":
-                # PostgreSQL syntax
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS authtokens (
-                        id SERIAL PRIMARY KEY,
-                        servicename VARCHAR(50) NOT NULL UNIQUE,
-                        accesstoken TEXT NOT NULL,
-                        refreshtoken TEXT NOT NULL,
-                        accesstokenexpiresat TIMESTAMP NOT NULL,
-                        refreshtokenexpiresat TIMESTAMP NOT NULL,
-                        logintime TIMESTAMP NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                    )
-                )
-            else:
-                # SQLite syntax
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS authtokens (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        servicename VARCHAR(50) NOT NULL UNIQUE,
-                        accesstoken TEXT NOT NULL,
-                        refreshtoken TEXT NOT NULL,
-                        accesstokenexpiresat TIMESTAMP NOT NULL,
-                        refreshtokenexpiresat TIMESTAMP NOT NULL,
-                        logintime TIMESTAMP NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                    )
-                )
 
     def storeTokens(self,serviceName: str,accessToken: str,refreshToken: str,isNewLogin: bool = False,) -> None:
         try:
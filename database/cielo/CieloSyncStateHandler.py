@@ -0,0 +1,115 @@
+from config.Config import get_config
+"""
+Sync state of the incremental Cielo swap feed per (wallet, token): the newest
+swap folded in so far and the running investment aggregates.
+"""
+
+from database.operations.BaseDBHandler import BaseDBHandler
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.schema import CieloSwapSyncState
+from decimal import Decimal
+from logs.logger import get_logger
+from sqlalchemy import text
+from typing import Optional
+import json
+
+logger = get_logger(__name__)
+
+
+class CieloSyncStateHandler(BaseDBHandler):
+    """Database handler for cieloswapsync"""
+
+    def __init__(self, conn_manager=None):
+        """Initialize with connection manager. Tables are created by the migration runner."""
+        super().__init__(conn_manager or DatabaseConnectionManager())
+
+    def getSyncState(self, walletAddress: str, tokenId: str) -> Optional[CieloSwapSyncState]:
+        """
+        Get the sync state of a wallet / token pair
+
+        Returns:
+            Optional[CieloSwapSyncState]: Stored state, None if the pair was never synced
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text("""
+                SELECT walletaddress, tokenid, lastswaptimestamp, lastswaphashes,
+                    totalinvested, totaltakenout, totalcoins, swapcount
+                FROM cieloswapsync
+                WHERE walletaddress = %s AND tokenid = %s
+            """), (walletAddress, tokenId))
+            row = cursor.fetchone()
+
+        if not row:
+            return None
+        row = dict(row)
+        hashes = row['lastswaphashes']
+        if isinstance(hashes, str):
+            hashes = json.loads(hashes)
+        return CieloSwapSyncState(
+            walletaddress=row['walletaddress'],
+            tokenid=row['tokenid'],
+            lastswaptimestamp=row['lastswaptimestamp'],
+            lastswaphashes=list(hashes or []),
+            totalinvested=Decimal(str(row['totalinvested'])),
+            totaltakenout=Decimal(str(row['totaltakenout'])),
+            totalcoins=Decimal(str(row['totalcoins'])),
+            swapcount=row['swapcount'],
+        )
+
+    def saveSyncState(self, state: CieloSwapSyncState, fullSync: bool = False) -> None:
+        """
+        Store a pair's sync state
+
+        Args:
+            state: State after folding in the latest swaps
+            fullSync: The aggregates were rebuilt from the whole history
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text("""
+                INSERT INTO cieloswapsync (
+                    walletaddress, tokenid, lastswaptimestamp, lastswaphashes,
+                    totalinvested, totaltakenout, totalcoins, swapcount, fullsyncedat, syncedat
+                )
+                VALUES (%s, %s, %s, %s::jsonb, %s, %s, %s, %s, CASE WHEN %s = 1 THEN NOW() END, NOW())
+                ON CONFLICT (walletaddress, tokenid) DO UPDATE SET
+                    lastswaptimestamp = EXCLUDED.lastswaptimestamp,
+                    lastswaphashes = EXCLUDED.lastswaphashes,
+                    totalinvested = EXCLUDED.totalinvested,
+                    totaltakenout = EXCLUDED.totaltakenout,
+                    totalcoins = EXCLUDED.totalcoins,
+                    swapcount = EXCLUDED.swapcount,
+                    fullsyncedat = COALESCE(EXCLUDED.fullsyncedat, cieloswapsync.fullsyncedat),
+                    syncedat = EXCLUDED.syncedat
+            """), (
+                state.walletaddress,
+                state.tokenid,
+                state.lastswaptimestamp,
+                json.dumps(state.lastswaphashes),
+                state.totalinvested,
+                state.totaltakenout,
+                state.totalcoins,
+                state.swapcount,
+                fullSync,
+            ))
+
+    def resetSyncState(self, walletAddress: str, tokenId: Optional[str] = None) -> int:
+        """
+        Forget the sync state so the next refresh rebuilds it from the whole history
+
+        Args:
+            walletAddress: Wallet to reset
+            tokenId: Token to reset (all of the wallet's tokens when None)
+
+        Returns:
+            int: Number of pairs reset
+        """
+        with self.conn_manager.transaction() as cursor:
+            if tokenId:
+                cursor.execute(text("""
+                    DELETE FROM cieloswapsync WHERE walletaddress = %s AND tokenid = %s
+                """), (walletAddress, tokenId))
+            else:
+                cursor.execute(text("""
+                    DELETE FROM cieloswapsync WHERE walletaddress = %s
+                """), (walletAddress,))
+            return cursor.rowcount
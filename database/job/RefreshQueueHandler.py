@@ -0,0 +1,279 @@
+from config.Config import get_config
+"""
+Persistent priority queue of the wallet / token refresh jobs.
+
+Every refresh job keeps its entities in refreshqueue keyed by (job, entitykey).
+A run first syncs the table from the job's source query (new entities are added,
+value / change signals refreshed, entities that left the source removed), then
+leases batches in priority order:
+
+    priority = staleness (days since the last refresh, capped)
+             + log10(1 + value)    smart balance / holding / PNL
+             + 2 * log10(1 + change)   qtychange1d spike, transaction-count delta
+
+so the most valuable and most active entities are refreshed first and a long
+run that is cut short has already done the work that mattered. The priority is
+stored in the row and indexed with the job; syncJob recomputes it for the whole
+job at the start of every run and complete() when an entity is refreshed, so
+leasing reads the top of the index instead of scoring every row. Leases use
+FOR UPDATE SKIP LOCKED, so parallel workers never get the same entity, and are
+tagged with the run id: an entity is leased at most once per run, and a
+restarted run starts with whatever the interrupted one had not reached yet.
+"""
+
+from config.PortfolioStatusEnum import PortfolioStatus
+from database.operations.BaseDBHandler import BaseDBHandler
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.schema import WalletInvestedStatusEnum
+from database.smartmoneywallets.WalletPNLStatusEnum import SmartWalletPnlStatus
+from logs.logger import get_logger
+from sqlalchemy import text
+from typing import Any, Dict, Iterator, List, Optional
+import uuid
+
+logger = get_logger(__name__)
+
+# Jobs using the queue
+JOB_WALLETS_INVESTED = "walletsinvested"
+JOB_SMWALLET_TOP_PNL_TOKENS = "smwallettoppnltoken"
+JOB_WALLETS_INVESTED_DETAILS = "walletsinvesteddetails"
+JOB_TOP_PNL_TOKEN_DETAILS = "toppnltokendetails"
+
+# Staleness counts in days and stops growing after a week
+STALENESS_CAP_DAYS = 7
+CHANGE_WEIGHT = 2
+
+
+
+def priorityExpression(lastRefreshedAt: str = "lastrefreshedat", valueScore: str = "valuescore",
+                       changeScore: str = "changescore") -> str:
+    """SQL for an entity's priority from the given refresh time, value and change expressions"""
+    return f"""(
+        LEAST(EXTRACT(EPOCH FROM (NOW() - COALESCE({lastRefreshedAt}, TIMESTAMP 'epoch'))) / 86400.0, {STALENESS_CAP_DAYS})
+        + LOG(1 + GREATEST({valueScore}, 0))
+        + {CHANGE_WEIGHT} * LOG(1 + GREATEST({changeScore}, 0))
+    )::DOUBLE PRECISION"""
+
+
+# Source of each job's entities: entitykey, payload (handed to the worker), valuescore
+# and changescore. A NULL changescore keeps the one recorded when the entity was
+# last refreshed (transaction-count deltas are only known after the API call).
+SOURCE_QUERIES: Dict[str, str] = {
+    JOB_WALLETS_INVESTED: """
+        SELECT DISTINCT ON (tokenid)
+            tokenid AS entitykey,
+            jsonb_build_object('tokenid', tokenid, 'name', name, 'portsummaryid', portsummaryid) AS payload,
+            smartbalance AS valuescore,
+            ABS(qtychange1d) AS changescore
+        FROM portsummary
+        WHERE status = %(activeStatus)s
+        ORDER BY tokenid, portsummaryid DESC
+    """,
+    JOB_SMWALLET_TOP_PNL_TOKENS: """
+        SELECT
+            walletaddress AS entitykey,
+            jsonb_build_object('walletAddress', walletaddress) AS payload,
+            COALESCE(CAST(profitandloss AS DECIMAL), 0) AS valuescore,
+            NULL::DECIMAL AS changescore
+        FROM smartmoneywallets
+        WHERE status = %(highPnlStatus)s
+    """,
+    JOB_WALLETS_INVESTED_DETAILS: """
+        SELECT
+            walletinvestedid::TEXT AS entitykey,
+            jsonb_build_object('walletinvestedid', walletinvestedid, 'walletaddress', walletaddress, 'tokenid', tokenid) AS payload,
+            COALESCE(smartholding, 0) AS valuescore,
+            NULL::DECIMAL AS changescore
+        FROM walletsinvested
+        WHERE smartholding >= %(minBalance)s::DECIMAL
+        AND status = %(walletActiveStatus)s
+    """,
+    JOB_TOP_PNL_TOKEN_DETAILS: """
+        SELECT
+            t.walletaddress || ':' || t.tokenid AS entitykey,
+            jsonb_build_object('walletAddress', t.walletaddress, 'tokenId', t.tokenid, 'name', t.name) AS payload,
+            ABS(COALESCE(t.unprocessedpnl, 0)) AS valuescore,
+            NULL::DECIMAL AS changescore
+        FROM smwallettoppnltoken t
+        JOIN smartmoneywallets w ON w.walletaddress = t.walletaddress
+        WHERE w.status = %(highPnlStatus)s
+        AND t.transactionscount = 0
+        AND t.tokenid != 'So11111111111111111111111111111111111111112'
+    """,
+}
+
+
+class RefreshQueueHandler(BaseDBHandler):
+    """Database handler for the refresh jobs' priority queue"""
+
+    def __init__(self, conn_manager=None):
+        """Initialize with connection manager. Tables are created by the migration runner."""
+        super().__init__(conn_manager or DatabaseConnectionManager())
+
+    def syncJob(self, job: str, minBalance: Any = 0) -> int:
+        """
+        Bring a job's queue in line with its source table
+
+        Args:
+            job: One of the JOB_* names
+            minBalance: Smallest smart holding queued (wallets invested details only)
+
+        Returns:
+            int: Number of entities queued for the job
+        """
+        params = {
+            "job": job,
+            "activeStatus": PortfolioStatus.ACTIVE.statuscode,
+            "highPnlStatus": SmartWalletPnlStatus.HIGH_PNL_SM.value,
+            "walletActiveStatus": int(WalletInvestedStatusEnum.ACTIVE),
+            "minBalance": str(minBalance),
+        }
+        changeScore = "CASE WHEN %(keepChange)s = 1 THEN refreshqueue.changescore ELSE EXCLUDED.changescore END"
+        with self.conn_manager.transaction() as cursor:
+            # Every row of the job is rewritten here, so the stored priority (staleness included) is refreshed too
+            cursor.execute(text(f"""
+                INSERT INTO refreshqueue (job, entitykey, payload, valuescore, changescore, priority, syncedat)
+                SELECT %(job)s, source.entitykey, source.payload, COALESCE(source.valuescore, 0),
+                    COALESCE(source.changescore, 0),
+                    {priorityExpression("NULL::TIMESTAMP", "COALESCE(source.valuescore, 0)", "COALESCE(source.changescore, 0)")},
+                    NOW()
+                FROM ({SOURCE_QUERIES[job]}) AS source
+                ON CONFLICT (job, entitykey) DO UPDATE SET
+                    payload = EXCLUDED.payload,
+                    valuescore = EXCLUDED.valuescore,
+                    changescore = {changeScore},
+                    priority = {priorityExpression("refreshqueue.lastrefreshedat", "EXCLUDED.valuescore", changeScore)},
+                    syncedat = EXCLUDED.syncedat
+            """), {**params, "keepChange": job != JOB_WALLETS_INVESTED})
+            queued = cursor.rowcount
+
+            # NOW() is fixed for the transaction, so rows not touched above left the source
+            cursor.execute(text("""
+                DELETE FROM refreshqueue
+                WHERE job = %s AND syncedat < NOW()
+            """), (job,))
+            if cursor.rowcount:
+                logger.info(f"Removed {cursor.rowcount} entities no longer eligible for {job}")
+
+        logger.info(f"Refresh queue for {job} synced: {queued} entities")
+        return queued
+
+    def leaseBatch(self, job: str, runId: str, limit: int, leaseSeconds: int) -> List[Dict[str, Any]]:
+        """
+        Lease the highest-priority entities of a job not yet leased by this run
+
+        Args:
+            job: Job name
+            runId: Identifier of the current run; entities it leased before are skipped
+            limit: Batch size
+            leaseSeconds: How long the entities stay reserved if never completed
+
+        Returns:
+            List[Dict]: entitykey and payload of each leased entity, highest priority first
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text("""
+                WITH next AS (
+                    SELECT job, entitykey, priority
+                    FROM refreshqueue
+                    WHERE job = %s
+                    AND leaseowner IS DISTINCT FROM %s
+                    AND (leaseduntil IS NULL OR leaseduntil < NOW())
+                    ORDER BY priority DESC, entitykey
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE refreshqueue q
+                SET leaseowner = %s,
+                    leaseduntil = NOW() + make_interval(secs => %s),
+                    attempts = q.attempts + 1
+                FROM next
+                WHERE q.job = next.job AND q.entitykey = next.entitykey
+                RETURNING q.entitykey, q.payload, next.priority
+            """), (job, runId, limit, runId, leaseSeconds))
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        # UPDATE ... RETURNING does not keep the CTE's order
+        rows.sort(key=lambda row: row["priority"], reverse=True)
+        return rows
+
+    def leaseBatches(self, job: str, batchSize: int, leaseSeconds: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lease a job's entities batch by batch until every one has been handed out once
+
+        Each batch is leased only when the previous one has been consumed, so
+        entities that became more urgent in the meantime move ahead.
+        """
+        runId = uuid.uuid4().hex
+        leaseSeconds = leaseSeconds or get_config().REFRESH_QUEUE_LEASE_SECONDS
+        while True:
+            batch = self.leaseBatch(job, runId, batchSize, leaseSeconds)
+            if not batch:
+                return
+            yield batch
+
+    def complete(self, job: str, entityKey: str, changeSignal: Optional[float] = None) -> None:
+        """
+        Mark an entity refreshed and release its lease
+
+        Args:
+            changeSignal: Change observed during the refresh (e.g. new transactions); kept as its change score
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text(f"""
+                UPDATE refreshqueue
+                SET lastrefreshedat = NOW(),
+                    leaseduntil = NULL,
+                    attempts = 0,
+                    lasterror = NULL,
+                    changescore = COALESCE(%s, changescore),
+                    priority = {priorityExpression("NOW()", "valuescore", "COALESCE(%s, changescore)")}
+                WHERE job = %s AND entitykey = %s
+            """), (changeSignal, changeSignal, job, entityKey))
+
+    def completeBatch(self, job: str, entityKeys: List[str]) -> None:
+        """Mark several entities refreshed and release their leases in one statement"""
+        if not entityKeys:
+            return
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text(f"""
+                UPDATE refreshqueue
+                SET lastrefreshedat = NOW(),
+                    leaseduntil = NULL,
+                    attempts = 0,
+                    lasterror = NULL,
+                    priority = {priorityExpression("NOW()")}
+                WHERE job = %s AND entitykey = ANY(%s)
+            """), (job, list(entityKeys)))
+
+    def release(self, job: str, entityKey: str, error: Optional[str] = None) -> None:
+        """Give an entity's lease back after a failed refresh; it is retried on the next run"""
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text("""
+                UPDATE refreshqueue
+                SET leaseduntil = NULL,
+                    lasterror = %s
+                WHERE job = %s AND entitykey = %s
+            """), (error[:1000] if error else None, job, entityKey))
+
+    def getQueueStats(self) -> List[Dict[str, Any]]:
+        """
+        Per-job queue summary
+
+        Returns:
+            List[Dict]: job, entity count, never refreshed, leased, failing and oldest refresh
+        """
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(text("""
+                SELECT
+                    job,
+                    COUNT(*) AS entities,
+                    COUNT(*) FILTER (WHERE lastrefreshedat IS NULL) AS neverrefreshed,
+                    COUNT(*) FILTER (WHERE leaseduntil > NOW()) AS leased,
+                    COUNT(*) FILTER (WHERE lasterror IS NOT NULL) AS failing,
+                    MIN(lastrefreshedat) AS oldestrefresh
+                FROM refreshqueue
+                GROUP BY job
+                ORDER BY job
+            """))
+            return [dict(row) for row in cursor.fetchall()]
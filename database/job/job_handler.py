@@ -26,80 +26,8 @@ class JobStatus(Enum):
 class JobHandler(BaseDBHandler):
     """Database handler for job scheduling and execution tracking."""
     def __init__(self, conn_manager=None):
-        """Initialize with connection manager and create tables."""
+        """Initialize with connection manager. Tables are created by the migration runner."""
         super().__init__(conn_manager or DatabaseConnectionManager())
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create jobs and job_executions tables if they don't exist."""
-        config = get_config()
-        is_postgres = config.DB_TYPE == 'postgres'
-        
-        jobs_sql = """
-            CREATE TABLE IF NOT EXISTS jobs (
-                id SERIAL PRIMARY KEY,
-                job_id TEXT NOT NULL UNIQUE,
-                name TEXT NOT NULL,
-                description TEXT,
-                params TEXT,
-                status INTEGER NOT NULL,
-                schedule TEXT,
-                last_run TIMESTAMP,
-                next_run TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        
-        job_executions_sql = """
-            CREATE TABLE IF NOT EXISTS job_executions (
-                id SERIAL PRIMARY KEY,
-                job_id TEXT NOT NULL,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP,
-                status INTEGER NOT NULL,
-                result TEXT,
-                error_message TEXT,
-                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
-            )
-        """
-        
-        with self.conn_manager.transaction() as cursor:
-            cursor.execute(text(jobs_sql))
-            cursor.execute(text(job_executions_sql))
-            
-            # Check if error_message column exists, if not, try to add it
-            if is_postgres:
-                try:
-                    cursor.execute(text("""
-                        SELECT column_name FROM information_schema.columns 
-                        WHERE table_name='job_executions' AND column_name='error_message'
-                    """))
-                    
-                    # If error column doesn't exist, add error_message column
-                    if not cursor.fetchone():
-                        cursor.execute(text("""
-                            ALTER TABLE job_executions 
-                            ADD COLUMN IF NOT EXISTS error_message TEXT
-                        """))
-                        
-                    # Check if 'error' column exists (old name)
-                    cursor.execute(text("""
-                        SELECT column_name FROM information_schema.columns 
-                        WHERE table_name='job_executions' AND column_name='error'
-                    """))
-                    
-                    # Rename error to error_message if it exists
-                    if cursor.fetchone():
-                        cursor.execute(text("""
-                            ALTER TABLE job_executions 
-                            RENAME COLUMN error TO error_message
-                        """))
-                        
-                except Exception as e:
-                    logger.warning(f"Error checking/creating error_message column: {e}")
-                    
-        logger.info("Job tables created")
 
     def startJobExecution(self, job_id: str) -> int:
         """Start a job execution and return its ID."""
@@ -0,0 +1,585 @@
+"""
+Verifies that report and hot-path queries are served by the index catalogue.
+
+Builds a scratch schema whose tables are copies of the live ones (including
+every index from the migrations) and fills them with a synthetic dataset. Each
+catalogued check then calls the real handler method against the scratch schema,
+records every statement it executes, and EXPLAINs those statements; the check
+fails if a plan sequentially scans a table the handler is expected to reach
+through an index. Statements that cannot be EXPLAINed on PostgreSQL (legacy
+sqlite-style placeholders, syntax errors, unknown columns) are reported as
+skipped and fail the run as well, since no index can be shown to serve them.
+
+Usage:
+    python -m database.migrations.IndexVerifier --rows 1000000
+    python -m database.migrations.IndexVerifier --rows 1000000 --keep
+"""
+
+from actions.WalletsInvestedAction import EXISTING_WALLET_INVESTED_QUERY
+from contextlib import contextmanager
+from database.attention.AttentionHandler import AttentionHandler
+from database.attention.AttentionReportHandler import AttentionReportHandler
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.portsummary.PortfolioHandler import PortfolioHandler
+from database.portsummary.PortSummaryReportHandler import PortSummaryReportHandler
+from database.smartmoneywallets.SMWalletTopPNLTokenHandler import SMWalletTopPNLTokenHandler
+from database.smartmoneywallets.SmartMoneyPerformanceReportHandler import SmartMoneyPerformanceReportHandler
+from database.smartmoneywallets.SmartMoneyWalletsReportHandler import SmartMoneyWalletsReportHandler
+from database.smartmoneywallets.TopTokenPNLStatusEnum import TokenStatus
+from database.smwalletsbehaviour.SMWalletInvestmentRangeReportHandler import SMWalletInvestmentRangeReportHandler
+from database.smwalletsbehaviour.SmartMoneyWalletBehaviourReportHandler import SmartMoneyWalletBehaviourReportHandler
+from database.strategyreport.StrategyPerformanceHandler import StrategyPerformanceHandler
+from database.walletinvested.WalletsInvestedHandler import WalletsInvestedHandler
+from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
+from logs.logger import get_logger
+from dataclasses import dataclass, field
+from psycopg2.extras import RealDictCursor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import re
+import sys
+import time
+
+logger = get_logger(__name__)
+
+SCRATCH_SCHEMA = "indexcheck"
+
+# Tables copied into the scratch schema, in FK-safe order
+SCRATCH_TABLES = [
+    "portsummary",
+    "portsummaryhistory",
+    "walletsinvested",
+    "smartmoneywallets",
+    "smwallettoppnltoken",
+    "smwalletpnlstats",
+    "smartmoneywalletbehaviour",
+    "smartmoneywalletbehaviourhistory",
+    "attentiontokenregistry",
+    "attentiondata",
+    "attentiondatahistory",
+    "strategyconfig",
+    "strategyexecution",
+    "tradelog",
+]
+
+# Plan nodes that reach a table through an index
+INDEX_SCAN_NODES = ("Index Scan", "Index Only Scan", "Bitmap Heap Scan")
+
+
+class RecordingCursor:
+    """Cursor proxy that records every statement a handler executes"""
+
+    def __init__(self, cursor, statements: List[Tuple[str, Any]]):
+        self._cursor = cursor
+        self._statements = statements
+
+    def execute(self, query, params=None):
+        # Handlers pass sqlalchemy text() objects as well as plain strings
+        sql = getattr(query, "text", query)
+        self._statements.append((sql, params))
+        return self._cursor.execute(sql, params)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class ScratchConnectionManager:
+    """
+    Connection manager handed to handlers under test.
+
+    Transactions run against the scratch schema (public stays on the search
+    path for functions such as portsummary_tagset) and are always rolled back,
+    so handlers that write leave nothing behind. Executed statements are
+    collected in `statements`.
+    """
+
+    def __init__(self, conn_manager: DatabaseConnectionManager):
+        self.conn_manager = conn_manager
+        self.statements: List[Tuple[str, Any]] = []
+
+    @contextmanager
+    def scratchCursor(self):
+        """Raw dict cursor bound to the scratch schema, rolled back on exit"""
+        with self.conn_manager.get_connection() as connection:
+            cursor = connection.cursor(cursor_factory=RealDictCursor)
+            try:
+                cursor.execute(f"SET LOCAL search_path TO {SCRATCH_SCHEMA}, public")
+                yield cursor
+            finally:
+                cursor.close()
+                connection.rollback()
+
+    @contextmanager
+    def transaction(self):
+        with self.scratchCursor() as cursor:
+            yield RecordingCursor(cursor, self.statements)
+
+    def __getattr__(self, name):
+        return getattr(self.conn_manager, name)
+
+
+def runStatement(sql: str, params: Tuple) -> Callable[[ScratchConnectionManager], None]:
+    """Check callable for a shared SQL constant that is executed outside a handler method"""
+
+    def run(connManager: ScratchConnectionManager) -> None:
+        with connManager.transaction() as cursor:
+            cursor.execute(sql, params)
+
+    return run
+
+
+@dataclass
+class CheckedQuery:
+    """A handler call whose statements must reach each of `tables` through an index"""
+
+    name: str
+    tables: Tuple[str, ...]
+    run: Callable[[ScratchConnectionManager], Any]
+
+
+@dataclass
+class StatementResult:
+    """Outcome of EXPLAINing one recorded statement"""
+
+    status: str  # PASS, FAIL or SKIP
+    sql: str
+    scans: List[Tuple[str, str]] = field(default_factory=list)
+    executionMs: float = 0.0
+    error: Optional[str] = None
+
+
+CHECKED_QUERIES: List[CheckedQuery] = [
+    # Hot paths named in the index catalogue
+    CheckedQuery(
+        "WalletsInvestedAction.persistWalletsInvestedData existing row",
+        ("walletsinvested",),
+        runStatement(EXISTING_WALLET_INVESTED_QUERY, ("token42", "wallet42")),
+    ),
+    CheckedQuery(
+        "WalletsInvestedHandler.getActiveWalletsByTokenId",
+        ("walletsinvested",),
+        lambda cm: WalletsInvestedHandler(cm).getActiveWalletsByTokenId("token42"),
+    ),
+    CheckedQuery(
+        "SmartMoneyPerformanceReportHandler.calculateWinRate",
+        ("smwallettoppnltoken",),
+        lambda cm: SmartMoneyPerformanceReportHandler(cm).calculateWinRate("wallet42"),
+    ),
+    CheckedQuery(
+        "SMWalletTopPNLTokenHandler.getAllTokensByStatus",
+        ("smwallettoppnltoken",),
+        lambda cm: SMWalletTopPNLTokenHandler(cm).getAllTokensByStatus(TokenStatus.HIGH_PNL_TOKEN),
+    ),
+    CheckedQuery(
+        "AttentionHandler.getTokenDataForAnalysis",
+        ("attentiondata",),
+        lambda cm: AttentionHandler(cm).getTokenDataForAnalysis("token42"),
+    ),
+    CheckedQuery(
+        "AnalyticsHandler.getActiveExecutionsWithConfig",
+        ("strategyexecution",),
+        lambda cm: AnalyticsHandler(cm).getActiveExecutionsWithConfig(),
+    ),
+    CheckedQuery(
+        "AnalyticsHandler.getExecutionsForTokenAndStrategy",
+        ("strategyexecution",),
+        lambda cm: AnalyticsHandler(cm).getExecutionsForTokenAndStrategy("token42", 3),
+    ),
+    CheckedQuery(
+        "AnalyticsHandler.getExecutionTrades",
+        ("tradelog",),
+        lambda cm: AnalyticsHandler(cm).getExecutionTrades(42),
+    ),
+    CheckedQuery(
+        "PortfolioHandler.getTokenData",
+        ("portsummary",),
+        lambda cm: PortfolioHandler(cm).getTokenData(["token42"]),
+    ),
+    # Report handlers
+    CheckedQuery(
+        "PortSummaryReportHandler.getPortSummaryReport",
+        ("portsummary",),
+        lambda cm: PortSummaryReportHandler(cm).getPortSummaryReport(limit=100),
+    ),
+    CheckedQuery(
+        "PortSummaryReportHandler.getPortSummaryReport tags",
+        ("portsummary",),
+        lambda cm: PortSummaryReportHandler(cm).getPortSummaryReport(selectedTags=["whale"], limit=100),
+    ),
+    CheckedQuery(
+        "PortSummaryReportHandler.getPortSummaryById",
+        ("portsummary",),
+        lambda cm: PortSummaryReportHandler(cm).getPortSummaryById(42),
+    ),
+    CheckedQuery(
+        "PortSummaryReportHandler.getTopPerformers",
+        ("portsummary",),
+        lambda cm: PortSummaryReportHandler(cm).getTopPerformers(100),
+    ),
+    CheckedQuery(
+        "PortSummaryReportHandler.getTokenHistory",
+        ("portsummary", "portsummaryhistory"),
+        lambda cm: PortSummaryReportHandler(cm).getTokenHistory("token42"),
+    ),
+    CheckedQuery(
+        "AttentionReportHandler.getAttentionReport",
+        ("attentiontokenregistry", "attentiondata"),
+        lambda cm: AttentionReportHandler(cm).getAttentionReport(limit=100),
+    ),
+    CheckedQuery(
+        "AttentionReportHandler.getAttentionHistoryById",
+        ("attentiondatahistory", "attentiondata"),
+        lambda cm: AttentionReportHandler(cm).getAttentionHistoryById("token42"),
+    ),
+    CheckedQuery(
+        "SmartMoneyPerformanceReportHandler.getSmartMoneyPerformanceReport",
+        ("smartmoneywallets", "smwalletpnlstats"),
+        lambda cm: SmartMoneyPerformanceReportHandler(cm).getSmartMoneyPerformanceReport(limit=100),
+    ),
+    CheckedQuery(
+        "SmartMoneyWalletsReportHandler.getSmartMoneyWalletReport",
+        ("smartmoneywallets", "smwallettoppnltoken"),
+        lambda cm: SmartMoneyWalletsReportHandler(cm).getSmartMoneyWalletReport("wallet42"),
+    ),
+    CheckedQuery(
+        "SMWalletInvestmentRangeReportHandler.getInvestmentRangeReport",
+        ("smwallettoppnltoken",),
+        lambda cm: SMWalletInvestmentRangeReportHandler(cm).getInvestmentRangeReport("wallet42"),
+    ),
+    CheckedQuery(
+        "SmartMoneyWalletBehaviourReportHandler.getWalletBehaviourReport",
+        ("smartmoneywalletbehaviour",),
+        lambda cm: SmartMoneyWalletBehaviourReportHandler(cm).getWalletBehaviourReport("wallet42"),
+    ),
+    CheckedQuery(
+        "SmartMoneyWalletBehaviourReportHandler.getAllWalletsBehaviourSummary",
+        ("smartmoneywalletbehaviour",),
+        lambda cm: SmartMoneyWalletBehaviourReportHandler(cm).getAllWalletsBehaviourSummary(limit=100),
+    ),
+    CheckedQuery(
+        "SmartMoneyWalletBehaviourReportHandler.getWalletBehaviourHistory",
+        ("smartmoneywalletbehaviourhistory",),
+        lambda cm: SmartMoneyWalletBehaviourReportHandler(cm).getWalletBehaviourHistory("wallet42"),
+    ),
+    CheckedQuery(
+        "StrategyPerformanceHandler.getAllExecutions",
+        ("strategyexecution",),
+        lambda cm: StrategyPerformanceHandler(cm).getAllExecutions(limit=100),
+    ),
+    CheckedQuery(
+        "StrategyPerformanceHandler.getStrategyExecutions",
+        ("strategyexecution",),
+        lambda cm: StrategyPerformanceHandler(cm).getStrategyExecutions(3),
+    ),
+]
+
+# Synthetic data generators; {rows} is the row count of the large fact tables.
+# Most rows are inactive/closed so that the active-status predicates stay selective,
+# mirroring production where live rows are a small fraction of history.
+SEED_SQL: Dict[str, str] = {
+    "portsummary": """
+        INSERT INTO {schema}.portsummary (
+            chainname, tokenid, name, tokenage, mcap, currentprice, avgprice, smartbalance,
+            walletsinvesting1000, walletsinvesting5000, walletsinvesting10000,
+            qtychange1d, qtychange7d, qtychange30d, status, firstseen, lastseen, tags)
+        SELECT 'sol', 'token' || g, 'T' || g, '1d', random() * 1e7, random(), random(),
+               random() * 1e6, 1, 1, 1, 0, 0, 0,
+               CASE WHEN g % 100 = 0 THEN 1 ELSE 2 END, now(), now(),
+               CASE WHEN g % 500 = 0 THEN '["whale"]' ELSE '[]' END
+        FROM generate_series(1, {rows}) g
+    """,
+    "portsummaryhistory": """
+        INSERT INTO {schema}.portsummaryhistory (
+            portsummaryid, tokenid, chainname, name, tokenage, mcap, currentprice, avgprice,
+            smartbalance, walletsinvesting1000, walletsinvesting5000, walletsinvesting10000,
+            qtychange1d, qtychange7d, qtychange30d, createdat)
+        SELECT p.portsummaryid, p.tokenid, 'sol', p.name, '1d', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+               now() - (g || ' minutes')::interval
+        FROM {schema}.portsummary p, generate_series(1, 3) g
+        WHERE p.portsummaryid % 3 = 0
+    """,
+    "walletsinvested": """
+        INSERT INTO {schema}.walletsinvested (portsummaryid, tokenid, walletaddress, status)
+        SELECT (g % ({rows} - 1)) + 1, 'token' || (g % 20000), 'wallet' || g, (g % 2) + 1
+        FROM generate_series(1, {rows}) g
+    """,
+    "smartmoneywallets": """
+        INSERT INTO {schema}.smartmoneywallets (walletaddress, walletname, pnl, status)
+        SELECT 'wallet' || g, 'W' || g, random() * 1e5, CASE WHEN g % 10 = 0 THEN 1 ELSE 0 END
+        FROM generate_series(1, 50000) g
+    """,
+    "smwallettoppnltoken": """
+        INSERT INTO {schema}.smwallettoppnltoken (walletaddress, tokenid, name, unprocessedpnl, status)
+        SELECT 'wallet' || (g % 50000), 'token' || g, 'T' || g, random() * 1e5,
+               CASE WHEN g % 50 = 0 THEN 1 ELSE 2 END
+        FROM generate_series(1, {rows}) g
+    """,
+    "smwalletpnlstats": """
+        INSERT INTO {schema}.smwalletpnlstats (walletaddress, tokencount, wincount, winrate)
+        SELECT 'wallet' || g, 20, 10, 50
+        FROM generate_series(1, 50000) g
+    """,
+    "smartmoneywalletbehaviour": """
+        INSERT INTO {schema}.smartmoneywalletbehaviour (walletaddress, totalinvestment, numtokens, analysistime)
+        SELECT 'wallet' || g, random() * 1e6, 20, now()
+        FROM generate_series(1, 50000) g
+    """,
+    "smartmoneywalletbehaviourhistory": """
+        INSERT INTO {schema}.smartmoneywalletbehaviourhistory (walletaddress, totalinvestment, numtokens, analysistime, archivedtime)
+        SELECT 'wallet' || (g % 50000), random() * 1e6, 20, now(), now() - (g || ' minutes')::interval
+        FROM generate_series(1, {rows}) g
+    """,
+    "attentiontokenregistry": """
+        INSERT INTO {schema}.attentiontokenregistry (tokenid, name, chain, firstseenat, lastseenat)
+        SELECT 'token' || g, 'T' || g, 'sol', now(), now()
+        FROM generate_series(0, 19999) g
+    """,
+    "attentiondata": """
+        INSERT INTO {schema}.attentiondata (tokenid, attentionscore, recordedat)
+        SELECT 'token' || (g % 20000), random() * 100, now() - (g || ' seconds')::interval
+        FROM generate_series(1, {rows}) g
+    """,
+    "attentiondatahistory": """
+        INSERT INTO {schema}.attentiondatahistory (
+            attentiondataid, tokenid, attentionscore, recordedat, createdat, updatedat)
+        SELECT g, 'token' || (g % 20000), random() * 100, now(), now(),
+               now() - (g || ' seconds')::interval
+        FROM generate_series(1, {rows}) g
+    """,
+    "strategyconfig": """
+        INSERT INTO {schema}.strategyconfig (
+            strategyname, source, strategyentryconditions, investmentinstructions,
+            profittakinginstructions, riskmanagementinstructions)
+        SELECT 'S' || g, 'PORTSUMMARY', '{{}}', '{{}}', '{{}}', '{{}}'
+        FROM generate_series(1, 50) g
+    """,
+    "strategyexecution": """
+        INSERT INTO {schema}.strategyexecution (
+            strategyid, tokenid, tokenname, allotedamount, status, createdat)
+        SELECT (g % 50) + 1, 'token' || (g % 20000), 'T', 100,
+               CASE WHEN g % 200 = 0 THEN 1 WHEN g % 200 = 1 THEN 2 ELSE 3 END,
+               now() - (g || ' seconds')::interval
+        FROM generate_series(1, {rows}) g
+    """,
+    "tradelog": """
+        INSERT INTO {schema}.tradelog (
+            executionid, tokenid, tokenname, tradetype, amount, tokenprice, coins)
+        SELECT (g % {rows}) + 1, 'token' || (g % 20000), 'T', 'BUY', 1, 1, 1
+        FROM generate_series(1, {rows}) g
+    """,
+}
+
+
+class IndexVerifier:
+    """Builds the synthetic dataset and checks query plans against it"""
+
+    def __init__(self, conn_manager: Optional[DatabaseConnectionManager] = None):
+        self.conn_manager = conn_manager or DatabaseConnectionManager()
+
+    def buildScratchSchema(self, rows: int) -> None:
+        """Create the scratch schema, copy table definitions with indexes and seed data"""
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE")
+            cursor.execute(f"CREATE SCHEMA {SCRATCH_SCHEMA}")
+            for table in SCRATCH_TABLES:
+                # INCLUDING ALL copies defaults, constraints and every catalogued index
+                cursor.execute(
+                    f"CREATE TABLE {SCRATCH_SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)"
+                )
+
+        for table in SCRATCH_TABLES:
+            start = time.time()
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(SEED_SQL[table].format(schema=SCRATCH_SCHEMA, rows=rows))
+            logger.info(f"Seeded {SCRATCH_SCHEMA}.{table} in {time.time() - start:.1f}s")
+
+        # VACUUM cannot run inside a transaction; it also sets the visibility map
+        # so that index-only scans are considered
+        with self.conn_manager.get_connection() as connection:
+            connection.autocommit = True
+            try:
+                with connection.cursor() as cursor:
+                    for table in SCRATCH_TABLES:
+                        cursor.execute(f"VACUUM ANALYZE {SCRATCH_SCHEMA}.{table}")
+            finally:
+                connection.autocommit = False
+
+    def dropScratchSchema(self) -> None:
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(f"DROP SCHEMA IF EXISTS {SCRATCH_SCHEMA} CASCADE")
+
+    def getInvalidIndexes(self) -> List[str]:
+        """Indexes left INVALID by an interrupted CREATE INDEX CONCURRENTLY"""
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(
+                """
+                SELECT c.relname AS indexname
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE NOT i.indisvalid AND n.nspname = 'public'
+                """
+            )
+            return [row["indexname"] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _collectScans(plan: Dict, scans: List[Tuple[str, str]]) -> None:
+        """Walk an EXPLAIN JSON plan collecting (node type, relation) pairs"""
+        relation = plan.get("Relation Name")
+        if relation:
+            scans.append((plan.get("Node Type"), relation))
+        for child in plan.get("Plans", []):
+            IndexVerifier._collectScans(child, scans)
+
+    def checkQuery(self, query: CheckedQuery) -> Tuple[str, List[StatementResult]]:
+        """
+        Run a handler call against the scratch schema and EXPLAIN what it executed.
+
+        Returns:
+            Tuple: (PASS / FAIL / SKIP, result of every statement touching the target tables);
+                SKIP when any statement could not be EXPLAINed
+        """
+        scratch = ScratchConnectionManager(self.conn_manager)
+        try:
+            query.run(scratch)
+        except Exception as e:
+            # Statements executed before the failure are still checked
+            logger.warning(f"{query.name} raised while recording its statements: {e}")
+
+        results = []
+        for sql, params in scratch.statements:
+            if sql.lstrip().upper().startswith("EXPLAIN"):
+                continue
+            touched = [
+                table for table in query.tables
+                if re.search(rf"\b{table}\b", sql, re.IGNORECASE)
+            ]
+            if touched:
+                results.append(self._explainStatement(scratch, sql, params, touched))
+
+        if not results:
+            return "FAIL", results
+        if any(result.status == "FAIL" for result in results):
+            return "FAIL", results
+        if any(result.status == "SKIP" for result in results):
+            return "SKIP", results
+        return "PASS", results
+
+    def _explainStatement(
+        self, scratch: ScratchConnectionManager, sql: str, params: Any, tables: List[str],
+    ) -> StatementResult:
+        """EXPLAIN one recorded statement; reads are also executed (ANALYZE)"""
+        analyze = sql.lstrip().upper().startswith(("SELECT", "WITH"))
+        options = "ANALYZE, FORMAT JSON" if analyze else "FORMAT JSON"
+        try:
+            with scratch.scratchCursor() as cursor:
+                cursor.execute(f"EXPLAIN ({options}) {sql}", params or None)
+                plan = list(cursor.fetchone().values())[0][0]
+        except Exception as e:
+            # The statement cannot run on PostgreSQL at all, so no index can serve it
+            return StatementResult("SKIP", sql, error=str(e).strip().splitlines()[0])
+
+        scans: List[Tuple[str, str]] = []
+        self._collectScans(plan["Plan"], scans)
+        passed = all(
+            any(relation == table for _, relation in scans)
+            and all(nodeType in INDEX_SCAN_NODES for nodeType, relation in scans if relation == table)
+            for table in tables
+        )
+        return StatementResult(
+            "PASS" if passed else "FAIL", sql, scans, plan.get("Execution Time", 0.0)
+        )
+
+    def getTopStatements(self, limit: int = 10) -> List[Dict]:
+        """
+        Slowest statements touching the catalogued tables, if pg_stat_statements is installed.
+
+        Returns:
+            List[Dict]: query, calls, mean time; empty if the extension is unavailable
+        """
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"
+                )
+                if not cursor.fetchone():
+                    return []
+                tablePattern = "|".join(SCRATCH_TABLES)
+                cursor.execute(
+                    """
+                    SELECT query, calls, mean_exec_time
+                    FROM pg_stat_statements
+                    WHERE query ~* %s AND query !~* 'EXPLAIN|indexcheck'
+                    ORDER BY mean_exec_time DESC
+                    LIMIT %s
+                    """,
+                    (f"\\m({tablePattern})\\M", limit),
+                )
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.warning(f"Could not read pg_stat_statements: {e}")
+            return []
+
+    def run(self, rows: int, keep: bool = False) -> bool:
+        """
+        Build the dataset, check every catalogued handler call and print a report.
+
+        Returns:
+            bool: True if every recorded statement ran on PostgreSQL and reached its tables through an index
+        """
+        invalid = self.getInvalidIndexes()
+        if invalid:
+            print(f"INVALID indexes (rebuild them): {', '.join(invalid)}")
+
+        print(f"Building synthetic dataset with {rows} rows per fact table...")
+        self.buildScratchSchema(rows)
+
+        allPassed = not invalid
+        try:
+            for query in CHECKED_QUERIES:
+                status, results = self.checkQuery(query)
+                # A skipped statement proves nothing about its plan, so it fails the run too
+                allPassed = allPassed and status == "PASS"
+                print(f"[{status}] {query.name}")
+                if not results:
+                    print(f"    no statement reached {', '.join(query.tables)}")
+                for result in results:
+                    statement = " ".join(result.sql.split())[:120]
+                    if result.error:
+                        print(f"    {result.status} {statement}\n      could not run: {result.error}")
+                    else:
+                        scanSummary = ", ".join(f"{nodeType} on {relation}" for nodeType, relation in result.scans)
+                        print(
+                            f"    {result.status} ({result.executionMs:.2f} ms) {statement}\n"
+                            f"      {scanSummary}"
+                        )
+        finally:
+            if not keep:
+                self.dropScratchSchema()
+
+        topStatements = self.getTopStatements()
+        if topStatements:
+            print("\nSlowest production statements on catalogued tables (pg_stat_statements):")
+            for statement in topStatements:
+                print(
+                    f"  {statement['mean_exec_time']:.2f} ms x {statement['calls']}: "
+                    f"{' '.join(statement['query'].split())[:160]}"
+                )
+
+        return allPassed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verify that report queries use indexes")
+    parser.add_argument("--rows", type=int, default=1000000, help="Rows per large synthetic table")
+    parser.add_argument("--keep", action="store_true", help=f"Keep the {SCRATCH_SCHEMA} schema afterwards")
+    args = parser.parse_args()
+
+    return 0 if IndexVerifier().run(args.rows, args.keep) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from logs.logger import get_logger
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import hashlib
+import os
+import re
+import time
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "versions")
+
+# Files are named <version>_<description>.sql, e.g. 0001_baseline_schema.sql
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_([A-Za-z0-9_]+)\.sql$")
+
+# A migration whose first line is this marker runs outside a transaction
+# (needed for statements such as CREATE INDEX CONCURRENTLY)
+NO_TRANSACTION_MARKER = "-- migration: no-transaction"
+
+# Index builds whose name can be checked in pg_index before and after they run
+CONCURRENT_INDEX_PATTERN = re.compile(
+    r"^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE,
+)
+
+# Arbitrary constant identifying the migration advisory lock
+MIGRATION_LOCK_ID = 720451
+
+
+class MigrationError(Exception):
+    """Raised when a schema migration cannot be applied."""
+
+    pass
+
+
+@dataclass
+class Migration:
+    """A single versioned migration file"""
+
+    version: int
+    name: str
+    path: str
+    sql: str
+    checksum: str
+    transactional: bool = True
+
+
+class MigrationRunner:
+    """
+    Applies ordered SQL migration files exactly once per database.
+
+    Applied versions are recorded in the schemaversion table. A Postgres
+    advisory lock serialises runners, so several gunicorn workers starting
+    at the same time apply each migration once and the rest simply observe it.
+    """
+
+    def __init__(
+        self,
+        conn_manager: Optional[DatabaseConnectionManager] = None,
+        migrationsDir: str = MIGRATIONS_DIR,
+    ):
+        self.conn_manager = conn_manager or DatabaseConnectionManager()
+        self.migrationsDir = migrationsDir
+
+    def loadMigrations(self) -> List[Migration]:
+        """
+        Read all migration files, ordered by version.
+
+        Returns:
+            List[Migration]: Migrations sorted by ascending version
+
+        Raises:
+            MigrationError: If two files share the same version
+        """
+        migrations: Dict[int, Migration] = {}
+        for fileName in sorted(os.listdir(self.migrationsDir)):
+            match = MIGRATION_FILE_PATTERN.match(fileName)
+            if not match:
+                continue
+
+            version = int(match.group(1))
+            if version in migrations:
+                raise MigrationError(
+                    f"Duplicate migration version {version}: "
+                    f"{migrations[version].path} and {fileName}"
+                )
+
+            path = os.path.join(self.migrationsDir, fileName)
+            with open(path, "r", encoding="utf-8") as f:
+                sql = f.read()
+
+            migrations[version] = Migration(
+                version=version,
+                name=match.group(2),
+                path=path,
+                sql=sql,
+                checksum=hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+                transactional=not sql.lstrip().startswith(NO_TRANSACTION_MARKER),
+            )
+
+        return [migrations[v] for v in sorted(migrations)]
+
+    def _ensureVersionTable(self, cursor) -> None:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schemaversion (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                checksum TEXT NOT NULL,
+                executiontimems INTEGER,
+                appliedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+    def getAppliedVersions(self) -> Dict[int, str]:
+        """
+        Get applied migration versions and their checksums.
+
+        Returns:
+            Dict[int, str]: version -> checksum
+        """
+        with self.conn_manager.transaction() as cursor:
+            self._ensureVersionTable(cursor)
+            cursor.execute("SELECT version, checksum FROM schemaversion")
+            return {row["version"]: row["checksum"] for row in cursor.fetchall()}
+
+    def applyPendingMigrations(self) -> List[int]:
+        """
+        Apply every migration that has not been recorded yet, in version order.
+
+        Returns:
+            List[int]: Versions applied by this call
+
+        Raises:
+            MigrationError: If a migration fails; later migrations are not attempted
+        """
+        migrations = self.loadMigrations()
+        applied = self.getAppliedVersions()
+
+        for migration in migrations:
+            if migration.version in applied and applied[migration.version] != migration.checksum:
+                logger.warning(
+                    f"Migration {migration.version}_{migration.name} changed after it was applied; "
+                    "add a new migration instead of editing an applied one"
+                )
+
+        # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index that
+        # IF NOT EXISTS would skip forever, even in an already applied migration
+        self.rebuildInvalidIndexes([m for m in migrations if m.version in applied])
+
+        pending = [m for m in migrations if m.version not in applied]
+        if not pending:
+            logger.info(
+                f"Database schema is up to date (version {max(applied) if applied else 0})"
+            )
+            return []
+
+        appliedNow = []
+        for migration in pending:
+            if self._applyMigration(migration):
+                appliedNow.append(migration.version)
+
+        logger.info(f"Applied {len(appliedNow)} migration(s): {appliedNow}")
+        return appliedNow
+
+    def _applyMigration(self, migration: Migration) -> bool:
+        """
+        Apply one migration under the advisory lock.
+
+        Returns:
+            bool: True if applied here, False if another process applied it first
+        """
+        start = time.time()
+        try:
+            if migration.transactional:
+                with self.conn_manager.transaction() as cursor:
+                    cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+                    if self._isApplied(cursor, migration.version):
+                        return False
+                    cursor.execute(migration.sql)
+                    self._recordMigration(cursor, migration, start)
+            else:
+                with self.conn_manager.get_connection() as connection:
+                    connection.autocommit = True
+                    try:
+                        with connection.cursor() as cursor:
+                            cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+                            try:
+                                if self._isApplied(cursor, migration.version):
+                                    return False
+                                # A multi-statement string would run as one implicit transaction
+                                for statement in self._splitStatements(migration.sql):
+                                    self._executeStatement(cursor, statement)
+                                self._recordMigration(cursor, migration, start)
+                            finally:
+                                cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+                    finally:
+                        connection.autocommit = False
+        except Exception as e:
+            raise MigrationError(
+                f"Migration {migration.version}_{migration.name} failed: {e}"
+            ) from e
+
+        logger.info(
+            f"Applied migration {migration.version}_{migration.name} "
+            f"in {int((time.time() - start) * 1000)}ms"
+        )
+        return True
+
+    def _executeStatement(self, cursor, statement: str) -> None:
+        """
+        Run one statement of a no-transaction migration.
+
+        Concurrent index builds first drop an INVALID index of the same name left
+        by an earlier failed build, and are checked to be valid afterwards.
+
+        Raises:
+            MigrationError: If an index build leaves an INVALID index behind
+        """
+        match = CONCURRENT_INDEX_PATTERN.match(statement)
+        if not match:
+            cursor.execute(statement)
+            return
+
+        indexName = match.group(1)
+        if self._isIndexValid(cursor, indexName) is False:
+            logger.warning(f"Dropping INVALID index {indexName} before rebuilding it")
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {indexName}")
+
+        cursor.execute(statement)
+        if not self._isIndexValid(cursor, indexName):
+            raise MigrationError(f"Index {indexName} was not built or is INVALID after CREATE INDEX")
+
+    @staticmethod
+    def _isIndexValid(cursor, indexName: str) -> Optional[bool]:
+        """
+        Returns:
+            Optional[bool]: pg_index.indisvalid of the index, None if it does not exist
+        """
+        cursor.execute(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s AND pg_catalog.pg_table_is_visible(c.oid)
+            """,
+            (indexName,),
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return bool(row["indisvalid"] if isinstance(row, dict) else row[0])
+
+    def rebuildInvalidIndexes(self, migrations: List[Migration]) -> List[str]:
+        """
+        Drop and rebuild INVALID indexes declared by the given migrations.
+
+        Returns:
+            List[str]: Names of the indexes rebuilt
+
+        Raises:
+            MigrationError: If a rebuild fails or leaves the index INVALID again
+        """
+        statements = {}
+        for migration in migrations:
+            if migration.transactional:
+                continue
+            for statement in self._splitStatements(migration.sql):
+                match = CONCURRENT_INDEX_PATTERN.match(statement)
+                if match:
+                    statements[match.group(1)] = statement
+        if not statements:
+            return []
+
+        rebuilt = []
+        try:
+            with self.conn_manager.get_connection() as connection:
+                connection.autocommit = True
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+                        try:
+                            for indexName, statement in statements.items():
+                                if self._isIndexValid(cursor, indexName) is not False:
+                                    continue
+                                self._executeStatement(cursor, statement)
+                                logger.info(f"Rebuilt INVALID index {indexName}")
+                                rebuilt.append(indexName)
+                        finally:
+                            cursor.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+                finally:
+                    connection.autocommit = False
+        except Exception as e:
+            raise MigrationError(f"Rebuilding INVALID indexes failed: {e}") from e
+        return rebuilt
+
+    @staticmethod
+    def _splitStatements(sql: str) -> List[str]:
+        """Split a no-transaction migration into statements terminated by ';' at line end"""
+        statements = []
+        for chunk in re.split(r";\s*(?:\n|$)", sql):
+            lines = [l for l in chunk.splitlines() if l.strip() and not l.strip().startswith("--")]
+            if lines:
+                statements.append("\n".join(lines))
+        return statements
+
+    @staticmethod
+    def _isApplied(cursor, version: int) -> bool:
+        cursor.execute("SELECT 1 FROM schemaversion WHERE version = %s", (version,))
+        return cursor.fetchone() is not None
+
+    @staticmethod
+    def _recordMigration(cursor, migration: Migration, start: float) -> None:
+        cursor.execute(
+            """
+            INSERT INTO schemaversion (version, name, checksum, executiontimems)
+            VALUES (%s, %s, %s, %s)
+            """,
+            (
+                migration.version,
+                migration.name,
+                migration.checksum,
+                int((time.time() - start) * 1000),
+            ),
+        )
@@ -0,0 +1,571 @@
+-- Baseline schema: every table previously created by handler constructors
+-- and initialize_database(). All statements are idempotent so the baseline can
+-- be recorded against databases that already contain these tables.
+
+-- Portfolio summary
+CREATE TABLE IF NOT EXISTS portsummary (
+    portsummaryid SERIAL PRIMARY KEY,
+    chainname TEXT NOT NULL,
+    tokenid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tokenage TEXT NOT NULL,
+    mcap DECIMAL NOT NULL,
+    currentprice DECIMAL NOT NULL,
+    avgprice DECIMAL NOT NULL,
+    smartbalance DECIMAL NOT NULL,
+    walletsinvesting1000 INTEGER NOT NULL,
+    walletsinvesting5000 INTEGER NOT NULL,
+    walletsinvesting10000 INTEGER NOT NULL,
+    qtychange1d DECIMAL NOT NULL,
+    qtychange7d DECIMAL NOT NULL,
+    qtychange30d DECIMAL NOT NULL,
+    status INTEGER DEFAULT 1,
+    firstseen TIMESTAMP NOT NULL,
+    lastseen TIMESTAMP NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    tags TEXT,
+    markedinactive TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS portsummaryhistory (
+    historyid SERIAL PRIMARY KEY,
+    portsummaryid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    chainname TEXT NOT NULL,
+    name TEXT NOT NULL,
+    tokenage TEXT NOT NULL,
+    mcap DECIMAL NOT NULL,
+    currentprice DECIMAL NOT NULL,
+    avgprice DECIMAL NOT NULL,
+    smartbalance DECIMAL NOT NULL,
+    walletsinvesting1000 INTEGER NOT NULL,
+    walletsinvesting5000 INTEGER NOT NULL,
+    walletsinvesting10000 INTEGER NOT NULL,
+    qtychange1d DECIMAL NOT NULL,
+    qtychange7d DECIMAL NOT NULL,
+    qtychange30d DECIMAL NOT NULL,
+    status INTEGER DEFAULT 1,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    tags TEXT,
+    FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
+);
+
+-- Wallets invested
+CREATE TABLE IF NOT EXISTS walletsinvested (
+    walletinvestedid SERIAL PRIMARY KEY,
+    portsummaryid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    walletaddress TEXT NOT NULL,
+    walletname TEXT,
+    coinquantity DECIMAL,
+    smartholding DECIMAL,
+    firstbuytime TIMESTAMP,
+    totalinvestedamount DECIMAL,
+    amounttakenout DECIMAL,
+    totalcoins DECIMAL,
+    avgentry DECIMAL,
+    qtychange1d DECIMAL,
+    qtychange7d DECIMAL,
+    chainedgepnl DECIMAL,
+    transactionscount INTEGER DEFAULT 0,
+    tags TEXT,
+    firstseen TIMESTAMP,
+    lastseen TIMESTAMP,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status INTEGER DEFAULT 1,
+    FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE,
+    UNIQUE(tokenid, walletaddress)
+);
+
+CREATE TABLE IF NOT EXISTS walletsinvestedhistory (
+    historyid SERIAL PRIMARY KEY,
+    walletinvestedid INTEGER NOT NULL,
+    portsummaryid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    walletaddress TEXT NOT NULL,
+    walletname TEXT,
+    coinquantity DECIMAL,
+    smartholding DECIMAL,
+    firstbuytime TIMESTAMP,
+    totalinvestedamount DECIMAL,
+    amounttakenout DECIMAL,
+    totalcoins DECIMAL,
+    avgentry DECIMAL,
+    qtychange1d DECIMAL,
+    qtychange7d DECIMAL,
+    chainedgepnl DECIMAL,
+    transactionscount INTEGER,
+    tags TEXT,
+    status INTEGER,
+    snaptimeat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    createdat TIMESTAMP NOT NULL,
+    FOREIGN KEY (walletinvestedid) REFERENCES walletsinvested(walletinvestedid) ON DELETE CASCADE,
+    FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
+);
+
+-- Job tracking
+CREATE TABLE IF NOT EXISTS job_locks (
+    job_id TEXT PRIMARY KEY,
+    locked_at TIMESTAMP NOT NULL,
+    timeout INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS job_executions (
+    id SERIAL PRIMARY KEY,
+    job_id TEXT NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP,
+    status TEXT NOT NULL,
+    error_message TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS jobs (
+    id SERIAL PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    description TEXT,
+    params TEXT,
+    status INTEGER NOT NULL,
+    schedule TEXT,
+    last_run TIMESTAMP,
+    next_run TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Older deployments stored the failure text in a column named "error"
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'job_executions' AND column_name = 'error'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'job_executions' AND column_name = 'error_message'
+    ) THEN
+        ALTER TABLE job_executions RENAME COLUMN error TO error_message;
+    END IF;
+END $$;
+
+ALTER TABLE job_executions ADD COLUMN IF NOT EXISTS error_message TEXT;
+
+-- Smart money wallets
+CREATE TABLE IF NOT EXISTS smartmoneywallets (
+    id SERIAL PRIMARY KEY,
+    walletaddress TEXT NOT NULL UNIQUE,
+    walletname TEXT NOT NULL,
+    totalinvested DECIMAL,
+    totalwithdrew DECIMAL,
+    pnl DECIMAL,
+    pnlpercentage DECIMAL,
+    winrate DECIMAL,
+    wincount INTEGER,
+    losscount INTEGER,
+    totaldeals INTEGER,
+    verified INTEGER,
+    chain TEXT,
+    status INTEGER DEFAULT 1,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    issmartmoney INTEGER DEFAULT 1
+);
+
+-- status defaults to TokenStatus.LOW_PNL_TOKEN
+CREATE TABLE IF NOT EXISTS smwallettoppnltoken (
+    id SERIAL PRIMARY KEY,
+    walletaddress TEXT NOT NULL,
+    tokenid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    amountinvested DECIMAL,
+    amounttakenout DECIMAL,
+    remainingcoins DECIMAL,
+    unprocessedpnl DECIMAL,
+    unprocessedroi DECIMAL,
+    transactionscount INTEGER DEFAULT 0,
+    createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    lastupdatedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status INTEGER DEFAULT 2,
+    UNIQUE(walletaddress, tokenid)
+);
+
+CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviour (
+    walletaddress TEXT PRIMARY KEY,
+    totalinvestment DECIMAL,
+    numtokens INTEGER,
+    avginvestmentpertoken DECIMAL,
+    highconvictionnumtokens INTEGER,
+    highconvictionavginvestment DECIMAL,
+    highconvictionwinrate DECIMAL,
+    highconvictiontotalinvested DECIMAL,
+    highconvictiontotaltakenout DECIMAL,
+    highconvictionpercentagereturn DECIMAL,
+    mediumconvictionnumtokens INTEGER,
+    mediumconvictionavginvestment DECIMAL,
+    mediumconvictionwinrate DECIMAL,
+    mediumconvictiontotalinvested DECIMAL,
+    mediumconvictiontotaltakenout DECIMAL,
+    mediumconvictionpercentagereturn DECIMAL,
+    lowconvictionnumtokens INTEGER,
+    lowconvictionavginvestment DECIMAL,
+    lowconvictionwinrate DECIMAL,
+    lowconvictiontotalinvested DECIMAL,
+    lowconvictiontotaltakenout DECIMAL,
+    lowconvictionpercentagereturn DECIMAL,
+    createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    analysistime TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviourhistory (
+    historyid SERIAL PRIMARY KEY,
+    walletaddress TEXT,
+    totalinvestment DECIMAL,
+    numtokens INTEGER,
+    avginvestmentpertoken DECIMAL,
+    highconvictionnumtokens INTEGER,
+    highconvictionavginvestment DECIMAL,
+    highconvictionwinrate DECIMAL,
+    highconvictiontotalinvested DECIMAL,
+    highconvictiontotaltakenout DECIMAL,
+    highconvictionpercentagereturn DECIMAL,
+    mediumconvictionnumtokens INTEGER,
+    mediumconvictionavginvestment DECIMAL,
+    mediumconvictionwinrate DECIMAL,
+    mediumconvictiontotalinvested DECIMAL,
+    mediumconvictiontotaltakenout DECIMAL,
+    mediumconvictionpercentagereturn DECIMAL,
+    lowconvictionnumtokens INTEGER,
+    lowconvictionavginvestment DECIMAL,
+    lowconvictionwinrate DECIMAL,
+    lowconvictiontotalinvested DECIMAL,
+    lowconvictiontotaltakenout DECIMAL,
+    lowconvictionpercentagereturn DECIMAL,
+    createdtime TIMESTAMP,
+    analysistime TIMESTAMP,
+    archivedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Attention
+CREATE TABLE IF NOT EXISTS attentiontokenregistry (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    firstseenat TIMESTAMP NOT NULL,
+    lastseenat TIMESTAMP NOT NULL,
+    currentstatus VARCHAR(20) DEFAULT 'NEW',
+    attentioncount INT DEFAULT 1,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS attentiondata (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL,
+    name TEXT,
+    chain TEXT,
+    attentionscore NUMERIC NOT NULL,
+    change1hbps INTEGER,
+    change1dbps INTEGER,
+    change7dbps INTEGER,
+    change30dbps INTEGER,
+    recordedat TIMESTAMP NOT NULL,
+    datasource VARCHAR(50),
+    registryid INTEGER,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (tokenid) REFERENCES attentiontokenregistry(tokenid) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS attentiondatahistory (
+    historyid SERIAL PRIMARY KEY,
+    attentiondataid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    name TEXT,
+    chain TEXT,
+    attentionscore NUMERIC NOT NULL,
+    change1hbps INTEGER,
+    change1dbps INTEGER,
+    change7dbps INTEGER,
+    change30dbps INTEGER,
+    recordedat TIMESTAMP NOT NULL,
+    datasource VARCHAR(50),
+    createdat TIMESTAMP NOT NULL,
+    updatedat TIMESTAMP NOT NULL,
+    FOREIGN KEY (tokenid) REFERENCES attentiontokenregistry(tokenid) ON DELETE CASCADE
+);
+
+-- Volume bot
+CREATE TABLE IF NOT EXISTS volumetokeninfo (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    tokenname TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    tokendecimals INTEGER,
+    circulatingsupply TEXT,
+    tokenage TEXT,
+    twitterlink TEXT,
+    telegramlink TEXT,
+    websitelink TEXT,
+    firstseenat TIMESTAMP,
+    lastupdatedat TIMESTAMP,
+    count INTEGER DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS volumetokenstates (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    volume24h DECIMAL NOT NULL,
+    buysolqty INTEGER NOT NULL,
+    occurrencecount INTEGER NOT NULL,
+    percentilerankpeats DECIMAL,
+    percentileranksol DECIMAL,
+    dexstatus INTEGER NOT NULL,
+    change1hpct DECIMAL NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    lastupdatedat TIMESTAMP,
+    FOREIGN KEY(tokenid) REFERENCES volumetokeninfo(tokenid)
+);
+
+CREATE TABLE IF NOT EXISTS volumetokenhistory (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL,
+    snapshotat TIMESTAMP NOT NULL,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    volume24h DECIMAL NOT NULL,
+    buysolqty INTEGER NOT NULL,
+    occurrencecount INTEGER NOT NULL,
+    percentilerankpeats DECIMAL,
+    percentileranksol DECIMAL,
+    dexstatus INTEGER NOT NULL,
+    change1hpct DECIMAL NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(tokenid) REFERENCES volumetokeninfo(tokenid)
+);
+
+CREATE INDEX IF NOT EXISTS idx_volumetokeninfo_tokenid ON volumetokeninfo(tokenid);
+CREATE INDEX IF NOT EXISTS idx_volumetokenstates_tokenid ON volumetokenstates(tokenid);
+CREATE INDEX IF NOT EXISTS idx_volumetokenhistory_tokenid ON volumetokenhistory(tokenid);
+CREATE INDEX IF NOT EXISTS idx_volumetokenhistory_snapshot ON volumetokenhistory(snapshotat);
+
+-- Pump.fun
+CREATE TABLE IF NOT EXISTS pumpfuninfo (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    tokenname TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    tokendecimals INTEGER NOT NULL,
+    circulatingsupply TEXT,
+    tokenage TEXT,
+    twitterlink TEXT,
+    telegramlink TEXT,
+    websitelink TEXT,
+    firstseenat TIMESTAMP NOT NULL,
+    lastupdatedat TIMESTAMP,
+    count INTEGER DEFAULT 1,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS pumpfunstates (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    volume24h DECIMAL NOT NULL,
+    buysolqty INTEGER NOT NULL,
+    occurrencecount INTEGER NOT NULL,
+    percentilerankpeats DECIMAL,
+    percentileranksol DECIMAL,
+    dexstatus INTEGER NOT NULL,
+    change1hpct DECIMAL NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    lastupdatedat TIMESTAMP,
+    FOREIGN KEY(tokenid) REFERENCES pumpfuninfo(tokenid)
+);
+
+CREATE TABLE IF NOT EXISTS pumpfunhistory (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL,
+    snapshotat TIMESTAMP NOT NULL,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    volume24h DECIMAL NOT NULL,
+    buysolqty INTEGER NOT NULL,
+    occurrencecount INTEGER NOT NULL,
+    percentilerankpeats DECIMAL,
+    percentileranksol DECIMAL,
+    dexstatus INTEGER NOT NULL,
+    change1hpct DECIMAL NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(tokenid) REFERENCES pumpfuninfo(tokenid)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pumpfuninfo_tokenid ON pumpfuninfo(tokenid);
+CREATE INDEX IF NOT EXISTS idx_pumpfunstates_tokenid ON pumpfunstates(tokenid);
+CREATE INDEX IF NOT EXISTS idx_pumpfunhistory_tokenid ON pumpfunhistory(tokenid);
+
+-- Onchain
+CREATE TABLE IF NOT EXISTS onchaininfo (
+    id SERIAL PRIMARY KEY,
+    tokenid TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    count INTEGER DEFAULT 1,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS onchainstate (
+    id SERIAL PRIMARY KEY,
+    onchaininfoid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL UNIQUE,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    makers INTEGER NOT NULL,
+    price1h DECIMAL NOT NULL,
+    rank INTEGER NOT NULL,
+    age TEXT,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP,
+    FOREIGN KEY(onchaininfoid) REFERENCES onchaininfo(id),
+    FOREIGN KEY(tokenid) REFERENCES onchaininfo(tokenid)
+);
+
+CREATE TABLE IF NOT EXISTS onchainhistory (
+    id SERIAL PRIMARY KEY,
+    onchainstateid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    price DECIMAL NOT NULL,
+    marketcap DECIMAL NOT NULL,
+    liquidity DECIMAL NOT NULL,
+    makers INTEGER NOT NULL,
+    price1h DECIMAL NOT NULL,
+    rank INTEGER NOT NULL,
+    age TEXT,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(onchainstateid) REFERENCES onchainstate(id),
+    FOREIGN KEY(tokenid) REFERENCES onchaininfo(tokenid)
+);
+
+CREATE INDEX IF NOT EXISTS idx_onchaininfo_tokenid ON onchaininfo(tokenid);
+CREATE INDEX IF NOT EXISTS idx_onchainstate_tokenid ON onchainstate(tokenid);
+CREATE INDEX IF NOT EXISTS idx_onchainhistory_tokenid ON onchainhistory(tokenid);
+
+-- Auth
+CREATE TABLE IF NOT EXISTS authtokens (
+    id SERIAL PRIMARY KEY,
+    servicename VARCHAR(50) NOT NULL UNIQUE,
+    accesstoken TEXT NOT NULL,
+    refreshtoken TEXT NOT NULL,
+    accesstokenexpiresat TIMESTAMP NOT NULL,
+    refreshtokenexpiresat TIMESTAMP NOT NULL,
+    logintime TIMESTAMP NOT NULL,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS servicecredentials (
+    id SERIAL PRIMARY KEY,
+    servicename VARCHAR(100) NOT NULL,
+    credentialtype VARCHAR(20) NOT NULL,
+    isactive INTEGER DEFAULT 1,
+    metadata TEXT,
+    apikey TEXT,
+    apisecret TEXT,
+    availablecredits INTEGER,
+    username TEXT,
+    password TEXT,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    lastusedat TIMESTAMP,
+    expiresat TIMESTAMP,
+    UNIQUE(servicename, apikey),
+    UNIQUE(servicename, username)
+);
+
+-- Strategy analytics
+-- status: whether the execution monitor should retry investing after a failed attempt
+-- active: whether the strategy is active
+CREATE TABLE IF NOT EXISTS strategyconfig (
+    strategyid SERIAL PRIMARY KEY,
+    strategyname TEXT NOT NULL,
+    source TEXT NOT NULL,
+    description TEXT,
+    strategyentryconditions TEXT NOT NULL,
+    chartconditions TEXT,
+    investmentinstructions TEXT NOT NULL,
+    profittakinginstructions TEXT NOT NULL,
+    riskmanagementinstructions TEXT NOT NULL,
+    moonbaginstructions TEXT,
+    additionalinstructions TEXT,
+    status INTEGER DEFAULT 1,
+    active INTEGER DEFAULT 1,
+    superuser INTEGER DEFAULT 0,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS strategyexecution (
+    executionid SERIAL PRIMARY KEY,
+    strategyid INTEGER NOT NULL,
+    description TEXT,
+    tokenid TEXT NOT NULL,
+    tokenname TEXT NOT NULL,
+    avgentryprice DECIMAL,
+    remainingcoins DECIMAL,
+    allotedamount DECIMAL NOT NULL,
+    investedamount DECIMAL,
+    amounttakenout DECIMAL,
+    realizedpnl DECIMAL,
+    realizedpnlpercent DECIMAL,
+    status INTEGER NOT NULL,
+    notes TEXT,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (strategyid) REFERENCES strategyconfig(strategyid)
+);
+
+CREATE TABLE IF NOT EXISTS tradelog (
+    tradeid SERIAL PRIMARY KEY,
+    executionid INTEGER NOT NULL,
+    tokenid TEXT NOT NULL,
+    tokenname TEXT NOT NULL,
+    tradetype TEXT NOT NULL,
+    amount DECIMAL NOT NULL,
+    tokenprice DECIMAL NOT NULL,
+    coins DECIMAL NOT NULL,
+    description TEXT,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (executionid) REFERENCES strategyexecution(executionid)
+);
+
+-- Notifications (status defaults to NotificationStatus.PENDING)
+CREATE TABLE IF NOT EXISTS notification (
+    id SERIAL PRIMARY KEY,
+    source TEXT NOT NULL,
+    chatgroup TEXT NOT NULL,
+    content TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'PENDING',
+    servicetype TEXT,
+    errordetails TEXT,
+    buttons TEXT,
+    createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updatedat TIMESTAMP,
+    sentat TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_notification_status ON notification (status);
@@ -0,0 +1,50 @@
+-- migration: no-transaction
+-- Index catalogue for hot lookup columns. Built CONCURRENTLY so ingest jobs
+-- keep writing while the indexes are created; each entry names the query it serves.
+-- Unique indexes are only declared where the code already treats the key as unique;
+-- creating one fails if the table holds duplicates, which must then be resolved by hand.
+
+-- portsummary: PortfolioHandler.getTokenData / updateSummary look rows up by tokenid
+-- and PortfolioSummaryAction keys existing records by tokenid, so it is one row per token
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_portsummary_tokenid ON portsummary(tokenid);
+-- PortSummaryReportHandler: WHERE status = 1 ORDER BY mcap DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummary_status_mcap ON portsummary(status, mcap DESC);
+
+-- portsummaryhistory: history reads by token, newest first; FK cascade from portsummary
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummaryhistory_tokenid_createdat ON portsummaryhistory(tokenid, createdat DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummaryhistory_portsummaryid ON portsummaryhistory(portsummaryid);
+
+-- walletsinvested: (tokenid, walletaddress) is already covered by its UNIQUE constraint.
+-- PortfolioTaggerAction: WHERE tokenid = ? AND status = ?; joins and cascades by portsummaryid
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_walletsinvested_tokenid_status ON walletsinvested(tokenid, status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_walletsinvested_portsummaryid ON walletsinvested(portsummaryid);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_walletsinvested_walletaddress ON walletsinvested(walletaddress);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_walletsinvestedhistory_walletinvestedid ON walletsinvestedhistory(walletinvestedid);
+
+-- smwallettoppnltoken: WHERE walletaddress = ? is served by UNIQUE(walletaddress, tokenid).
+-- SMWalletTopPNLTokenHandler: WHERE status = ? ORDER BY unprocessedpnl DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_smwallettoppnltoken_status_pnl ON smwallettoppnltoken(status, unprocessedpnl DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_smwallettoppnltoken_tokenid ON smwallettoppnltoken(tokenid);
+
+-- smartmoneywallets: WHERE status = 1 ORDER BY pnl DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_smartmoneywallets_status_pnl ON smartmoneywallets(status, pnl DESC);
+
+-- attentiondata: AttentionReportHandler GROUP BY tokenid MAX(recordedat) and
+-- AttentionHandler._getLastAttentionRecord ORDER BY recordedat DESC LIMIT 1
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attentiondata_tokenid_recordedat ON attentiondata(tokenid, recordedat DESC);
+-- AttentionReportHandler token history: WHERE tokenid = ? ORDER BY updatedat
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attentiondatahistory_tokenid_updatedat ON attentiondatahistory(tokenid, updatedat);
+
+-- strategyexecution: AnalyticsHandler.getActiveExecutionsWithConfig WHERE status IN (...),
+-- getExecutionsForTokenAndStrategy WHERE tokenid = ? AND strategyid = ? ORDER BY createdat DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategyexecution_status ON strategyexecution(status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategyexecution_tokenid_strategyid ON strategyexecution(tokenid, strategyid, createdat DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategyexecution_strategyid ON strategyexecution(strategyid);
+
+-- tradelog: WHERE executionid = ? ORDER BY createdat
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tradelog_executionid_createdat ON tradelog(executionid, createdat);
+
+-- Per-token time series reads (getTokenHistory): WHERE tokenid = ? AND time BETWEEN ? AND ?
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_volumetokenhistory_tokenid_snapshotat ON volumetokenhistory(tokenid, snapshotat);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_pumpfunhistory_tokenid_snapshotat ON pumpfunhistory(tokenid, snapshotat);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_onchainhistory_tokenid_createdat ON onchainhistory(tokenid, createdat DESC);
@@ -0,0 +1,34 @@
+-- migration: no-transaction
+-- Time-series rollups for token history (TimeSeriesStore). Raw snapshots stay in the
+-- per-source history tables; rollups hold 1m/5m/1h OHLC buckets per (source, token).
+
+CREATE TABLE IF NOT EXISTS tokentimeseriesrollup (
+    source TEXT NOT NULL,
+    tokenid TEXT NOT NULL,
+    resolution TEXT NOT NULL,
+    bucketstart TIMESTAMP NOT NULL,
+    open DECIMAL,
+    high DECIMAL,
+    low DECIMAL,
+    close DECIMAL,
+    marketcap DECIMAL,
+    liquidity DECIMAL,
+    volume DECIMAL,
+    samples INTEGER NOT NULL,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source, tokenid, resolution, bucketstart)
+);
+
+-- Highest raw history id folded into the rollups, per source
+CREATE TABLE IF NOT EXISTS tokentimeserieswatermark (
+    source TEXT PRIMARY KEY,
+    lastid BIGINT NOT NULL DEFAULT 0,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Retention deletes by age across all tokens
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tokentimeseriesrollup_resolution_bucketstart ON tokentimeseriesrollup(resolution, bucketstart);
+
+-- portsummaryhistory rows are stamped with the archive time in updatedat
+-- (createdat carries the summary's original creation time)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummaryhistory_tokenid_updatedat ON portsummaryhistory(tokenid, updatedat);
@@ -0,0 +1,30 @@
+-- Per-wallet win-rate stats over smwallettoppnltoken for the Smart Money Performance
+-- Report. Maintained by SMWalletTopPNLTokenHandler.refreshWalletStats whenever
+-- SMWalletTopPNLTokenAction persists a wallet's tokens.
+
+CREATE TABLE IF NOT EXISTS smwalletpnlstats (
+    walletaddress TEXT PRIMARY KEY,
+    tokencount INTEGER NOT NULL DEFAULT 0,
+    wincount INTEGER NOT NULL DEFAULT 0,
+    winrate DECIMAL NOT NULL DEFAULT 0,
+    updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- SmartMoneyPerformanceReportHandler: ORDER BY winrate
+CREATE INDEX IF NOT EXISTS idx_smwalletpnlstats_winrate ON smwalletpnlstats(winrate DESC);
+
+-- Backfill from the tokens already stored
+INSERT INTO smwalletpnlstats (walletaddress, tokencount, wincount, winrate, updatedat)
+SELECT
+    walletaddress,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE unprocessedpnl > 0),
+    COUNT(*) FILTER (WHERE unprocessedpnl > 0) * 100.0 / COUNT(*),
+    CURRENT_TIMESTAMP
+FROM smwallettoppnltoken
+GROUP BY walletaddress
+ON CONFLICT (walletaddress) DO UPDATE SET
+    tokencount = EXCLUDED.tokencount,
+    wincount = EXCLUDED.wincount,
+    winrate = EXCLUDED.winrate,
+    updatedat = EXCLUDED.updatedat;
@@ -0,0 +1,21 @@
+-- migration: no-transaction
+-- Report pagination (ReportQuery): tag filters pushed into SQL and indexes for the
+-- default keyset orders. Each entry names the report it serves.
+
+-- portsummary.tags is TEXT holding a JSON array (older rows: comma-separated).
+-- portsummary_tagset normalises both forms to text[] so tag filters can use && on a GIN index.
+CREATE OR REPLACE FUNCTION portsummary_tagset(tags TEXT) RETURNS TEXT[] LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT CASE WHEN tags IS NULL OR btrim(tags) = '' THEN ARRAY[]::TEXT[] WHEN left(btrim(tags), 1) = '[' THEN ARRAY(SELECT btrim(value) FROM jsonb_array_elements_text(tags::jsonb) AS value) ELSE ARRAY(SELECT btrim(value) FROM unnest(string_to_array(tags, ',')) AS value WHERE btrim(value) <> '') END $$;
+
+-- PortSummaryReportHandler: WHERE status = 1 AND portsummary_tagset(tags) && ?
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummary_tagset ON portsummary USING GIN (portsummary_tagset(tags));
+-- PortSummaryReportHandler default order: smartbalance DESC, portsummaryid DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_portsummary_status_smartbalance_id ON portsummary(status, smartbalance DESC, portsummaryid DESC);
+
+-- AttentionReportHandler default order: attentioncount DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_attentiontokenregistry_attentioncount_id ON attentiontokenregistry((COALESCE(attentioncount, 0)) DESC, id DESC);
+
+-- StrategyPerformanceHandler.getAllExecutions default order: createdat DESC, executionid DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_strategyexecution_createdat_id ON strategyexecution((COALESCE(createdat, TIMESTAMP 'epoch')) DESC, executionid DESC);
+
+-- SmartMoneyWalletBehaviourReportHandler summaries: totalinvestment DESC, walletaddress DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_smartmoneywalletbehaviour_totalinvestment ON smartmoneywalletbehaviour((COALESCE(totalinvestment, 0)) DESC, walletaddress DESC);
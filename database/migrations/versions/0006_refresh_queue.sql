@@ -0,0 +1,23 @@
+-- Persistent work queue of the wallet / token refresh jobs (RefreshQueueHandler).
+-- One row per (job, entity); each run upserts its candidates, then leases them in
+-- priority order with FOR UPDATE SKIP LOCKED so concurrent workers never share an
+-- entity and a restarted run carries on with whatever is stalest.
+
+CREATE TABLE IF NOT EXISTS refreshqueue (
+    job TEXT NOT NULL,
+    entitykey TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    valuescore DECIMAL NOT NULL DEFAULT 0,
+    changescore DECIMAL NOT NULL DEFAULT 0,
+    lastrefreshedat TIMESTAMP,
+    leaseowner TEXT,
+    leaseduntil TIMESTAMP,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lasterror TEXT,
+    syncedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (job, entitykey)
+);
+
+-- RefreshQueueHandler.leaseBatch: WHERE job = ? AND lease free, ORDER BY staleness first
+CREATE INDEX IF NOT EXISTS idx_refreshqueue_job_lastrefreshedat ON refreshqueue(job, lastrefreshedat NULLS FIRST);
@@ -0,0 +1,17 @@
+-- Incremental Cielo swap sync (CieloSyncStateHandler). One row per (wallet, token):
+-- the newest swap already folded in and the running investment aggregates, so a
+-- refresh only downloads and sums swaps newer than lastswaptimestamp.
+
+CREATE TABLE IF NOT EXISTS cieloswapsync (
+    walletaddress TEXT NOT NULL,
+    tokenid TEXT NOT NULL,
+    lastswaptimestamp BIGINT NOT NULL,
+    lastswaphashes JSONB NOT NULL DEFAULT '[]'::jsonb,
+    totalinvested DECIMAL NOT NULL DEFAULT 0,
+    totaltakenout DECIMAL NOT NULL DEFAULT 0,
+    totalcoins DECIMAL NOT NULL DEFAULT 0,
+    swapcount INTEGER NOT NULL DEFAULT 0,
+    fullsyncedat TIMESTAMP,
+    syncedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (walletaddress, tokenid)
+);
@@ -0,0 +1,6 @@
+-- Commit-safe rollup watermark (TimeSeriesStore). Each rollup run records the
+-- MAX(id) it observed; a later run only advances lastid to that candidate once
+-- it is older than the safety lag, so ids committed out of order are not skipped.
+
+ALTER TABLE tokentimeserieswatermark ADD COLUMN IF NOT EXISTS candidateid BIGINT;
+ALTER TABLE tokentimeserieswatermark ADD COLUMN IF NOT EXISTS candidateat TIMESTAMP;
@@ -0,0 +1,16 @@
+-- migration: no-transaction
+-- Stored refresh priority (RefreshQueueHandler). leaseBatch used to score every
+-- row of the job on each call; the priority is now a column, recomputed by syncJob
+-- for the whole job and by complete() per entity, and leased from an index.
+
+ALTER TABLE refreshqueue ADD COLUMN IF NOT EXISTS priority DOUBLE PRECISION NOT NULL DEFAULT 0;
+
+-- Same formula as RefreshQueueHandler.priorityExpression; the next syncJob recomputes it anyway
+UPDATE refreshqueue SET priority = (LEAST(EXTRACT(EPOCH FROM (NOW() - COALESCE(lastrefreshedat, TIMESTAMP 'epoch'))) / 86400.0, 7) + LOG(1 + GREATEST(valuescore, 0)) + 2 * LOG(1 + GREATEST(changescore, 0)))::DOUBLE PRECISION;
+
+-- RefreshQueueHandler.leaseBatch: WHERE job = ? AND lease free, ORDER BY priority DESC, entitykey
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_refreshqueue_job_priority ON refreshqueue(job, priority DESC, entitykey);
+
+-- 0006 described this index as serving leaseBatch's order; it never did (that ordered by the
+-- computed priority, not by staleness alone) and nothing else reads it
+DROP INDEX CONCURRENTLY IF EXISTS idx_refreshqueue_job_lastrefreshedat;
@@ -28,67 +28,7 @@ class NotificationHandler(BaseDBHandler):
         """Initialize with connection manager"""
         super().__init__(conn_manager)
         self.tableName = 'notification'
-        self._ensureTableExists()
     
-    def _ensureTableExists(self) -> None:
-        """Ensure the notification table exists"""
-        config = get_config()
-        
-        try:
-            with self.conn_manager.transaction() as cursor:
-                table_name = self.tableName
-                default_status = NotificationStatus.PENDING.value
-                
-                if config.DB_TYPE == 'postgres':
-                    # PostgreSQL syntax - use %s instead of named parameters
-                    cursor.execute(text("""
-                        CREATE TABLE IF NOT EXISTS notification (
-                            id SERIAL PRIMARY KEY,
-                            source TEXT NOT NULL,
-                            chatgroup TEXT NOT NULL,
-                            content TEXT NOT NULL,
-                            status TEXT NOT NULL DEFAULT %s,
-                            servicetype TEXT,
-                            errordetails TEXT,
-                            buttons TEXT,
-                            createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP,
-                            sentat TIMESTAMP
-                        )
-                    """), (default_status,))
-                    
-                    # Create index for faster queries
-                    cursor.execute(text("""
-                        CREATE INDEX IF NOT EXISTS idx_notification_status
-                        ON notification (status)
-                    """))
-                else:
-                    # SQLite syntax
-                    cursor.execute(text("""
-                        CREATE TABLE IF NOT EXISTS notification (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            source TEXT NOT NULL,
-                            chatgroup TEXT NOT NULL,
-                            content TEXT NOT NULL,
-                            status TEXT NOT NULL DEFAULT ?,
-                            servicetype TEXT,
-                            errordetails TEXT,
-                            buttons TEXT,
-                            createdat TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                            updatedat TIMESTAMP,
-                            sentat TIMESTAMP
-                        )
-                    """), (default_status,))
-                    
-                    # Create index for faster queries
-                    cursor.execute(text("""
-                        CREATE INDEX IF NOT EXISTS idx_notification_status
-                        ON notification (status)
-                    """))
-        except Exception as e:
-            logger.error(f"Error ensuring notification table exists: {e}")
-            # Don't re-raise, as we want to allow graceful fallback
-            
     def createNotification(self, notification: Notification) -> Optional[Notification]:
 
         try:
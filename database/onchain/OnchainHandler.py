@@ -9,6 +9,7 @@ from database.operations.schema import OnchainInfo
 from logs.logger import get_logger
 import pytz
 from sqlalchemy import text
+from psycopg2.extras import execute_values
 
 logger = get_logger(__name__)
 
@@ -59,101 +60,6 @@ class OnchainHandler(BaseDBHandler):
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
         self.schema = SCHEMA_DOCS
-        self._createTables()
-
-    def _createTables(self):
-        """Creates all necessary tables for the onchain information system"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                # 1. Base Token Information
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS onchaininfo (
-                        id SERIAL PRIMARY KEY,
-                        tokenid TEXT NOT NULL UNIQUE,
-                        name TEXT NOT NULL,
-                        chain TEXT NOT NULL,
-                        count INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP
-                    )
-                """
-                    )
-                )
-
-                # 2. Token Current State
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS onchainstate (
-                        id SERIAL PRIMARY KEY,
-                        onchaininfoid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL UNIQUE,
-                        price DECIMAL NOT NULL,
-                        marketcap DECIMAL NOT NULL,
-                        liquidity DECIMAL NOT NULL,
-                        makers INTEGER NOT NULL,
-                        price1h DECIMAL NOT NULL,
-                        rank INTEGER NOT NULL,
-                        age TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP,
-                        FOREIGN KEY(onchaininfoid) REFERENCES onchaininfo(id),
-                        FOREIGN KEY(tokenid) REFERENCES onchaininfo(tokenid)
-                    )
-                """
-                    )
-                )
-
-                # 3. Token History
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS onchainhistory (
-                        id SERIAL PRIMARY KEY,
-                        onchainstateid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        price DECIMAL NOT NULL,
-                        marketcap DECIMAL NOT NULL,
-                        liquidity DECIMAL NOT NULL,
-                        makers INTEGER NOT NULL,
-                        price1h DECIMAL NOT NULL,
-                        rank INTEGER NOT NULL,
-                        age TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY(onchainstateid) REFERENCES onchainstate(id),
-                        FOREIGN KEY(tokenid) REFERENCES onchaininfo(tokenid)
-                    )
-                """
-                    )
-                )
-
-            # Create indices in separate transactions
-            self._createIndex(
-                "idx_onchaininfo_tokenid", "onchaininfo", "tokenid"
-            )
-            self._createIndex(
-                "idx_onchainstate_tokenid", "onchainstate", "tokenid"
-            )
-            self._createIndex(
-                "idx_onchainhistory_tokenid", "onchainhistory", "tokenid"
-            )
-
-        except Exception as e:
-            logger.error(f"Error creating tables for OnchainHandler: {e}")
-
-    def _createIndex(self, index_name, table_name, column_name):
-        """Create an index safely in its own transaction"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                cursor.execute(
-                    text(
-                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})"
-                    )
-                )
-        except Exception as e:
-            logger.error(f"Error creating index {index_name}: {e}")
 
     def getTableDocumentation(self, tableName: str) -> dict:
         """Get documentation for a specific table"""
@@ -208,141 +114,102 @@ class OnchainHandler(BaseDBHandler):
         Returns:
             bool: Success status
         """
+        return self.insertTokenDataBatch([onchainToken])
+
+    def insertTokenDataBatch(self, onchainTokens: List['OnchainInfo']) -> bool:
+        """
+        Insert or update a batch of tokens in a single transaction
+        
+        Bumps the info count of known tokens (or inserts them), archives every
+        state about to be replaced into onchainhistory and upserts the new states.
+        Either the whole batch is persisted or none of it is.
+        
+        Args:
+            onchainTokens: OnchainInfo objects to persist
+            
+        Returns:
+            bool: Success status
+        """
+        if not onchainTokens:
+            return True
+
         try:
             # Convert datetime objects to IST timezone
             ist = pytz.timezone('Asia/Kolkata')
             now = datetime.now(ist)
-            
-            # First, check if token already exists in onchaininfo
-            existingInfo = self.getExistingTokenInfo(onchainToken.tokenid)
-            
-            if existingInfo:
-                # Update existing token info
-                with self.conn_manager.transaction() as cursor:
-                    cursor.execute(
-                        text(
-                            """
-                        UPDATE onchaininfo
-                        SET count = count + 1,
-                            updatedat = %s
-                        WHERE tokenid = %s
-                        RETURNING id
-                        """
-                        ),
-                        (now, onchainToken.tokenid),
-                    )
-                    result = cursor.fetchone()
-                    onchainInfoId = result["id"]
-            else:
-                # Insert new token info
-                with self.conn_manager.transaction() as cursor:
-                    cursor.execute(
-                        text(
-                            """
-                        INSERT INTO onchaininfo
-                        (tokenid, name, chain, createdat, updatedat)
-                        VALUES (%s, %s, %s, %s, %s)
-                        RETURNING id
-                        """
-                        ),
-                        (
-                            onchainToken.tokenid,
-                            onchainToken.name,
-                            onchainToken.chain,
-                            now,
-                            now,
-                        ),
-                    )
-                    result = cursor.fetchone()
-                    onchainInfoId = result["id"]
-            
-            # Check if token state exists
-            existingState = self.getExistingTokenState(onchainToken.tokenid)
-            
-            if existingState:
-                # Save current state to history
-                with self.conn_manager.transaction() as cursor:
-                    cursor.execute(
-                        text(
-                            """
-                        INSERT INTO onchainhistory
-                        (onchainstateid, tokenid, price, marketcap, liquidity, makers, price1h, rank, age, createdat)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        ),
-                        (
-                            existingState["id"],
-                            existingState["tokenid"],
-                            existingState["price"],
-                            existingState["marketcap"],
-                            existingState["liquidity"],
-                            existingState["makers"],
-                            existingState["price1h"],
-                            existingState["rank"],
-                            existingState["age"],
-                            now,
-                        ),
-                    )
-                
-                # Update token state
-                with self.conn_manager.transaction() as cursor:
-                    cursor.execute(
-                        text(
-                            """
-                        UPDATE onchainstate
-                        SET price = %s,
-                            marketcap = %s,
-                            liquidity = %s,
-                            makers = %s,
-                            price1h = %s,
-                            rank = %s,
-                            age = %s,
-                            updatedat = %s
-                        WHERE tokenid = %s
-                        """
-                        ),
-                        (
-                            onchainToken.price,
-                            onchainToken.marketcap,
-                            onchainToken.liquidity,
-                            onchainToken.makers,
-                            onchainToken.price1h,
-                            onchainToken.rank,
-                            onchainToken.age,
-                            now,
-                            onchainToken.tokenid,
-                        ),
-                    )
-            else:
-                # Insert new token state
-                with self.conn_manager.transaction() as cursor:
-                    cursor.execute(
-                        text(
-                            """
-                        INSERT INTO onchainstate
-                        (onchaininfoid, tokenid, price, marketcap, liquidity, makers, price1h, rank, age, createdat, updatedat)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """
-                        ),
+
+            # ON CONFLICT cannot touch the same row twice in one statement
+            uniqueTokens = {token.tokenid: token for token in onchainTokens}
+            tokenIds = list(uniqueTokens)
+
+            with self.conn_manager.transaction() as cursor:
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO onchaininfo
+                    (tokenid, name, chain, createdat, updatedat)
+                    VALUES %s
+                    ON CONFLICT (tokenid) DO UPDATE
+                    SET count = onchaininfo.count + 1,
+                        updatedat = EXCLUDED.updatedat
+                    """,
+                    [(token.tokenid, token.name, token.chain, now, now) for token in uniqueTokens.values()],
+                    page_size=len(uniqueTokens),
+                )
+
+                # Save current states to history before they are overwritten
+                cursor.execute(
+                    """
+                    INSERT INTO onchainhistory
+                    (onchainstateid, tokenid, price, marketcap, liquidity, makers, price1h, rank, age, createdat)
+                    SELECT id, tokenid, price, marketcap, liquidity, makers, price1h, rank, age, %s
+                    FROM onchainstate
+                    WHERE tokenid = ANY(%s)
+                    """,
+                    (now, tokenIds),
+                )
+
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO onchainstate
+                    (onchaininfoid, tokenid, price, marketcap, liquidity, makers, price1h, rank, age, createdat, updatedat)
+                    SELECT i.id, v.tokenid, v.price, v.marketcap, v.liquidity, v.makers,
+                           v.price1h, v.rank, v.age, v.seenat, v.seenat
+                    FROM (VALUES %s) AS v (tokenid, price, marketcap, liquidity, makers, price1h, rank, age, seenat)
+                    JOIN onchaininfo i ON i.tokenid = v.tokenid
+                    ON CONFLICT (tokenid) DO UPDATE
+                    SET price = EXCLUDED.price,
+                        marketcap = EXCLUDED.marketcap,
+                        liquidity = EXCLUDED.liquidity,
+                        makers = EXCLUDED.makers,
+                        price1h = EXCLUDED.price1h,
+                        rank = EXCLUDED.rank,
+                        age = EXCLUDED.age,
+                        updatedat = EXCLUDED.updatedat
+                    """,
+                    [
                         (
-                            onchainInfoId,
-                            onchainToken.tokenid,
-                            onchainToken.price,
-                            onchainToken.marketcap,
-                            onchainToken.liquidity,
-                            onchainToken.makers,
-                            onchainToken.price1h,
-                            onchainToken.rank,
-                            onchainToken.age,
+                            token.tokenid,
+                            token.price,
+                            token.marketcap,
+                            token.liquidity,
+                            token.makers,
+                            token.price1h,
+                            token.rank,
+                            token.age,
                             now,
-                            now,
-                        ),
-                    )
-            
+                        )
+                        for token in uniqueTokens.values()
+                    ],
+                    template="(%s, %s::numeric, %s::numeric, %s::numeric, %s::integer, %s::numeric, %s::integer, %s::text, %s)",
+                    page_size=len(uniqueTokens),
+                )
+
             return True
-        
+
         except Exception as e:
-            logger.error(f"Error inserting token data: {e}")
+            logger.error(f"Error inserting batch of {len(onchainTokens)} onchain tokens: {e}")
             return False
 
     def getTokenState(self, tokenId: str) -> Optional[Dict]:
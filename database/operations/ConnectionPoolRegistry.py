@@ -0,0 +1,351 @@
+from config.Config import get_config
+from logs.logger import get_logger
+from typing import Dict, Optional, Tuple
+import os
+import threading
+import time
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+logger = get_logger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes free within the wait timeout."""
+
+    pass
+
+
+class SharedConnectionPool:
+    """
+    Bounded, health-checked wrapper around psycopg2's ThreadedConnectionPool.
+
+    Key features:
+    - Hard cap on open connections (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    - Callers block up to DB_POOL_TIMEOUT seconds for a free connection
+      instead of failing immediately with "connection pool exhausted"
+    - Pre-ping of connections that sat idle longer than the health check interval
+    - Recycling of connections older than DB_POOL_RECYCLE seconds
+    - In-use / idle / wait-time metrics
+    """
+
+    def __init__(
+        self,
+        conn_params: Dict,
+        minconn: int,
+        maxconn: int,
+        wait_timeout: float,
+        recycle_seconds: int,
+        health_check_interval: int,
+    ):
+        self.conn_params = conn_params
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.wait_timeout = wait_timeout
+        self.recycle_seconds = recycle_seconds
+        self.health_check_interval = health_check_interval
+        self.pid = os.getpid()
+        self.closed = False
+
+        self._pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=minconn, maxconn=maxconn, **conn_params
+        )
+        # Slots bound concurrent checkouts so that waiters block instead of erroring
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._stats_lock = threading.Lock()
+        # id(connection) -> creation / last-return timestamps (monotonic).
+        # Entries are dropped whenever a connection is closed so that a
+        # recycled id() never makes a new connection inherit stale timestamps.
+        self._born_at: Dict[int, float] = {}
+        self._returned_at: Dict[int, float] = {}
+
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._health_check_failures = 0
+        self._recycled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def getconn(self):
+        """
+        Borrow a healthy connection from the pool, waiting for a free slot if needed.
+
+        Raises:
+            PoolTimeoutError: If no connection became free within wait_timeout
+        """
+        if self.closed:
+            raise psycopg2.pool.PoolError("connection pool is closed")
+
+        start = time.monotonic()
+        with self._stats_lock:
+            self._waiting += 1
+        acquired = self._slots.acquire(timeout=self.wait_timeout)
+        waited = time.monotonic() - start
+        with self._stats_lock:
+            self._waiting -= 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+            if not acquired:
+                self._timeouts += 1
+
+        if not acquired:
+            raise PoolTimeoutError(
+                f"Timed out after {self.wait_timeout}s waiting for a database connection "
+                f"({self.maxconn} connections in use)"
+            )
+
+        try:
+            connection = self._checkout_healthy()
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._stats_lock:
+            self._in_use += 1
+            self._checkouts += 1
+        return connection
+
+    def _checkout_healthy(self):
+        """Take a connection from the underlying pool, replacing stale or broken ones."""
+        # One retry is enough: a replacement connection is freshly opened
+        for _ in range(2):
+            connection = self._pool.getconn()
+            now = time.monotonic()
+            key = id(connection)
+            bornAt = self._born_at.setdefault(key, now)
+
+            if connection.closed:
+                self._discard(connection)
+                continue
+
+            if self.recycle_seconds and now - bornAt > self.recycle_seconds:
+                with self._stats_lock:
+                    self._recycled += 1
+                self._discard(connection)
+                continue
+
+            returnedAt = self._returned_at.get(key)
+            if returnedAt is not None and now - returnedAt > self.health_check_interval:
+                if not self._ping(connection):
+                    with self._stats_lock:
+                        self._health_check_failures += 1
+                    self._discard(connection)
+                    continue
+
+            return connection
+
+        # Both attempts were stale; the last discard freed a slot for a fresh one
+        connection = self._pool.getconn()
+        self._born_at.setdefault(id(connection), time.monotonic())
+        return connection
+
+    def _ping(self, connection) -> bool:
+        """Run a trivial query to verify the connection is still usable."""
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed health check: {e}")
+            return False
+
+    def _forget(self, connection):
+        """Drop the bookkeeping held for a connection that is being closed."""
+        key = id(connection)
+        self._born_at.pop(key, None)
+        self._returned_at.pop(key, None)
+
+    def _discard(self, connection):
+        """Close a connection and drop it from the underlying pool."""
+        self._forget(connection)
+        try:
+            self._pool.putconn(connection, close=True)
+        except Exception as e:
+            logger.warning(f"Error discarding pooled connection: {e}")
+
+    def putconn(self, connection):
+        """Return a borrowed connection, resetting any open transaction first."""
+        try:
+            if self.closed:
+                if not connection.closed:
+                    connection.close()
+                return
+
+            broken = bool(connection.closed)
+            if not broken:
+                status = connection.get_transaction_status()
+                if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                    broken = True
+                elif status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    try:
+                        connection.rollback()
+                    except Exception:
+                        broken = True
+
+            if broken:
+                self._discard(connection)
+            else:
+                self._returned_at[id(connection)] = time.monotonic()
+                self._pool.putconn(connection)
+                # psycopg2 closes connections returned beyond minconn
+                if connection.closed:
+                    self._forget(connection)
+        finally:
+            with self._stats_lock:
+                self._in_use = max(0, self._in_use - 1)
+            self._slots.release()
+
+    def closeall(self):
+        """Close every connection held by the pool."""
+        self.closed = True
+        try:
+            self._pool.closeall()
+        finally:
+            self._born_at.clear()
+            self._returned_at.clear()
+
+    def getMetrics(self) -> Dict:
+        """
+        Snapshot of pool usage.
+
+        Returns:
+            Dict: inUse, idle, waiting, maxConnections and wait-time statistics
+        """
+        with self._stats_lock:
+            idle = 0 if self.closed else len(self._pool._pool)
+            return {
+                "host": self.conn_params.get("host"),
+                "dbname": self.conn_params.get("dbname"),
+                "pid": self.pid,
+                "closed": self.closed,
+                "maxConnections": self.maxconn,
+                "inUse": self._in_use,
+                "idle": idle,
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "healthCheckFailures": self._health_check_failures,
+                "recycled": self._recycled,
+                "totalWaitSeconds": round(self._total_wait, 6),
+                "avgWaitSeconds": round(self._total_wait / self._checkouts, 6)
+                if self._checkouts
+                else 0.0,
+                "maxWaitSeconds": round(self._max_wait, 6),
+            }
+
+
+class ConnectionPoolRegistry:
+    """
+    Process-wide registry of shared connection pools.
+
+    Every DatabaseConnectionManager resolves its pool here, so constructing
+    managers ad hoc (per request, per job, per API object) never opens new
+    pools. Pools are keyed by connection target and process id so that forked
+    gunicorn workers never reuse sockets inherited from the parent.
+    """
+
+    _pools: Dict[Tuple, SharedConnectionPool] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _build_key(config) -> Tuple:
+        return (
+            config.DB_HOST,
+            config.DB_PORT,
+            config.DB_NAME,
+            config.DB_USER,
+            os.getpid(),
+        )
+
+    @classmethod
+    def get_pool(cls, config=None) -> SharedConnectionPool:
+        """
+        Get (creating on first use) the shared pool for the configured database.
+
+        Args:
+            config: Optional config instance, defaults to get_config()
+
+        Returns:
+            SharedConnectionPool: Pool shared by the whole process
+        """
+        config = config or get_config()
+        key = cls._build_key(config)
+
+        # Fast path - pool already exists and is open
+        pool = cls._pools.get(key)
+        if pool is not None and not pool.closed:
+            return pool
+
+        with cls._lock:
+            pool = cls._pools.get(key)
+            if pool is not None and not pool.closed:
+                return pool
+
+            conn_params = {
+                "user": config.DB_USER,
+                "password": config.DB_PASSWORD,
+                "host": config.DB_HOST,
+                "port": config.DB_PORT,
+                "dbname": config.DB_NAME,
+                "connect_timeout": config.DB_CONNECT_TIMEOUT,
+            }
+            # psycopg2 keeps at most minconn idle connections and closes the
+            # rest on return, so minconn is what keeps DB_POOL_SIZE warm
+            minconn = max(1, config.DB_POOL_SIZE)
+            maxconn = max(minconn, config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW)
+
+            log_params = conn_params.copy()
+            log_params["password"] = "****" if log_params["password"] else "None"
+            logger.info(
+                f"Initializing shared PostgreSQL connection pool "
+                f"(warm {minconn}, max {maxconn}) with: {log_params}"
+            )
+
+            pool = SharedConnectionPool(
+                conn_params=conn_params,
+                minconn=minconn,
+                maxconn=maxconn,
+                wait_timeout=config.DB_POOL_TIMEOUT,
+                recycle_seconds=config.DB_POOL_RECYCLE,
+                health_check_interval=config.DB_POOL_HEALTHCHECK_INTERVAL,
+            )
+            cls._pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_pool(cls, config=None):
+        """Close and forget the shared pool for the configured database."""
+        config = config or get_config()
+        key = cls._build_key(config)
+        with cls._lock:
+            pool = cls._pools.pop(key, None)
+        if pool is not None and not pool.closed:
+            pool.closeall()
+
+    @classmethod
+    def close_all(cls):
+        """Close every pool owned by this process. Call only at shutdown."""
+        with cls._lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            if not pool.closed and pool.pid == os.getpid():
+                try:
+                    pool.closeall()
+                except Exception as e:
+                    logger.error(f"Error closing shared connection pool: {e}")
+
+    @classmethod
+    def get_metrics(cls) -> Optional[Dict]:
+        """
+        Metrics for the pool owned by the current process.
+
+        Returns:
+            Dict or None: Pool metrics, None if no pool has been created yet
+        """
+        pool = cls._pools.get(cls._build_key(get_config()))
+        return pool.getMetrics() if pool is not None else None
@@ -1,8 +1,13 @@
 from config.Config import get_config
 import threading
 from contextlib import contextmanager
-from typing import ContextManager, Generator
+from typing import ContextManager, Generator, Dict, Optional
 from logs.logger import get_logger
+from database.operations.ConnectionPoolRegistry import (
+    ConnectionPoolRegistry,
+    SharedConnectionPool,
+    PoolTimeoutError,
+)
 import os
 import psycopg2
 import psycopg2.pool
@@ -22,11 +27,12 @@ class DatabaseConnectionError(Exception):
 class DatabaseConnectionManager:
     """
     Manages database connections with thread safety.
-    Connection pooling for PostgreSQL is handled here.
+    Connections are borrowed from the process-wide pool in ConnectionPoolRegistry,
+    so any number of managers can be constructed without opening new pools.
 
     Key features:
     - Thread-safe connections
-    - Connection pooling
+    - Shared, bounded connection pooling with health checks
     - Table-level locking
     - Transaction management
     """
@@ -39,19 +45,23 @@ class DatabaseConnectionManager:
     def __init__(self, db_url: str = None):
         """
         Initializes the connection manager.
-        Actual connection initialization is lazy - happens on first use.
+        The shared pool is created lazily on first use and reused by every manager.
 
         Args:
             db_url: Database connection URL (deprecated, kept for compatibility)
         """
         self.config = get_config()
         self.connection_type = "postgres"
-        self.pool = None
-        self._pool_closed = False
         self.logger = logger
 
-        # Store the initialization parameters for lazy connection
-        self._initialized = False
+    @property
+    def pool(self) -> Optional[SharedConnectionPool]:
+        """The shared pool for this process, or None if it could not be created"""
+        try:
+            return ConnectionPoolRegistry.get_pool(self.config)
+        except Exception as e:
+            self._log_pool_failure(e)
+            return None
 
     def _check_pool_status(self):
         """
@@ -59,89 +69,83 @@ class DatabaseConnectionManager:
         Returns:
             bool: True if pool is available, False otherwise
         """
-        return not (self.pool is None or self._pool_closed)
+        return not self.is_pool_closed()
 
     def _initialize_pool_if_needed(self):
         """
-        Initializes the connection pool if needed.
+        Initializes the shared connection pool if needed.
         Returns:
             bool: True if pool is available (either already or newly initialized), False if initialization failed
         """
-        # Fast path - pool is already initialized and available
-        if self._check_pool_status():
-            return True
-
-        # Slow path - acquire lock and initialize pool
-        with self._lock:
-            # Double-check pattern to avoid unnecessary initialization
-            if self._check_pool_status():
-                return True
-
-            # Actually initialize the pool
-            return self._initialize_pool()
+        return self.pool is not None
 
     def _initialize_pool(self):
-        """Initialize the connection pool"""
-        try:
-            # Set connection parameters
-            conn_params = {
-                "user": self.config.DB_USER,
-                "password": self.config.DB_PASSWORD,
-                "host": self.config.DB_HOST,
-                "port": self.config.DB_PORT,
-                "dbname": self.config.DB_NAME,
-            }
-
-            # Log connection attempt (without password)
-            log_params = conn_params.copy()
-            log_params["password"] = "****" if log_params["password"] else "None"
-            logger.info(f"Initializing PostgreSQL connection pool with: {log_params}")
-
-            # Create connection pool
-            self.pool = psycopg2.pool.ThreadedConnectionPool(
-                minconn=1, maxconn=self.config.DB_POOL_SIZE, **conn_params
-            )
-            self._pool_closed = False
-            self._initialized = True
-
-            # Test the connection
-            test_connection = self.pool.getconn()
-            self.pool.putconn(test_connection)
+        """Initialize (or re-create) the shared connection pool"""
+        ConnectionPoolRegistry.close_pool(self.config)
+        pool = self.pool
+        if pool is None:
+            return False
 
-            logger.info(
-                f"Successfully initialized PostgreSQL connection pool to {self.config.DB_HOST}"
-            )
-            return True
+        # Test the connection
+        try:
+            test_connection = pool.getconn()
+            pool.putconn(test_connection)
         except Exception as e:
-            logger.error(f"Failed to initialize PostgreSQL connection pool: {e}")
-            self.pool = None
-            self._pool_closed = True
-            self._initialized = False
+            self._log_pool_failure(e)
+            return False
 
-            # Print more detailed error information
+        logger.info(
+            f"Successfully initialized PostgreSQL connection pool to {self.config.DB_HOST}"
+        )
+        return True
+
+    def _log_pool_failure(self, e: Exception):
+        """Log a failure to create the shared pool with connection details"""
+        logger.error(f"Failed to initialize PostgreSQL connection pool: {e}")
+        logger.error(
+            f"Database connection error details: {type(e).__name__}: {str(e)}"
+        )
+        logger.error(
+            f"Connection parameters: Host={self.config.DB_HOST}, Port={self.config.DB_PORT}, "
+            + f"Database={self.config.DB_NAME}, User={self.config.DB_USER}"
+        )
+
+        if isinstance(e, psycopg2.OperationalError):
             logger.error(
-                f"Database connection error details: {type(e).__name__}: {str(e)}"
+                "This is typically a connection issue (server not running, "
+                + "incorrect credentials, etc.)"
             )
             logger.error(
-                f"Connection parameters: Host={self.config.DB_HOST}, Port={self.config.DB_PORT}, "
-                + f"Database={self.config.DB_NAME}, User={self.config.DB_USER}"
+                "Make sure PostgreSQL is installed and running, and that your "
+                + "credentials are correct."
             )
 
-            if isinstance(e, psycopg2.OperationalError):
-                logger.error(
-                    "This is typically a connection issue (server not running, "
-                    + "incorrect credentials, etc.)"
-                )
-                logger.error(
-                    "Make sure PostgreSQL is installed and running, and that your "
-                    + "credentials are correct."
-                )
+    def is_pool_closed(self):
+        """Check if the shared connection pool is closed"""
+        pool = ConnectionPoolRegistry._pools.get(
+            ConnectionPoolRegistry._build_key(self.config)
+        )
+        return pool is None or pool.closed
 
-            return False
+    def reinitialize_pool_if_closed(self):
+        """
+        Re-create the shared pool if it was closed or never created.
 
-    def is_pool_closed(self):
-        """Check if the connection pool is closed"""
-        return self._pool_closed or self.pool is None
+        Returns:
+            bool: True if the pool is available afterwards
+        """
+        if not self.is_pool_closed():
+            return True
+        return self._initialize_pool_if_needed()
+
+    def get_pool_metrics(self) -> Optional[Dict]:
+        """
+        Usage metrics of the shared pool (in-use, idle, waiting, wait times).
+
+        Returns:
+            Dict or None: Metrics, None if the pool was never created
+        """
+        return ConnectionPoolRegistry.get_metrics()
 
     def _check_and_initialize_pool(self):
         """
@@ -151,46 +155,30 @@ class DatabaseConnectionManager:
             bool: True if pool is available (either already or after initialization),
                   False if initialization failed
         """
-        # Fast path - pool is available
-        if self._check_pool_status():
-            return True
-
-        # Pool unavailable - try to initialize it
-        logger.info("Connection pool unavailable, initializing")
         return self._initialize_pool_if_needed()
 
     @contextmanager
     def get_connection(self):
         """
-        Gets a database connection from the pool.
+        Gets a database connection from the shared pool.
 
         Returns:
             Connection: Database connection
         """
         connection = None
+        pool = None
         try:
-            # Ensure pool is initialized
-            if not self._check_and_initialize_pool():
+            pool = self.pool
+            if pool is None:
                 raise DatabaseConnectionError(
                     "Database connection pool is not initialized and could not be reinitialized. "
                     + "Make sure PostgreSQL is running and credentials are correct."
                 )
 
-            # Get connection from pool
             try:
-                connection = self.pool.getconn()
-            except psycopg2.pool.PoolError as e:
-                # If pool error, try to reinitialize once and get connection again
-                logger.warning(
-                    f"Pool error when getting connection: {str(e)}, attempting to reinitialize"
-                )
-                if self._initialize_pool():
-                    connection = self.pool.getconn()
-                    logger.info(
-                        "Successfully got connection after pool reinitialization"
-                    )
-                else:
-                    self._handle_connection_error(e, "get_connection")
+                connection = pool.getconn()
+            except PoolTimeoutError as e:
+                self._handle_connection_error(e, "get_connection")
 
             yield connection
         except Exception as e:
@@ -200,40 +188,15 @@ class DatabaseConnectionManager:
                 # Already handled, just re-raise
                 raise
         finally:
-            if connection and self._check_pool_status():
-                # Return PostgreSQL connection to pool if it's still open
-                try:
-                    if not connection.closed:
-                        try:
-                            self.pool.putconn(connection)
-                        except psycopg2.pool.PoolError as e:
-                            # Handle "trying to put unkeyed connection" error
-                            if "unkeyed connection" in str(e):
-                                logger.warning(
-                                    f"Attempted to return unkeyed connection to pool: {str(e)}"
-                                )
-                                # Just close the connection instead of returning it to the pool
-                                try:
-                                    connection.close()
-                                    logger.info(
-                                        "Successfully closed unkeyed connection"
-                                    )
-                                except Exception as close_error:
-                                    logger.error(
-                                        f"Error closing unkeyed connection: {close_error}"
-                                    )
-                            else:
-                                self._handle_connection_error(
-                                    e, "return connection to pool"
-                                )
-                except Exception as putconn_error:
-                    logger.error(f"Error returning connection to pool: {putconn_error}")
-                    # Flag for reinitialization if the pool appears to be closed
-                    if "connection pool is closed" in str(putconn_error):
-                        logger.warning(
-                            "Pool appears to be closed, will reinitialize on next transaction"
-                        )
-                        self._pool_closed = True
+            if connection is not None and pool is not None:
+                self._release(pool, connection)
+
+    def _release(self, pool: SharedConnectionPool, connection):
+        """Return a connection to the pool it was borrowed from"""
+        try:
+            pool.putconn(connection)
+        except Exception as putconn_error:
+            logger.error(f"Error returning connection to pool: {putconn_error}")
 
     def _handle_connection_error(
         self, error, operation="database operation", connection=None
@@ -256,8 +219,8 @@ class DatabaseConnectionManager:
                 "This is typically a connection issue (server not running, network, credentials)"
             )
 
-            # If this is a connection issue, mark the pool for reinitialization
-            self._pool_closed = True
+        elif isinstance(error, PoolTimeoutError):
+            logger.error(f"Connection pool exhausted during {operation}: {error}")
 
         elif isinstance(error, psycopg2.pool.PoolError):
             logger.error(f"Pool error during {operation}: {error}")
@@ -285,19 +248,22 @@ class DatabaseConnectionManager:
             f"Database error during {operation}: {str(error)}"
         ) from error
 
-    def _get_transaction_cursor(self):
+    def _get_transaction_cursor(self, pool: SharedConnectionPool):
         """
         Helper method to get a connection and cursor for transactions.
 
+        Args:
+            pool: Shared pool to borrow the connection from
+
         Returns:
             tuple: (connection, cursor)
         """
-        if not self._check_and_initialize_pool():
-            raise DatabaseConnectionError(
-                "Database connection pool could not be initialized"
-            )
-        conn = self.pool.getconn()
-        cur = conn.cursor(cursor_factory=RealDictCursor)
+        conn = pool.getconn()
+        try:
+            cur = conn.cursor(cursor_factory=RealDictCursor)
+        except Exception:
+            pool.putconn(conn)
+            raise
         original_execute = cur.execute
 
         def patched_execute(query, params=None):
@@ -311,7 +277,7 @@ class DatabaseConnectionManager:
                 elif isinstance(params, dict):
                     params = {
                         k: (1 if v is True else 0 if v is False else v)
-                        for k, v in params
+                        for k, v in params.items()
                     }
             return original_execute(query, params)
 
@@ -326,24 +292,16 @@ class DatabaseConnectionManager:
         Returns:
             Cursor: Database cursor for operations
         """
+        pool = None
         conn = None
         cur = None
         try:
-            # First attempt to get connection and cursor
-            try:
-                conn, cur = self._get_transaction_cursor()
-            except psycopg2.pool.PoolError as e:
-                logger.error(f"Pool error on first attempt: {str(e)}")
-                if self._initialize_pool():
-                    logger.info("Reinitialized pool after error")
-                    try:
-                        conn, cur = self._get_transaction_cursor()
-                    except psycopg2.pool.PoolError as e2:
-                        self._handle_connection_error(
-                            e2, "transaction after reinitialization"
-                        )
-                else:
-                    self._handle_connection_error(e, "transaction")
+            pool = self.pool
+            if pool is None:
+                raise DatabaseConnectionError(
+                    "Database connection pool could not be initialized"
+                )
+            conn, cur = self._get_transaction_cursor(pool)
 
             # Yield the cursor for the transaction
             yield cur
@@ -355,6 +313,8 @@ class DatabaseConnectionManager:
                     conn.rollback()
                 except Exception as rollback_error:
                     logger.error(f"Error during transaction rollback: {rollback_error}")
+            if isinstance(e, DatabaseConnectionError):
+                raise
             self._handle_connection_error(e, "transaction", None)
         finally:
             # Close cursor first
@@ -364,21 +324,8 @@ class DatabaseConnectionManager:
                 except Exception as close_error:
                     logger.error(f"Error closing cursor: {close_error}")
             # Then return connection to pool
-            if conn and self._check_pool_status() and not conn.closed:
-                try:
-                    self.pool.putconn(conn)
-                except psycopg2.pool.PoolError as e:
-                    logger.warning(f"Pool error on return: {str(e)}")
-                    if "unkeyed connection" in str(e):
-                        try:
-                            conn.close()
-                            logger.info("Closed unkeyed connection")
-                        except Exception as close_error:
-                            logger.error(
-                                f"Error closing unkeyed connection: {close_error}"
-                            )
-                    else:
-                        self._handle_connection_error(e, "return connection to pool")
+            if conn is not None:
+                self._release(pool, conn)
 
     @contextmanager
     def table_lock(self, table_name: str):
@@ -395,18 +342,17 @@ class DatabaseConnectionManager:
 
     def close(self):
         """
-        Closes all database connections.
-        This method should only be called during application shutdown.
+        Closes all connections of the shared pool.
+        This method should only be called during application shutdown, since
+        every manager in the process borrows from the same pool.
         """
-        if self.pool and not self._pool_closed:
+        if not self.is_pool_closed():
             try:
                 logger.info("Closing PostgreSQL connection pool")
-                self.pool.closeall()
-                self._pool_closed = True
+                ConnectionPoolRegistry.close_pool(self.config)
                 logger.info("Closed all PostgreSQL connections in the pool")
             except Exception as e:
                 logger.error(f"Error closing PostgreSQL connection pool: {e}")
-                self._pool_closed = True
 
     def reconnect(self, force=False):
         """
@@ -420,13 +366,7 @@ class DatabaseConnectionManager:
         """
         logger.info(f"Attempting to reconnect to database (force={force})")
 
-        if force and self.pool and not self._pool_closed:
-            try:
-                logger.info("Forcing pool closure before reconnection")
-                self.pool.closeall()
-            except Exception as e:
-                logger.error(f"Error closing pool during forced reconnection: {e}")
-            finally:
-                self._pool_closed = True
+        if not force and not self.is_pool_closed():
+            return True
 
         return self._initialize_pool()
@@ -6,6 +6,7 @@ from database.smwalletsbehaviour.SmartMoneyWalletBehaviourHandler import (
 )
 from database.walletinvested.WalletsInvestedHandler import WalletsInvestedHandler
 from database.job.job_handler import JobHandler
+from database.job.RefreshQueueHandler import RefreshQueueHandler
 from database.smartmoneywallets.SmartMoneyWalletsHandler import SmartMoneyWalletsHandler
 from database.smartmoneywallets.SMWalletTopPNLTokenHandler import (
     SMWalletTopPNLTokenHandler,
@@ -17,8 +18,10 @@ from database.attention.AttentionHandler import AttentionHandler
 from database.volume.VolumeHandler import VolumeHandler
 from database.pumpfun.PumpfunHandler import PumpFunHandler
 from database.onchain.OnchainHandler import OnchainHandler
+from database.timeseries.TimeSeriesStore import TimeSeriesStore
 from database.auth.TokenHandler import TokenHandler
 from database.auth.CredentialsHandler import CredentialsHandler
+from database.cielo.CieloSyncStateHandler import CieloSyncStateHandler
 from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
 from database.notification.NotificationHandler import NotificationHandler
 from typing import Optional, Any, List, Tuple
@@ -119,6 +122,9 @@ class PortfolioDB:
             "analytics": AnalyticsHandler(self.conn_manager),
             "notification": NotificationHandler(self.conn_manager),
             "smWalletBehaviour": SmartMoneyWalletBehaviourHandler(self.conn_manager),
+            "timeseries": TimeSeriesStore(self.conn_manager),
+            "refreshQueue": RefreshQueueHandler(self.conn_manager),
+            "cieloSyncState": CieloSyncStateHandler(self.conn_manager),
         }
 
         # Set direct properties for commonly used handlers for ease of access
@@ -137,6 +143,9 @@ class PortfolioDB:
         self.analytics = self._handlers["analytics"]
         self.notification = self._handlers["notification"]
         self.smWalletBehaviour = self._handlers["smWalletBehaviour"]
+        self.timeseries = self._handlers["timeseries"]
+        self.refreshQueue = self._handlers["refreshQueue"]
+        self.cieloSyncState = self._handlers["cieloSyncState"]
 
         # Also create a handler map for getattr fallback lookup
         self._handler_method_map = {}
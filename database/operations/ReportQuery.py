@@ -0,0 +1,238 @@
+from config.Config import get_config
+"""
+Shared query layer for report endpoints.
+
+A ReportQuery is a FROM clause plus the columns a report needs, WHERE conditions
+added by the handler, and a whitelist of sort keys. fetchPage runs it with keyset
+pagination: rows are ordered by (sort key, id) and the next page starts strictly
+after the last row returned, so deep pages cost the same as the first one and
+rows inserted while a client pages do not shift later pages.
+
+Cursors are opaque URL-safe strings holding the sort key and id of the last row.
+Sort keys must never be NULL (row comparison with NULL matches nothing), so
+nullable columns are registered as COALESCE(...) expressions.
+"""
+
+from dataclasses import dataclass, field
+from logs.logger import get_logger
+from typing import Any, Dict, List, Optional, Tuple
+import base64
+import json
+
+logger = get_logger(__name__)
+
+# Largest page a client can ask for
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the sort"""
+
+    pass
+
+
+@dataclass
+class ReportPage:
+    """One page of report rows"""
+    rows: List[Dict[str, Any]]
+    nextCursor: Optional[str] = None  # None on the last page
+    totalEstimate: Optional[int] = None  # planner estimate of matching rows (first page only)
+    limit: Optional[int] = None
+
+    def toDict(self) -> Dict[str, Any]:
+        """Pagination fields for an API response"""
+        return {
+            "nextCursor": self.nextCursor,
+            "totalEstimate": self.totalEstimate,
+            "limit": self.limit,
+        }
+
+
+def encodeCursor(sortBy: str, sortOrder: str, sortValue: Any, rowId: Any) -> str:
+    payload = json.dumps([sortBy, sortOrder, sortValue, rowId], default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodeCursor(cursor: str) -> Tuple[str, str, Any, Any]:
+    """
+    Returns:
+        Tuple: sort key name, sort order, last sort value and last id
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sortBy, sortOrder, sortValue, rowId = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return sortBy, sortOrder, sortValue, rowId
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {str(e)}") from e
+
+
+@dataclass
+class ReportQuery:
+    """
+    A report's base query with filters, column selection and keyset pagination.
+
+    Args:
+        source: FROM clause, including joins
+        columns: Select list entries (expressions may carry an alias)
+        sortFields: Public sort key -> non-null SQL expression
+        idColumn: Unique column that breaks ties between equal sort keys
+        defaultSort: Sort key used when the requested one is unknown
+        defaultOrder: Sort order used when the requested one is invalid
+    """
+    source: str
+    columns: List[str]
+    sortFields: Dict[str, str]
+    idColumn: str
+    defaultSort: str
+    defaultOrder: str = "desc"
+    conditions: List[str] = field(default_factory=list)
+    params: List[Any] = field(default_factory=list)
+
+    def where(self, condition: str, *params: Any) -> "ReportQuery":
+        """Add a condition (with %s placeholders) that every row must satisfy"""
+        self.conditions.append(condition)
+        self.params.extend(params)
+        return self
+
+    def whereAnyTag(self, tagExpression: str, tags: Optional[List[str]]) -> "ReportQuery":
+        """
+        Keep rows having at least one of the tags.
+
+        Args:
+            tagExpression: text[] expression of a row's tags (GIN indexed for && lookups)
+            tags: Tags to match; no condition is added when empty
+        """
+        if tags:
+            self.where(f"{tagExpression} && %s::text[]", list(tags))
+        return self
+
+    def _whereClause(self, extra: Optional[str] = None) -> str:
+        conditions = self.conditions + ([extra] if extra else [])
+        return f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    def _resolveSort(self, sortBy: Optional[str], sortOrder: Optional[str]) -> Tuple[str, str]:
+        if sortBy not in self.sortFields:
+            sortBy = self.defaultSort
+        sortOrder = (sortOrder or "").lower()
+        if sortOrder not in ("asc", "desc"):
+            sortOrder = self.defaultOrder
+        return sortBy, sortOrder
+
+    def fetchPage(
+        self,
+        dbCursor,
+        sortBy: Optional[str] = None,
+        sortOrder: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        withTotal: Optional[bool] = None,
+        offset: Optional[int] = None,
+        keepKeys: bool = False,
+    ) -> ReportPage:
+        """
+        Run the query for one page.
+
+        Args:
+            dbCursor: Open database cursor (dict rows)
+            sortBy: Public sort key
+            sortOrder: asc or desc
+            limit: Page size (capped at MAX_PAGE_SIZE); None returns every remaining row
+            cursor: nextCursor of the previous page; None starts at the first row
+            withTotal: Include the total-count estimate (default: on the first page only)
+            offset: Rows to skip (legacy OFFSET paging for older clients; cannot be
+                combined with cursor)
+            keepKeys: Leave _sortkey / _rowid on the rows, for callers that filter rows
+                in Python and resume after one of them with cursorAfter()
+
+        Returns:
+            ReportPage: Rows (keys as selected), next cursor and optional estimate
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, was issued for another sort
+                or is combined with an offset
+        """
+        if cursor and offset:
+            raise InvalidCursorError("Pass either a pagination cursor or an offset, not both")
+
+        sortBy, sortOrder = self._resolveSort(sortBy, sortOrder)
+        sortExpression = self.sortFields[sortBy]
+        direction = sortOrder.upper()
+
+        params = list(self.params)
+        keyset = None
+        if cursor:
+            cursorSortBy, cursorSortOrder, sortValue, rowId = decodeCursor(cursor)
+            if (cursorSortBy, cursorSortOrder) != (sortBy, sortOrder):
+                raise InvalidCursorError("Pagination cursor was issued for a different sort")
+            keyset = f"({sortExpression}, {self.idColumn}) {'<' if sortOrder == 'desc' else '>'} (%s, %s)"
+            params.extend([sortValue, rowId])
+
+        if limit is not None:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        query = f"""
+            SELECT {', '.join(self.columns)},
+                {sortExpression} AS _sortkey,
+                {self.idColumn} AS _rowid
+            FROM {self.source}
+            {self._whereClause(keyset)}
+            ORDER BY {sortExpression} {direction}, {self.idColumn} {direction}
+        """
+        if limit is not None:
+            # One extra row tells whether another page follows
+            query += " LIMIT %s"
+            params.append(limit + 1)
+        if offset:
+            query += " OFFSET %s"
+            params.append(max(0, int(offset)))
+
+        dbCursor.execute(query, tuple(params))
+        rows = [dict(row) for row in dbCursor.fetchall()]
+
+        nextCursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            nextCursor = encodeCursor(sortBy, sortOrder, rows[-1]["_sortkey"], rows[-1]["_rowid"])
+        if not keepKeys:
+            self.dropKeys(rows)
+
+        totalEstimate = None
+        if withTotal if withTotal is not None else cursor is None and not offset:
+            totalEstimate = self.estimateCount(dbCursor)
+
+        return ReportPage(rows=rows, nextCursor=nextCursor, totalEstimate=totalEstimate, limit=limit)
+
+    def cursorAfter(self, row: Dict[str, Any], sortBy: Optional[str], sortOrder: Optional[str]) -> str:
+        """Cursor of the page starting right after a row fetched with keepKeys"""
+        sortBy, sortOrder = self._resolveSort(sortBy, sortOrder)
+        return encodeCursor(sortBy, sortOrder, row["_sortkey"], row["_rowid"])
+
+    @staticmethod
+    def dropKeys(rows: List[Dict[str, Any]]) -> None:
+        """Remove the pagination keys fetchPage adds to each row"""
+        for row in rows:
+            row.pop("_sortkey", None)
+            row.pop("_rowid", None)
+
+    def estimateCount(self, dbCursor) -> Optional[int]:
+        """
+        Planner estimate of the rows matching the filters (no cursor), without counting them
+
+        Returns:
+            Optional[int]: Estimated row count, None if the plan could not be read
+        """
+        try:
+            dbCursor.execute(
+                f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {self.source} {self._whereClause()}",
+                tuple(self.params),
+            )
+            plan = next(iter(dict(dbCursor.fetchone()).values()))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.warning(f"Failed to estimate report row count: {str(e)}")
+            return None
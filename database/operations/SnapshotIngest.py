@@ -0,0 +1,238 @@
+from datetime import datetime
+from typing import Dict, List, Union
+from database.operations.schema import VolumeToken, PumpFunToken
+from logs.logger import get_logger
+from psycopg2.extras import execute_values
+import pytz
+
+logger = get_logger(__name__)
+
+# Tokens not seen by the bot within this window keep their previous state
+SEEN_WINDOW_MINUTES = 20
+
+INFO_COLUMNS = [
+    "tokenid", "name", "tokenname", "chain", "tokendecimals",
+    "circulatingsupply", "tokenage", "twitterlink", "telegramlink", "websitelink",
+]
+
+STATE_COLUMNS = [
+    "price", "marketcap", "liquidity", "volume24h", "buysolqty", "occurrencecount",
+    "percentilerankpeats", "percentileranksol", "dexstatus", "change1hpct",
+]
+
+# A state is archived and replaced only when one of these differs
+CHANGE_METRICS = ["buysolqty", "occurrencecount", "percentilerankpeats", "percentileranksol"]
+
+
+class SnapshotIngest:
+    """
+    Set-based ingest for the bot sources that share the info/states/history layout
+    (volume bot and pump.fun).
+
+    The parsed batch is loaded into a temporary table and everything else happens
+    in SQL, so a cycle costs a fixed handful of statements instead of several per token:
+
+    1. Tokens without an info row get an info row (count 1) and a state row.
+    2. Tokens with both rows whose timeago is within SEEN_WINDOW_MINUTES and whose
+       CHANGE_METRICS differ have their current state archived to history, the state
+       replaced and the info count incremented.
+    3. Everything else (stale, unchanged, or info without state) is left untouched.
+    """
+
+    def __init__(self, infoTable: str, stateTable: str, historyTable: str):
+        self.infoTable = infoTable
+        self.stateTable = stateTable
+        self.historyTable = historyTable
+        self.batchTable = f"{stateTable}batch"
+
+    def ingest(self, cursor, tokens: List[Union[VolumeToken, PumpFunToken]]) -> Dict[str, int]:
+        """
+        Persist a parsed batch inside the caller's transaction.
+
+        Args:
+            cursor: Database cursor of the enclosing transaction
+            tokens: Parsed tokens; a token listed twice keeps its last occurrence
+
+        Returns:
+            Dict: inserted, updated and skipped counts
+        """
+        if not tokens:
+            return {"inserted": 0, "updated": 0, "skipped": 0}
+
+        insertTime = datetime.now()
+        updateTime = datetime.now(pytz.UTC)
+        uniqueTokens = {token.tokenid: token for token in tokens}
+
+        self._loadBatch(cursor, list(uniqueTokens.values()))
+        insertedIds = self._insertNewTokens(cursor, insertTime)
+        updatedIds = self._applyChangedStates(cursor, updateTime)
+
+        skipped = len(uniqueTokens) - len(insertedIds) - len(updatedIds)
+        logger.debug(f"{self.stateTable}: inserted {insertedIds}, updated {updatedIds}")
+        return {"inserted": len(insertedIds), "updated": len(updatedIds), "skipped": skipped}
+
+    def _loadBatch(self, cursor, tokens: List[Union[VolumeToken, PumpFunToken]]) -> None:
+        cursor.execute(
+            f"""
+            CREATE TEMP TABLE {self.batchTable} (
+                tokenid TEXT PRIMARY KEY,
+                name TEXT,
+                tokenname TEXT,
+                chain TEXT,
+                tokendecimals INTEGER,
+                circulatingsupply TEXT,
+                tokenage TEXT,
+                twitterlink TEXT,
+                telegramlink TEXT,
+                websitelink TEXT,
+                price DECIMAL,
+                marketcap DECIMAL,
+                liquidity DECIMAL,
+                volume24h DECIMAL,
+                buysolqty INTEGER,
+                occurrencecount INTEGER,
+                percentilerankpeats DECIMAL,
+                percentileranksol DECIMAL,
+                dexstatus INTEGER,
+                change1hpct DECIMAL,
+                timeago TIMESTAMPTZ
+            ) ON COMMIT DROP
+            """
+        )
+
+        rows = []
+        for token in tokens:
+            # The parsers produce naive UTC datetimes
+            timeago = token.timeago
+            if timeago is not None and timeago.tzinfo is None:
+                timeago = pytz.UTC.localize(timeago)
+
+            rows.append(
+                tuple(getattr(token, column) for column in INFO_COLUMNS)
+                + (
+                    str(token.price),
+                    str(token.marketcap),
+                    str(token.liquidity),
+                    str(token.volume24h),
+                    token.buysolqty,
+                    token.occurrencecount,
+                    token.percentilerankpeats,
+                    token.percentileranksol,
+                    token.dexstatus,
+                    str(token.change1hpct),
+                    timeago,
+                )
+            )
+
+        execute_values(
+            cursor,
+            f"INSERT INTO {self.batchTable} ({', '.join(INFO_COLUMNS + STATE_COLUMNS)}, timeago) VALUES %s",
+            rows,
+            page_size=len(rows),
+        )
+
+    def _insertNewTokens(self, cursor, insertTime: datetime) -> List[str]:
+        """Insert info and state rows for tokens that have no info row yet"""
+        infoColumns = ", ".join(INFO_COLUMNS)
+        cursor.execute(
+            f"""
+            INSERT INTO {self.infoTable} (
+                {infoColumns}, firstseenat, lastupdatedat, count
+            )
+            SELECT {infoColumns}, %s, %s, 1
+            FROM {self.batchTable} b
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.infoTable} i WHERE i.tokenid = b.tokenid
+            )
+            RETURNING tokenid
+            """,
+            (insertTime, insertTime),
+        )
+        insertedIds = [row["tokenid"] for row in cursor.fetchall()]
+        if not insertedIds:
+            return []
+
+        stateColumns = ", ".join(STATE_COLUMNS)
+        cursor.execute(
+            f"""
+            INSERT INTO {self.stateTable} (
+                tokenid, {stateColumns}, createdat, lastupdatedat
+            )
+            SELECT tokenid, {stateColumns}, %s, %s
+            FROM {self.batchTable}
+            WHERE tokenid = ANY(%s)
+            """,
+            (insertTime, insertTime, insertedIds),
+        )
+        return insertedIds
+
+    def _applyChangedStates(self, cursor, updateTime: datetime) -> List[str]:
+        """Archive, replace and count states that were seen recently and changed"""
+        stateColumns = ", ".join(STATE_COLUMNS)
+        changedPredicate = " OR ".join(f"b.{metric} IS DISTINCT FROM s.{metric}" for metric in CHANGE_METRICS)
+        stateAssignments = ", ".join(f"{column} = b.{column}" for column in STATE_COLUMNS)
+
+        # All CTEs read the same snapshot, so history receives the pre-update state
+        cursor.execute(
+            f"""
+            WITH changed AS (
+                SELECT s.*
+                FROM {self.batchTable} b
+                JOIN {self.infoTable} i ON i.tokenid = b.tokenid
+                JOIN {self.stateTable} s ON s.tokenid = b.tokenid
+                WHERE b.timeago IS NOT NULL
+                AND b.timeago >= %(updatetime)s - INTERVAL '{SEEN_WINDOW_MINUTES} minutes'
+                AND ({changedPredicate})
+            ),
+            archived AS (
+                INSERT INTO {self.historyTable} (
+                    tokenid, snapshotat, {stateColumns}, createdat
+                )
+                SELECT tokenid, lastupdatedat, {stateColumns}, %(updatetime)s
+                FROM changed
+            ),
+            updated AS (
+                UPDATE {self.stateTable} s
+                SET {stateAssignments}, lastupdatedat = %(updatetime)s
+                FROM {self.batchTable} b
+                WHERE s.tokenid = b.tokenid
+                AND s.tokenid IN (SELECT tokenid FROM changed)
+                RETURNING s.tokenid
+            )
+            UPDATE {self.infoTable}
+            SET count = count + 1,
+                lastupdatedat = %(updatetime)s
+            WHERE tokenid IN (SELECT tokenid FROM updated)
+            RETURNING tokenid
+            """,
+            {"updatetime": updateTime},
+        )
+        return [row["tokenid"] for row in cursor.fetchall()]
+
+    def readSnapshots(self, cursor, tokenIds: List[str]) -> Dict[str, Dict]:
+        """
+        Read state merged with info for many tokens in one query
+
+        Info columns win over state columns of the same name, as in
+        {**tokenState, **tokenInfo}. Tokens missing either row are left out.
+
+        Args:
+            cursor: Database cursor
+            tokenIds: Tokens to read
+
+        Returns:
+            Dict: tokenid -> merged row
+        """
+        if not tokenIds:
+            return {}
+        cursor.execute(
+            f"""
+            SELECT s.*, i.*
+            FROM {self.stateTable} s
+            JOIN {self.infoTable} i ON i.tokenid = s.tokenid
+            WHERE s.tokenid = ANY(%s)
+            """,
+            (list(tokenIds),),
+        )
+        return {row["tokenid"]: dict(row) for row in cursor.fetchall()}
+
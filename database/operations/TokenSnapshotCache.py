@@ -0,0 +1,154 @@
+from config.Config import get_config
+from collections import OrderedDict
+from logs.logger import get_logger
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+logger = get_logger(__name__)
+
+
+class TokenSnapshotCache:
+    """
+    Process-wide write-through cache of merged token rows keyed by (source, tokenid).
+
+    Ingest handlers put the rows they have just committed (state merged with info,
+    exactly what a strategy push reads), so pushes made by the same job right
+    after persisting need no database round trip. Entries expire after ttlSeconds
+    and the least recently used entries are dropped beyond maxEntries.
+    """
+
+    _shared: Optional["TokenSnapshotCache"] = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, ttlSeconds: float, maxEntries: int):
+        self.ttlSeconds = ttlSeconds
+        self.maxEntries = maxEntries
+
+        self._lock = threading.Lock()
+        # (source, tokenid) -> (snapshot, expiresAt monotonic), least recently used first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Dict, float]]" = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    @classmethod
+    def shared(cls) -> "TokenSnapshotCache":
+        """Get (creating on first use) the process-wide cache"""
+        if cls._shared is not None:
+            return cls._shared
+        with cls._sharedLock:
+            if cls._shared is None:
+                config = get_config()
+                cls._shared = cls(
+                    ttlSeconds=config.TOKEN_SNAPSHOT_TTL_SECONDS,
+                    maxEntries=config.TOKEN_SNAPSHOT_MAX_ENTRIES,
+                )
+            return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttlSeconds > 0 and self.maxEntries > 0
+
+    def putMany(self, source: str, snapshots: Dict[str, Dict]) -> None:
+        """
+        Store freshly committed rows
+
+        Args:
+            source: Source the rows belong to (volume, pumpfun, ...)
+            snapshots: tokenid -> merged row
+        """
+        if not self.enabled or not snapshots:
+            return
+        expiresAt = time.monotonic() + self.ttlSeconds
+        with self._lock:
+            for tokenId, snapshot in snapshots.items():
+                key = (source, tokenId)
+                self._entries[key] = (snapshot, expiresAt)
+                self._entries.move_to_end(key)
+            self._writes += len(snapshots)
+            overflow = len(self._entries) - self.maxEntries
+            for _ in range(max(0, overflow)):
+                self._entries.popitem(last=False)
+            self._evictions += max(0, overflow)
+
+    def getMany(
+        self,
+        source: str,
+        tokenIds: Iterable[str],
+        load: Callable[[List[str]], Dict[str, Dict]],
+    ) -> Dict[str, Dict]:
+        """
+        Resolve rows from the cache, loading all misses with one call
+
+        Args:
+            source: Source the tokens belong to
+            tokenIds: Tokens to resolve
+            load: Batched read for the missing tokens; returns tokenid -> merged row
+
+        Returns:
+            Dict: tokenid -> merged row for every token found (cached or loaded);
+                rows are shared, so copy before modifying
+        """
+        tokenIds = list(dict.fromkeys(tokenIds))
+        result: Dict[str, Dict] = {}
+        missing: List[str] = []
+        now = time.monotonic()
+
+        with self._lock:
+            for tokenId in tokenIds:
+                key = (source, tokenId)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    result[tokenId] = entry[0]
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    missing.append(tokenId)
+            self._hits += len(result)
+            self._misses += len(missing)
+
+        if missing:
+            loaded = load(missing) or {}
+            self.putMany(source, loaded)
+            result.update(loaded)
+
+        return result
+
+    def discard(self, source: str, tokenIds: Iterable[str]) -> None:
+        """Forget cached rows of tokens written outside the ingest path"""
+        with self._lock:
+            for tokenId in tokenIds:
+                self._entries.pop((source, tokenId), None)
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        """Forget every cached row of a source (or of every source)"""
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == source]:
+                del self._entries[key]
+
+    def getMetrics(self) -> Dict:
+        """
+        Snapshot of cache usage.
+
+        Returns:
+            Dict: entry count, hit / miss / write counters and hit ratio
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "ttlSeconds": self.ttlSeconds,
+                "maxEntries": self.maxEntries,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evictions": self._evictions,
+                "hitRatio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
@@ -172,6 +172,20 @@ class InvestmentDetails:
     avgEntry: Decimal
 
 
+@dataclass
+class CieloSwapSyncState:
+    """Running totals of a wallet's Cielo swaps in one token, up to the newest swap seen"""
+
+    walletaddress: str
+    tokenid: str
+    lastswaptimestamp: Optional[int] = None  # None until the first sync
+    lastswaphashes: List[str] = field(default_factory=list)  # swaps at lastswaptimestamp already counted
+    totalinvested: Decimal = Decimal("0")
+    totaltakenout: Decimal = Decimal("0")
+    totalcoins: Decimal = Decimal("0")
+    swapcount: int = 0
+
+
 @dataclass
 class VolumeToken:
     """Volume token data structure for volume signals"""
@@ -8,6 +8,7 @@ from logs.logger import get_logger
 from datetime import datetime
 import json
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.ReportQuery import ReportPage, ReportQuery
 
 logger = get_logger(__name__)
 
@@ -38,7 +39,9 @@ class PortSummaryReportHandler(BaseDBHandler):
                             maxTokenAge: float = None,
                             sortBy: str = "smartbalance",
                             sortOrder: str = "desc",
-                            selectedTags: List[str] = None) -> List[Dict[str, Any]]:
+                            selectedTags: List[str] = None,
+                            limit: Optional[int] = None,
+                            cursor: Optional[str] = None) -> ReportPage:
         """
         Get port summary report data with optional filters.
         
@@ -52,113 +55,86 @@ class PortSummaryReportHandler(BaseDBHandler):
             maxTokenAge: Maximum token age filter
             sortBy: Field to sort by (default: smartbalance)
             sortOrder: Sort order (asc or desc, default: desc)
-            selectedTags: List of tags to filter by
+            selectedTags: Keep tokens having at least one of these tags
+            limit: Page size (optional, default: every row)
+            cursor: nextCursor of the previous page (optional)
             
         Returns:
-            List of port summary data dictionaries
+            ReportPage of port summary data dictionaries
         """
-        # Build the base query
-        query = """
-            SELECT 
-                portsummaryid,
-                chainname,
-                tokenid,
-                name,
-                tokenage,
-                mcap,
-                avgprice,
-                smartbalance,
-                tags
-            FROM portsummary
-            WHERE status = 1
-        """
-        params = []
+        query = ReportQuery(
+            source="portsummary",
+            columns=["portsummaryid", "chainname", "tokenid", "name", "tokenage", "mcap", "avgprice", "smartbalance", "tags"],
+            sortFields={
+                "portsummaryid": "portsummaryid",
+                "chainname": "chainname",
+                "tokenid": "tokenid",
+                "name": "name",
+                "tokenage": "tokenage",
+                "mcap": "mcap",
+                "avgprice": "avgprice",
+                "smartbalance": "smartbalance"
+            },
+            idColumn="portsummaryid",
+            defaultSort="smartbalance"
+        )
+        query.where("status = 1")
 
         # Add filters based on parameters
         if tokenId:
-            query += " AND tokenid LIKE ?"
-            params.append(f"%{tokenId}%")
+            query.where("tokenid LIKE %s", f"%{tokenId}%")
         
         if name:
-            query += " AND name LIKE ?"
-            params.append(f"%{name}%")
+            query.where("name LIKE %s", f"%{name}%")
         
         if chainName:
-            query += " AND chainname LIKE ?"
-            params.append(f"%{chainName}%")
+            query.where("chainname LIKE %s", f"%{chainName}%")
         
         if minMarketCap is not None:
-            query += " AND mcap >= ?"
-            params.append(minMarketCap)
+            query.where("mcap >= %s", minMarketCap)
         
         if maxMarketCap is not None:
-            query += " AND mcap <= ?"
-            params.append(maxMarketCap)
+            query.where("mcap <= %s", maxMarketCap)
         
         if minTokenAge is not None:
-            query += " AND CAST(tokenage AS FLOAT) >= ?"
-            params.append(minTokenAge)
+            query.where("CAST(tokenage AS FLOAT) >= %s", minTokenAge)
         
         if maxTokenAge is not None:
-            query += " AND CAST(tokenage AS FLOAT) <= ?"
-            params.append(maxTokenAge)
-            
-        # Validate sort parameters
-        valid_sort_fields = ["portsummaryid", "chainname", "tokenid", "name", "tokenage", "mcap", "avgprice", "smartbalance"]
-        valid_sort_orders = ["asc", "desc"]
-        
-        if sortBy not in valid_sort_fields:
-            sortBy = "smartbalance"
-        
-        if sortOrder.lower() not in valid_sort_orders:
-            sortOrder = "desc"
-            
-        # Add sorting
-        query += f" ORDER BY {sortBy} {sortOrder.upper()}"
+            query.where("CAST(tokenage AS FLOAT) <= %s", maxTokenAge)
 
-        # Execute query
-        with self.transaction() as cursor:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
+        # Served by the GIN index on portsummary_tagset(tags)
+        query.whereAnyTag("portsummary_tagset(tags)", selectedTags)
 
-            # Convert results to list of dictionaries
-            portSummaryData = []
-            for row in results:
-                # Try to parse tags as JSON if it's a string
-                tags = row[8]
-                if tags and isinstance(tags, str):
-                    try:
-                        parsed_tags = json.loads(tags)
-                        tags = parsed_tags
-                    except Exception as e:
-                        logger.error(f"Error parsing tags JSON: {e}")
-                        # If parsing fails, split by comma (common format in the database)
-                        if ',' in tags:
-                            tags = [tag.strip() for tag in tags.split(',') if tag.strip()]
-                        else:
-                            # If it's a single tag, make it a list
-                            tags = [tags]
-                
-                # Filter tags if selectedTags is provided
-                if selectedTags:
-                    # Only include records that have at least one of the selected tags
-                    matching_tags = [tag for tag in tags if tag in selectedTags]
-                    if not matching_tags:  # Skip records with no matching tags
-                        continue
-                
-                portSummaryData.append({
-                    'portsummaryid': row[0],
-                    'chainname': row[1],
-                    'tokenid': row[2],
-                    'name': row[3],
-                    'tokenage': float(row[4]) if row[4] else None,
-                    'mcap': float(row[5]) if row[5] else None,
-                    'avgprice': float(row[6]) if row[6] else None,
-                    'smartbalance': float(row[7]) if row[7] else None,
-                    'tags': tags if tags else []
-                })
+        with self.transaction() as dbCursor:
+            page = query.fetchPage(dbCursor, sortBy, sortOrder, limit, cursor)
+
+        page.rows = [
+            {
+                'portsummaryid': row['portsummaryid'],
+                'chainname': row['chainname'],
+                'tokenid': row['tokenid'],
+                'name': row['name'],
+                'tokenage': float(row['tokenage']) if row['tokenage'] else None,
+                'mcap': float(row['mcap']) if row['mcap'] else None,
+                'avgprice': float(row['avgprice']) if row['avgprice'] else None,
+                'smartbalance': float(row['smartbalance']) if row['smartbalance'] else None,
+                'tags': self._parseTags(row['tags'])
+            }
+            for row in page.rows
+        ]
+        return page
 
-        return portSummaryData
+    @staticmethod
+    def _parseTags(tags: Any) -> List[str]:
+        """Tags are stored as a JSON array; older rows hold a comma-separated string"""
+        if not tags:
+            return []
+        if not isinstance(tags, str):
+            return list(tags)
+        try:
+            return json.loads(tags)
+        except Exception:
+            return [tag.strip() for tag in tags.split(',') if tag.strip()]
     
     def getPortSummaryById(self, portsummaryId: int) -> Optional[Dict[str, Any]]:
         """
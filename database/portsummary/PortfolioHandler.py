@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import pytz
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from psycopg2.extras import execute_values
 
 logger = get_logger(__name__)
 
@@ -21,119 +22,6 @@ class PortfolioHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)  # Properly initialize base class
-        self._create_tables()
-
-    def _create_tables(self):
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-            if config.DB_TYPE == 'postgres':
-                # PostgreSQL syntax
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS portsummary (
-                        portsummaryid SERIAL PRIMARY KEY,
-                        chainname TEXT NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        tokenage TEXT NOT NULL,
-                        mcap DECIMAL NOT NULL,
-                        currentprice DECIMAL NOT NULL,
-                        avgprice DECIMAL NOT NULL,
-                        smartbalance DECIMAL NOT NULL,
-                        walletsinvesting1000 INTEGER NOT NULL,
-                        walletsinvesting5000 INTEGER NOT NULL,
-                        walletsinvesting10000 INTEGER NOT NULL,
-                        qtychange1d DECIMAL NOT NULL,
-                        qtychange7d DECIMAL NOT NULL,
-                        qtychange30d DECIMAL NOT NULL,
-                        status INTEGER DEFAULT 1,
-                        firstseen TIMESTAMP NOT NULL,
-                        lastseen TIMESTAMP NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        tags TEXT,
-                        markedinactive TIMESTAMP
-                    )
-                '''))
-                
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS portsummaryhistory (
-                        historyid SERIAL PRIMARY KEY,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        chainname TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        tokenage TEXT NOT NULL,
-                        mcap DECIMAL NOT NULL,
-                        currentprice DECIMAL NOT NULL,
-                        avgprice DECIMAL NOT NULL,
-                        smartbalance DECIMAL NOT NULL,
-                        walletsinvesting1000 INTEGER NOT NULL,
-                        walletsinvesting5000 INTEGER NOT NULL,
-                        walletsinvesting10000 INTEGER NOT NULL,
-                        qtychange1d DECIMAL NOT NULL,
-                        qtychange7d DECIMAL NOT NULL,
-                        qtychange30d DECIMAL NOT NULL,
-                        status INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        tags TEXT,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
-                    )
-                '''))
-            else:
-                # SQLite syntax
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS portsummary (
-                        portsummaryid INTEGER PRIMARY KEY AUTOINCREMENT,
-                        chainname TEXT NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        tokenage TEXT NOT NULL,
-                        mcap DECIMAL NOT NULL,
-                        currentprice DECIMAL NOT NULL,
-                        avgprice DECIMAL NOT NULL,
-                        smartbalance DECIMAL NOT NULL,
-                        walletsinvesting1000 INTEGER NOT NULL,
-                        walletsinvesting5000 INTEGER NOT NULL,
-                        walletsinvesting10000 INTEGER NOT NULL,
-                        qtychange1d DECIMAL NOT NULL,
-                        qtychange7d DECIMAL NOT NULL,
-                        qtychange30d DECIMAL NOT NULL,
-                        status INTEGER DEFAULT 1,
-                        firstseen TIMESTAMP NOT NULL,
-                        lastseen TIMESTAMP NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        tags TEXT,
-                        markedinactive TIMESTAMP
-                    )
-                '''))
-                
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS portsummaryhistory (
-                        historyid INTEGER PRIMARY KEY AUTOINCREMENT,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        chainname TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        tokenage TEXT NOT NULL,
-                        mcap DECIMAL NOT NULL,
-                        currentprice DECIMAL NOT NULL,
-                        avgprice DECIMAL NOT NULL,
-                        smartbalance DECIMAL NOT NULL,
-                        walletsinvesting1000 INTEGER NOT NULL,
-                        walletsinvesting5000 INTEGER NOT NULL,
-                        walletsinvesting10000 INTEGER NOT NULL,
-                        qtychange1d DECIMAL NOT NULL,
-                        qtychange7d DECIMAL NOT NULL,
-                        qtychange30d DECIMAL NOT NULL,
-                        status INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        tags TEXT,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
-                    )
-                '''))
 
     def insertSummary(self, item: PortfolioSummary, session: Optional[Any] = None) -> None:
         currentTime = datetime.now()
@@ -339,6 +227,129 @@ class PortfolioHandler(BaseDBHandler):
                 else:
                     cur.execute(query, params)
 
+    def upsertSummaries(self, items: List[PortfolioSummary], cursor: Any, currentTime: datetime) -> Dict[str, int]:
+        """
+        Archive, insert and update a whole batch of portfolio summaries in one statement.
+
+        Existing rows are copied to portsummaryhistory as they were before this batch,
+        then every item is upserted on tokenid. Inserted rows keep the item's own
+        timestamps; updated rows keep firstseen/createdat and get lastseen/updatedat
+        set to currentTime, matching insertSummary/updateSummary/insertHistory.
+
+        Args:
+            items: Items to persist; tokenids must be unique within the batch
+            cursor: Database cursor of the enclosing transaction
+            currentTime: Timestamp used for history and update rows
+
+        Returns:
+            Dict: inserted, updated and reactivated counts
+        """
+        if not items:
+            return {"inserted": 0, "updated": 0, "reactivated": 0}
+
+        query = """
+            WITH incoming (
+                chainname, tokenid, name, tokenage, mcap, currentprice,
+                avgprice, smartbalance, walletsinvesting1000,
+                walletsinvesting5000, walletsinvesting10000,
+                qtychange1d, qtychange7d, qtychange30d, status, tags,
+                firstseen, lastseen, createdat, updatedat, seenat
+            ) AS (
+                VALUES %s
+            ),
+            prior AS (
+                SELECT ps.tokenid, ps.status
+                FROM portsummary ps
+                JOIN incoming i ON i.tokenid = ps.tokenid
+            ),
+            archived AS (
+                INSERT INTO portsummaryhistory (
+                    portsummaryid, tokenid, chainname, name, tokenage,
+                    mcap, currentprice, avgprice, smartbalance,
+                    walletsinvesting1000, walletsinvesting5000,
+                    walletsinvesting10000, qtychange1d, qtychange7d,
+                    qtychange30d, status, tags, createdat, updatedat
+                )
+                SELECT
+                    ps.portsummaryid, ps.tokenid, ps.chainname, ps.name, ps.tokenage,
+                    ps.mcap, ps.currentprice, ps.avgprice, ps.smartbalance,
+                    ps.walletsinvesting1000, ps.walletsinvesting5000,
+                    ps.walletsinvesting10000, ps.qtychange1d, ps.qtychange7d,
+                    ps.qtychange30d, ps.status, COALESCE(ps.tags, '[]'),
+                    COALESCE(ps.createdat, i.seenat), i.seenat
+                FROM portsummary ps
+                JOIN incoming i ON i.tokenid = ps.tokenid
+            ),
+            upserted AS (
+                INSERT INTO portsummary (
+                    chainname, tokenid, name, tokenage, mcap, currentprice,
+                    avgprice, smartbalance, walletsinvesting1000,
+                    walletsinvesting5000, walletsinvesting10000,
+                    qtychange1d, qtychange7d, qtychange30d, status, tags,
+                    firstseen, lastseen, createdat, updatedat
+                )
+                SELECT
+                    chainname, tokenid, name, tokenage, mcap, currentprice,
+                    avgprice, smartbalance, walletsinvesting1000,
+                    walletsinvesting5000, walletsinvesting10000,
+                    qtychange1d, qtychange7d, qtychange30d, status, tags,
+                    firstseen, lastseen, createdat, updatedat
+                FROM incoming
+                ON CONFLICT (tokenid) DO UPDATE SET
+                    chainname = EXCLUDED.chainname, name = EXCLUDED.name,
+                    tokenage = EXCLUDED.tokenage, mcap = EXCLUDED.mcap,
+                    currentprice = EXCLUDED.currentprice, avgprice = EXCLUDED.avgprice,
+                    smartbalance = EXCLUDED.smartbalance,
+                    walletsinvesting1000 = EXCLUDED.walletsinvesting1000,
+                    walletsinvesting5000 = EXCLUDED.walletsinvesting5000,
+                    walletsinvesting10000 = EXCLUDED.walletsinvesting10000,
+                    qtychange1d = EXCLUDED.qtychange1d, qtychange7d = EXCLUDED.qtychange7d,
+                    qtychange30d = EXCLUDED.qtychange30d, status = EXCLUDED.status,
+                    tags = COALESCE(EXCLUDED.tags, '[]'),
+                    -- seenat is currentTime on every row; the uncorrelated subquery runs once
+                    lastseen = (SELECT MAX(seenat) FROM incoming),
+                    updatedat = (SELECT MAX(seenat) FROM incoming)
+                RETURNING tokenid
+            )
+            SELECT u.tokenid, p.tokenid IS NOT NULL AS existed, p.status AS priorstatus
+            FROM upserted u
+            LEFT JOIN prior p ON p.tokenid = u.tokenid
+        """
+        # Explicit casts: VALUES infers column types from literals, and a NULL or
+        # string literal would otherwise not assign to the numeric/timestamp columns
+        template = """(
+            %s, %s, %s, %s, %s::numeric, %s::numeric, %s::numeric, %s::numeric,
+            %s::integer, %s::integer, %s::integer,
+            %s::numeric, %s::numeric, %s::numeric, %s::integer, %s::text,
+            %s::timestamp, %s::timestamp, %s::timestamp, %s::timestamp, %s::timestamp
+        )"""
+        rows = [
+            (
+                item.chainname, item.tokenid, item.name, item.tokenage,
+                item.mcap, item.currentprice, item.avgprice, item.smartbalance,
+                item.walletsinvesting1000, item.walletsinvesting5000, item.walletsinvesting10000,
+                item.qtychange1d, item.qtychange7d, item.qtychange30d, item.status,
+                json.dumps(item.tags) if item.tags else None,
+                item.firstseen or currentTime, item.lastseen or currentTime,
+                item.createdat or currentTime, item.updatedat or currentTime,
+                currentTime
+            )
+            for item in items
+        ]
+
+        results = execute_values(cursor, query, rows, template=template, page_size=len(rows), fetch=True)
+
+        inserted = updated = reactivated = 0
+        for row in results:
+            if not row["existed"]:
+                inserted += 1
+            elif row["priorstatus"] != PortfolioStatus.ACTIVE.statuscode:
+                reactivated += 1
+            else:
+                updated += 1
+
+        return {"inserted": inserted, "updated": updated, "reactivated": reactivated}
+
     def getTokenData(self, token_ids: List[str]) -> List[PortfolioSummary]:
         """
         Get token data by token IDs without filtering by status
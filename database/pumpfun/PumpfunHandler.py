@@ -6,6 +6,8 @@ import json
 from database.operations.BaseDBHandler import BaseDBHandler
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
 from database.operations.schema import PumpFunToken
+from database.operations.SnapshotIngest import SnapshotIngest
+from database.operations.TokenSnapshotCache import TokenSnapshotCache
 from logs.logger import get_logger
 import pytz
 from sqlalchemy import text
@@ -71,106 +73,7 @@ class PumpFunHandler(BaseDBHandler):
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
         self.schema = SCHEMA_DOCS
-        self._createTables()
-
-    def _createTables(self):
-        """Creates all necessary tables for the system"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                # 1. Base Token Information
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS pumpfuninfo (
-                        id SERIAL PRIMARY KEY,
-                        tokenid TEXT NOT NULL UNIQUE,
-                        name TEXT NOT NULL,
-                        tokenname TEXT NOT NULL,
-                        chain TEXT NOT NULL,
-                        tokendecimals INTEGER NOT NULL,
-                        circulatingsupply TEXT,
-                        tokenage TEXT,
-                        twitterlink TEXT,
-                        telegramlink TEXT,
-                        websitelink TEXT,
-                        firstseenat TIMESTAMP NOT NULL,
-                        lastupdatedat TIMESTAMP,
-                        count INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                    )
-                )
-
-                # 2. Token Current State
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS pumpfunstates (
-                        id SERIAL PRIMARY KEY,
-                        tokenid TEXT NOT NULL UNIQUE,
-                        price DECIMAL NOT NULL,
-                        marketcap DECIMAL NOT NULL,
-                        liquidity DECIMAL NOT NULL,
-                        volume24h DECIMAL NOT NULL,
-                        buysolqty INTEGER NOT NULL,
-                        occurrencecount INTEGER NOT NULL,
-                        percentilerankpeats DECIMAL,
-                        percentileranksol DECIMAL,
-                        dexstatus INTEGER NOT NULL,
-                        change1hpct DECIMAL NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        lastupdatedat TIMESTAMP,
-                        FOREIGN KEY(tokenid) REFERENCES pumpfuninfo(tokenid)
-                    )
-                """
-                    )
-                )
-
-                # 3. Token History
-                cursor.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS pumpfunhistory (
-                        id SERIAL PRIMARY KEY,
-                        tokenid TEXT NOT NULL,
-                        snapshotat TIMESTAMP NOT NULL,
-                        price DECIMAL NOT NULL,
-                        marketcap DECIMAL NOT NULL,
-                        liquidity DECIMAL NOT NULL,
-                        volume24h DECIMAL NOT NULL,
-                        buysolqty INTEGER NOT NULL,
-                        occurrencecount INTEGER NOT NULL,
-                        percentilerankpeats DECIMAL,
-                        percentileranksol DECIMAL,
-                        dexstatus INTEGER NOT NULL,
-                        change1hpct DECIMAL NOT NULL,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY(tokenid) REFERENCES pumpfuninfo(tokenid)
-                    )
-                """
-                    )
-                )
-
-            # Create indices in separate transactions
-            self._createIndex("idx_pumpfuninfo_tokenid", "pumpfuninfo", "tokenid")
-            self._createIndex("idx_pumpfunstates_tokenid", "pumpfunstates", "tokenid")
-            self._createIndex("idx_pumpfunhistory_tokenid", "pumpfunhistory", "tokenid")
-
-        except Exception as e:
-            logger.error(f"Error creating tables for PumpFunHandler: {e}")
-
-    def _createIndex(self, index_name, table_name, column_name):
-        """Create an index safely in its own transaction"""
-        try:
-            with self.conn_manager.transaction() as cursor:
-                cursor.execute(
-                    text(
-                        f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})"
-                    )
-                )
-        except Exception as e:
-            logger.error(f"Error creating index {index_name}: {e}")
+        self.ingest = SnapshotIngest("pumpfuninfo", "pumpfunstates", "pumpfunhistory")
 
     def insertTokenData(self, token: PumpFunToken) -> None:
         """
@@ -181,262 +84,54 @@ class PumpFunHandler(BaseDBHandler):
         Args:
             token: PumpFunToken object to persist
         """
-        try:
-            with self.conn_manager.transaction() as cursor:
-                self._handleTokenData(cursor, token)
-        except Exception as e:
-            logger.error(f"Failed to process token {token.tokenid}: {str(e)}")
-            raise
-
-    def _handleTokenData(self, cursor, token: PumpFunToken) -> None:
-        """Handle token data insertion or update"""
-        cursor.execute(
-            text(
-                """
-            SELECT 
-                i.id as info_exists,
-                s.id as state_exists,
-                s.*
-            FROM pumpfuninfo i
-            LEFT JOIN pumpfunstates s ON i.tokenid = s.tokenid
-            WHERE i.tokenid = %s
-        """
-            ),
-            (token.tokenid,),
-        )
-
-        result = cursor.fetchone()
-
-        if not result:
-            # New token - insert both records
-            logger.info(f"New token {token.name} addition")
-            self._insertNewRecords(cursor, token)
-        else:
-            # Existing token - archive and update
-            if not result["state_exists"]:
-                logger.info(f"Inconsistent state: Token {token.name} exists in info but not in state table")
-                return
+        self.insertTokenDataBatch([token])
 
-            self._updateExistingRecords(cursor, token, result)
-
-    def _insertNewRecords(self, cursor, token: PumpFunToken) -> None:
-        """Insert new token records in both tables"""
-        currentTime = datetime.now()
-
-        # Insert info record
-        cursor.execute(
-            text(
-                """
-            INSERT INTO pumpfuninfo (
-                tokenid, name, tokenname, chain, tokendecimals,
-                circulatingsupply, tokenage, twitterlink, telegramlink,
-                websitelink, firstseenat, lastupdatedat, count
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 1)
+    def insertTokenDataBatch(self, tokens: List[PumpFunToken]) -> Dict[str, int]:
         """
-            ),
-            (
-                token.tokenid,
-                token.name,
-                token.tokenname,
-                token.chain,
-                token.tokendecimals,
-                token.circulatingsupply,
-                token.tokenage,
-                token.twitterlink,
-                token.telegramlink,
-                token.websitelink,
-                currentTime,
-                currentTime,
-            ),
-        )
-        
-        logger.info(f"Info record added for the token :  {token.name}")
+        Insert or update a parsed batch in one transaction.
 
-        # Insert state record
-        cursor.execute(
-            text(
-                """
-            INSERT INTO pumpfunstates (
-                tokenid, price, marketcap, liquidity, volume24h,
-                buysolqty, occurrencecount, percentilerankpeats,
-                percentileranksol, dexstatus, change1hpct,
-                createdat, lastupdatedat
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-            ),
-            (
-                token.tokenid,
-                str(token.price),
-                str(token.marketcap),
-                str(token.liquidity),
-                str(token.volume24h),
-                token.buysolqty,
-                token.occurrencecount,
-                token.percentilerankpeats,
-                token.percentileranksol,
-                token.dexstatus,
-                str(token.change1hpct),
-                currentTime,
-                currentTime,
-            ),
-        )
-        logger.info(f"State record added for the token :  {token.name}")
+        New tokens get info and state rows. Existing tokens seen within the last
+        20 minutes whose buysolqty, occurrencecount or percentile ranks changed
+        have their state archived to history, replaced, and their info count
+        incremented. Change detection runs in SQL against a temp copy of the batch.
+        The committed rows are written through to the TokenSnapshotCache.
 
-        logger.info(f"Inserted new token {token.tokenid}")
+        Args:
+            tokens: PumpFunToken objects to persist
 
-    def _updateExistingRecords(
-        self, cursor, token: PumpFunToken, currentState: Dict
-    ) -> None:
+        Returns:
+            Dict: inserted, updated and skipped counts
         """
-        Archive current state and update records ONLY if:
-        1. The token was seen within the last 20 minutes (timeago ≤ 20 minutes), AND
-        2. Key metrics have changed
+        try:
+            with self.conn_manager.transaction() as cursor:
+                stats = self.ingest.ingest(cursor, tokens)
+                snapshots = self.ingest.readSnapshots(cursor, [token.tokenid for token in tokens])
+        except Exception as e:
+            logger.error(f"Failed to process batch of {len(tokens)} tokens: {str(e)}")
+            raise
 
-        If the token was seen more than 20 minutes ago, skip the update regardless of metric changes.
+        # Write through only once the rows are committed
+        TokenSnapshotCache.shared().putMany("pumpfun", snapshots)
+        return stats
 
-        Key metrics monitored for changes:
-        - buysolqty: Number of SOL buy transactions
-        - occurrencecount: Number of times token detected
-        - percentilerankpeats: Ranking based on occurrences
-        - percentileranksol: Ranking based on SOL buys
+    def getTokenSnapshots(self, tokenIds: List[str]) -> Dict[str, Dict]:
         """
-        currentTime = datetime.now(pytz.UTC)
-
-        # PRIMARY CONDITION: Check if token was seen within the last 20 minutes using timeago field
-        if hasattr(token, "timeago") and token.timeago is not None:
-            # Ensure timeago is timezone-aware (UTC)
-            tokenTimeago = token.timeago
-            if tokenTimeago.tzinfo is None:
-                tokenTimeago = pytz.UTC.localize(tokenTimeago)
-
-            timeDifference = (
-                currentTime - tokenTimeago
-            ).total_seconds() / 60  # Convert to minutes
+        Current state merged with info ({**state, **info}) for many tokens
 
-            if timeDifference > 20:
-                logger.info(
-                    f"Token {token.name} was seen {timeDifference:.2f} minutes ago (UTC), outside 20-minute threshold, skipping update"
-                )
-                return  # Skip update entirely if token was seen more than 20 minutes ago
+        Served from the snapshot cache the ingest writes through; misses are read
+        with one query.
 
-            logger.info(
-                f"Token {token.name} was seen {timeDifference:.2f} minutes ago (UTC), within 20-minute threshold, checking for changes"
-            )
-        else:
-            # If timeago is None, skip update
-            logger.info(f"Token {token.name} has no timeago value, skipping update")
-            return
-
-        # SECONDARY CONDITION: Check if any metrics have changed
-        shouldUpdate = False
-        metricsToCompare = [
-            ("buysolqty", token.buysolqty, currentState["buysolqty"]),
-            ("occurrencecount", token.occurrencecount, currentState["occurrencecount"]),
-            (
-                "percentilerankpeats",
-                token.percentilerankpeats,
-                currentState["percentilerankpeats"],
-            ),
-            (
-                "percentileranksol",
-                token.percentileranksol,
-                currentState["percentileranksol"],
-            ),
-        ]
-
-        # Compare metrics and log changes
-        changedMetrics = []
-        for metricName, newValue, oldValue in metricsToCompare:
-            if newValue != oldValue:
-                shouldUpdate = True
-                changedMetrics.append(f"{metricName}: {oldValue} -> {newValue}")
-
-        if not shouldUpdate:
-            logger.info(f"No changes detected for token {token.name}, skipping update")
-            return
-
-        logger.info(f"Changes detected for token {token.name}: {', '.join(changedMetrics)}")
-
-        # 1. Archive current state since we're going to update
-        cursor.execute(
-            text(
-                """
-            INSERT INTO pumpfunhistory (
-                tokenid, snapshotat, price, marketcap, liquidity,
-                volume24h, buysolqty, occurrencecount, percentilerankpeats,
-                percentileranksol, dexstatus, change1hpct, createdat
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-            ),
-            (
-                currentState["tokenid"],
-                currentState["lastupdatedat"],
-                currentState["price"],
-                currentState["marketcap"],
-                currentState["liquidity"],
-                currentState["volume24h"],
-                currentState["buysolqty"],
-                currentState["occurrencecount"],
-                currentState["percentilerankpeats"],
-                currentState["percentileranksol"],
-                currentState["dexstatus"],
-                currentState["change1hpct"],
-                currentTime,
-            ),
-        )
-        logger.info(f"Updated history for token {token.name}: {', '.join(changedMetrics)}")
+        Args:
+            tokenIds: Tokens to resolve
 
-        # 2. Update state table
-        cursor.execute(
-            text(
-                """
-            UPDATE pumpfunstates SET
-                price = %s,
-                marketcap = %s,
-                liquidity = %s,
-                volume24h = %s,
-                buysolqty = %s,
-                occurrencecount = %s,
-                percentilerankpeats = %s,
-                percentileranksol = %s,
-                dexstatus = %s,
-                change1hpct = %s,
-                lastupdatedat = %s
-            WHERE tokenid = %s
+        Returns:
+            Dict: tokenid -> merged row for tokens that have both rows
         """
-            ),
-            (
-                str(token.price),
-                str(token.marketcap),
-                str(token.liquidity),
-                str(token.volume24h),
-                token.buysolqty,
-                token.occurrencecount,
-                token.percentilerankpeats,
-                token.percentileranksol,
-                token.dexstatus,
-                str(token.change1hpct),
-                currentTime,
-                token.tokenid,
-            ),
-        )
-        
-        logger.info(f"Updated state for token {token.name}: {', '.join(changedMetrics)}")
+        return TokenSnapshotCache.shared().getMany("pumpfun", tokenIds, self._readSnapshots)
 
-        # 3. Update info table
-        cursor.execute(
-            text(
-                """
-            UPDATE pumpfuninfo SET
-                count = count + 1,
-                lastupdatedat = %s
-            WHERE tokenid = %s
-        """
-            ),
-            (currentTime, token.tokenid),
-        )
-        
-        logger.info(f"Updated info for token {token.name}, incremented count")
+    def _readSnapshots(self, tokenIds: List[str]) -> Dict[str, Dict]:
+        with self.conn_manager.transaction() as cursor:
+            return self.ingest.readSnapshots(cursor, tokenIds)
 
     def getTokenHistory(
         self, tokenId: str, startTime: datetime, endTime: datetime
@@ -21,51 +21,6 @@ class SMWalletTopPNLTokenHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create toppnltoken table if it doesn't exist"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-            
-            if config.DB_TYPE == 'postgres':
-                cursor.execute(f'''
-                    CREATE TABLE IF NOT EXISTS smwallettoppnltoken (
-                        id SERIAL PRIMARY KEY,
-                        walletaddress TEXT NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        amountinvested DECIMAL,
-                        amounttakenout DECIMAL,
-                        remainingcoins DECIMAL,
-                        unprocessedpnl DECIMAL,
-                        unprocessedroi DECIMAL,
-                        transactionscount INTEGER DEFAULT 0,
-                        createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        lastupdatedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status INTEGER DEFAULT {TokenStatus.LOW_PNL_TOKEN.value},
-                        UNIQUE(walletaddress, tokenid)
-                    )
-                ''')
-            else:
-                cursor.execute(f'''
-                    CREATE TABLE IF NOT EXISTS smwallettoppnltoken (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        walletaddress TEXT NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        amountinvested DECIMAL,
-                        amounttakenout DECIMAL,
-                        remainingcoins DECIMAL,
-                        unprocessedpnl DECIMAL,
-                        unprocessedroi DECIMAL,
-                        transactionscount INTEGER DEFAULT 0,
-                        createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        lastupdatedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status INTEGER DEFAULT {TokenStatus.LOW_PNL_TOKEN.value},
-                        UNIQUE(walletaddress, tokenid)
-                    )
-                ''')
 
     def insertSMWalletToken(self, token_data: SMWalletTopPnlToken, cursor: Optional[Any] = None) -> bool:
         """
@@ -554,6 +509,84 @@ class SMWalletTopPNLTokenHandler(BaseDBHandler):
             logger.error(f"Failed to update transaction count for wallet {walletAddress} and token {tokenId}: {str(e)}")
             return False
 
+    def getTransactionCounts(self, pairs: List[tuple]) -> Dict[tuple, int]:
+        """
+        Get the transaction counts of many wallet / token pairs in one query
+
+        Args:
+            pairs: (walletAddress, tokenId) tuples
+
+        Returns:
+            Dict[tuple, int]: Transaction count by (walletAddress, tokenId); pairs not stored are missing
+        """
+        if not pairs:
+            return {}
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(text("""
+                    SELECT t.walletaddress, t.tokenid, COALESCE(t.transactionscount, 0) AS transactionscount
+                    FROM smwallettoppnltoken t
+                    JOIN unnest(%s::text[], %s::text[]) AS p(walletaddress, tokenid)
+                        ON t.walletaddress = p.walletaddress AND t.tokenid = p.tokenid
+                """), ([pair[0] for pair in pairs], [pair[1] for pair in pairs]))
+                return {
+                    (row['walletaddress'], row['tokenid']): int(row['transactionscount'])
+                    for row in cursor.fetchall()
+                }
+
+        except Exception as e:
+            logger.error(f"Failed to get transaction counts for {len(pairs)} wallet / token pairs: {str(e)}")
+            raise
+
+    def updateInvestmentDataBatch(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Write the transaction counts and investment amounts of many pairs in one statement
+
+        Args:
+            updates: Dicts with walletAddress, tokenId, transactionsCount and amountInvested,
+                amountTakenOut, remainingCoins (None keeps the stored amounts, so a pair
+                whose investment details could not be fetched still gets its new count)
+
+        Returns:
+            int: Number of rows updated
+        """
+        if not updates:
+            return 0
+
+        def amounts(field: str) -> List[Optional[str]]:
+            return [str(update[field]) if update.get(field) is not None else None for update in updates]
+
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(text("""
+                    UPDATE smwallettoppnltoken AS t
+                    SET transactionscount = u.transactionscount,
+                        amountinvested = COALESCE(u.amountinvested, t.amountinvested),
+                        amounttakenout = COALESCE(u.amounttakenout, t.amounttakenout),
+                        remainingcoins = COALESCE(u.remainingcoins, t.remainingcoins),
+                        lastupdatedtime = %s
+                    FROM unnest(%s::text[], %s::text[], %s::int[], %s::numeric[], %s::numeric[], %s::numeric[])
+                        AS u(walletaddress, tokenid, transactionscount, amountinvested, amounttakenout, remainingcoins)
+                    WHERE t.walletaddress = u.walletaddress
+                    AND t.tokenid = u.tokenid
+                """), (
+                    datetime.now(),
+                    [update['walletAddress'] for update in updates],
+                    [update['tokenId'] for update in updates],
+                    [int(update['transactionsCount']) for update in updates],
+                    amounts('amountInvested'),
+                    amounts('amountTakenOut'),
+                    amounts('remainingCoins'),
+                ))
+                updated = cursor.rowcount
+
+            logger.info(f"Updated investment data of {updated}/{len(updates)} wallet / token pairs")
+            return updated
+
+        except Exception as e:
+            logger.error(f"Failed to update investment data of {len(updates)} wallet / token pairs: {str(e)}")
+            raise
+
     def getTokensForWallet(self, walletAddress: str) -> List[SMWalletTopPnlToken]:
         """
         Get all tokens invested by a specific wallet
@@ -595,4 +628,57 @@ class SMWalletTopPNLTokenHandler(BaseDBHandler):
                 
         except Exception as e:
             logger.error(f"Failed to get tokens for wallet {walletAddress}: {str(e)}")
-            return [] 
\ No newline at end of file
+            return [] 
+
+    def refreshWalletStats(self, walletAddresses: List[str], cursor: Optional[Any] = None) -> bool:
+        """
+        Recompute the smwalletpnlstats rows (token count, winning tokens, win rate) of wallets
+        
+        Args:
+            walletAddresses: Wallets whose tokens were just persisted
+            cursor: Optional database cursor for transaction management
+            
+        Returns:
+            bool: Success status
+        """
+        walletAddresses = list(dict.fromkeys(walletAddresses))
+        if not walletAddresses:
+            return True
+        try:
+            config = get_config()
+            placeholder = "%s" if config.DB_TYPE == 'postgres' else "?"
+
+            query = f"""
+                INSERT INTO smwalletpnlstats (walletaddress, tokencount, wincount, winrate, updatedat)
+                SELECT
+                    walletaddress,
+                    COUNT(*),
+                    COUNT(*) FILTER (WHERE unprocessedpnl > 0),
+                    COUNT(*) FILTER (WHERE unprocessedpnl > 0) * 100.0 / COUNT(*),
+                    CURRENT_TIMESTAMP
+                FROM smwallettoppnltoken
+                WHERE walletaddress IN ({", ".join([placeholder] * len(walletAddresses))})
+                GROUP BY walletaddress
+                ON CONFLICT (walletaddress) DO UPDATE SET
+                    tokencount = EXCLUDED.tokencount,
+                    wincount = EXCLUDED.wincount,
+                    winrate = EXCLUDED.winrate,
+                    updatedat = EXCLUDED.updatedat
+            """
+            params = tuple(walletAddresses)
+
+            if cursor:
+                if config.DB_TYPE == 'postgres':
+                    cursor.execute(text(query), params)
+                else:
+                    cursor.execute(query, params)
+            else:
+                with self.conn_manager.transaction() as cur:
+                    if config.DB_TYPE == 'postgres':
+                        cur.execute(text(query), params)
+                    else:
+                        cur.execute(query, params)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to refresh PNL stats for {len(walletAddresses)} wallets: {str(e)}")
+            return False
@@ -33,10 +33,17 @@ class SmartMoneyPerformanceReportHandler(BaseDBHandler):
                                      maxTradeCount: int = None,
                                      minInvestedAmount: float = None,
                                      sortBy: str = "profitandloss",
-                                     sortOrder: str = "desc") -> List[Dict[str, Any]]:
+                                     sortOrder: str = "desc",
+                                     limit: Optional[int] = None,
+                                     offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get Smart Money Performance Report with optional filters
         
+        Wallets and their win rates come from one query. Without minInvestedAmount the
+        win rate is read from smwalletpnlstats (refreshed whenever a wallet's top PNL
+        tokens are persisted); with it, the qualifying tokens are aggregated per wallet
+        in the same query.
+        
         Args:
             walletAddress: Filter by wallet address (optional)
             minProfitAndLoss: Minimum profit and loss (optional)
@@ -46,106 +53,104 @@ class SmartMoneyPerformanceReportHandler(BaseDBHandler):
             minInvestedAmount: Minimum invested amount for win rate calculation (optional)
             sortBy: Field to sort by (default: profitandloss)
             sortOrder: Sort order (asc or desc, default: desc)
+            limit: Maximum number of wallets to return (optional, default: all)
+            offset: Number of wallets to skip (default: 0)
             
         Returns:
             List of wallet performance data dictionaries
         """
         try:
             config = get_config()
+            placeholder = "%s" if config.DB_TYPE == 'postgres' else "?"
             
             # Validate sort parameters
-            valid_sort_fields = ["walletaddress", "profitandloss", "tradecount", "winrate"]
-            if sortBy not in valid_sort_fields:
+            sort_fields = {
+                "walletaddress": "w.walletaddress",
+                "profitandloss": "w.profitandloss",
+                "tradecount": "w.tradecount",
+                "winrate": "winrate"
+            }
+            if sortBy not in sort_fields:
                 sortBy = "profitandloss"
                 
             if sortOrder.lower() not in ["asc", "desc"]:
                 sortOrder = "desc"
-                
-            # Map frontend sort field to database field
-            db_sort_field = sortBy
+            
+            params = []
+            
+            # Win rate per wallet: precomputed stats, or aggregated over the qualifying tokens
+            if minInvestedAmount is None:
+                win_rate_source = "smwalletpnlstats"
+            else:
+                win_rate_source = f"""(
+                    SELECT
+                        walletaddress,
+                        COUNT(*) FILTER (WHERE unprocessedpnl > 0) * 100.0 / COUNT(*) AS winrate
+                    FROM smwallettoppnltoken
+                    WHERE amountinvested >= {placeholder}
+                    GROUP BY walletaddress
+                )"""
+                params.append(minInvestedAmount)
             
             # Build query conditions
             conditions = ["1=1"]  # Always true condition to simplify query building
-            params = []
             
             if walletAddress:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("w.walletaddress LIKE %s")
-                else:
-                    conditions.append("w.walletaddress LIKE ?")
+                conditions.append(f"w.walletaddress LIKE {placeholder}")
                 params.append(f"%{walletAddress}%")
                 
             if minProfitAndLoss is not None:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("w.profitandloss >= %s")
-                else:
-                    conditions.append("w.profitandloss >= ?")
+                conditions.append(f"w.profitandloss >= {placeholder}")
                 params.append(minProfitAndLoss)
                 
             if maxProfitAndLoss is not None:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("w.profitandloss <= %s")
-                else:
-                    conditions.append("w.profitandloss <= ?")
+                conditions.append(f"w.profitandloss <= {placeholder}")
                 params.append(maxProfitAndLoss)
                 
             if minTradeCount is not None:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("w.tradecount >= %s")
-                else:
-                    conditions.append("w.tradecount >= ?")
+                conditions.append(f"w.tradecount >= {placeholder}")
                 params.append(minTradeCount)
                 
             if maxTradeCount is not None:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("w.tradecount <= %s")
-                else:
-                    conditions.append("w.tradecount <= ?")
+                conditions.append(f"w.tradecount <= {placeholder}")
                 params.append(maxTradeCount)
             
-            # Base query to get wallet data
+            # Wallet address breaks ties so pages do not overlap
             query = f"""
             SELECT 
                 w.walletaddress,
                 w.profitandloss,
-                w.tradecount
+                w.tradecount,
+                COALESCE(s.winrate, 0) AS winrate
             FROM smartmoneywallets w
+            LEFT JOIN {win_rate_source} s ON s.walletaddress = w.walletaddress
             WHERE {" AND ".join(conditions)}
-            ORDER BY {db_sort_field} {sortOrder}
+            ORDER BY {sort_fields[sortBy]} {sortOrder}, w.walletaddress
             """
             
-            # Execute the query
-            wallet_results = []
+            if limit is not None:
+                query += f" LIMIT {placeholder} OFFSET {placeholder}"
+                params.extend([max(0, int(limit)), max(0, int(offset or 0))])
+            elif offset:
+                query += f" OFFSET {placeholder}"
+                params.append(max(0, int(offset)))
+            
             with self.transaction() as cursor:
                 if config.DB_TYPE == 'postgres':
                     cursor.execute(text(query), tuple(params))
                 else:
                     cursor.execute(query, tuple(params))
-                wallet_results = cursor.fetchall()
-            
-            # Process results
-            results = []
-            for wallet_row in wallet_results:
-                wallet_address = wallet_row[0]
-                
-                # Calculate win rate based on token performance
-                win_rate = self.calculateWinRate(wallet_address, minInvestedAmount)
-                
-                # Create result dictionary
-                result = {
-                    "walletaddress": wallet_address,
-                    "profitandloss": wallet_row[1],
-                    "tradecount": wallet_row[2],
-                    "winrate": win_rate
+                rows = cursor.fetchall()
+            
+            return [
+                {
+                    "walletaddress": row["walletaddress"],
+                    "profitandloss": row["profitandloss"],
+                    "tradecount": row["tradecount"],
+                    "winrate": float(row["winrate"])
                 }
-                
-                results.append(result)
-            
-            # If sorting by win rate, we need to sort the results in Python
-            if sortBy == "winrate":
-                results.sort(key=lambda x: x["winrate"], reverse=(sortOrder.lower() == "desc"))
-            
-            return results
+                for row in rows
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get Smart Money Performance Report: {str(e)}")
@@ -164,48 +169,34 @@ class SmartMoneyPerformanceReportHandler(BaseDBHandler):
         """
         try:
             config = get_config()
+            placeholder = "%s" if config.DB_TYPE == 'postgres' else "?"
             
             # Build query conditions
-            if config.DB_TYPE == 'postgres':
-                conditions = ["walletaddress = %s"]
-            else:
-                conditions = ["walletaddress = ?"]
+            conditions = [f"walletaddress = {placeholder}"]
             params = [walletAddress]
             
             if minInvestedAmount is not None:
-                if config.DB_TYPE == 'postgres':
-                    conditions.append("amountinvested >= %s")
-                else:
-                    conditions.append("amountinvested >= ?")
+                conditions.append(f"amountinvested >= {placeholder}")
                 params.append(minInvestedAmount)
             
-            # Query to get token performance data
             query = f"""
             SELECT 
-                tokenid,
-                unprocessedpnl
+                COUNT(*) AS tokencount,
+                COUNT(*) FILTER (WHERE unprocessedpnl > 0) AS wincount
             FROM smwallettoppnltoken
             WHERE {" AND ".join(conditions)}
             """
             
-            # Execute the query
-            token_results = []
             with self.transaction() as cursor:
                 if config.DB_TYPE == 'postgres':
                     cursor.execute(text(query), tuple(params))
                 else:
                     cursor.execute(query, tuple(params))
-                token_results = cursor.fetchall()
+                row = cursor.fetchone()
             
-            # Calculate win rate
-            total_tokens = len(token_results)
-            if total_tokens == 0:
+            if not row or not row["tokencount"]:
                 return 0.0
-                
-            winning_tokens = sum(1 for row in token_results if row[1] > 0)
-            win_rate = (winning_tokens / total_tokens) * 100
-            
-            return win_rate
+            return row["wincount"] / row["tokencount"] * 100
             
         except Exception as e:
             logger.error(f"Failed to calculate win rate for wallet {walletAddress}: {str(e)}")
@@ -221,50 +212,8 @@ class SmartMoneyPerformanceReportHandler(BaseDBHandler):
         Returns:
             List of top performing wallet data
         """
-        try:
-            config = get_config()
-            
-            query = """
-            SELECT 
-                w.walletaddress,
-                w.profitandloss,
-                w.tradecount
-            FROM smartmoneywallets w
-            ORDER BY w.profitandloss DESC
-            LIMIT ?
-            """
-            
-            # Execute the query
-            results = []
-            with self.transaction() as cursor:
-                if config.DB_TYPE == 'postgres':
-                    # In PostgreSQL, LIMIT uses $1 or %s instead of ?
-                    pg_query = query.replace('?', '%s')
-                    cursor.execute(text(pg_query), (limit,))
-                else:
-                    cursor.execute(query, (limit,))
-                results = cursor.fetchall()
-            
-            # Process results
-            top_performers = []
-            for row in results:
-                wallet_address = row[0]
-                
-                # Calculate win rate
-                win_rate = self.calculateWinRate(wallet_address)
-                
-                # Create result dictionary
-                performer = {
-                    "walletaddress": wallet_address,
-                    "profitandloss": row[1],
-                    "tradecount": row[2],
-                    "winrate": win_rate
-                }
-                
-                top_performers.append(performer)
-            
-            return top_performers
-            
-        except Exception as e:
-            logger.error(f"Failed to get top performers: {str(e)}")
-            return [] 
\ No newline at end of file
+        return self.getSmartMoneyPerformanceReport(
+            sortBy="profitandloss",
+            sortOrder="desc",
+            limit=limit
+        )
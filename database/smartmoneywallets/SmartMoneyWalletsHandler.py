@@ -22,57 +22,6 @@ class SmartMoneyWalletsHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._create_tables()
-
-    def _create_tables(self):
-        """Create smartmoneywallets table if it doesn't exist"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-            
-            if config.DB_TYPE == 'postgres':
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywallets (
-                        id SERIAL PRIMARY KEY,
-                        walletaddress TEXT NOT NULL UNIQUE,
-                        walletname TEXT NOT NULL,
-                        totalinvested DECIMAL,
-                        totalwithdrew DECIMAL,
-                        pnl DECIMAL,
-                        pnlpercentage DECIMAL,
-                        winrate DECIMAL,
-                        wincount INTEGER,
-                        losscount INTEGER,
-                        totaldeals INTEGER,
-                        verified INTEGER,
-                        chain TEXT,
-                        status INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        issmartmoney INTEGER DEFAULT 1
-                    )
-                '''))
-            else:
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywallets (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        walletaddress TEXT NOT NULL UNIQUE,
-                        walletname TEXT NOT NULL,
-                        totalinvested DECIMAL,
-                        totalwithdrew DECIMAL,
-                        pnl DECIMAL,
-                        pnlpercentage DECIMAL,
-                        winrate DECIMAL,
-                        wincount INTEGER,
-                        losscount INTEGER,
-                        totaldeals INTEGER,
-                        verified INTEGER,
-                        chain TEXT,
-                        status INTEGER DEFAULT 1,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        issmartmoney INTEGER DEFAULT 1
-                    )
-                '''))
 
     def insertSmartMoneyWallet(self, wallet: SmartMoneyWallet, cursor: Optional[Any] = None) -> Optional[int]:
         """Insert a smart money wallet"""
@@ -14,137 +14,6 @@ class SmartMoneyWalletBehaviourHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)
-        self._createTables()
-
-    def _createTables(self):
-        """Create the smartmoneywalletbehaviour and history tables"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-            
-            if config.DB_TYPE == 'postgres':
-                # PostgreSQL version with correct syntax
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviour (
-                        walletaddress TEXT PRIMARY KEY,
-                        totalinvestment DECIMAL,
-                        numtokens INTEGER,
-                        avginvestmentpertoken DECIMAL,
-                        highconvictionnumtokens INTEGER,
-                        highconvictionavginvestment DECIMAL,
-                        highconvictionwinrate DECIMAL,
-                        highconvictiontotalinvested DECIMAL,
-                        highconvictiontotaltakenout DECIMAL,
-                        highconvictionpercentagereturn DECIMAL,
-                        mediumconvictionnumtokens INTEGER,
-                        mediumconvictionavginvestment DECIMAL,
-                        mediumconvictionwinrate DECIMAL,
-                        mediumconvictiontotalinvested DECIMAL,
-                        mediumconvictiontotaltakenout DECIMAL,
-                        mediumconvictionpercentagereturn DECIMAL,
-                        lowconvictionnumtokens INTEGER,
-                        lowconvictionavginvestment DECIMAL,
-                        lowconvictionwinrate DECIMAL,
-                        lowconvictiontotalinvested DECIMAL,
-                        lowconvictiontotaltakenout DECIMAL,
-                        lowconvictionpercentagereturn DECIMAL,
-                        createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        analysistime TIMESTAMP
-                    )
-                ''')
-                
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviourhistory (
-                        historyid SERIAL PRIMARY KEY,
-                        walletaddress TEXT,
-                        totalinvestment DECIMAL,
-                        numtokens INTEGER,
-                        avginvestmentpertoken DECIMAL,
-                        highconvictionnumtokens INTEGER,
-                        highconvictionavginvestment DECIMAL,
-                        highconvictionwinrate DECIMAL,
-                        highconvictiontotalinvested DECIMAL,
-                        highconvictiontotaltakenout DECIMAL,
-                        highconvictionpercentagereturn DECIMAL,
-                        mediumconvictionnumtokens INTEGER,
-                        mediumconvictionavginvestment DECIMAL,
-                        mediumconvictionwinrate DECIMAL,
-                        mediumconvictiontotalinvested DECIMAL,
-                        mediumconvictiontotaltakenout DECIMAL,
-                        mediumconvictionpercentagereturn DECIMAL,
-                        lowconvictionnumtokens INTEGER,
-                        lowconvictionavginvestment DECIMAL,
-                        lowconvictionwinrate DECIMAL,
-                        lowconvictiontotalinvested DECIMAL,
-                        lowconvictiontotaltakenout DECIMAL,
-                        lowconvictionpercentagereturn DECIMAL,
-                        createdtime TIMESTAMP,
-                        analysistime TIMESTAMP,
-                        archivedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-            else:
-                # SQLite version remains unchanged
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviour (
-                        walletaddress TEXT PRIMARY KEY,
-                        totalinvestment DECIMAL,
-                        numtokens INTEGER,
-                        avginvestmentpertoken DECIMAL,
-                        highconvictionnumtokens INTEGER,
-                        highconvictionavginvestment DECIMAL,
-                        highconvictionwinrate DECIMAL,
-                        highconvictiontotalinvested DECIMAL,
-                        highconvictiontotaltakenout DECIMAL,
-                        highconvictionpercentagereturn DECIMAL,
-                        mediumconvictionnumtokens INTEGER,
-                        mediumconvictionavginvestment DECIMAL,
-                        mediumconvictionwinrate DECIMAL,
-                        mediumconvictiontotalinvested DECIMAL,
-                        mediumconvictiontotaltakenout DECIMAL,
-                        mediumconvictionpercentagereturn DECIMAL,
-                        lowconvictionnumtokens INTEGER,
-                        lowconvictionavginvestment DECIMAL,
-                        lowconvictionwinrate DECIMAL,
-                        lowconvictiontotalinvested DECIMAL,
-                        lowconvictiontotaltakenout DECIMAL,
-                        lowconvictionpercentagereturn DECIMAL,
-                        createdtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        analysistime TIMESTAMP
-                    )
-                ''')
-                
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS smartmoneywalletbehaviourhistory (
-                        historyid INTEGER PRIMARY KEY AUTOINCREMENT,
-                        walletaddress TEXT,
-                        totalinvestment DECIMAL,
-                        numtokens INTEGER,
-                        avginvestmentpertoken DECIMAL,
-                        highconvictionnumtokens INTEGER,
-                        highconvictionavginvestment DECIMAL,
-                        highconvictionwinrate DECIMAL,
-                        highconvictiontotalinvested DECIMAL,
-                        highconvictiontotaltakenout DECIMAL,
-                        highconvictionpercentagereturn DECIMAL,
-                        mediumconvictionnumtokens INTEGER,
-                        mediumconvictionavginvestment DECIMAL,
-                        mediumconvictionwinrate DECIMAL,
-                        mediumconvictiontotalinvested DECIMAL,
-                        mediumconvictiontotaltakenout DECIMAL,
-                        mediumconvictionpercentagereturn DECIMAL,
-                        lowconvictionnumtokens INTEGER,
-                        lowconvictionavginvestment DECIMAL,
-                        lowconvictionwinrate DECIMAL,
-                        lowconvictiontotalinvested DECIMAL,
-                        lowconvictiontotaltakenout DECIMAL,
-                        lowconvictionpercentagereturn DECIMAL,
-                        createdtime TIMESTAMP,
-                        analysistime TIMESTAMP,
-                        archivedtime TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-            logger.info("SMWallet behaviour tables ensured")
 
     def getWalletInvestmentData(self, walletAddress: Optional[str] = None, tokensToBeExcluded: Optional[List[str]] = None) -> pd.DataFrame:
         """Fetch investment data from smwallettoppnltoken, optionally for a specific wallet and excluding specified tokens"""
@@ -3,6 +3,7 @@ from database.operations.BaseDBHandler import BaseDBHandler
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.ReportQuery import ReportPage, ReportQuery
 from logs.logger import get_logger
 import pandas as pd
 import json
@@ -107,56 +108,59 @@ class SmartMoneyWalletBehaviourReportHandler(BaseDBHandler):
             logger.error(f"Failed to fetch wallet behaviour report for {walletAddress}: {str(e)}")
             raise
     
-    def getAllWalletsBehaviourSummary(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    def getAllWalletsBehaviourSummary(self, limit: int = 100, cursor: Optional[str] = None,
+                                      offset: Optional[int] = None) -> ReportPage:
         """
-        Retrieve a summary of behaviour reports for all wallets
+        Retrieve a summary of behaviour reports for all wallets, highest total investment first
         
         Args:
             limit: Maximum number of wallets to return
-            offset: Number of wallets to skip for pagination
+            cursor: nextCursor of the previous page (optional)
+            offset: Number of wallets to skip, for clients still paging by offset (optional)
             
         Returns:
-            List of dictionaries containing wallet behaviour summaries
+            ReportPage of dictionaries containing wallet behaviour summaries
         """
         try:
-            with self.conn_manager.transaction() as cursor:
-                cursor.execute('''
-                    SELECT 
-                        walletaddress, totalinvestment, numtokens, avginvestmentpertoken,
-                        highconvictionwinrate, mediumconvictionwinrate, lowconvictionwinrate,
-                        highconvictionpercentagereturn, mediumconvictionpercentagereturn, lowconvictionpercentagereturn,
-                        analysistime
-                    FROM smartmoneywalletbehaviour
-                    ORDER BY totalinvestment DESC
-                    LIMIT ? OFFSET ?
-                ''', (limit, offset))
-                
-                rows = cursor.fetchall()
-                
-                # Convert rows to dictionaries with formatted data
-                summaries = []
-                for row in rows:
-                    summary = {
-                        'walletAddress': row[0],
-                        'totalInvestment': float(row[1]),
-                        'numTokens': int(row[2]),
-                        'avgInvestmentPerToken': float(row[3]),
-                        'winRates': {
-                            'high': float(row[4]),
-                            'medium': float(row[5]),
-                            'low': float(row[6])
-                        },
-                        'returns': {
-                            'high': float(row[7]),
-                            'medium': float(row[8]),
-                            'low': float(row[9])
-                        },
-                        'lastAnalysis': row[10]
-                    }
-                    summaries.append(summary)
-                
-                logger.info(f"Successfully fetched {len(summaries)} wallet behaviour summaries")
-                return summaries
+            query = ReportQuery(
+                source="smartmoneywalletbehaviour",
+                columns=[
+                    "walletaddress", "totalinvestment", "numtokens", "avginvestmentpertoken",
+                    "highconvictionwinrate", "mediumconvictionwinrate", "lowconvictionwinrate",
+                    "highconvictionpercentagereturn", "mediumconvictionpercentagereturn", "lowconvictionpercentagereturn",
+                    "analysistime"
+                ],
+                sortFields={"totalinvestment": "COALESCE(totalinvestment, 0)"},
+                idColumn="walletaddress",
+                defaultSort="totalinvestment"
+            )
+            with self.conn_manager.transaction() as dbCursor:
+                page = query.fetchPage(dbCursor, "totalinvestment", "desc", limit, cursor, offset=offset)
+            
+            # Convert rows to dictionaries with formatted data
+            page.rows = [
+                {
+                    'walletAddress': row['walletaddress'],
+                    'totalInvestment': float(row['totalinvestment'] or 0),
+                    'numTokens': int(row['numtokens'] or 0),
+                    'avgInvestmentPerToken': float(row['avginvestmentpertoken'] or 0),
+                    'winRates': {
+                        'high': float(row['highconvictionwinrate'] or 0),
+                        'medium': float(row['mediumconvictionwinrate'] or 0),
+                        'low': float(row['lowconvictionwinrate'] or 0)
+                    },
+                    'returns': {
+                        'high': float(row['highconvictionpercentagereturn'] or 0),
+                        'medium': float(row['mediumconvictionpercentagereturn'] or 0),
+                        'low': float(row['lowconvictionpercentagereturn'] or 0)
+                    },
+                    'lastAnalysis': row['analysistime']
+                }
+                for row in page.rows
+            ]
+            
+            logger.info(f"Successfully fetched {len(page.rows)} wallet behaviour summaries")
+            return page
                 
         except Exception as e:
             logger.error(f"Failed to fetch wallet behaviour summaries: {str(e)}")
@@ -1,6 +1,7 @@
 from config.Config import get_config
 from database.operations.BaseDBHandler import BaseDBHandler
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.operations.ReportQuery import InvalidCursorError, ReportPage, ReportQuery
 from typing import List, Dict, Optional, Any, Set
 from decimal import Decimal
 import sqlite3
@@ -11,6 +12,10 @@ from framework.analyticsframework.enums.ExecutionStatusEnum import ExecutionStat
 
 logger = get_logger(__name__)
 
+# Batches scanned for one page of executions filtered by total PNL; a sparse filter
+# returns a short page (with a cursor to continue) instead of scanning every execution
+MAX_PNL_FILTER_BATCHES = 10
+
 class StrategyPerformanceHandler(BaseDBHandler):
     """
     Handler for strategy performance report operations.
@@ -473,7 +478,9 @@ class StrategyPerformanceHandler(BaseDBHandler):
                        min_realized_pnl: float = None,
                        min_total_pnl: float = None,
                        sortBy: str = "createdat",
-                       sortOrder: str = "desc") -> List[Dict[str, Any]]:
+                       sortOrder: str = "desc",
+                       limit: Optional[int] = None,
+                       cursor: Optional[str] = None) -> ReportPage:
         """
         Get all strategy executions with optional filters.
         
@@ -486,42 +493,103 @@ class StrategyPerformanceHandler(BaseDBHandler):
             min_total_pnl: Optional filter by minimum total PNL
             sortBy: Field to sort by (default: createdat)
             sortOrder: Sort order (asc/desc, default: desc)
+            limit: Page size (optional, default: every row)
+            cursor: nextCursor of the previous page (optional)
             
         Returns:
-            List[Dict[str, Any]]: List of executions with performance metrics
+            ReportPage of executions with performance metrics
         """
         try:
             # Save min_total_pnl for later filtering after getting prices
             self._min_total_pnl = min_total_pnl
             
-            # Build the query
-            query, params = self._build_executions_query(
-                strategy_name=strategy_name,
-                source=source,
-                token_id=token_id,
-                token_name=token_name,
-                min_realized_pnl=min_realized_pnl,
-                sortBy=sortBy,
-                sortOrder=sortOrder
+            query = ReportQuery(
+                source="strategyexecution e JOIN strategyconfig s ON e.strategyid = s.strategyid",
+                columns=[
+                    "e.executionid", "e.strategyid", "s.strategyname", "s.source", "e.tokenid",
+                    "e.tokenname", "e.description", "e.avgentryprice", "e.investedamount",
+                    "e.remainingcoins", "e.amounttakenout", "e.status", "e.createdat", "e.updatedat"
+                ],
+                sortFields={
+                    "executionid": "e.executionid",
+                    "strategyname": "s.strategyname",
+                    "tokenname": "e.tokenname",
+                    "source": "s.source",
+                    "status": "e.status",
+                    "investedamount": "COALESCE(e.investedamount, 0)",
+                    "amounttakenout": "COALESCE(e.amounttakenout, 0)",
+                    "createdat": "COALESCE(e.createdat, TIMESTAMP 'epoch')",
+                    "updatedat": "COALESCE(e.updatedat, TIMESTAMP 'epoch')"
+                },
+                idColumn="e.executionid",
+                defaultSort="createdat"
             )
             
-            with self.conn_manager.transaction() as cursor:
-                cursor.execute(query, params)
-                
-                columns = [col[0] for col in cursor.description]
-                executions = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            if strategy_name:
+                query.where("LOWER(s.strategyname) LIKE LOWER(%s)", f"%{strategy_name}%")
+            if token_id:
+                query.where("e.tokenid = %s", token_id)
+            if source:
+                query.where("s.source = %s", source)
+            if token_name:
+                query.where("LOWER(e.tokenname) LIKE LOWER(%s)", f"%{token_name}%")
+            if min_realized_pnl is not None:
+                query.where("(e.amounttakenout - e.investedamount) >= %s", min_realized_pnl)
+            
+            if min_total_pnl is None:
+                with self.conn_manager.transaction() as dbCursor:
+                    page = query.fetchPage(dbCursor, sortBy, sortOrder, limit, cursor)
                 
                 # Calculate additional metrics
-                executions, _ = self._enhance_executions_with_metrics(executions)
-                
-                # Log the result
-                logger.info(f"Retrieved {len(executions)} executions")
-                
-                return executions
+                page.rows, _ = self._enhance_executions_with_metrics(page.rows)
+            else:
+                page = self._fetchExecutionsByTotalPnl(query, sortBy, sortOrder, limit, cursor)
+            
+            logger.info(f"Retrieved {len(page.rows)} executions")
+            return page
                 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get executions: {str(e)}")
-            return []
+            return ReportPage(rows=[])
+    
+    def _fetchExecutionsByTotalPnl(self, query: ReportQuery, sortBy: str, sortOrder: str,
+                                   limit: Optional[int], cursor: Optional[str]) -> ReportPage:
+        """
+        Page through executions keeping those at or above self._min_total_pnl.
+        
+        Total PNL needs live token prices, so the filter cannot run in SQL. Batches
+        are fetched and priced until the page holds `limit` matching rows; the cursor
+        then points right after the last row returned, so no match is skipped.
+        
+        Args:
+            query: Execution query with the SQL filters applied
+            sortBy: Field to sort by
+            sortOrder: Sort order (asc/desc)
+            limit: Page size (None: every matching row)
+            cursor: nextCursor of the previous page (optional)
+            
+        Returns:
+            ReportPage of priced executions passing the total PNL filter
+        """
+        rows: List[Dict[str, Any]] = []
+        nextCursor = cursor
+        for _ in range(MAX_PNL_FILTER_BATCHES):
+            with self.conn_manager.transaction() as dbCursor:
+                batch = query.fetchPage(dbCursor, sortBy, sortOrder, limit, nextCursor,
+                                        withTotal=False, keepKeys=True)
+            nextCursor, limit = batch.nextCursor, batch.limit  # limit as capped by fetchPage
+            batchRows, _ = self._enhance_executions_with_metrics(batch.rows)
+            rows.extend(self.updateExecutionPrices(batchRows))
+            if limit is None or nextCursor is None or len(rows) >= limit:
+                break
+        
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            nextCursor = query.cursorAfter(rows[-1], sortBy, sortOrder)
+        query.dropKeys(rows)
+        return ReportPage(rows=rows, nextCursor=nextCursor, limit=limit)
     
     def updateExecutionPrices(self, executions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -0,0 +1,415 @@
+from config.Config import get_config
+from database.operations.BaseDBHandler import BaseDBHandler
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from logs.logger import get_logger
+import numpy as np
+
+logger = get_logger(__name__)
+
+# Rollup resolutions and their bucket width in seconds
+RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+
+# Rollup columns holding the last value of a bucket, besides OHLC
+EXTRA_COLUMNS = ["marketcap", "liquidity", "volume"]
+
+# Raw history rows folded into rollups per chunk, so the first run on a large
+# table does not hold one huge transaction
+ROLLUP_CHUNK_ROWS = 50000
+
+
+@dataclass
+class TimeSeriesSource:
+    """Where a source keeps its raw snapshots"""
+
+    table: str
+    idColumn: str
+    timeColumn: str
+    valueColumn: str
+    # rollup column -> raw column, for the EXTRA_COLUMNS the source provides
+    extraColumns: Dict[str, str] = field(default_factory=dict)
+
+
+SOURCES: Dict[str, TimeSeriesSource] = {
+    "volume": TimeSeriesSource(
+        "volumetokenhistory", "id", "snapshotat", "price",
+        {"marketcap": "marketcap", "liquidity": "liquidity", "volume": "volume24h"},
+    ),
+    "pumpfun": TimeSeriesSource(
+        "pumpfunhistory", "id", "snapshotat", "price",
+        {"marketcap": "marketcap", "liquidity": "liquidity", "volume": "volume24h"},
+    ),
+    "onchain": TimeSeriesSource(
+        "onchainhistory", "id", "createdat", "price",
+        {"marketcap": "marketcap", "liquidity": "liquidity"},
+    ),
+    "attention": TimeSeriesSource(
+        "attentiondatahistory", "historyid", "updatedat", "attentionscore",
+    ),
+    # portsummaryhistory.createdat is the summary's original creation time;
+    # updatedat is when the snapshot was archived
+    "portsummary": TimeSeriesSource(
+        "portsummaryhistory", "historyid", "updatedat", "currentprice",
+        {"marketcap": "mcap"},
+    ),
+}
+
+
+class TimeSeriesStore(BaseDBHandler):
+    """
+    Uniform read API over token history, returning NumPy arrays.
+
+    Raw snapshots stay in each source's history table. A rollup job folds new
+    history rows into 1m/5m/1h OHLC buckets in tokentimeseriesrollup, tracking
+    progress per source by history id (lagged so that only committed ids are
+    passed), so late-arriving snapshots still land in the right bucket. Reads at a resolution overlay any buckets touched by rows
+    the job has not folded yet, so results are always current.
+    """
+
+    def __init__(self, conn_manager=None):
+        if conn_manager is None:
+            conn_manager = DatabaseConnectionManager()
+        super().__init__(conn_manager)
+
+    @staticmethod
+    def _getSource(source: str) -> TimeSeriesSource:
+        if source not in SOURCES:
+            raise ValueError(f"Unknown time-series source '{source}', expected one of {list(SOURCES)}")
+        return SOURCES[source]
+
+    @staticmethod
+    def _bucketExpression(column: str, seconds: int) -> str:
+        """SQL expression flooring a TIMESTAMP column to the start of its bucket"""
+        return (
+            f"('epoch'::timestamp + floor(extract(epoch FROM {column}) / {seconds}) "
+            f"* {seconds} * interval '1 second')"
+        )
+
+    def _aggregateSelect(self, spec: TimeSeriesSource, seconds: int) -> str:
+        """SELECT list computing one OHLC bucket per (tokenid, bucketstart) group of alias r"""
+        ts = f"r.{spec.timeColumn}"
+        value = f"r.{spec.valueColumn}"
+        extras = ", ".join(
+            f"(array_agg(r.{spec.extraColumns[column]} ORDER BY {ts} DESC))[1] AS {column}"
+            if column in spec.extraColumns
+            else f"NULL::numeric AS {column}"
+            for column in EXTRA_COLUMNS
+        )
+        return f"""
+            (array_agg({value} ORDER BY {ts}))[1] AS open,
+            MAX({value}) AS high,
+            MIN({value}) AS low,
+            (array_agg({value} ORDER BY {ts} DESC))[1] AS close,
+            {extras},
+            COUNT(*) AS samples
+        """
+
+    def read(
+        self,
+        tokenid: str,
+        source: str,
+        start: datetime,
+        end: datetime,
+        resolution: Optional[str] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Read a token's series for [start, end).
+
+        Args:
+            tokenid: Token identifier
+            source: One of SOURCES (volume, pumpfun, onchain, attention, portsummary)
+            start: Inclusive range start
+            end: Exclusive range end
+            resolution: None for raw snapshots, or one of RESOLUTIONS for OHLC buckets
+
+        Returns:
+            Dict[str, np.ndarray]: 'timestamp' (datetime64[us]) plus float64 columns:
+                raw -> value and the source's extra columns;
+                resolution -> open, high, low, close, marketcap, liquidity, volume
+                and int64 samples
+        """
+        return self.readMany([tokenid], source, start, end, resolution)[tokenid]
+
+    def readMany(
+        self,
+        tokenids: List[str],
+        source: str,
+        start: datetime,
+        end: datetime,
+        resolution: Optional[str] = None,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        read() for many tokens with a fixed number of queries.
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: tokenid -> arrays as returned by read();
+                tokens without data get empty arrays
+        """
+        spec = self._getSource(source)
+        tokenids = list(dict.fromkeys(tokenids))
+        if resolution is None:
+            return self._readRaw(spec, tokenids, start, end)
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution '{resolution}', expected one of {list(RESOLUTIONS)}")
+        return self._readRollup(source, spec, tokenids, start, end, resolution)
+
+    def _readRaw(
+        self, spec: TimeSeriesSource, tokenids: List[str], start: datetime, end: datetime,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        extraSelect = "".join(f", {raw} AS {column}" for column, raw in spec.extraColumns.items())
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(
+                f"""
+                SELECT tokenid, {spec.timeColumn} AS timestamp, {spec.valueColumn} AS value{extraSelect}
+                FROM {spec.table}
+                WHERE tokenid = ANY(%s)
+                AND {spec.timeColumn} >= %s
+                AND {spec.timeColumn} < %s
+                ORDER BY tokenid, {spec.timeColumn}
+                """,
+                (tokenids, start, end),
+            )
+            rows = cursor.fetchall()
+
+        rowsByToken: Dict[str, List[Dict]] = {tokenid: [] for tokenid in tokenids}
+        for row in rows:
+            rowsByToken[row["tokenid"]].append(row)
+        columns = ["value"] + list(spec.extraColumns)
+        return {tokenid: self._toArrays(tokenRows, columns) for tokenid, tokenRows in rowsByToken.items()}
+
+    def _readRollup(
+        self, source: str, spec: TimeSeriesSource, tokenids: List[str],
+        start: datetime, end: datetime, resolution: str,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        seconds = RESOLUTIONS[resolution]
+        bucket = self._bucketExpression(f"r.{spec.timeColumn}", seconds)
+        buckets: Dict[str, Dict] = {tokenid: {} for tokenid in tokenids}
+
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(
+                f"""
+                SELECT tokenid, bucketstart AS timestamp, open, high, low, close,
+                       {', '.join(EXTRA_COLUMNS)}, samples
+                FROM tokentimeseriesrollup
+                WHERE source = %s AND tokenid = ANY(%s) AND resolution = %s
+                AND bucketstart >= %s AND bucketstart < %s
+                """,
+                (source, tokenids, resolution, start, end),
+            )
+            for row in cursor.fetchall():
+                buckets[row["tokenid"]][row["timestamp"]] = row
+
+            # Recompute, from raw rows, the buckets that snapshots newer than the
+            # watermark fall into; these replace any stale rollup rows
+            cursor.execute(
+                f"""
+                WITH pending AS (
+                    SELECT DISTINCT r.tokenid, {bucket} AS bucketstart
+                    FROM {spec.table} r
+                    WHERE r.tokenid = ANY(%(tokenids)s)
+                    AND r.{spec.idColumn} > COALESCE(
+                        (SELECT lastid FROM tokentimeserieswatermark WHERE source = %(source)s), 0)
+                    AND r.{spec.timeColumn} >= %(start)s AND r.{spec.timeColumn} < %(end)s
+                )
+                SELECT r.tokenid, p.bucketstart AS timestamp, {self._aggregateSelect(spec, seconds)}
+                FROM {spec.table} r
+                JOIN pending p
+                  ON r.tokenid = p.tokenid
+                 AND r.{spec.timeColumn} >= p.bucketstart
+                 AND r.{spec.timeColumn} < p.bucketstart + interval '{seconds} seconds'
+                GROUP BY r.tokenid, p.bucketstart
+                """,
+                {"tokenids": tokenids, "source": source, "start": start, "end": end},
+            )
+            for row in cursor.fetchall():
+                buckets[row["tokenid"]][row["timestamp"]] = row
+
+        result = {}
+        for tokenid, tokenBuckets in buckets.items():
+            rows = [tokenBuckets[key] for key in sorted(tokenBuckets)]
+            arrays = self._toArrays(rows, ["open", "high", "low", "close"] + EXTRA_COLUMNS)
+            arrays["samples"] = np.array([row["samples"] for row in rows], dtype=np.int64)
+            result[tokenid] = arrays
+        return result
+
+    @staticmethod
+    def _toArrays(rows: List[Dict], columns: List[str]) -> Dict[str, np.ndarray]:
+        arrays = {"timestamp": np.array([row["timestamp"] for row in rows], dtype="datetime64[us]")}
+        for column in columns:
+            arrays[column] = np.array(
+                [np.nan if row[column] is None else float(row[column]) for row in rows],
+                dtype=np.float64,
+            )
+        return arrays
+
+    def rollup(self, source: str) -> int:
+        """
+        Fold committed history rows added since the last run into every resolution.
+
+        Rows are folded up to the highest id seen at least
+        TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS ago, so a snapshot whose transaction
+        commits after a higher id is never skipped by the watermark.
+
+        Args:
+            source: One of SOURCES
+
+        Returns:
+            int: Number of raw rows folded
+        """
+        spec = self._getSource(source)
+        lag = timedelta(seconds=get_config().TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS)
+        now = datetime.now()
+        folded = 0
+
+        with self.conn_manager.transaction() as cursor:
+            cursor.execute(f"SELECT COALESCE(MAX({spec.idColumn}), 0) AS maxid FROM {spec.table}")
+            maxId = cursor.fetchone()["maxid"]
+            cursor.execute(
+                "SELECT lastid, candidateid, candidateat FROM tokentimeserieswatermark WHERE source = %s",
+                (source,),
+            )
+            row = cursor.fetchone()
+            lastId = row["lastid"] if row else 0
+            candidateId = row["candidateid"] if row else None
+            candidateAt = row["candidateat"] if row else None
+
+        # SERIAL ids are handed out at insert but only become visible at commit,
+        # so MAX(id) can already be ahead of rows still in flight. Fold only up to
+        # the MAX(id) observed at least the safety lag ago; rows above it are
+        # still overlaid by reads.
+        if lag.total_seconds() <= 0:
+            safeId = maxId
+        elif candidateId is not None and candidateAt is not None and now - candidateAt >= lag:
+            safeId = max(lastId, candidateId)
+        else:
+            safeId = lastId
+
+        while lastId < safeId:
+            upTo = min(lastId + ROLLUP_CHUNK_ROWS, safeId)
+            with self.conn_manager.transaction() as cursor:
+                for resolution, seconds in RESOLUTIONS.items():
+                    self._rollupRange(cursor, source, spec, resolution, seconds, lastId, upTo)
+                cursor.execute(
+                    """
+                    INSERT INTO tokentimeserieswatermark (source, lastid, updatedat)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (source) DO UPDATE
+                    SET lastid = EXCLUDED.lastid, updatedat = EXCLUDED.updatedat
+                    """,
+                    (source, upTo, datetime.now()),
+                )
+            folded += upTo - lastId
+            lastId = upTo
+
+        # Observe a new candidate once the previous one has been folded
+        if candidateId is None or lastId >= candidateId:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO tokentimeserieswatermark (source, lastid, candidateid, candidateat, updatedat)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT (source) DO UPDATE
+                    SET candidateid = EXCLUDED.candidateid, candidateat = EXCLUDED.candidateat
+                    """,
+                    (source, lastId, maxId, now, now),
+                )
+
+        return folded
+
+    def _rollupRange(
+        self, cursor, source: str, spec: TimeSeriesSource,
+        resolution: str, seconds: int, fromId: int, toId: int,
+    ) -> None:
+        """Recompute every bucket touched by history ids in (fromId, toId]"""
+        bucket = self._bucketExpression(f"{spec.timeColumn}", seconds)
+        cursor.execute(
+            f"""
+            WITH touched AS (
+                SELECT DISTINCT tokenid, {bucket} AS bucketstart
+                FROM {spec.table}
+                WHERE {spec.idColumn} > %(fromid)s AND {spec.idColumn} <= %(toid)s
+                AND {spec.timeColumn} IS NOT NULL
+            )
+            INSERT INTO tokentimeseriesrollup (
+                source, tokenid, resolution, bucketstart,
+                open, high, low, close, {', '.join(EXTRA_COLUMNS)}, samples, updatedat
+            )
+            SELECT %(source)s, r.tokenid, %(resolution)s, t.bucketstart,
+                   {self._aggregateSelect(spec, seconds)}, %(now)s
+            FROM touched t
+            JOIN {spec.table} r
+              ON r.tokenid = t.tokenid
+             AND r.{spec.timeColumn} >= t.bucketstart
+             AND r.{spec.timeColumn} < t.bucketstart + interval '{seconds} seconds'
+            GROUP BY r.tokenid, t.bucketstart
+            ON CONFLICT (source, tokenid, resolution, bucketstart) DO UPDATE SET
+                open = EXCLUDED.open,
+                high = EXCLUDED.high,
+                low = EXCLUDED.low,
+                close = EXCLUDED.close,
+                marketcap = EXCLUDED.marketcap,
+                liquidity = EXCLUDED.liquidity,
+                volume = EXCLUDED.volume,
+                samples = EXCLUDED.samples,
+                updatedat = EXCLUDED.updatedat
+            """,
+            {
+                "source": source,
+                "resolution": resolution,
+                "fromid": fromId,
+                "toid": toId,
+                "now": datetime.now(),
+            },
+        )
+
+    def applyRetention(self) -> Dict[str, int]:
+        """
+        Prune data older than the configured retention windows.
+
+        Minute rollups older than TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS are removed
+        (1h rollups are kept). When TIMESERIES_RAW_RETENTION_DAYS is set, raw history
+        rows older than that are removed, but only once they are folded into rollups
+        and never within the safety lag of the last watermark advance.
+
+        Returns:
+            Dict[str, int]: rows deleted per table
+        """
+        config = get_config()
+        now = datetime.now()
+        deleted: Dict[str, int] = {}
+
+        with self.conn_manager.transaction() as cursor:
+            if config.TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS > 0:
+                cursor.execute(
+                    """
+                    DELETE FROM tokentimeseriesrollup
+                    WHERE resolution IN ('1m', '5m') AND bucketstart < %s
+                    """,
+                    (now - timedelta(days=config.TIMESERIES_MINUTE_ROLLUP_RETENTION_DAYS),),
+                )
+                deleted["tokentimeseriesrollup"] = cursor.rowcount
+
+            if config.TIMESERIES_RAW_RETENTION_DAYS > 0:
+                cutoff = now - timedelta(days=config.TIMESERIES_RAW_RETENTION_DAYS)
+                lagSeconds = max(0, config.TIMESERIES_ROLLUP_SAFETY_LAG_SECONDS)
+                for source, spec in SOURCES.items():
+                    cursor.execute(
+                        f"""
+                        WITH watermark AS (
+                            SELECT lastid, updatedat - %(lag)s * interval '1 second' AS safebefore
+                            FROM tokentimeserieswatermark
+                            WHERE source = %(source)s
+                        )
+                        DELETE FROM {spec.table}
+                        USING watermark w
+                        WHERE {spec.table}.{spec.timeColumn} < %(cutoff)s
+                        AND {spec.table}.{spec.timeColumn} < w.safebefore
+                        AND {spec.table}.{spec.idColumn} <= w.lastid
+                        """,
+                        {"cutoff": cutoff, "source": source, "lag": lagSeconds},
+                    )
+                    deleted[spec.table] = cursor.rowcount
+
+        return deleted
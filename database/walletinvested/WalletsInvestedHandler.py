@@ -17,7 +17,6 @@ class WalletsInvestedHandler(BaseDBHandler):
         if conn_manager is None:
             conn_manager = DatabaseConnectionManager()
         super().__init__(conn_manager)  # Properly initialize base class
-        self._create_tables()
 
     @staticmethod
     def get_current_ist_time() -> datetime:
@@ -30,127 +29,6 @@ class WalletsInvestedHandler(BaseDBHandler):
         ist = pytz.timezone('Asia/Kolkata')
         return datetime.now(ist)
 
-    def _create_tables(self):
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-            
-            if config.DB_TYPE == 'postgres':
-                # PostgreSQL syntax
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS walletsinvested (
-                        walletinvestedid SERIAL PRIMARY KEY,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        walletaddress TEXT NOT NULL,
-                        walletname TEXT,
-                        coinquantity DECIMAL,
-                        smartholding DECIMAL,
-                        firstbuytime TIMESTAMP,
-                        totalinvestedamount DECIMAL,
-                        amounttakenout DECIMAL,
-                        totalcoins DECIMAL,
-                        avgentry DECIMAL,
-                        qtychange1d DECIMAL,
-                        qtychange7d DECIMAL,
-                        chainedgepnl DECIMAL,
-                        transactionscount INTEGER DEFAULT 0,
-                        tags TEXT,
-                        firstseen TIMESTAMP,
-                        lastseen TIMESTAMP,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status INTEGER DEFAULT 1,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE,
-                        UNIQUE(tokenid, walletaddress)
-                    )
-                '''))
-                
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS walletsinvestedhistory (
-                        historyid SERIAL PRIMARY KEY,
-                        walletinvestedid INTEGER NOT NULL,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        walletaddress TEXT NOT NULL,
-                        walletname TEXT,
-                        coinquantity DECIMAL,
-                        smartholding DECIMAL,
-                        firstbuytime TIMESTAMP,
-                        totalinvestedamount DECIMAL,
-                        amounttakenout DECIMAL,
-                        totalcoins DECIMAL,
-                        avgentry DECIMAL,
-                        qtychange1d DECIMAL,
-                        qtychange7d DECIMAL,
-                        chainedgepnl DECIMAL,
-                        transactionscount INTEGER,
-                        tags TEXT,
-                        status INTEGER,
-                        snaptimeat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        createdat TIMESTAMP NOT NULL,
-                        FOREIGN KEY (walletinvestedid) REFERENCES walletsinvested(walletinvestedid) ON DELETE CASCADE,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
-                    )
-                '''))
-            else:
-                # SQLite syntax
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS walletsinvested (
-                        walletinvestedid INTEGER PRIMARY KEY AUTOINCREMENT,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        walletaddress TEXT NOT NULL,
-                        walletname TEXT,
-                        coinquantity DECIMAL,
-                        smartholding DECIMAL,
-                        firstbuytime TIMESTAMP,
-                        totalinvestedamount DECIMAL,
-                        amounttakenout DECIMAL,
-                        totalcoins DECIMAL,
-                        avgentry DECIMAL,
-                        qtychange1d DECIMAL,
-                        qtychange7d DECIMAL,
-                        chainedgepnl DECIMAL,
-                        transactionscount INTEGER DEFAULT 0,
-                        tags TEXT,
-                        firstseen TIMESTAMP,
-                        lastseen TIMESTAMP,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        status INTEGER DEFAULT 1,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE,
-                        UNIQUE(tokenid, walletaddress)
-                    )
-                '''))
-                
-                cursor.execute(text('''
-                    CREATE TABLE IF NOT EXISTS walletsinvestedhistory (
-                        historyid INTEGER PRIMARY KEY AUTOINCREMENT,
-                        walletinvestedid INTEGER NOT NULL,
-                        portsummaryid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        walletaddress TEXT NOT NULL,
-                        walletname TEXT,
-                        coinquantity DECIMAL,
-                        smartholding DECIMAL,
-                        firstbuytime TIMESTAMP,
-                        totalinvestedamount DECIMAL,
-                        amounttakenout DECIMAL,
-                        totalcoins DECIMAL,
-                        avgentry DECIMAL,
-                        qtychange1d DECIMAL,
-                        qtychange7d DECIMAL,
-                        chainedgepnl DECIMAL,
-                        transactionscount INTEGER,
-                        tags TEXT,
-                        status INTEGER,
-                        snaptimeat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        createdat TIMESTAMP NOT NULL,
-                        FOREIGN KEY (walletinvestedid) REFERENCES walletsinvested(walletinvestedid) ON DELETE CASCADE,
-                        FOREIGN KEY (portsummaryid) REFERENCES portsummary(portsummaryid) ON DELETE CASCADE
-                    )
-                '''))
-
     def insertWalletInvested(self, wallet: WalletsInvested, cursor: Optional[Any] = None) -> Optional[int]:
         """Insert new wallet investment record"""
         try:
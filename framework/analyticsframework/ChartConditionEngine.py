@@ -0,0 +1,350 @@
+from config.Config import get_config
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
+from database.timeseries.TimeSeriesStore import RESOLUTIONS, TimeSeriesStore
+from framework.analyticsframework.models.StrategyModels import ChartConditions
+from logs.logger import get_logger
+import json
+import numpy as np
+import pandas as pd
+import re
+import threading
+import time
+
+logger = get_logger(__name__)
+
+# Cached series younger than this are evaluated without touching the database
+SERIES_REFRESH_SECONDS = 30
+
+# Bars kept per cached series beyond what the conditions need
+EXTRA_BARS = 10
+
+# Cached (source, token, timeframe) series; the least recently used are evicted
+SERIES_CACHE_MAX_ENTRIES = 20000
+
+CHART_CONDITION_FIELDS = {f.name for f in fields(ChartConditions)}
+
+DEFAULT_RSI_PERIOD = 14
+DEFAULT_VOLUME_LOOKBACK = 20
+
+
+@dataclass
+class CachedSeries:
+    """One token's bars at one timeframe plus the indicators computed on them"""
+
+    bucketStarts: np.ndarray  # int64 seconds since epoch (naive, like the history tables)
+    close: np.ndarray
+    volume: np.ndarray  # rolling 24h volume as of each bar's last snapshot
+    windowStart: int  # earliest bucket the series is complete from
+    refreshedAt: float
+    indicators: Dict[Tuple, np.ndarray] = field(default_factory=dict)
+
+
+class ChartConditionEngine:
+    """
+    Evaluates ChartConditions against token history, many tokens at a time.
+
+    Series come from TimeSeriesStore rollups (one query per batch of tokens) and
+    are resampled to the strategy timeframe. They are cached per
+    (source, token, timeframe): a refresh only reads bars from the last cached
+    bucket onward and appends them, and indicator arrays are cached until the
+    series changes. The cache is an LRU bounded by SERIES_CACHE_MAX_ENTRIES.
+
+    Supported conditions:
+    - minpricechange / maxpricechange: % change of the last close versus the
+      previous bar's close
+    - rsiconditions: {"period": 14, "min": 30, "max": 70}
+    - maconditions: {"sma": [fast, slow], "ema": [fast, slow]} require the fast
+      average above the slow one; "smacrossover" / "emacrossover" require it to
+      have crossed above on the last bar
+    - volumeconditions: {"lookback": 20, "minspike": 2} require the last bar's
+      volume to be at least minspike times the mean of the previous lookback bars.
+      Sources only store a rolling 24h volume, so a bar's volume is taken as the
+      increase of that figure over the bar (clipped at zero)
+    """
+
+    _series: "OrderedDict[Tuple[str, str, str], CachedSeries]" = OrderedDict()
+    _lock = threading.Lock()
+
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        self.store = store or TimeSeriesStore(DatabaseConnectionManager())
+
+    def evaluate(self, tokenid: str, source: str, chartConditions: Any) -> bool:
+        """
+        Check one token's chart conditions.
+
+        Args:
+            tokenid: Token identifier
+            source: TimeSeriesStore source (volume, pumpfun, onchain, attention, portsummary)
+            chartConditions: ChartConditions, its dict form, or None
+
+        Returns:
+            bool: True if every configured condition holds (or none are configured)
+        """
+        return self.evaluateMany([tokenid], source, chartConditions)[tokenid]
+
+    def evaluateMany(self, tokenids: List[str], source: str, chartConditions: Any) -> Dict[str, bool]:
+        """
+        Check the same chart conditions for many tokens.
+
+        Returns:
+            Dict[str, bool]: tokenid -> whether the conditions hold; tokens without
+                enough history fail
+        """
+        try:
+            conditions = self._normalize(chartConditions)
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.error(f"Invalid chart conditions {chartConditions}: {str(e)}")
+            return {tokenid: False for tokenid in tokenids}
+        if conditions is None or not self._hasConditions(conditions):
+            return {tokenid: True for tokenid in tokenids}
+
+        try:
+            timeframeSeconds = self._parseTimeframe(conditions.timeframe)
+            series = self._loadSeries(tokenids, source, conditions.timeframe, timeframeSeconds,
+                                      self._requiredBars(conditions))
+        except Exception as e:
+            logger.error(f"Failed to load chart series for {len(tokenids)} {source} tokens: {str(e)}")
+            return {tokenid: False for tokenid in tokenids}
+
+        return {tokenid: self._check(tokenid, series[tokenid], conditions) for tokenid in tokenids}
+
+    @staticmethod
+    def _normalize(chartConditions: Any) -> Optional[ChartConditions]:
+        if chartConditions is None or isinstance(chartConditions, ChartConditions):
+            return chartConditions
+        if isinstance(chartConditions, str):
+            chartConditions = json.loads(chartConditions)
+        # Ignore keys ChartConditions does not model rather than failing the strategy
+        known = {name: value for name, value in chartConditions.items() if name in CHART_CONDITION_FIELDS}
+        return ChartConditions(**known)
+
+    @staticmethod
+    def _hasConditions(conditions: ChartConditions) -> bool:
+        return any(
+            value is not None
+            for value in (
+                conditions.minpricechange, conditions.maxpricechange, conditions.rsiconditions,
+                conditions.maconditions, conditions.volumeconditions,
+            )
+        )
+
+    @staticmethod
+    def _parseTimeframe(timeframe: str) -> int:
+        match = re.fullmatch(r"(\d+)([mhd])", (timeframe or "1h").strip().lower())
+        if not match:
+            raise ValueError(f"Unsupported chart timeframe '{timeframe}'")
+        return int(match.group(1)) * {"m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+    @staticmethod
+    def _requiredBars(conditions: ChartConditions) -> int:
+        bars = 2
+        if conditions.rsiconditions:
+            # Wilder smoothing needs a few periods to settle
+            bars = max(bars, int(conditions.rsiconditions.get("period", DEFAULT_RSI_PERIOD)) * 3 + 1)
+        for periods in (conditions.maconditions or {}).values():
+            bars = max(bars, int(max(periods)) * 3 + 1)
+        if conditions.volumeconditions:
+            # One extra snapshot: bar volumes are differences of consecutive bars
+            bars = max(bars, int(conditions.volumeconditions.get("lookback", DEFAULT_VOLUME_LOOKBACK)) + 2)
+        return bars + EXTRA_BARS
+
+    def _loadSeries(
+        self, tokenids: List[str], source: str, timeframe: str, timeframeSeconds: int, bars: int,
+    ) -> Dict[str, CachedSeries]:
+        """Return fresh cached series for every token, reading only what is missing"""
+        now = time.monotonic()
+        nowEpoch = self._toEpoch(datetime.now())
+        windowStart = (nowEpoch // timeframeSeconds - bars + 1) * timeframeSeconds
+
+        result: Dict[str, CachedSeries] = {}
+        reload: List[str] = []
+        extend: List[str] = []
+        with self._lock:
+            for tokenid in dict.fromkeys(tokenids):
+                key = (source, tokenid, timeframe)
+                cached = self._series.get(key)
+                if cached is None or cached.windowStart > windowStart:
+                    reload.append(tokenid)
+                    continue
+                self._series.move_to_end(key)
+                result[tokenid] = cached
+                if now - cached.refreshedAt > SERIES_REFRESH_SECONDS:
+                    extend.append(tokenid)
+
+        if reload:
+            for tokenid, (starts, close, volume) in self._read(reload, source, timeframeSeconds, windowStart).items():
+                result[tokenid] = CachedSeries(starts, close, volume, windowStart, now)
+
+        if extend:
+            # The last cached bar may have gained snapshots, so re-read from it
+            fromStart = min(
+                int(result[tokenid].bucketStarts[-1]) if len(result[tokenid].bucketStarts) else windowStart
+                for tokenid in extend
+            )
+            fetched = self._read(extend, source, timeframeSeconds, fromStart)
+            for tokenid in extend:
+                result[tokenid] = self._merge(result[tokenid], fetched[tokenid], bars, windowStart, now)
+
+        with self._lock:
+            for tokenid in reload + extend:
+                key = (source, tokenid, timeframe)
+                self._series[key] = result[tokenid]
+                self._series.move_to_end(key)
+            while len(self._series) > SERIES_CACHE_MAX_ENTRIES:
+                self._series.popitem(last=False)
+        return result
+
+    def _read(
+        self, tokenids: List[str], source: str, timeframeSeconds: int, fromEpoch: int,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Read rollups at the coarsest resolution that divides the timeframe and resample"""
+        resolution = max(
+            (name for name, seconds in RESOLUTIONS.items() if timeframeSeconds % seconds == 0),
+            key=RESOLUTIONS.get,
+            default="1m",
+        )
+        start = datetime(1970, 1, 1) + timedelta(seconds=fromEpoch)
+        end = datetime.now() + timedelta(seconds=timeframeSeconds)
+        arrays = self.store.readMany(tokenids, source, start, end, resolution)
+        return {
+            tokenid: self._resample(tokenArrays, timeframeSeconds)
+            for tokenid, tokenArrays in arrays.items()
+        }
+
+    @staticmethod
+    def _resample(arrays: Dict[str, np.ndarray], timeframeSeconds: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collapse rollup buckets to timeframe bars, keeping each bar's last close and volume"""
+        epochs = arrays["timestamp"].astype("datetime64[s]").astype(np.int64)
+        bars = epochs // timeframeSeconds
+        if len(bars) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+        last = np.flatnonzero(np.r_[bars[1:] != bars[:-1], True])
+        return bars[last] * timeframeSeconds, arrays["close"][last], arrays["volume"][last]
+
+    @staticmethod
+    def _merge(
+        cached: CachedSeries, fetched: Tuple[np.ndarray, np.ndarray, np.ndarray],
+        bars: int, windowStart: int, now: float,
+    ) -> CachedSeries:
+        starts, close, volume = fetched
+        if len(starts) == 0:
+            cached.refreshedAt = now
+            return cached
+
+        keep = cached.bucketStarts < starts[0]
+        merged = CachedSeries(
+            bucketStarts=np.concatenate([cached.bucketStarts[keep], starts])[-bars:],
+            close=np.concatenate([cached.close[keep], close])[-bars:],
+            volume=np.concatenate([cached.volume[keep], volume])[-bars:],
+            windowStart=windowStart,
+            refreshedAt=now,
+        )
+        # Indicators are recomputed lazily on the new bars
+        return merged
+
+    @staticmethod
+    def _toEpoch(value: datetime) -> int:
+        return int((value - datetime(1970, 1, 1)).total_seconds())
+
+    def _check(self, tokenid: str, series: CachedSeries, conditions: ChartConditions) -> bool:
+        close = series.close
+        valid = close[~np.isnan(close)]
+        if len(valid) < 2:
+            logger.info(f"Not enough {conditions.timeframe} history for {tokenid} to check chart conditions")
+            return False
+
+        if conditions.minpricechange is not None or conditions.maxpricechange is not None:
+            change = (valid[-1] - valid[-2]) / valid[-2] * 100 if valid[-2] else np.nan
+            if np.isnan(change):
+                return False
+            if conditions.minpricechange is not None and change < float(conditions.minpricechange):
+                logger.info(f"{tokenid} price change {change:.2f}% below {conditions.minpricechange}%")
+                return False
+            if conditions.maxpricechange is not None and change > float(conditions.maxpricechange):
+                logger.info(f"{tokenid} price change {change:.2f}% above {conditions.maxpricechange}%")
+                return False
+
+        if conditions.rsiconditions:
+            period = int(conditions.rsiconditions.get("period", DEFAULT_RSI_PERIOD))
+            rsi = self._indicator(series, ("rsi", period), lambda: self._rsi(valid, period))
+            if len(rsi) == 0 or np.isnan(rsi[-1]):
+                return False
+            minimum = conditions.rsiconditions.get("min")
+            maximum = conditions.rsiconditions.get("max")
+            if minimum is not None and rsi[-1] < float(minimum):
+                logger.info(f"{tokenid} RSI({period}) {rsi[-1]:.1f} below {minimum}")
+                return False
+            if maximum is not None and rsi[-1] > float(maximum):
+                logger.info(f"{tokenid} RSI({period}) {rsi[-1]:.1f} above {maximum}")
+                return False
+
+        for kind, periods in (conditions.maconditions or {}).items():
+            average = "ema" if kind.startswith("ema") else "sma"
+            fast, slow = int(periods[0]), int(periods[1])
+            fastLine = self._indicator(series, (average, fast), lambda: self._movingAverage(valid, fast, average))
+            slowLine = self._indicator(series, (average, slow), lambda: self._movingAverage(valid, slow, average))
+            above = fastLine > slowLine
+            if not len(above) or not above[-1]:
+                logger.info(f"{tokenid} {average.upper()}({fast}) not above {average.upper()}({slow})")
+                return False
+            if kind.endswith("crossover") and (len(above) < 2 or above[-2]):
+                logger.info(f"{tokenid} {average.upper()}({fast}) did not cross {average.upper()}({slow}) on the last bar")
+                return False
+
+        if conditions.volumeconditions:
+            lookback = int(conditions.volumeconditions.get("lookback", DEFAULT_VOLUME_LOOKBACK))
+            minSpike = float(conditions.volumeconditions.get("minspike", 1))
+            volume = self._indicator(series, ("barvolume",), lambda: self._barVolume(series.volume))
+            if len(volume) < lookback + 1:
+                logger.info(f"Not enough volume history for {tokenid}")
+                return False
+            baseline = volume[-lookback - 1:-1].mean()
+            if not baseline or volume[-1] / baseline < minSpike:
+                logger.info(f"{tokenid} volume spike below {minSpike}x")
+                return False
+
+        return True
+
+    @staticmethod
+    def _indicator(series: CachedSeries, key: Tuple, compute) -> np.ndarray:
+        values = series.indicators.get(key)
+        if values is None:
+            values = compute()
+            series.indicators[key] = values
+        return values
+
+    @staticmethod
+    def _barVolume(rollingVolume: np.ndarray) -> np.ndarray:
+        """Per-bar volume from a rolling 24h volume: its increase over each bar, at least zero"""
+        valid = rollingVolume[~np.isnan(rollingVolume)]
+        if len(valid) < 2:
+            return np.empty(0)
+        return np.clip(np.diff(valid), 0, None)
+
+    @staticmethod
+    def _movingAverage(values: np.ndarray, period: int, kind: str) -> np.ndarray:
+        """SMA (NaN until `period` bars) or EMA over a 1-D array"""
+        if kind == "ema":
+            return pd.Series(values).ewm(span=period, adjust=False).mean().to_numpy()
+        result = np.full(len(values), np.nan)
+        if len(values) >= period:
+            cumulative = np.cumsum(np.insert(values, 0, 0.0))
+            result[period - 1:] = (cumulative[period:] - cumulative[:-period]) / period
+        return result
+
+    @staticmethod
+    def _rsi(values: np.ndarray, period: int) -> np.ndarray:
+        """Wilder's RSI; NaN until `period` changes are available"""
+        if len(values) <= period:
+            return np.full(len(values), np.nan)
+        delta = np.diff(values)
+        gains = pd.Series(np.clip(delta, 0, None)).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+        losses = pd.Series(np.clip(-delta, 0, None)).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(losses == 0, 100.0, 100 - 100 / (1 + gains / losses))
+        rsi[: period - 1] = np.nan
+        return np.r_[np.nan, rsi]
@@ -2,6 +2,8 @@ from config.Config import get_config
 from typing import List, Optional, Tuple, Dict, Any
 from decimal import Decimal
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import time
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
 from framework.analyticsframework.enums.ExecutionStatusEnum import ExecutionStatus
@@ -9,6 +11,7 @@ from framework.analyticsframework.enums.SourceHandlerEnum import SourceHandler
 from framework.analyticsframework.interfaces.BaseStrategy import BaseStrategy
 from framework.analyticsframework.models.BaseModels import ExecutionState, BaseStrategyConfig, BaseTokenData
 from framework.analyticsframework.StrategyFramework import StrategyFramework
+from framework.analyticsframework.PriceTriggerEngine import PriceTriggerEngine
 from framework.analyticsframework.models.StrategyModels import (
     ProfitTarget,RiskManagementInstructions
 )
@@ -31,14 +34,26 @@ class ExecutionMonitor:
         self.analyticsHandler = self.strategyFramework.analyticsHandler
 
     def monitorActiveExecutions(self):
-        """Monitor and update active executions"""
+        """
+        Monitor and update active executions
+
+        INVESTED executions are priced with one batched DexScreener lookup, checked
+        for stop loss and profit targets in one vectorized pass and their sells are
+        written in one transaction. With PRICE_TRIGGER_ENGINE_ENABLED they are
+        handed to the PriceTriggerEngine instead, which settles them as prices
+        arrive. ACTIVE high-conviction executions are retried for investment on a
+        small worker pool.
+        """
+        cycleStart = time.perf_counter()
         # Initialize stats
         stats = {
             "executionsProcessed": 0,
             "stopLossesTriggered": 0,
             "profitTargetsHit": 0,
             "investmentsMade": 0,
-            "errors": 0
+            "errors": 0,
+            "priceFetchMs": 0.0,
+            "durationMs": 0.0
         }
          
         try:
@@ -50,29 +65,198 @@ class ExecutionMonitor:
                 return stats
             
             logger.info(f"Found {len(activeExecutions)} active executions to process")
-            
-            for executionState, strategyConfig in activeExecutions:
-                try:
-                    logger.info(f"Processing execution for token ID: {executionState.tokenid}, Name: {executionState.tokenname}")
-                    stats["executionsProcessed"] += 1
+            stats["executionsProcessed"] = len(activeExecutions)
 
-                    if executionState.status == ExecutionStatus.INVESTED:
-                        self.processProfitTaking(executionState, strategyConfig,stats)
-                    
-                    if (executionState.status == ExecutionStatus.ACTIVE) and (strategyConfig.status == TokenConvictionEnum.HIGH.value):
-                        self.processInvestment(executionState, strategyConfig, stats)          
+            investedExecutions = [
+                (executionState, strategyConfig)
+                for executionState, strategyConfig in activeExecutions
+                if executionState.status == ExecutionStatus.INVESTED
+            ]
+            pendingExecutions = [
+                (executionState, strategyConfig)
+                for executionState, strategyConfig in activeExecutions
+                if executionState.status == ExecutionStatus.ACTIVE
+                and strategyConfig.status == TokenConvictionEnum.HIGH.value
+            ]
 
-                except Exception as e:
-                    logger.error(f"Error processing execution {executionState.executionid}: {str(e)}")
-                    stats["errors"] += 1
+            if self.config.PRICE_TRIGGER_ENGINE_ENABLED:
+                # Stop losses and targets fire from price updates; this cycle only
+                # reconciles the trigger index and prices tokens nobody else has
+                self.refreshPriceTriggers(investedExecutions, stats)
+            elif investedExecutions:
+                self.processProfitTakingBatch(investedExecutions, stats)
+            if pendingExecutions:
+                self.processInvestmentsConcurrently(pendingExecutions, stats)
 
-            logger.info(f"Monitoring cycle completed: {stats}")
             return stats
 
         except Exception as e:
             logger.error(f"Error monitoring executions: {str(e)}")
             return stats
 
+        finally:
+            stats["durationMs"] = round((time.perf_counter() - cycleStart) * 1000, 1)
+            intervalSeconds = self.config.EXECUTION_MONITOR_INTERVAL_SECONDS
+            if stats["durationMs"] > intervalSeconds * 1000:
+                logger.warning(
+                    f"Monitoring cycle took {stats['durationMs']} ms, longer than its "
+                    f"{intervalSeconds}s interval: {stats}"
+                )
+            else:
+                logger.info(f"Monitoring cycle completed: {stats}")
+
+    def refreshPriceTriggers(self, executions: List[Tuple[ExecutionState, BaseStrategyConfig]], stats: Dict[str, Any]):
+        """Sync the PriceTriggerEngine index and fetch prices for tokens without a recent update"""
+        engine = PriceTriggerEngine.shared()
+        stats["executionsTracked"] = engine.sync(executions)
+
+        staleTokens = engine.staleTokens(self.config.EXECUTION_MONITOR_INTERVAL_SECONDS)
+        stats["staleTokensPriced"] = len(staleTokens)
+        if not staleTokens:
+            return
+
+        fetchStart = time.perf_counter()
+        try:
+            # Fetched prices reach the engine through the pool price cache listener
+            self.dexScreener.getBatchPoolPrices(staleTokens)
+        except Exception as e:
+            logger.error(f"Failed to get prices for {len(staleTokens)} tokens: {str(e)}")
+            stats["errors"] += 1
+        finally:
+            stats["priceFetchMs"] = round((time.perf_counter() - fetchStart) * 1000, 1)
+
+    def processProfitTakingBatch(self, executions: List[Tuple[ExecutionState, BaseStrategyConfig]], stats: Dict[str, Any]):
+        """Price, evaluate and settle stop losses and profit targets for INVESTED executions"""
+        tokenIds = list(dict.fromkeys(executionState.tokenid for executionState, _ in executions))
+
+        fetchStart = time.perf_counter()
+        try:
+            prices = self.dexScreener.getBatchPoolPrices(tokenIds)
+        except Exception as e:
+            logger.error(f"Failed to get prices for {len(tokenIds)} tokens: {str(e)}")
+            stats["errors"] += len(executions)
+            return
+        finally:
+            stats["priceFetchMs"] = round((time.perf_counter() - fetchStart) * 1000, 1)
+
+        priced = []
+        for executionState, strategyConfig in executions:
+            priceData = prices.get(executionState.tokenid)
+            if not priceData:
+                logger.warning(f"Could not get price for token {executionState.tokenid}")
+                continue
+            priced.append((executionState, strategyConfig, priceData))
+
+        if not priced:
+            return
+
+        exits = []
+        for (executionState, strategyConfig, priceData), (target, isStopLoss) in zip(priced, self.evaluateExitRules(priced)):
+            if target is None:
+                continue
+
+            currentPrice = Decimal(str(priceData.price))
+            if isStopLoss:
+                logger.warning(f"Stop loss triggered for execution {executionState.executionid}")
+            else:
+                logger.info(
+                    f"Profit target hit for execution {executionState.executionid}: "
+                    f"{target.pricepct}%"
+                )
+
+            # Create minimal token data object for profit taking
+            tokenData = BaseTokenData(
+                tokenid=executionState.tokenid,
+                tokenname=executionState.tokenname,
+                price=currentPrice,
+                marketcap=Decimal(str(priceData.marketCap or 0)),
+                holders=0,
+                chainname='solana'
+            )
+            exits.append((executionState, tokenData, strategyConfig, target, currentPrice, isStopLoss))
+
+        if not exits:
+            return
+
+        results = self.strategyFramework.takeProfitsBatch([item[:5] for item in exits])
+        for executionState, _, _, _, _, isStopLoss in exits:
+            if not results.get(executionState.executionid):
+                logger.error(f"Failed to execute {'stop loss' if isStopLoss else 'profit taking'} for execution {executionState.executionid}")
+                stats["errors"] += 1
+            elif isStopLoss:
+                stats["stopLossesTriggered"] += 1
+            else:
+                stats["profitTargetsHit"] += 1
+
+    def evaluateExitRules(self, priced: List[Tuple[ExecutionState, BaseStrategyConfig, Any]]) -> List[Tuple[Optional[ProfitTarget], bool]]:
+        """
+        Apply isStopLossHit and getProfitTargets to every execution at once
+
+        Args:
+            priced: (execution, strategy config, TokenPrice) per execution
+
+        Returns:
+            List of (target, isStopLoss) in input order: a full-exit target when the stop
+            loss is hit, the highest profit target reached, or (None, False)
+        """
+        count = len(priced)
+        entryPrices = np.array([float(e.avgentryprice or 0) for e, _, _ in priced])
+        currentPrices = np.array([float(p.price) for _, _, p in priced])
+        investedAmounts = np.array([float(e.investedamount or 0) for e, _, _ in priced])
+        stopLossEnabled = np.array([bool(c.riskmanagementinstructions.stoplossenabled) for _, c, _ in priced])
+        stopLossPcts = np.array([float(c.riskmanagementinstructions.stoplosspct) for _, c, _ in priced])
+        minProfitPcts = np.array([float(c.profittakinginstructions.minprofitpct) for _, c, _ in priced])
+
+        hasEntry = entryPrices > 0
+        profitPcts = np.zeros(count)
+        np.divide(currentPrices - entryPrices, entryPrices, out=profitPcts, where=hasEntry)
+        profitPcts *= 100
+
+        stopLossHit = hasEntry & (investedAmounts > 0) & stopLossEnabled & (profitPcts <= -stopLossPcts)
+        targetCandidates = hasEntry & ~stopLossHit & (profitPcts >= minProfitPcts)
+
+        results: List[Tuple[Optional[ProfitTarget], bool]] = [(None, False)] * count
+        for index in np.flatnonzero(stopLossHit):
+            # Full position exit
+            results[index] = (ProfitTarget(pricepct=Decimal('0'), sizepct=Decimal('100')), True)
+
+        # Targets are per strategy: one sorted threshold table each, searched for all its executions
+        byStrategy: Dict[int, List[int]] = {}
+        for index in np.flatnonzero(targetCandidates):
+            byStrategy.setdefault(priced[index][1].strategyid, []).append(index)
+
+        for indices in byStrategy.values():
+            targets = priced[indices[0]][1].profittakinginstructions.targets
+            if not targets:
+                continue
+            # Ascending, with ties in the reverse of getProfitTargets' order so the same target wins
+            sortedTargets = list(reversed(sorted(targets, key=lambda t: t.pricepct, reverse=True)))
+            thresholds = np.array([float(t.pricepct) for t in sortedTargets])
+            positions = np.searchsorted(thresholds, profitPcts[indices], side='right') - 1
+            for index, position in zip(indices, positions):
+                if position >= 0:
+                    results[index] = (sortedTargets[position], False)
+
+        return results
+
+    def processInvestmentsConcurrently(self, executions: List[Tuple[ExecutionState, BaseStrategyConfig]], stats: Dict[str, Any]):
+        """Run processInvestment for ACTIVE executions on a bounded worker pool"""
+        def process(item) -> Dict[str, int]:
+            executionState, strategyConfig = item
+            localStats = {"investmentsMade": 0, "errors": 0}
+            try:
+                self.processInvestment(executionState, strategyConfig, localStats)
+            except Exception as e:
+                logger.error(f"Error processing execution {executionState.executionid}: {str(e)}")
+                localStats["errors"] += 1
+            return localStats
+
+        maxWorkers = max(1, min(self.config.EXECUTION_MONITOR_MAX_WORKERS, len(executions)))
+        with ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="executionmonitor") as executor:
+            for localStats in executor.map(process, executions):
+                stats["investmentsMade"] += localStats["investmentsMade"]
+                stats["errors"] += localStats["errors"]
+
     def handleStopLoss(self, executionState: ExecutionState, tokenData: BaseTokenData, 
                        strategyConfig: BaseStrategyConfig, currentPrice: Decimal) -> bool:
         """
@@ -114,67 +298,7 @@ class ExecutionMonitor:
     def processProfitTaking(self, executionState: ExecutionState, strategyConfig: BaseStrategyConfig,stats: Dict[str, Any]):
         """Process a single execution"""
         try:
-            # Get current price
-            priceData = self.dexScreener.getTokenPrice(executionState.tokenid)
-            if not priceData:
-                logger.warning(f"Could not get price for token {executionState.tokenid}")
-                return
-
-            currentPrice = Decimal(str(priceData.price))
-
-            # Create minimal token data object for profit taking
-            tokenData = BaseTokenData(
-                tokenid=executionState.tokenid,
-                tokenname=executionState.tokenname,
-                price=currentPrice,
-                marketcap=Decimal(str(getattr(priceData, 'marketcap', '0'))),
-                holders=getattr(priceData, 'holders', 0),
-                chainname=getattr(priceData, 'chainname', 'solana')
-            )
-
-            # Check stop loss first
-            if self.strategyFramework.isStopLossHit(executionState, currentPrice, strategyConfig.riskmanagementinstructions):
-                self.handleStopLoss(executionState, tokenData, strategyConfig, currentPrice)
-                return  # Exit early after stop loss
-
-            # Continue with profit target checks if stop loss not triggered
-            profitTarget = self.strategyFramework.getProfitTargets(
-                executionState=executionState,
-                currentPrice=currentPrice,
-                profitTakingInstructions=strategyConfig.profittakinginstructions
-            )
-
-            if profitTarget:
-                logger.info(
-                    f"Profit target hit for execution {executionState.executionid}: "
-                    f"{profitTarget.pricepct}%"
-                )
-                
-                # Execute profit taking with objects we already have
-                success = self.strategyFramework.takeProfits(
-                    executionState=executionState,
-                    tokenData=tokenData,
-                    strategyConfig=strategyConfig,
-                    target=profitTarget,
-                    currentPrice=currentPrice
-                )
-                
-                if success:
-                    logger.info(
-                        f"Successfully executed profit taking for execution "
-                        f"{executionState.executionid}"
-                    )
-                else:
-                    logger.error(
-                        f"Failed to execute profit taking for execution "
-                        f"{executionState.executionid}"
-                    )
-
-                if success.get("stopLossTriggered", False):
-                    stats["stopLossesTriggered"] += 1
-                if success.get("profitTargetHit", False):
-                    stats["profitTargetsHit"] += 1
-
+            self.processProfitTakingBatch([(executionState, strategyConfig)], stats)
         except Exception as e:
             logger.error(f"Error processing execution {executionState.executionid}: {str(e)}")
 
@@ -0,0 +1,452 @@
+from config.Config import get_config
+"""
+Event-driven stop-loss and profit-target triggers for invested executions.
+
+Every INVESTED execution is indexed by token with its stop-loss price and the
+price at which its first profit target is reached. Each token keeps two sorted
+lists of (price, executionid), so a price update finds every crossed threshold
+with one bisect per list. Crossed executions are settled on a worker pool with
+the same StrategyFramework rules the execution monitor uses.
+
+Prices arrive from the shared DexScreener pool price cache (every ingest job,
+API call and monitor cycle that fetches prices feeds the engine) or from
+onPrice / onPrices.
+
+Usage (synthetic index and feed, no database):
+    python -m framework.analyticsframework.PriceTriggerEngine --executions 10000 --updates 100000
+"""
+
+from actions.DexScreenerPriceCache import PriceCacheRegistry
+from bisect import bisect_left, bisect_right, insort
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from framework.analyticsframework.enums.ExecutionStatusEnum import ExecutionStatus
+from framework.analyticsframework.models.BaseModels import BaseStrategyConfig, BaseTokenData, ExecutionState
+from framework.analyticsframework.models.StrategyModels import ProfitTarget
+from logs.logger import get_logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import random
+import sys
+import threading
+import time
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PriceTrigger:
+    """A crossed threshold handed to the dispatcher"""
+    executionid: int
+    tokenid: str
+    price: float
+    isStopLoss: bool
+    receivedAt: float  # monotonic time the price arrived
+
+
+@dataclass
+class TrackedExecution:
+    """Thresholds indexed for one execution"""
+    executionid: int
+    tokenid: str
+    stopPrice: Optional[float]
+    targetPrice: Optional[float]
+    targetArmedAt: float = 0.0  # monotonic time before which the target is ignored
+
+
+class TokenTriggers:
+    """One token's thresholds as two sorted lists of (price, executionid)"""
+
+    def __init__(self):
+        self.stops: List[Tuple[float, int]] = []
+        self.targets: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.stops) + len(self.targets)
+
+    def add(self, tracked: TrackedExecution) -> None:
+        if tracked.stopPrice is not None:
+            insort(self.stops, (tracked.stopPrice, tracked.executionid))
+        if tracked.targetPrice is not None:
+            insort(self.targets, (tracked.targetPrice, tracked.executionid))
+
+    def remove(self, tracked: TrackedExecution) -> None:
+        for entries, price in ((self.stops, tracked.stopPrice), (self.targets, tracked.targetPrice)):
+            if price is None:
+                continue
+            index = bisect_left(entries, (price, tracked.executionid))
+            if index < len(entries) and entries[index] == (price, tracked.executionid):
+                del entries[index]
+
+    def crossed(self, price: float) -> Tuple[List[int], List[int]]:
+        """
+        Returns:
+            Tuple[List[int], List[int]]: executions whose stop loss is at or above the
+                price, and executions whose target is at or below it
+        """
+        stopIds = [executionId for _, executionId in self.stops[bisect_left(self.stops, (price, float('-inf'))):]]
+        targetIds = [executionId for _, executionId in self.targets[:bisect_right(self.targets, (price, float('inf')))]]
+        return stopIds, targetIds
+
+
+class PriceTriggerEngine:
+    """
+    In-memory trigger index for INVESTED executions.
+
+    Key features:
+    - Per-token sorted stop-loss and target prices; an update costs O(log n) plus
+      the executions it actually triggers
+    - A triggered execution leaves the index until its dispatch has re-read it, so
+      a burst of updates fires it once
+    - After a profit take the next target is re-armed only after
+      EXECUTION_MONITOR_INTERVAL_SECONDS, the cadence the polling monitor sells at
+    - sync() reconciles the index with the executions loaded by the monitor
+    """
+
+    _shared: Optional["PriceTriggerEngine"] = None
+    _sharedLock = threading.Lock()
+
+    def __init__(
+        self,
+        dispatch: Optional[Callable[[PriceTrigger], None]] = None,
+        maxWorkers: int = 2,
+        targetRearmSeconds: Optional[float] = None,
+    ):
+        config = get_config()
+        self.targetRearmSeconds = (
+            targetRearmSeconds if targetRearmSeconds is not None else config.EXECUTION_MONITOR_INTERVAL_SECONDS
+        )
+        self.dispatch = dispatch or self._settle
+        self.executor = ThreadPoolExecutor(max_workers=max(1, maxWorkers), thread_name_prefix="pricetrigger")
+        self._strategyFramework = None
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, TokenTriggers] = {}
+        self._tracked: Dict[int, TrackedExecution] = {}
+        # Executions handed to the dispatcher and not yet re-read
+        self._dispatching: set = set()
+        self._lastPriceAt: Dict[str, float] = {}
+
+        self._updates = 0
+        self._triggers = 0
+        self._dispatchErrors = 0
+        self._dispatchLatencyTotal = 0.0
+        self._dispatchLatencyMax = 0.0
+
+    @classmethod
+    def shared(cls) -> "PriceTriggerEngine":
+        """Get (creating and subscribing to the pool price cache on first use) the process-wide engine"""
+        if cls._shared is not None:
+            return cls._shared
+        with cls._sharedLock:
+            if cls._shared is None:
+                engine = cls()
+                PriceCacheRegistry.get_cache("pool").addListener(engine.onPrices)
+                cls._shared = engine
+            return cls._shared
+
+    @property
+    def strategyFramework(self):
+        # Created on first dispatch so the index can be used without a database
+        if self._strategyFramework is None:
+            from framework.analyticsframework.StrategyFramework import StrategyFramework
+            self._strategyFramework = StrategyFramework()
+        return self._strategyFramework
+
+    @staticmethod
+    def thresholds(executionState: ExecutionState, strategyConfig: BaseStrategyConfig) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Prices at which isStopLossHit and getProfitTargets start to fire
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]: stop-loss price and first target price
+        """
+        entryPrice = float(executionState.avgentryprice or 0)
+        if entryPrice <= 0:
+            return None, None
+
+        stopPrice = None
+        risk = strategyConfig.riskmanagementinstructions
+        if risk.stoplossenabled and float(executionState.investedamount or 0) > 0:
+            stopPrice = entryPrice * (1 - float(risk.stoplosspct) / 100)
+
+        targetPrice = None
+        profitTaking = strategyConfig.profittakinginstructions
+        if profitTaking.targets:
+            firstTargetPct = max(
+                float(profitTaking.minprofitpct),
+                min(float(target.pricepct) for target in profitTaking.targets),
+            )
+            targetPrice = entryPrice * (1 + firstTargetPct / 100)
+
+        return stopPrice, targetPrice
+
+    def track(self, executionState: ExecutionState, strategyConfig: BaseStrategyConfig, targetArmedAt: float = 0.0) -> None:
+        """Index (or re-index) an INVESTED execution; anything else is dropped"""
+        if executionState.status != ExecutionStatus.INVESTED:
+            self.untrack(executionState.executionid)
+            return
+
+        stopPrice, targetPrice = self.thresholds(executionState, strategyConfig)
+        tracked = TrackedExecution(
+            executionid=executionState.executionid,
+            tokenid=executionState.tokenid,
+            stopPrice=stopPrice,
+            targetPrice=targetPrice,
+            targetArmedAt=targetArmedAt,
+        )
+        with self._lock:
+            self._untrackLocked(executionState.executionid)
+            if stopPrice is None and targetPrice is None:
+                return
+            self._tracked[tracked.executionid] = tracked
+            self._index.setdefault(tracked.tokenid, TokenTriggers()).add(tracked)
+
+    def untrack(self, executionId: int) -> None:
+        with self._lock:
+            self._untrackLocked(executionId)
+
+    def _untrackLocked(self, executionId: int) -> Optional[TrackedExecution]:
+        tracked = self._tracked.pop(executionId, None)
+        if tracked is None:
+            return None
+        triggers = self._index.get(tracked.tokenid)
+        if triggers is not None:
+            triggers.remove(tracked)
+            if not len(triggers):
+                del self._index[tracked.tokenid]
+        return tracked
+
+    def sync(self, executions: List[Tuple[ExecutionState, BaseStrategyConfig]]) -> int:
+        """
+        Make the index match the given active executions
+
+        Executions being dispatched are left to their dispatcher, and the target
+        re-arm time of executions already tracked is kept.
+
+        Returns:
+            int: Executions indexed
+        """
+        with self._lock:
+            armedAt = {executionId: tracked.targetArmedAt for executionId, tracked in self._tracked.items()}
+            dispatching = set(self._dispatching)
+            self._index.clear()
+            self._tracked.clear()
+
+        for executionState, strategyConfig in executions:
+            if executionState.executionid in dispatching:
+                continue
+            self.track(executionState, strategyConfig, armedAt.get(executionState.executionid, 0.0))
+
+        with self._lock:
+            return len(self._tracked)
+
+    def onPrice(self, tokenId: str, price: float) -> int:
+        """
+        Apply one price update
+
+        Returns:
+            int: Executions triggered
+        """
+        return self._apply({tokenId: float(price)})
+
+    def onPrices(self, chainId: str, prices: Dict[str, Any]) -> int:
+        """Price cache listener: prices maps token address to TokenPrice (or a number)"""
+        updates = {}
+        for tokenId, value in prices.items():
+            price = getattr(value, "price", value)
+            if price:
+                updates[tokenId] = float(price)
+        return self._apply(updates) if updates else 0
+
+    def _apply(self, prices: Dict[str, float]) -> int:
+        now = time.monotonic()
+        triggers: List[PriceTrigger] = []
+        with self._lock:
+            self._updates += len(prices)
+            for tokenId, price in prices.items():
+                self._lastPriceAt[tokenId] = now
+                tokenTriggers = self._index.get(tokenId)
+                if tokenTriggers is None:
+                    continue
+
+                stopIds, targetIds = tokenTriggers.crossed(price)
+                fired = {executionId: True for executionId in stopIds}
+                for executionId in targetIds:
+                    if executionId not in fired and self._tracked[executionId].targetArmedAt <= now:
+                        fired[executionId] = False
+
+                for executionId, isStopLoss in fired.items():
+                    self._untrackLocked(executionId)
+                    self._dispatching.add(executionId)
+                    triggers.append(PriceTrigger(executionId, tokenId, price, isStopLoss, now))
+
+            self._triggers += len(triggers)
+
+        for trigger in triggers:
+            self.executor.submit(self._run, trigger)
+        return len(triggers)
+
+    def _run(self, trigger: PriceTrigger) -> None:
+        try:
+            self.dispatch(trigger)
+        except Exception as e:
+            with self._lock:
+                self._dispatchErrors += 1
+            logger.error(f"Failed to settle trigger for execution {trigger.executionid}: {str(e)}")
+        finally:
+            latency = time.monotonic() - trigger.receivedAt
+            with self._lock:
+                self._dispatching.discard(trigger.executionid)
+                self._dispatchLatencyTotal += latency
+                self._dispatchLatencyMax = max(self._dispatchLatencyMax, latency)
+
+    def _loadExecution(self, executionId: int) -> Optional[Tuple[ExecutionState, BaseStrategyConfig]]:
+        """The stored execution and its config, or None when it is no longer active"""
+        rows = self.strategyFramework.analyticsHandler.getActiveExecutionsWithConfig([executionId])
+        for executionState, strategyConfig in rows:
+            if executionState.executionid == executionId:
+                return executionState, strategyConfig
+        if rows:
+            # Never sell a different execution than the one that triggered
+            logger.error(f"Lookup for execution {executionId} returned other executions, skipping trigger")
+        return None
+
+    def _settle(self, trigger: PriceTrigger) -> None:
+        """Re-check the triggered rule against the stored execution and sell"""
+        framework = self.strategyFramework
+        loaded = self._loadExecution(trigger.executionid)
+        if not loaded:
+            return
+        executionState, strategyConfig = loaded
+        if executionState.status != ExecutionStatus.INVESTED:
+            return
+
+        currentPrice = Decimal(str(trigger.price))
+        target = None
+        if trigger.isStopLoss:
+            if framework.isStopLossHit(executionState, currentPrice, strategyConfig.riskmanagementinstructions):
+                logger.warning(f"Stop loss triggered for execution {executionState.executionid}")
+                # Full position exit
+                target = ProfitTarget(pricepct=Decimal('0'), sizepct=Decimal('100'))
+        else:
+            target = framework.getProfitTargets(executionState, currentPrice, strategyConfig.profittakinginstructions)
+            if target:
+                logger.info(f"Profit target hit for execution {executionState.executionid}: {target.pricepct}%")
+
+        if target:
+            tokenData = BaseTokenData(
+                tokenid=executionState.tokenid,
+                tokenname=executionState.tokenname,
+                price=currentPrice,
+                marketcap=Decimal('0'),
+                holders=0,
+                chainname='solana'
+            )
+            if not framework.takeProfits(executionState, tokenData, strategyConfig, target, currentPrice):
+                logger.error(f"Failed to execute {'stop loss' if trigger.isStopLoss else 'profit taking'} for execution {executionState.executionid}")
+
+            # Re-read: the sell changes remaining coins, average entry price and status
+            loaded = self._loadExecution(trigger.executionid)
+            if not loaded:
+                return
+            executionState, strategyConfig = loaded
+
+        armedAt = time.monotonic() + self.targetRearmSeconds if target and not trigger.isStopLoss else 0.0
+        self.track(executionState, strategyConfig, armedAt)
+
+    def staleTokens(self, maxAgeSeconds: float) -> List[str]:
+        """Tracked tokens without a price update in the last maxAgeSeconds"""
+        cutoff = time.monotonic() - maxAgeSeconds
+        with self._lock:
+            return [tokenId for tokenId in self._index if self._lastPriceAt.get(tokenId, 0.0) < cutoff]
+
+    def getMetrics(self) -> Dict:
+        """
+        Snapshot of the index and dispatching.
+
+        Returns:
+            Dict: tracked executions / tokens, update and trigger counters, dispatch latency
+        """
+        with self._lock:
+            settled = self._triggers - len(self._dispatching)
+            return {
+                "trackedExecutions": len(self._tracked),
+                "trackedTokens": len(self._index),
+                "dispatching": len(self._dispatching),
+                "priceUpdates": self._updates,
+                "triggers": self._triggers,
+                "dispatchErrors": self._dispatchErrors,
+                "avgDispatchLatencyMs": round(self._dispatchLatencyTotal / settled * 1000, 2) if settled else 0.0,
+                "maxDispatchLatencyMs": round(self._dispatchLatencyMax * 1000, 2),
+            }
+
+
+def main() -> int:
+    from framework.analyticsframework.models.StrategyModels import (
+        EntryType, InvestmentInstructions, ProfitTakingInstructions, RiskManagementInstructions, StrategyConfig
+    )
+
+    parser = argparse.ArgumentParser(description="Measure PriceTriggerEngine updates against a synthetic index")
+    parser.add_argument("--executions", type=int, default=10000, help="Invested executions to index")
+    parser.add_argument("--tokens", type=int, default=1000, help="Distinct tokens")
+    parser.add_argument("--updates", type=int, default=100000, help="Price updates to replay")
+    parser.add_argument("--volatility", type=float, default=0.02, help="Relative step of the random walk")
+    args = parser.parse_args()
+
+    settled: List[PriceTrigger] = []
+    settledLock = threading.Lock()
+
+    def record(trigger: PriceTrigger) -> None:
+        with settledLock:
+            settled.append(trigger)
+
+    engine = PriceTriggerEngine(dispatch=record, targetRearmSeconds=0)
+    strategyConfig = StrategyConfig(
+        strategyid=1,
+        strategyname="benchmark",
+        source="portsummary",
+        investmentinstructions=InvestmentInstructions(entrytype=EntryType.BULK.name, allocatedamount=Decimal('100')),
+        profittakinginstructions=ProfitTakingInstructions(
+            targets=[ProfitTarget(pricepct=Decimal('50'), sizepct=Decimal('50'))]
+        ),
+        riskmanagementinstructions=RiskManagementInstructions(stoplosspct=Decimal('30')),
+    )
+    tokens = [f"token-{i}" for i in range(args.tokens)]
+    prices = {token: 1.0 for token in tokens}
+    for i in range(args.executions):
+        engine.track(
+            ExecutionState(
+                executionid=i,
+                strategyid=1,
+                tokenid=tokens[i % len(tokens)],
+                tokenname="",
+                status=ExecutionStatus.INVESTED,
+                allotedamount=Decimal('100'),
+                investedamount=Decimal('100'),
+                avgentryprice=Decimal(str(round(random.uniform(0.8, 1.2), 4))),
+            ),
+            strategyConfig,
+        )
+
+    start = time.perf_counter()
+    for _ in range(args.updates):
+        token = random.choice(tokens)
+        prices[token] *= 1 + random.uniform(-args.volatility, args.volatility)
+        engine.onPrice(token, prices[token])
+    elapsed = time.perf_counter() - start
+    engine.executor.shutdown(wait=True)
+
+    metrics = engine.getMetrics()
+    print(
+        f"{args.updates} updates over {args.executions} executions: {elapsed * 1000:.1f} ms "
+        f"({elapsed / args.updates * 1e6:.2f} us/update), triggers={metrics['triggers']} "
+        f"(stop={sum(1 for t in settled if t.isStopLoss)}, target={sum(1 for t in settled if not t.isStopLoss)}), "
+        f"maxDispatchLatencyMs={metrics['maxDispatchLatencyMs']}"
+    )
+    return 0 if len(settled) == metrics["triggers"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
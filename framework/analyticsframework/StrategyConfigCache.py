@@ -0,0 +1,179 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from framework.analyticsframework.models.StrategyModels import StrategyConfig
+from logs.logger import get_logger
+import threading
+
+logger = get_logger(__name__)
+
+# Checks are re-ordered by observed rejection rate every this many evaluations
+REORDER_EVERY = 256
+
+
+class CompiledPredicate:
+    """
+    Entry conditions of one strategy compiled into an ordered list of checks.
+
+    Each check is a (name, fn) pair where fn(tokenData) -> bool. Checks run in
+    order and stop at the first rejection. They start in the order the compiler
+    gave them (cheapest / most selective first) and are periodically re-sorted
+    so the checks that reject the most tokens run first.
+    """
+
+    def __init__(self, strategyId: int, checks: List[Tuple[str, Callable[[Any], bool]]]):
+        self.strategyId = strategyId
+        self._checks = tuple(checks)
+        self._evaluated = {name: 0 for name, _ in checks}
+        self._rejected = {name: 0 for name, _ in checks}
+        self._calls = 0
+
+    @property
+    def order(self) -> List[str]:
+        return [name for name, _ in self._checks]
+
+    def __call__(self, tokenData) -> Tuple[bool, Optional[str]]:
+        """
+        Evaluate the checks against a token.
+
+        Returns:
+            Tuple[bool, Optional[str]]: whether the token matches, and the name of the
+                rejecting check when it does not
+        """
+        # Counters are approximate under concurrent use, which is fine for ordering
+        self._calls += 1
+        if self._calls % REORDER_EVERY == 0:
+            self._reorder()
+
+        for name, check in self._checks:
+            self._evaluated[name] += 1
+            if not check(tokenData):
+                self._rejected[name] += 1
+                return False, name
+        return True, None
+
+    def _reorder(self) -> None:
+        def rejectionRate(item):
+            name = item[0]
+            evaluated = self._evaluated[name]
+            return self._rejected[name] / evaluated if evaluated else 0.0
+
+        # sorted is stable, so checks with equal rates keep the compiler's order
+        self._checks = tuple(sorted(self._checks, key=rejectionRate, reverse=True))
+
+
+class StrategyConfigCache:
+    """
+    Process-wide cache of parsed strategy configs and their compiled entry predicates.
+
+    Rows are keyed by (strategyid, updatedat): an update made anywhere changes
+    updatedat and therefore misses the cache, and AnalyticsHandler.updateStrategy /
+    createStrategy also invalidate the strategy in this process straight away.
+    """
+
+    _configs: Dict[Tuple[int, Any], StrategyConfig] = {}
+    _predicates: Dict[Tuple[int, Any, str], CompiledPredicate] = {}
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+    _invalidations = 0
+
+    @classmethod
+    def get_config(cls, strategyRow: Dict[str, Any]) -> StrategyConfig:
+        """
+        Get the parsed StrategyConfig for a strategyconfig row, parsing it on first use.
+
+        Args:
+            strategyRow: Row from the strategyconfig table
+
+        Returns:
+            StrategyConfig: Shared parsed config; callers must not modify it
+        """
+        key = (strategyRow["strategyid"], strategyRow.get("updatedat"))
+        config = cls._configs.get(key)
+        if config is not None:
+            cls._hits += 1
+            return config
+
+        config = StrategyConfig(**strategyRow)
+        with cls._lock:
+            cls._misses += 1
+            # Drop older versions of the same strategy
+            for staleKey in [k for k in cls._configs if k[0] == key[0] and k != key]:
+                del cls._configs[staleKey]
+            cls._configs[key] = config
+        return config
+
+    @classmethod
+    def get_configs(cls, strategyRows: List[Dict[str, Any]]) -> List[StrategyConfig]:
+        """get_config for every row, in order"""
+        return [cls.get_config(row) for row in strategyRows]
+
+    @classmethod
+    def get_predicate(
+        cls,
+        strategyConfig: StrategyConfig,
+        kind: str,
+        compiler: Callable[[StrategyConfig], CompiledPredicate],
+    ) -> CompiledPredicate:
+        """
+        Get (compiling on first use) a strategy's entry predicate.
+
+        Args:
+            strategyConfig: Parsed strategy config
+            kind: Name of the compiler, one per strategy handler
+            compiler: Builds the predicate from the config
+
+        Returns:
+            CompiledPredicate: Predicate shared by every caller of this strategy version
+        """
+        key = (strategyConfig.strategyid, strategyConfig.updatedat, kind)
+        predicate = cls._predicates.get(key)
+        if predicate is not None:
+            return predicate
+
+        predicate = compiler(strategyConfig)
+        with cls._lock:
+            for staleKey in [k for k in cls._predicates if k[0] == key[0] and k[2] == kind and k != key]:
+                del cls._predicates[staleKey]
+            cls._predicates.setdefault(key, predicate)
+            return cls._predicates[key]
+
+    @classmethod
+    def invalidate(cls, strategyId: Optional[int] = None) -> None:
+        """
+        Forget the cached config and predicates of a strategy (or of every strategy).
+
+        Args:
+            strategyId: Strategy to drop; None clears the whole cache
+        """
+        with cls._lock:
+            cls._invalidations += 1
+            if strategyId is None:
+                cls._configs.clear()
+                cls._predicates.clear()
+                return
+            for key in [k for k in cls._configs if k[0] == strategyId]:
+                del cls._configs[key]
+            for key in [k for k in cls._predicates if k[0] == strategyId]:
+                del cls._predicates[key]
+        logger.debug(f"Invalidated cached config for strategy {strategyId}")
+
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """
+        Snapshot of cache usage.
+
+        Returns:
+            Dict: cached configs / predicates, hit and miss counters and predicate check order
+        """
+        with cls._lock:
+            return {
+                "configs": len(cls._configs),
+                "predicates": len(cls._predicates),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "invalidations": cls._invalidations,
+                "checkOrder": {
+                    f"{strategyId}:{kind}": predicate.order
+                    for (strategyId, _, kind), predicate in cls._predicates.items()
+                },
+            }
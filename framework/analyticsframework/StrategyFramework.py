@@ -79,26 +79,8 @@ class StrategyFramework:
 
             # Execute investment based on type
             success = strategy.executeInvestment(executionId, tokenData, strategyConfig)
-            if success:
-                # Get trade details to update execution
-                tradeDetails = self.analyticsHandler.getExecutionTrades(executionId)
-                if tradeDetails:
-                    # Calculate execution metrics
-                    totalAmount = sum(t['amount'] for t in tradeDetails)
-                    totalCoins = sum(t['coins'] for t in tradeDetails)
-                    avgEntryPrice = totalAmount / totalCoins if totalCoins > 0 else Decimal('0')
-                    
-                    self.analyticsHandler.updateExecution(
-                        executionId=executionId,
-                        investedAmount=totalAmount,
-                        remainingCoins=totalCoins,
-                        avgEntryPrice=avgEntryPrice,
-                        status=ExecutionStatus.INVESTED
-                    )
-                
-                else:
-                    logger.error(f"No trade details found for execution {executionId}")
-                    return None
+            if success and not self._markInvested(executionId):
+                return None
             
             return executionId
 
@@ -106,6 +88,136 @@ class StrategyFramework:
             logger.error(f"Error processing strategy {strategyConfig.strategyid}: {str(e)}")
             return None
 
+    def _markInvested(self, executionId: int) -> bool:
+        """Roll the execution's logged trades up into its totals and mark it INVESTED"""
+        # Get trade details to update execution
+        tradeDetails = self.analyticsHandler.getExecutionTrades(executionId)
+        if not tradeDetails:
+            logger.error(f"No trade details found for execution {executionId}")
+            return False
+
+        # Calculate execution metrics
+        totalAmount = sum(t['amount'] for t in tradeDetails)
+        totalCoins = sum(t['coins'] for t in tradeDetails)
+        avgEntryPrice = totalAmount / totalCoins if totalCoins > 0 else Decimal('0')
+        
+        self.analyticsHandler.updateExecution(
+            executionId=executionId,
+            investedAmount=totalAmount,
+            remainingCoins=totalCoins,
+            avgEntryPrice=avgEntryPrice,
+            status=ExecutionStatus.INVESTED
+        )
+        return True
+
+    def handleStrategiesBatch(self, strategy: BaseStrategy, tokens: List[BaseTokenData], strategyConfigs: List[BaseStrategyConfig], description: Optional[str] = None) -> Dict[str, List[int]]:
+        """
+        handleStrategy for every token x strategy pair with a fixed number of queries
+
+        1. Open executions for all pairs are read in one query; those pairs are kept as is.
+        2. Entry conditions are evaluated in memory for the remaining pairs.
+        3. Chart conditions are checked once per strategy for its matching tokens.
+        4. Real-time prices for every token about to be invested are fetched in one batch.
+        5. Executions, entry trades and invested totals are written in one transaction.
+
+        Strategies that cannot build entry trades in memory fall back to
+        executeInvestment per new execution.
+
+        Returns:
+            Dict[str, List[int]]: tokenid -> execution IDs (existing or new) across strategies
+        """
+        results: Dict[str, List[int]] = {}
+        if not tokens or not strategyConfigs:
+            return results
+
+        openExecutions = self.analyticsHandler.getOpenExecutionPairs(
+            [token.tokenid for token in tokens],
+            [config.strategyid for config in strategyConfigs]
+        )
+        for (tokenId, _), executionId in openExecutions.items():
+            results.setdefault(tokenId, []).append(executionId)
+
+        # (token, config, chart conditions met)
+        matches: List[Tuple[BaseTokenData, BaseStrategyConfig, bool]] = []
+        for strategyConfig in strategyConfigs:
+            candidates = []
+            for token in tokens:
+                if (token.tokenid, strategyConfig.strategyid) in openExecutions:
+                    continue
+                try:
+                    if strategy.checkEntryConditions(token, strategyConfig):
+                        candidates.append(token)
+                except Exception as e:
+                    logger.error(f"Error checking entry conditions for {token.tokenid} with strategy {strategyConfig.strategyid}: {str(e)}")
+            if not candidates:
+                continue
+
+            chartResults = strategy.validateChartConditionsBatch(candidates, strategyConfig.chartconditions)
+            for token in candidates:
+                chartMet = chartResults.get(token.tokenid, False)
+                if not chartMet:
+                    logger.info(f"Chart conditions not met for token {token.tokenid} ({token.tokenname})")
+                matches.append((token, strategyConfig, chartMet))
+
+        if not matches:
+            return results
+
+        # Real-time prices for all tokens about to be invested, in one lookup
+        investTokenIds = list(dict.fromkeys(token.tokenid for token, _, chartMet in matches if chartMet))
+        prices = self.dexScreener.getBatchPoolPrices(investTokenIds) if investTokenIds else {}
+
+        now = datetime.now()
+        entries: List[Tuple[ExecutionState, List[TradeLog]]] = []
+        fallback: List[Tuple[BaseTokenData, BaseStrategyConfig]] = []
+        for token, strategyConfig, chartMet in matches:
+            trades: List[TradeLog] = []
+            if chartMet:
+                priceData = prices.get(token.tokenid)
+                if not priceData:
+                    logger.error(f"Failed to get real-time price for token {token.tokenid}")
+                else:
+                    token.price = Decimal(str(priceData.price))
+                    built = strategy.buildEntryTrades(token, strategyConfig)
+                    if built is None:
+                        fallback.append((token, strategyConfig))
+                    else:
+                        trades = built
+
+            entries.append((
+                ExecutionState(
+                    executionid=0,  # Set by database
+                    strategyid=strategyConfig.strategyid,
+                    tokenid=token.tokenid,
+                    tokenname=token.tokenname,
+                    allotedamount=strategyConfig.investmentinstructions.allocatedamount,
+                    status=ExecutionStatus.ACTIVE,
+                    description=description or strategyConfig.description,
+                    createdat=now,
+                    updatedat=now
+                ),
+                trades
+            ))
+
+        try:
+            created = self.analyticsHandler.recordEntriesBatch(entries)
+        except Exception as e:
+            logger.error(f"Failed to record {len(entries)} strategy executions: {str(e)}")
+            return results
+
+        logger.info(
+            f"Created {len(created)} executions, "
+            f"{sum(1 for _, trades in entries if trades)} invested, across {len(strategyConfigs)} strategies"
+        )
+        for (tokenId, _), executionId in created.items():
+            results.setdefault(tokenId, []).append(executionId)
+
+        for token, strategyConfig in fallback:
+            executionId = created[(token.tokenid, strategyConfig.strategyid)]
+            if strategy.executeInvestment(executionId, token, strategyConfig):
+                self._markInvested(executionId)
+
+        return results
+
     def createExecution(self, strategy: BaseStrategy, tokenData: BaseTokenData, 
                          strategyConfig: BaseStrategyConfig, description: Optional[str] = None) -> Optional[int]:
         """Create a new strategy execution"""
@@ -217,6 +329,61 @@ class StrategyFramework:
             logger.error(f"Error executing profit taking: {str(e)}")
             return False
 
+    def takeProfitsBatch(self, exits: List[Tuple[ExecutionState, BaseTokenData, BaseStrategyConfig, ProfitTarget, Decimal]]) -> Dict[int, bool]:
+        """
+        takeProfits for many executions: moon bag totals are read in one query and
+        every sell trade and execution update is written in one transaction
+
+        Args:
+            exits: (execution, token data, strategy config, target, current price) per execution
+
+        Returns:
+            Dict[int, bool]: executionid -> whether its sell was recorded
+        """
+        if not exits:
+            return {}
+
+        moonBagIds = [
+            executionState.executionid
+            for executionState, _, strategyConfig, _, _ in exits
+            if strategyConfig.profittakinginstructions.moonbaginstructions
+            and strategyConfig.profittakinginstructions.moonbaginstructions.enabled
+        ]
+        tradeTotals = self.analyticsHandler.getExecutionTradeTotals(moonBagIds)
+
+        sells = []
+        for executionState, tokenData, strategyConfig, target, currentPrice in exits:
+            try:
+                moonBagInstructions = strategyConfig.profittakinginstructions.moonbaginstructions
+                qualifiesForMoonbag = False
+                if moonBagInstructions and moonBagInstructions.enabled:
+                    totals = tradeTotals.get(executionState.executionid, {})
+                    try:
+                        qualifiesForMoonbag = self._moonBagProfitReached(
+                            executionState, currentPrice, moonBagInstructions,
+                            totals.get("invested", Decimal('0')), totals.get("returned", Decimal('0'))
+                        )
+                    except Exception as e:
+                        logger.error(f"Error checking moon bag conditions: {str(e)}")
+
+                tradeRecord, sellAmount, sellCoins = self._createSellTradeRecord(
+                    executionState, tokenData, target, currentPrice,
+                    moonBagInstructions, qualifiesForMoonbag
+                )
+                update = self._buildSellUpdate(executionState, sellCoins, sellAmount, qualifiesForMoonbag)
+                sells.append((tradeRecord, update))
+            except Exception as e:
+                logger.error(f"Error preparing profit taking for execution {executionState.executionid}: {str(e)}")
+
+        try:
+            self.analyticsHandler.recordSellsBatch(sells)
+        except Exception as e:
+            logger.error(f"Failed to record {len(sells)} sells: {str(e)}")
+            return {executionState.executionid: False for executionState, *_ in exits}
+
+        recorded = {trade.executionid for trade, _ in sells}
+        return {executionState.executionid: executionState.executionid in recorded for executionState, *_ in exits}
+
     def _checkMoonBagEligibility(self, executionState: ExecutionState, 
                                strategyConfig: BaseStrategyConfig, 
                                currentPrice: Decimal) -> Tuple[Optional[MoonBagInstructions], bool]:
@@ -320,6 +487,26 @@ class StrategyFramework:
             sellAmount: Amount received from sell
             qualifiesForMoonbag: Whether execution qualifies for moon bag
         """
+        update = self._buildSellUpdate(executionState, sellCoins, sellAmount, qualifiesForMoonbag)
+        
+        # Update execution in database
+        self.analyticsHandler.updateExecution(
+            executionId=executionState.executionid,
+            investedAmount=executionState.investedamount or Decimal('0'),
+            remainingCoins=update["remainingcoins"],
+            avgEntryPrice=update["avgentryprice"],
+            status=update["status"],
+            amountTakenOut=update["amounttakenout"]
+        )
+
+    def _buildSellUpdate(self, executionState: ExecutionState,
+                         sellCoins: Decimal,
+                         sellAmount: Decimal,
+                         qualifiesForMoonbag: bool) -> Dict[str, Any]:
+        """
+        Execution fields after a sell: remainingcoins, amounttakenout, avgentryprice
+        (None when nothing remains) and status
+        """
         # Calculate remaining coins
         totalCoins = executionState.remainingcoins
         remainingCoins = totalCoins - sellCoins
@@ -347,16 +534,13 @@ class StrategyFramework:
             f"New avg price: {newAvgEntryPrice}, "
             f"New status: {newStatus.name}"
         )
-        
-        # Update execution in database
-        self.analyticsHandler.updateExecution(
-            executionId=executionState.executionid,
-            investedAmount=totalInvested,
-            remainingCoins=remainingCoins,
-            avgEntryPrice=newAvgEntryPrice,
-            status=newStatus,
-            amountTakenOut=updatedAmountTakenOut
-        )
+
+        return {
+            "remainingcoins": remainingCoins,
+            "amounttakenout": updatedAmountTakenOut,
+            "avgentryprice": newAvgEntryPrice,
+            "status": newStatus,
+        }
 
     def _determineNewStatus(self, remainingCoins: Decimal, qualifiesForMoonbag: bool) -> ExecutionStatus:
         """
@@ -397,27 +581,34 @@ class StrategyFramework:
                 elif trade['tradetype'] == TradeType.SELL.value:
                     totalReturned += trade['amount']
             
-            # Calculate remaining position value
-            remainingValue = executionState.remainingcoins * currentPrice
-            
-            # Calculate total profit percentage
-            totalValue = totalReturned + remainingValue
-            profitPct = ((totalValue - totalInvested) / totalInvested) * Decimal('100')
-            
-            logger.info(f"Moon bag check - Invested: {totalInvested}, "
-                       f"Returned: {totalReturned}, Remaining: {remainingValue}, "
-                       f"Profit%: {profitPct}%")
-
-            # Check minimum profit requirement
-            if profitPct < moonBagInstructions.minprofitpct:
-                return False
-
-            return True
+            return self._moonBagProfitReached(
+                executionState, currentPrice, moonBagInstructions, totalInvested, totalReturned
+            )
 
         except Exception as e:
             logger.error(f"Error checking moon bag conditions: {str(e)}")
             return False
 
+    def _moonBagProfitReached(self, executionState: ExecutionState,
+                              currentPrice: Decimal,
+                              moonBagInstructions: MoonBagInstructions,
+                              totalInvested: Decimal,
+                              totalReturned: Decimal) -> bool:
+        """Whether realized plus unrealized profit meets the moon bag's minimum"""
+        # Calculate remaining position value
+        remainingValue = executionState.remainingcoins * currentPrice
+        
+        # Calculate total profit percentage
+        totalValue = totalReturned + remainingValue
+        profitPct = ((totalValue - totalInvested) / totalInvested) * Decimal('100')
+        
+        logger.info(f"Moon bag check - Invested: {totalInvested}, "
+                   f"Returned: {totalReturned}, Remaining: {remainingValue}, "
+                   f"Profit%: {profitPct}%")
+
+        # Check minimum profit requirement
+        return profitPct >= moonBagInstructions.minprofitpct
+
     def generateTradeDescription(self, target: ProfitTarget,
                               moonBagInstructions: Optional[MoonBagInstructions]) -> str:
         """Generate descriptive message for trade"""
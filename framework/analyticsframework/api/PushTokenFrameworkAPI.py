@@ -18,6 +18,7 @@ from framework.analyticsframework.enums.SourceTypeEnum import SourceType
 from framework.analyticsframework.enums.PushSourceEnum import PushSource
 from framework.analyticsframework.enums.SourceHandlerEnum import SourceHandler
 from framework.analyticsframework.models.StrategyModels import StrategyConfig
+from framework.analyticsframework.StrategyConfigCache import StrategyConfigCache
 from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
 from logs.logger import get_logger
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
@@ -59,24 +60,16 @@ class PushTokenAPI:
                     return PushTokenAPI.mapAttentionTokenData(tokenData)
 
             elif sourceType == SourceType.VOLUME.value:
-                volumeHandler = db.volume
-                # Get both state and info
-                tokenState = volumeHandler.getTokenState(tokenId)
-                tokenInfo = volumeHandler.getTokenInfo(tokenId)
-                if tokenState and tokenInfo:
-                    # Combine state and info
-                    combinedTokenData = {**tokenState, **tokenInfo}
+                # State combined with info, from the ingest's snapshot cache
+                combinedTokenData = db.volume.getTokenSnapshots([tokenId]).get(tokenId)
+                if combinedTokenData:
                     return PushTokenAPI.mapVolumeTokenData(combinedTokenData)
 
             elif sourceType == SourceType.PUMPFUN.value:
-                pumpfunHandler = db.pumpfun
-                # Get both state and info
-                tokenState = pumpfunHandler.getTokenState(tokenId)
-                tokenInfo = pumpfunHandler.getTokenInfo(tokenId)
-                if tokenState and tokenInfo:
-                    # Combine state and info
-                    combinedTokenData = {**tokenState, **tokenInfo}
-                return PushTokenAPI.mapPumpFunTokenData(combinedTokenData)
+                # State combined with info, from the ingest's snapshot cache
+                combinedTokenData = db.pumpfun.getTokenSnapshots([tokenId]).get(tokenId)
+                if combinedTokenData:
+                    return PushTokenAPI.mapPumpFunTokenData(combinedTokenData)
 
             elif sourceType == SourceType.SMARTMONEY.value:
                 # For smart money, we need to handle it differently as it's wallet-based
@@ -93,21 +86,26 @@ class PushTokenAPI:
             return None
 
     @staticmethod
-    def mapPortfolioTokenData(tokenData: Dict) -> PortSummaryTokenData:
+    def mapPortfolioTokenData(tokenData: Dict, attentionInfoMap: Optional[Dict[str, Dict]] = None) -> PortSummaryTokenData:
         """
         Map raw portfolio token data to PortSummaryTokenData model
 
         Args:
             tokenData: Raw token data from database
+            attentionInfoMap: Attention info prefetched with getAttentionInfoBatch;
+                queried per token when not given
 
         Returns:
             PortSummaryTokenData: Mapped token data
         """
-        # Get attention info from the attention handler
-        db = DatabaseConnectionManager()
         attentionInfo = None
         try:
-            attentionData = db.attention.getAttentionInfo(tokenData["tokenid"])
+            if attentionInfoMap is not None:
+                attentionData = attentionInfoMap.get(tokenData["tokenid"])
+            else:
+                # Get attention info from the attention handler
+                db = DatabaseConnectionManager()
+                attentionData = db.attention.getAttentionInfo(tokenData["tokenid"])
             if attentionData:
                 attentionInfo = AttentionInfo(
                     isavailable=True,
@@ -169,7 +167,7 @@ class PushTokenAPI:
             success = False
             for strategy in allActiveStrategies:
                 # Convert dictionary to StrategyConfig
-                strategyConfig = StrategyConfig(**strategy)
+                strategyConfig = StrategyConfigCache.get_config(strategy)
 
                 # Process token through strategy
                 executionId = self.strategyFramework.handleStrategy(
@@ -377,47 +375,32 @@ class PushTokenAPI:
 
             logger.info(f"Found {len(tokens)} active tokens in portfolio summary")
 
-            # Process each token
+            allActiveStrategies: List[Dict] = self.analyticsHandler.getAllActiveStrategies(
+                SourceType.PORTSUMMARY.value, pushSource
+            )
+            if not allActiveStrategies:
+                logger.info(f"No active strategies found for source {SourceType.PORTSUMMARY.value}")
+            strategyConfigs = StrategyConfigCache.get_configs(allActiveStrategies)
+            strategyHandler = self.strategyHandlers.get(SourceType.PORTSUMMARY.value)
+
+            # Attention info for every token in one query
+            attentionInfoMap: Dict[str, Dict] = {}
+            try:
+                attentionInfoMap = self.db.attention.getAttentionInfoBatch(
+                    [token["tokenid"] for token in tokens]
+                )
+            except Exception as e:
+                logger.error(f"Failed to get attention info for portfolio tokens: {str(e)}")
+
             successCount = 0
             failedCount = 0
             processedTokens = []
             failedTokens = []
 
+            mappedTokens: List[PortSummaryTokenData] = []
             for token in tokens:
                 try:
-                    # Convert to PortSummaryTokenData
-                    tokenData = self.mapPortfolioTokenData(token)
-
-                    # Push to strategy framework
-                    success = self.pushToken(
-                        tokenData=tokenData,
-                        sourceType=SourceType.PORTSUMMARY.value,
-                        pushSource=pushSource,
-                    )
-
-                    if success:
-                        successCount += 1
-                        processedTokens.append(
-                            {
-                                "tokenId": tokenData.tokenid,
-                                "tokenName": tokenData.tokenname,
-                            }
-                        )
-                        logger.info(
-                            f"Successfully pushed token {tokenData.tokenid} ({tokenData.tokenname}) to strategy framework"
-                        )
-                    else:
-                        failedCount += 1
-                        failedTokens.append(
-                            {
-                                "tokenId": tokenData.tokenid,
-                                "tokenName": tokenData.tokenname,
-                            }
-                        )
-                        logger.warning(
-                            f"Failed to push token {tokenData.tokenid} ({tokenData.tokenname}) to strategy framework"
-                        )
-
+                    mappedTokens.append(self.mapPortfolioTokenData(token, attentionInfoMap))
                 except Exception as tokenError:
                     failedCount += 1
                     failedTokens.append(
@@ -429,7 +412,31 @@ class PushTokenAPI:
                     logger.error(
                         f"Error processing token {token.get('tokenid', 'unknown')}: {str(tokenError)}"
                     )
-                    continue
+
+            executions: Dict[str, List[int]] = {}
+            if strategyConfigs and strategyHandler:
+                executions = self.strategyFramework.handleStrategiesBatch(
+                    strategy=strategyHandler,
+                    tokens=mappedTokens,
+                    strategyConfigs=strategyConfigs,
+                )
+            elif strategyConfigs:
+                logger.error(f"No strategy handler found for source type: {SourceType.PORTSUMMARY.value}")
+
+            for tokenData in mappedTokens:
+                tokenSummary = {
+                    "tokenId": tokenData.tokenid,
+                    "tokenName": tokenData.tokenname,
+                }
+                if executions.get(tokenData.tokenid):
+                    successCount += 1
+                    processedTokens.append(tokenSummary)
+                    logger.debug(
+                        f"Token {tokenData.tokenid} ({tokenData.tokenname}) has executions {executions[tokenData.tokenid]}"
+                    )
+                else:
+                    failedCount += 1
+                    failedTokens.append(tokenSummary)
 
             stats = {
                 "total": len(tokens),
@@ -500,7 +507,7 @@ class PushTokenAPI:
                 return None
 
             # Convert dictionary to StrategyConfig model
-            strategyConfigModel = StrategyConfig(**strategyConfig)
+            strategyConfigModel = StrategyConfigCache.get_config(strategyConfig)
 
             # Process token through specific strategy
             executionId = (
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
 from framework.analyticsframework.models.BaseModels import (
-    BaseTokenData, BaseStrategyConfig, ExecutionState
+    BaseTokenData, BaseStrategyConfig, ExecutionState, TradeLog
 )
 
 
@@ -34,4 +34,27 @@ class BaseStrategy(ABC):
             bool: True if investment was executed successfully
         """
         pass
-   
\ No newline at end of file
+
+    def validateChartConditionsBatch(self, tokens: List[BaseTokenData], chartConditions: Optional[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Validate chart conditions for many tokens at once
+
+        Strategies that can check a whole batch cheaply override this; by default
+        each token is checked on its own.
+
+        Returns:
+            Dict[str, bool]: tokenid -> whether the chart conditions hold
+        """
+        return {token.tokenid: self.validateChartConditions(token, chartConditions) for token in tokens}
+
+    def buildEntryTrades(self, tokenData: BaseTokenData, strategyConfig: BaseStrategyConfig) -> Optional[List[TradeLog]]:
+        """
+        Build, without persisting, the entry trades executeInvestment would log
+
+        Lets the batch evaluator insert executions and trades in bulk. The trades'
+        executionid is filled in once the executions exist.
+
+        Returns:
+            List[TradeLog] to log, or None if the strategy only supports executeInvestment
+        """
+        return None
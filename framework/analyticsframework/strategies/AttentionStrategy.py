@@ -13,6 +13,7 @@ from framework.analyticsframework.models.StrategyModels import (
 )
 from framework.analyticsframework.enums.TradeTypeEnum import TradeType
 from actions.DexscrennerAction import DexScreenerAction
+from framework.analyticsframework.ChartConditionEngine import ChartConditionEngine
 from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
 
 logger = get_logger(__name__)
@@ -21,6 +22,7 @@ class AttentionStrategy(BaseStrategy):
     def __init__(self, analyticsHandler: AnalyticsHandler):
         self.analyticsHandler = analyticsHandler
         self.dexScreener = DexScreenerAction()
+        self.chartEngine = ChartConditionEngine()
 
     def checkEntryConditions(self,tokenData: AttentionTokenData,strategyConfig: BaseStrategyConfig) -> bool:
         """Validate attention-specific entry conditions"""
@@ -29,11 +31,8 @@ class AttentionStrategy(BaseStrategy):
         return True
 
     def validateChartConditions(self,tokenData: AttentionTokenData,chartConditions: Optional[Dict[str, Any]]) -> bool:
-        """Validate chart conditions"""
-       
-            
-        # Add chart validation logic
-        return True
+        """Validate chart conditions against the token's attention score history"""
+        return self.chartEngine.evaluate(tokenData.tokenid, "attention", chartConditions)
 
     def executeInvestment(self, executionId: int, tokenData: AttentionTokenData, strategyConfig: BaseStrategyConfig) -> bool:
         """Execute investment based on investment rules"""
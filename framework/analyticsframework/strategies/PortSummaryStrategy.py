@@ -12,93 +12,78 @@ from framework.analyticsframework.models.StrategyModels import (
 from framework.analyticsframework.enums.TradeTypeEnum import TradeType
 from datetime import datetime, timedelta
 from actions.DexscrennerAction import DexScreenerAction
+from framework.analyticsframework.ChartConditionEngine import ChartConditionEngine
+from framework.analyticsframework.StrategyConfigCache import CompiledPredicate, StrategyConfigCache
+from functools import lru_cache
 
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _tagSet(tags: Optional[str]) -> frozenset:
+    """Token tag string ("a, b, c") as a frozenset; many tokens share the same string"""
+    return frozenset(tag.strip() for tag in tags.split(',')) if tags else frozenset()
+
 class PortSummaryStrategy(BaseStrategy):
     """Strategy implementation for portfolio summary based tokens"""
 
     def __init__(self, analyticsHandler: AnalyticsHandler):
         self.analyticsHandler = analyticsHandler
         self.dexScreener = DexScreenerAction()
+        self.chartEngine = ChartConditionEngine()
     
-    def _checkRequiredTags(self, tokenData: PortSummaryTokenData, requiredTags: List[str]) -> bool:
-        if not requiredTags:
-            logger.warning("No required tags defined in strategy")
-            return True
+    def _compileEntryConditions(self, strategyConfig: BaseStrategyConfig) -> CompiledPredicate:
+        """
+        Compile entry conditions into checks: required tags as a frozenset, age and
+        smart balance thresholds as numbers, and checks a strategy does not set left out
+        """
+        entryConditions = strategyConfig.strategyentryconditions
+        checks = []
 
-        # Convert required tags to set
-        requiredTagsSet = set(requiredTags)
-        
-        # Convert token tags string to list and then to set
-        tokenTags = set(tag.strip() for tag in tokenData.tags.split(',')) if tokenData.tags else set()
+        # Attention availability is a single attribute lookup, so it goes first
+        attentionConfig = entryConditions.attentioninfo
+        requiresAttention = bool(attentionConfig and attentionConfig.get('isavailable') == True)
+        if requiresAttention:
+            checks.append(("attention", lambda token: bool(token.attentioninfo and token.attentioninfo.isavailable)))
 
-        # Check if all required tags are present
-        if not requiredTagsSet.issubset(tokenTags):
-            missingTags = requiredTagsSet - tokenTags
-            logger.info(f"Token {tokenData.tokenname} missing required tags: {missingTags}")
-            return False
+        minAge = int(entryConditions.minage)
+        maxAge = int(entryConditions.maxage)
+        if minAge != -1 or maxAge != -1:
+            lowerAge = minAge if minAge != -1 else float('-inf')
+            upperAge = maxAge if maxAge != -1 else float('inf')
 
-        return True
+            def checkAge(token) -> bool:
+                try:
+                    return lowerAge <= int(token.tokenage) <= upperAge
+                except (TypeError, ValueError):
+                    logger.warning(f"Invalid token age format for {token.tokenname}: {token.tokenage}")
+                    return False
 
-    def _checkTokenAge(self, tokenData: PortSummaryTokenData, minAge: int, maxAge: int) -> bool:
-        if minAge == -1 and maxAge == -1:
-            return True
+            checks.append(("age", checkAge))
 
-        try:
-            tokenAge = int(tokenData.tokenage)
-            
-            if minAge != -1 and tokenAge < minAge:
-                logger.info(f"Token {tokenData.tokenname} age ({tokenAge} days) is less than minimum required age ({minAge} days)")
-                return False
-            
-            if maxAge != -1 and tokenAge > maxAge:
-                logger.info(f"Token {tokenData.tokenname} age ({tokenAge} days) exceeds maximum allowed age ({maxAge} days)")
-                return False
-                
-            return True
-            
-        except ValueError:
-            logger.warning(f"Invalid token age format for {tokenData.tokenname}: {tokenData.tokenage}")
-            return False
+        minSmartBalance = float(entryConditions.minsmartbalance)
+        checks.append(("smartbalance", lambda token: float(token.smartbalance) >= minSmartBalance))
 
-    def _checkSmartBalance(self, tokenData: PortSummaryTokenData, minSmartBalance: float) -> bool:
-        if tokenData.smartbalance < minSmartBalance:
-            logger.info(f"Token {tokenData.tokenname} smart balance ({tokenData.smartbalance}) is less than minimum required ({minSmartBalance})")
-            return False
-        return True
-    
-    def _checkAttentionStatus(self, tokenData: PortSummaryTokenData, strategyConfig: BaseStrategyConfig) -> bool:
-        if strategyConfig.strategyentryconditions.attentioninfo['isavailable'] == True:
-            if tokenData.attentioninfo.isavailable == False:
-                logger.info(f"Token {tokenData.tokenname} is not available in attention data")
-                return False
+        requiredTags = frozenset(entryConditions.requiredtags or ())
+        if requiredTags:
+            checks.append(("tags", lambda token: requiredTags <= _tagSet(token.tags)))
+        else:
+            logger.warning(f"No required tags defined in strategy {strategyConfig.strategyid}")
 
-        return True
+        return CompiledPredicate(strategyConfig.strategyid, checks)
 
     def checkEntryConditions(self, tokenData: PortSummaryTokenData, strategyConfig: BaseStrategyConfig) -> bool:
         """
         Validate entry conditions for PortSummary tokens
-        Checks tags, age, and smart balance requirements
+        Checks tags, age, smart balance and attention requirements with the
+        strategy's cached compiled predicate
         """
         try:
-            entryConditions = strategyConfig.strategyentryconditions
-            
-            # Check tags
-            if not self._checkRequiredTags(tokenData, entryConditions.requiredtags):
-                return False
-                
-            # Check age
-            if not self._checkTokenAge(tokenData, entryConditions.minage, entryConditions.maxage):
-                return False
-                
-            # Check smart balance
-            if not self._checkSmartBalance(tokenData, entryConditions.minsmartbalance):
-                return False
-            
-            # Check attention status
-            if not self._checkAttentionStatus(tokenData, strategyConfig):
+            predicate = StrategyConfigCache.get_predicate(strategyConfig, "portsummary", self._compileEntryConditions)
+            matched, rejectedBy = predicate(tokenData)
+            if not matched:
+                logger.debug(f"Token {tokenData.tokenname} rejected by {rejectedBy} condition of strategy {strategyConfig.strategyid}")
                 return False
 
             logger.info(f"Token {tokenData.tokenname} matches all entry conditions")
@@ -108,10 +93,53 @@ class PortSummaryStrategy(BaseStrategy):
             logger.error(f"Error validating entry conditions: {str(e)}")
             return False
         
-        
-        #Implement chart conditions once we implement alchemy api
-    def validateChartConditions(self, tokenData: PortSummaryTokenData, strategyConfig: BaseStrategyConfig) -> bool:
-        return True
+
+    def validateChartConditions(self, tokenData: PortSummaryTokenData, chartConditions: Optional[Dict[str, Any]]) -> bool:
+        """Validate chart conditions against the token's portfolio summary history"""
+        return self.chartEngine.evaluate(tokenData.tokenid, "portsummary", chartConditions)
+
+    def validateChartConditionsBatch(self, tokens: List[PortSummaryTokenData], chartConditions: Optional[Dict[str, Any]]) -> Dict[str, bool]:
+        """Validate chart conditions for many tokens with one history read"""
+        return self.chartEngine.evaluateMany([token.tokenid for token in tokens], "portsummary", chartConditions)
+
+    def buildEntryTrades(self, tokenData: PortSummaryTokenData, strategyConfig: BaseStrategyConfig) -> Optional[List[TradeLog]]:
+        """Entry trade for the configured entry type, priced at tokenData.price"""
+        trade = self._buildEntryTrade(None, tokenData, strategyConfig.investmentinstructions)
+        return [trade] if trade else []
+
+    def _buildEntryTrade(self, executionId: Optional[int], tokenData: PortSummaryTokenData, investmentInstructions: InvestmentInstructions) -> Optional[TradeLog]:
+        """First (or only) buy of a BULK or DCA entry; None if the instructions are unusable"""
+        tokenPrice = Decimal(str(tokenData.price))
+        if not tokenPrice:
+            logger.error(f"Cannot size entry for token {tokenData.tokenid} without a price")
+            return None
+
+        if investmentInstructions.entrytype == EntryType.BULK.name:
+            amount = Decimal(str(investmentInstructions.allocatedamount))
+            description = "Bulk entry position"
+        elif investmentInstructions.entrytype == EntryType.DCA.name:
+            if not investmentInstructions.dcarules:
+                logger.error("DCA rules not configured")
+                return None
+            dcaRules = investmentInstructions.dcarules
+            amount = Decimal(str(dcaRules.amountperinterval))
+            description = f"DCA entry 1/{dcaRules.intervals}"
+        else:
+            logger.error(f"Unknown entry type: {investmentInstructions.entrytype}")
+            return None
+
+        return TradeLog(
+            tradeid=None,
+            executionid=executionId,
+            tokenid=tokenData.tokenid,
+            tokenname=tokenData.tokenname,
+            tradetype=TradeType.BUY.value,
+            amount=amount,
+            tokenprice=tokenPrice,  # Using real-time price
+            coins=amount / tokenPrice,
+            description=description,
+            createdat=datetime.now()
+        )
 
 
     def executeInvestment(self, executionId: int, tokenData: PortSummaryTokenData, strategyConfig: BaseStrategyConfig) -> bool:
@@ -146,24 +174,10 @@ class PortSummaryStrategy(BaseStrategy):
     def executeBulkInvestment(self, executionId: int, tokenData: PortSummaryTokenData, investmentInstructions: InvestmentInstructions) -> bool:
         """Execute a bulk investment"""
         try:
-            # Calculate position size
             # positionSize = min(investmentInstructions.allocated_amount, investmentInstructions.max_position_size)
-            positionSize = Decimal(str(investmentInstructions.allocatedamount))
-            tokenPrice = Decimal(str(tokenData.price))
-            
-            # Create trade record with real-time price
-            tradeRecord = TradeLog(
-                tradeid=None,
-                executionid=executionId,
-                tokenid=tokenData.tokenid,
-                tokenname=tokenData.tokenname,
-                tradetype=TradeType.BUY.value,
-                amount=positionSize,
-                tokenprice=tokenPrice,  # Using real-time price
-                coins=positionSize / tokenPrice,
-                description="Bulk entry position",
-                createdat=datetime.now()
-            )
+            tradeRecord = self._buildEntryTrade(executionId, tokenData, investmentInstructions)
+            if not tradeRecord:
+                return False
             
             # Log trade
             return self.analyticsHandler.logTrade(tradeRecord)
@@ -175,36 +189,17 @@ class PortSummaryStrategy(BaseStrategy):
     def executeDCAInvestement(self, executionId: int, tokenData: PortSummaryTokenData, investmentInstructions: InvestmentInstructions) -> bool:
         """Setup DCA investment schedule with real-time price"""
         try:
-            if not investmentInstructions.dcarules:
-                logger.error("DCA rules not configured")
-                return False
-
-            dcaRules = investmentInstructions.dcarules
-            currentTime = datetime.now()
-
             # Create first DCA entry with real-time price
-            first_entry = TradeLog(
-                trade_id=None,
-                execution_id=executionId,
-                token_id=tokenData.tokenid,
-                token_name=tokenData.tokenname,
-                trade_type=TradeType.BUY.value,
-                amount=dcaRules.amountperinterval,
-                token_price=tokenData.price,  # Using real-time price
-                coins=dcaRules.amountperinterval / tokenData.price,
-                fees=Decimal('0'),
-                pnl=None,
-                pnl_pct=None,
-                description=f"DCA entry 1/{dcaRules.intervals}",
-                created_time=currentTime
-            )
+            firstEntry = self._buildEntryTrade(executionId, tokenData, investmentInstructions)
+            if not firstEntry:
+                return False
 
             # Log first trade
-            if not self.analyticsHandler.logTrade(first_entry):
+            if not self.analyticsHandler.logTrade(firstEntry):
                 return False
 
             return True
 
         except Exception as e:
             logger.error(f"Error executing DCA investment: {str(e)}")
-            return False
\ No newline at end of file
+            return False
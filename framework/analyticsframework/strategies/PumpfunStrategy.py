@@ -13,6 +13,7 @@ from framework.analyticsframework.models.StrategyModels import (
 from framework.analyticsframework.enums.TradeTypeEnum import TradeType
 from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
 from actions.DexscrennerAction import DexScreenerAction
+from framework.analyticsframework.ChartConditionEngine import ChartConditionEngine
 from logs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +22,7 @@ class PumpFunStrategy(BaseStrategy):
     def __init__(self, analyticsHandler: AnalyticsHandler):
         self.analyticsHandler = analyticsHandler
         self.dexScreener = DexScreenerAction()
+        self.chartEngine = ChartConditionEngine()
 
     def checkEntryConditions(self, tokenData: PumpFunTokenData,strategyConfig: BaseStrategyConfig) -> bool:
         """Validate pump and fun token specific entry conditions"""
@@ -29,10 +31,8 @@ class PumpFunStrategy(BaseStrategy):
         return True
 
     def validateChartConditions(self,tokenData: PumpFunTokenData,chartConditions: Optional[Dict[str, Any]]) -> bool:
-        """Validate chart conditions for pump tokens"""
-    
-            
-        return True
+        """Validate chart conditions for pump tokens against their pump.fun history"""
+        return self.chartEngine.evaluate(tokenData.tokenid, "pumpfun", chartConditions)
 
     def executeInvestment(self, executionId: int, tokenData: PumpFunTokenData, strategyConfig: BaseStrategyConfig) -> bool:
         """Execute investment based on pump metrics"""
@@ -13,6 +13,7 @@ from framework.analyticsframework.models.StrategyModels import (
 from framework.analyticsframework.enums.TradeTypeEnum import TradeType
 from framework.analyticshandlers.AnalyticsHandler import AnalyticsHandler
 from actions.DexscrennerAction import DexScreenerAction
+from framework.analyticsframework.ChartConditionEngine import ChartConditionEngine
 from logs.logger import get_logger
 
 logger = get_logger(__name__)
@@ -21,6 +22,7 @@ class VolumeStrategy(BaseStrategy):
     def __init__(self, analyticsHandler: AnalyticsHandler):
         self.analyticsHandler = analyticsHandler
         self.dexScreener = DexScreenerAction()
+        self.chartEngine = ChartConditionEngine()
 
     def checkEntryConditions(self, tokenData: VolumeTokenData,strategyConfig: BaseStrategyConfig) -> bool:
         """Validate volume-specific entry conditions"""
@@ -29,10 +31,8 @@ class VolumeStrategy(BaseStrategy):
         return True
 
     def validateChartConditions(self,tokenData: VolumeTokenData,chartConditions: Optional[Dict[str, Any]]) -> bool:
-        """Validate chart conditions"""
-    
-        # Add volume-specific chart validation
-        return True
+        """Validate chart conditions against the token's volume bot history"""
+        return self.chartEngine.evaluate(tokenData.tokenid, "volume", chartConditions)
 
     def executeInvestment(self, executionId: int, tokenData: VolumeTokenData, strategyConfig: BaseStrategyConfig) -> bool:
         """Execute investment based on volume metrics"""
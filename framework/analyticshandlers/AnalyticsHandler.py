@@ -20,7 +20,9 @@ from framework.analyticsframework.models.StrategyModels import (
 from framework.analyticsframework.models.BaseModels import TradeLog
 import json
 from sqlalchemy import text
+from psycopg2.extras import execute_values
 from framework.analyticsframework.models.StrategyModels import TokenConvictionEnum
+from framework.analyticsframework.StrategyConfigCache import StrategyConfigCache
 from framework.analyticsframework.models.BaseModels import BaseStrategyConfig
 
 logger = get_logger(__name__)
@@ -31,87 +33,6 @@ class AnalyticsHandler(BaseDBHandler):
 
     def __init__(self, conn_manager):
         super().__init__(conn_manager)
-        self._createTables()
-
-    def _createTables(self):
-        """Creates all required tables for strategy analytics"""
-        with self.conn_manager.transaction() as cursor:
-            config = get_config()
-
-            # Strategy Configuration
-            # status INTEGER DEFAULT 1 - to represent whether the execution monitor should try to invest again even if the initial try fails
-            # active INTEGER DEFAULT 1 - to represent whether the strategy is active or not
-            # superuser INTEGER DEFAULT 0 -
-            if config.DB_TYPE == "postgres":
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS strategyconfig (
-                        strategyid SERIAL PRIMARY KEY,
-                        strategyname TEXT NOT NULL,
-                        source TEXT NOT NULL,
-                        description TEXT,
-                        strategyentryconditions TEXT NOT NULL,
-                        chartconditions TEXT,
-                        investmentinstructions TEXT NOT NULL,
-                        profittakinginstructions TEXT NOT NULL,
-                        riskmanagementinstructions TEXT NOT NULL,
-                        moonbaginstructions TEXT,
-                        additionalinstructions TEXT,
-                        status INTEGER DEFAULT 1,
-                        active INTEGER DEFAULT 1,
-                        superuser INTEGER DEFAULT 0,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                )
-
-                # Strategy execution table
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS strategyexecution (
-                        executionid SERIAL PRIMARY KEY,
-                        strategyid INTEGER NOT NULL,
-                        description TEXT,
-                        tokenid TEXT NOT NULL,
-                        tokenname TEXT NOT NULL,
-                        avgentryprice DECIMAL,
-                        remainingcoins DECIMAL,
-                        allotedamount DECIMAL NOT NULL,
-                        investedamount DECIMAL,
-                        amounttakenout DECIMAL,
-                        realizedpnl DECIMAL,
-                        realizedpnlpercent DECIMAL,
-                        status INTEGER NOT NULL,
-                        notes TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (strategyid) REFERENCES strategyconfig(strategyid)
-                    )
-                """
-                )
-
-                # Trade log table
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS tradelog (
-                        tradeid SERIAL PRIMARY KEY,
-                        executionid INTEGER NOT NULL,
-                        tokenid TEXT NOT NULL,
-                        tokenname TEXT NOT NULL,
-                        tradetype TEXT NOT NULL,
-                        amount DECIMAL NOT NULL,
-                        tokenprice DECIMAL NOT NULL,
-                        coins DECIMAL NOT NULL,
-                        description TEXT,
-                        createdat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updatedat TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (executionid) REFERENCES strategyexecution(executionid)
-                    )
-                """
-                )
-
-            logger.info("Analytics tables created successfully")
 
     def createStrategy(self, strategyConfig: Dict[str, Any]) -> Optional[int]:
         """Create a new strategy configuration"""
@@ -148,9 +69,11 @@ class AnalyticsHandler(BaseDBHandler):
                         RETURNING strategyid
                     """
                     )
-                    result = cursor.execute(query, params)
-                    row = result.fetchone()
-                    return row[0] if row else None
+                    cursor.execute(query, params)
+                    row = cursor.fetchone()
+                    strategyId = row["strategyid"] if row else None
+                    StrategyConfigCache.invalidate(strategyId)
+                    return strategyId
                 else:
                     query = """
                         INSERT INTO strategyconfig (
@@ -161,6 +84,7 @@ class AnalyticsHandler(BaseDBHandler):
                         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """
                     cursor.execute(query, params)
+                    StrategyConfigCache.invalidate(cursor.lastrowid)
                     return cursor.lastrowid
         except Exception as e:
             logger.error(f"Failed to create strategy: {str(e)}")
@@ -473,6 +397,7 @@ class AnalyticsHandler(BaseDBHandler):
                     """
 
                 cursor.execute(query, tuple(params))
+                StrategyConfigCache.invalidate(strategyId)
                 return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"Failed to update strategy {strategyId}: {str(e)}")
@@ -602,27 +527,33 @@ class AnalyticsHandler(BaseDBHandler):
             return False
 
     def getActiveExecutionsWithConfig(
-        self,
+        self, executionIds: Optional[List[int]] = None
     ) -> List[Tuple[ExecutionState, BaseStrategyConfig]]:
-        """Get all active executions along with their strategy configurations"""
+        """
+        Get all active executions along with their strategy configurations
+
+        Args:
+            executionIds: Only return these executions (when still active)
+        """
         try:
             config = get_config()
             with self.conn_manager.transaction() as cursor:
                 if config.DB_TYPE == "postgres":
-                    query = text(
-                        """
+                    query = """
                         SELECT 
                             se.*, sc.*
                         FROM strategyexecution se
                         JOIN strategyconfig sc ON se.strategyid = sc.strategyid
                         WHERE se.status IN (%s, %s)
                     """
-                    )
                     params = (
                         ExecutionStatus.ACTIVE.value,
                         ExecutionStatus.INVESTED.value,
                     )
-                    cursor.execute(query, params)
+                    if executionIds is not None:
+                        query += " AND se.executionid = ANY(%s)"
+                        params += (list(executionIds),)
+                    cursor.execute(text(query), params)
                 else:
                     query = """
                         SELECT 
@@ -635,6 +566,10 @@ class AnalyticsHandler(BaseDBHandler):
                         ExecutionStatus.ACTIVE.value,
                         ExecutionStatus.INVESTED.value,
                     )
+                    if executionIds is not None:
+                        placeholders = ", ".join("?" for _ in executionIds)
+                        query += f" AND se.executionid IN ({placeholders})"
+                        params += tuple(executionIds)
                     cursor.execute(query, params)
 
                 columns = [col[0] for col in cursor.description]
@@ -847,3 +782,264 @@ class AnalyticsHandler(BaseDBHandler):
                 f"Failed to get executions for token {tokenId} and strategy {strategyId}: {str(e)}"
             )
             return []
+
+    def getOpenExecutionPairs(
+        self, tokenIds: List[str], strategyIds: List[int]
+    ) -> Dict[Tuple[str, int], int]:
+        """
+        Find ACTIVE or INVESTED executions for every (token, strategy) pair in one query
+
+        Args:
+            tokenIds: Tokens being evaluated
+            strategyIds: Strategies being evaluated
+
+        Returns:
+            Dict mapping (tokenid, strategyid) to the latest open execution ID
+        """
+        if not tokenIds or not strategyIds:
+            return {}
+
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    """
+                    SELECT DISTINCT ON (tokenid, strategyid) tokenid, strategyid, executionid
+                    FROM strategyexecution
+                    WHERE tokenid = ANY(%s) AND strategyid = ANY(%s)
+                    AND status IN (%s, %s)
+                    ORDER BY tokenid, strategyid, createdat DESC
+                    """,
+                    (
+                        list(tokenIds),
+                        list(strategyIds),
+                        ExecutionStatus.ACTIVE.value,
+                        ExecutionStatus.INVESTED.value,
+                    ),
+                )
+                return {
+                    (row["tokenid"], row["strategyid"]): row["executionid"]
+                    for row in cursor.fetchall()
+                }
+        except Exception as e:
+            logger.error(f"Failed to get open executions for {len(tokenIds)} tokens: {str(e)}")
+            return {}
+
+    def recordEntriesBatch(
+        self, entries: List[Tuple[ExecutionState, List[TradeLog]]]
+    ) -> Dict[Tuple[str, int], int]:
+        """
+        Create executions, log their entry trades and mark executions with trades
+        as INVESTED, all in one transaction with one statement per step
+
+        Args:
+            entries: (execution, entry trades) pairs; trades' executionid is filled in here.
+                An execution without trades stays ACTIVE
+
+        Returns:
+            Dict mapping (tokenid, strategyid) to the new execution ID
+        """
+        if not entries:
+            return {}
+
+        with self.conn_manager.transaction() as cursor:
+            executionRows = execute_values(
+                cursor,
+                """
+                INSERT INTO strategyexecution (
+                    strategyid, tokenid, tokenname, status, allotedamount,
+                    description, createdat, updatedat
+                ) VALUES %s
+                RETURNING executionid, tokenid, strategyid
+                """,
+                [
+                    (
+                        execution.strategyid,
+                        execution.tokenid,
+                        execution.tokenname,
+                        execution.status.value,
+                        str(execution.allotedamount),
+                        execution.description,
+                        execution.createdat,
+                        execution.updatedat,
+                    )
+                    for execution, _ in entries
+                ],
+                page_size=len(entries),
+                fetch=True,
+            )
+            executionIds = {
+                (row["tokenid"], row["strategyid"]): row["executionid"] for row in executionRows
+            }
+
+            now = datetime.now()
+            tradeRows = []
+            totals = []
+            for execution, trades in entries:
+                if not trades:
+                    continue
+                executionId = executionIds[(execution.tokenid, execution.strategyid)]
+                totalAmount = sum(Decimal(str(trade.amount)) for trade in trades)
+                totalCoins = sum(Decimal(str(trade.coins)) for trade in trades)
+                avgEntryPrice = totalAmount / totalCoins if totalCoins > 0 else Decimal("0")
+                totals.append((
+                    executionId, str(totalAmount), str(totalCoins), str(avgEntryPrice),
+                    ExecutionStatus.INVESTED.value, now,
+                ))
+                for trade in trades:
+                    trade.executionid = executionId
+                    tradeRows.append(
+                        (
+                            executionId,
+                            trade.tokenid,
+                            trade.tokenname,
+                            trade.tradetype,
+                            str(trade.amount),
+                            str(trade.tokenprice),
+                            str(trade.coins),
+                            trade.description,
+                            now,
+                            now,
+                        )
+                    )
+
+            if tradeRows:
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO tradelog (
+                        executionid, tokenid, tokenname, tradetype,
+                        amount, tokenprice, coins, description,
+                        createdat, updatedat
+                    ) VALUES %s
+                    """,
+                    tradeRows,
+                    page_size=len(tradeRows),
+                )
+                execute_values(
+                    cursor,
+                    """
+                    UPDATE strategyexecution e
+                    SET investedamount = v.investedamount,
+                        remainingcoins = v.remainingcoins,
+                        avgentryprice = v.avgentryprice,
+                        status = v.status,
+                        updatedat = v.updatedat
+                    FROM (VALUES %s) AS v (executionid, investedamount, remainingcoins, avgentryprice, status, updatedat)
+                    WHERE e.executionid = v.executionid
+                    """,
+                    totals,
+                    template="(%s::bigint, %s::numeric, %s::numeric, %s::numeric, %s::int, %s::timestamp)",
+                    page_size=len(totals),
+                )
+
+        return executionIds
+
+    def getExecutionTradeTotals(self, executionIds: List[int]) -> Dict[int, Dict[str, Decimal]]:
+        """
+        Sum bought and sold amounts for many executions in one query
+
+        Args:
+            executionIds: Executions to total
+
+        Returns:
+            Dict mapping executionid to {"invested": buy total, "returned": sell total};
+            executions without trades are left out
+        """
+        if not executionIds:
+            return {}
+
+        try:
+            with self.conn_manager.transaction() as cursor:
+                cursor.execute(
+                    """
+                    SELECT executionid,
+                           COALESCE(SUM(amount) FILTER (WHERE tradetype = %s), 0) AS invested,
+                           COALESCE(SUM(amount) FILTER (WHERE tradetype = %s), 0) AS returned
+                    FROM tradelog
+                    WHERE executionid = ANY(%s)
+                    GROUP BY executionid
+                    """,
+                    (TradeType.BUY.value, TradeType.SELL.value, list(executionIds)),
+                )
+                return {
+                    row["executionid"]: {
+                        "invested": Decimal(str(row["invested"])),
+                        "returned": Decimal(str(row["returned"])),
+                    }
+                    for row in cursor.fetchall()
+                }
+        except Exception as e:
+            logger.error(f"Failed to get trade totals for {len(executionIds)} executions: {str(e)}")
+            return {}
+
+    def recordSellsBatch(self, sells: List[Tuple[TradeLog, Dict[str, Any]]]) -> int:
+        """
+        Log sell trades and apply the resulting execution updates in one transaction
+
+        Args:
+            sells: (sell trade, execution update) pairs. The update holds remainingcoins,
+                amounttakenout, status (ExecutionStatus) and avgentryprice, which is
+                left unchanged when None
+
+        Returns:
+            int: Number of executions updated
+        """
+        if not sells:
+            return 0
+
+        now = datetime.now()
+        with self.conn_manager.transaction() as cursor:
+            execute_values(
+                cursor,
+                """
+                INSERT INTO tradelog (
+                    executionid, tokenid, tokenname, tradetype,
+                    amount, tokenprice, coins, description,
+                    createdat, updatedat
+                ) VALUES %s
+                """,
+                [
+                    (
+                        trade.executionid,
+                        trade.tokenid,
+                        trade.tokenname,
+                        trade.tradetype,
+                        str(trade.amount),
+                        str(trade.tokenprice),
+                        str(trade.coins),
+                        trade.description,
+                        now,
+                        now,
+                    )
+                    for trade, _ in sells
+                ],
+                page_size=len(sells),
+            )
+
+            execute_values(
+                cursor,
+                """
+                UPDATE strategyexecution e
+                SET remainingcoins = v.remainingcoins,
+                    avgentryprice = COALESCE(v.avgentryprice, e.avgentryprice),
+                    amounttakenout = v.amounttakenout,
+                    status = v.status,
+                    updatedat = v.updatedat
+                FROM (VALUES %s) AS v (executionid, remainingcoins, avgentryprice, amounttakenout, status, updatedat)
+                WHERE e.executionid = v.executionid
+                """,
+                [
+                    (
+                        trade.executionid,
+                        str(update["remainingcoins"]),
+                        str(update["avgentryprice"]) if update.get("avgentryprice") is not None else None,
+                        str(update["amounttakenout"]),
+                        update["status"].value,
+                        now,
+                    )
+                    for trade, update in sells
+                ],
+                template="(%s::bigint, %s::numeric, %s::numeric, %s::numeric, %s::int, %s::timestamp)",
+                page_size=len(sells),
+            )
+            return cursor.rowcount
@@ -9,7 +9,6 @@ import re
 from logs.logger import get_logger
 from datetime import datetime
 from database.operations.schema import OnchainInfo
-from actions.DexscrennerAction import DexScreenerAction, TokenPrice
 import pytz
 
 logger = get_logger(__name__)
@@ -19,7 +18,7 @@ def parseOnchainResponse(response: Dict) -> List[OnchainInfo]:
     """
     Parse response from onchain API and convert to OnchainInfo objects
     Only include tokens where chain_raw = Sol and sort by change_pct_1h
-    Use DexscreennerAction to get price, marketcap, and liquidity data
+    Price and marketcap come from the API; TokenPriceEnrichment overlays DexScreener data
     
     Args:
         response: API response dictionary
@@ -46,16 +45,9 @@ def parseOnchainResponse(response: Dict) -> List[OnchainInfo]:
             reverse=True
         )
         
-        # Initialize DexScreener service
-        dexScreener = DexScreenerAction()
-        
-        # Get all token IDs for batch processing
-        token_ids = [item.get("token_id") for item in sorted_items if item.get("token_id")]
-        
-        # Get price data for all tokens in batches
-        logger.info(f"Fetching price data for {len(token_ids)} tokens from DexScreener")
-        price_data_map = dexScreener.getBatchTokenPrices(token_ids)
-        logger.info(f"Successfully fetched price data for {sum(1 for v in price_data_map.values() if v is not None)} tokens")
+        # Convert to IST timezone
+        ist = pytz.timezone('Asia/Kolkata')
+        now = datetime.now(ist)
         
         # Assign ranks starting from 1
         result = []
@@ -67,21 +59,14 @@ def parseOnchainResponse(response: Dict) -> List[OnchainInfo]:
                     logger.warning("Skipping item without token_id")
                     continue
 
-                # Convert to IST timezone
-                ist = pytz.timezone('Asia/Kolkata')
-                now = datetime.now(ist)
-                
                 # Parse makers value - it could be a formatted string like "5,155" or a raw number
                 makers_value = item.get("makers_raw", 0)
                 if isinstance(makers_value, str) and ',' in makers_value:
                     makers_value = int(makers_value.replace(',', ''))
                 
-                # Get price data from DexScreener
-                price_data = price_data_map.get(tokenId)
-                
-                # Use DexScreener data if available, otherwise fallback to API data
-                price = Decimal(str(price_data.price)) if price_data else _parseDecimal(item["price_1h_raw"])
-                marketcap = Decimal(str(price_data.marketCap)) if price_data else _parseDecimal(item["marketCap_raw"])
+                # API prices; replaced by DexScreener prices when available
+                price = _parseDecimal(item["price_1h_raw"])
+                marketcap = _parseDecimal(item["marketCap_raw"])
                 
                 # For liquidity, we need to use the API data as DexScreener doesn't provide it directly
                 liquidity = _parseDecimal(item["liquidity_raw"])
@@ -102,9 +87,7 @@ def parseOnchainResponse(response: Dict) -> List[OnchainInfo]:
                 )
 
                 result.append(onchainInfo)
-                logger.info(
-                    f"Successfully parsed token {tokenId} - {item['token_symbol']} with rank {rank}, using DexScreener data: {price_data is not None}"
-                )
+                logger.debug(f"Parsed token {tokenId} - {item['token_symbol']} with rank {rank}")
 
             except Exception as e:
                 logger.error(f"Failed to parse item: {str(e)}, item: {item}")
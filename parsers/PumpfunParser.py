@@ -8,7 +8,6 @@ from decimal import Decimal, InvalidOperation
 import re
 from logs.logger import get_logger
 from datetime import datetime
-from actions.DexscrennerAction import DexScreenerAction
 from database.operations.schema import PumpFunToken
 
 logger = get_logger(__name__)
@@ -39,9 +38,9 @@ def parsePumpFunResponse(response: Dict) -> List[PumpFunToken]:
             logger.warning("No items found in response")
             return []
 
-        # Initialize DexScreener service
-        dexScreener = DexScreenerAction()
+        # DexScreener prices are applied afterwards by TokenPriceEnrichment
         result = []
+        now = datetime.now()
 
         for item in items:
             try:
@@ -54,32 +53,15 @@ def parsePumpFunResponse(response: Dict) -> List[PumpFunToken]:
                 # Parse social links
                 socialLinks = item.get("token_socialLinks", {})
 
-                # Get price data from DexScreener
-                try:
-                    priceData = dexScreener.getTokenPrice(tokenId)
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to fetch DexScreener data for {tokenId}: {str(e)}"
-                    )
-                    priceData = None
-
                 # Create PumpFunToken object
                 pumpFunToken = PumpFunToken(
                     tokenid=tokenId,
                     name=item["token_symbol"],
                     tokenname=item["token_name"],
                     chain=item["chain_raw"],
-                    # Use DexScreener price if available, fallback to API price
-                    price=(
-                        Decimal(str(priceData.price))
-                        if priceData
-                        else _parseDecimal(item["price_1h_raw"])
-                    ),
-                    marketcap=(
-                        Decimal(str(priceData.marketCap))
-                        if priceData
-                        else _parseDecimal(item["marketCap_raw"])
-                    ),
+                    # API prices; replaced by DexScreener prices when available
+                    price=_parseDecimal(item["price_1h_raw"]),
+                    marketcap=_parseDecimal(item["marketCap_raw"]),
                     liquidity=_parseDecimal(item["liquidity_raw"]),
                     volume24h=_parseDecimal(item["volume24_raw"]),
                     buysolqty=int(item["buy_sol_qty"]),
@@ -95,16 +77,14 @@ def parsePumpFunResponse(response: Dict) -> List[PumpFunToken]:
                     telegramlink=socialLinks.get("telegram"),
                     websitelink=socialLinks.get("website"),
                     firstseenat=_parseDatetime(item["createdAt_time"]),
-                    lastupdatedat=datetime.now(),
-                    createdat=datetime.now(),
+                    lastupdatedat=now,
+                    createdat=now,
                     rugcount=float(item.get("rugcount", 0)),
                     timeago=_parseDatetime(item["time_ago"]),
                 )
 
                 result.append(pumpFunToken)
-                logger.info(
-                    f"Successfully parsed token {tokenId} - {item['token_name']} with DexScreener data: {bool(priceData)}"
-                )
+                logger.debug(f"Parsed token {tokenId} - {item['token_name']}")
 
             except Exception as e:
                 logger.error(f"Failed to parse item: {str(e)}, item: {item}")
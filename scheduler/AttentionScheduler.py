@@ -7,6 +7,7 @@ from database.operations.PortfolioDB import PortfolioDB
 from config.Security import COOKIE_MAP, isValidCookie
 from logs.logger import get_logger
 from actions.AttentionAction import AttentionAction
+from api.utils.responsecache import TAG_ATTENTION, invalidate_tags
 import time
 import random
 
@@ -50,6 +51,7 @@ class AttentionScheduler:
                 # Update inactive tokens after processing new data
                 self.db.attention.updateInactiveTokens()
                 logger.info("Updated status of inactive tokens")
+                invalidate_tags(TAG_ATTENTION)
                 
                 if attentionData and len(attentionData) > 0:
                     logger.info(f"Successfully processed {len(attentionData)} attention scores")
@@ -83,6 +85,7 @@ class AttentionScheduler:
                 # Update inactive tokens after processing new data
                 self.db.attention.updateInactiveTokens()
                 logger.info("Updated status of inactive Solana tokens")
+                invalidate_tags(TAG_ATTENTION)
                 
                 if attentionData and len(attentionData) > 0:
                     logger.info(f"Successfully processed {len(attentionData)} Solana attention scores")
@@ -19,6 +19,7 @@ from scheduler.OnchainScheduler import OnchainScheduler
 from scheduler.AttentionScheduler import AttentionScheduler
 from scheduler.DeactivateLostSMBalanceTokens import DeactiveLostSMBalanceTokens
 from scheduler.ExecutionMonitorScheduler import ExecutionMonitorScheduler
+from scheduler.TimeSeriesScheduler import TimeSeriesScheduler
 from database.operations.PortfolioDB import PortfolioDB
 from database.operations.DatabaseConnectionManager import DatabaseConnectionManager
 from database.job.job_handler import JobHandler
@@ -76,6 +77,11 @@ def run_onchain_analysis_job():
     with_retries(OnchainScheduler.handleOnchainAnalysisFromJob, OnchainScheduler)
 
 
+def run_timeseries_rollup_job():
+    """Run time-series rollup and retention with retry logic."""
+    with_retries(TimeSeriesScheduler.handleRollupFromJob, TimeSeriesScheduler)
+
+
 class JobRunner:
     """
     Manages APScheduler for scheduling and executing background jobs.
@@ -110,7 +116,8 @@ class JobRunner:
         jobs = [
             ("volume_bot_analysis", {"minute": "*/1"}),
             ("pump_fun_analysis", {"minute": "*/1"}),
-            ("onchain_analysis", {"minute": "*/2"})
+            ("onchain_analysis", {"minute": "*/2"}),
+            ("timeseries_rollup", {"minute": "*/5"})
         ]
         for job_id, default_schedule in jobs:
             schedule = config.JOB_SCHEDULES.get(job_id, default_schedule)
@@ -122,6 +129,8 @@ class JobRunner:
                 job_func = run_pump_fun_analysis_job
             if job_id == "onchain_analysis":
                 job_func = run_onchain_analysis_job
+            if job_id == "timeseries_rollup":
+                job_func = run_timeseries_rollup_job
             
 
             self.scheduler.add_job(
@@ -164,9 +173,8 @@ class JobRunner:
             # Set flag to prevent recursion
             thread_local.recording_job = True
 
-            # Create a connection manager that doesn't rely on the scheduler's connection
+            # Borrow from the shared pool; no dedicated connection is opened here
             try:
-                # Create a fresh connection manager
                 conn_manager = DatabaseConnectionManager()
 
                 # Create a job handler directly with this connection
@@ -184,14 +192,6 @@ class JobRunner:
                 except Exception as e:
                     logger.error(f"Error recording job execution details: {str(e)}")
 
-                # Ensure we properly close the connection
-                try:
-                    conn_manager.close()
-                except Exception as close_error:
-                    logger.error(
-                        f"Error closing connection manager: {str(close_error)}"
-                    )
-
             except Exception as e:
                 logger.error(f"Failed to record job execution: {str(e)}")
 
@@ -7,6 +7,7 @@ Runs every four hours
 """
 from apscheduler.schedulers.background import BackgroundScheduler
 from actions.portfolio.PortfolioSummaryAction import PortfolioSummaryAction
+from api.utils.responsecache import TAG_PORTSUMMARY, invalidate_tags
 from config.Constants import PORTFOLIO_CATEGORIES
 from config.Security import COOKIE_MAP, isValidCookie
 from database.operations.PortfolioDB import PortfolioDB
@@ -123,6 +124,9 @@ class PortfolioScheduler:
                       f"Tokens reactivated: {totalTokensReactivated}, "
                       f"Tokens marked inactive: {tokensMarkedInactive}")
             
+            # Port summary report responses were built from the previous data
+            invalidate_tags(TAG_PORTSUMMARY)
+            
         # Add tags and push tokens to strategy framework
         # PortfolioTaggerAction(self.db).addTagsToActivePortSummaryTokens()
         # self.action.pushPortSummaryTokensToStrategyFramework()
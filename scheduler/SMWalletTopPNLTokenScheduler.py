@@ -3,12 +3,12 @@ from config.Config import get_config
 Persists all the top pnl tokens of sm wallets
 """
 from apscheduler.schedulers.background import BackgroundScheduler
+from actions.CrawlExecutor import CrawlExecutor
 from actions.SMWalletTopPNLTokenAction import SMWalletTopPNLTokenAction
 from config.Security import COOKIE_MAP, isValidCookie
+from database.job.RefreshQueueHandler import JOB_SMWALLET_TOP_PNL_TOKENS
 from database.operations.PortfolioDB import PortfolioDB
 from logs.logger import get_logger
-import time
-import random
 
 logger = get_logger(__name__)
 
@@ -42,43 +42,48 @@ class SMWalletTopPNLTokenScheduler:
             return False
 
         try:
-            # Get all active wallets from wallet_behaviour table
-            activeWallets = self.db.smartMoneyWallets.getAllHighPnlSmartMoneyWallets()
+            # Highest PNL / stalest wallets first; see RefreshQueueHandler
+            config = get_config()
+            queued = self.db.refreshQueue.syncJob(JOB_SMWALLET_TOP_PNL_TOKENS)
             
-            if not activeWallets:
+            if not queued:
                 logger.warning("No active wallets found for analysis")
                 return False
 
-            for cookie in validCookies:
-                try:
-                    logger.info(f"Using cookie: {cookie[:15]}...")
-                    
-                    # Process each wallet
-                    for wallet in activeWallets:
-                        try:
-                            self.action.persistAllTopPNLTokensForASMWallet(
-                                cookie=cookie,
-                                walletAddress=wallet.get('walletAddress'),
-                                lookbackDays=180
-                            )
-                            
-                            # Sleep between API calls
-                            delay = random.uniform(20, 50)
-                            logger.info(f"Sleeping for {delay} seconds")
-                            time.sleep(delay)
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to process wallet {wallet['walletaddress']}: {str(e)}")
-                            continue
-                    
-                except Exception as e:
-                    logger.error(f"Failed to execute action with cookie: {str(e)}")
-                    continue
-                    
+            # Wallets are shared out across the cookies, each at its own request rate
+            executor = CrawlExecutor(
+                name="smwallettoppnltoken",
+                cookies=validCookies,
+                task=self._refreshWallet,
+                intervalSeconds=config.SMWALLET_TOP_PNL_CRAWL_INTERVAL_SECONDS,
+                maxAttempts=config.CRAWL_MAX_ATTEMPTS,
+                describe=lambda lease: f"wallet {lease['payload']['walletAddress']}"
+            )
+            processed = 0
+            batchSize = config.REFRESH_QUEUE_BATCH_SIZE * len(validCookies)
+            for batch in self.db.refreshQueue.leaseBatches(JOB_SMWALLET_TOP_PNL_TOKENS, batchSize):
+                processed += executor.run(batch)['processed']
+            return processed > 0
+
         except Exception as e:
             logger.error(f"Error in top PNL token processing: {e}")
             return False 
 
+    def _refreshWallet(self, cookie: str, lease: dict):
+        """Crawl task: refresh one leased wallet and record it in the refresh queue"""
+        try:
+            self.action.persistAllTopPNLTokensForASMWallet(
+                cookie=cookie,
+                walletAddress=lease['payload']['walletAddress'],
+                lookbackDays=180,
+                raiseOnThrottle=True,
+                raiseOnFailure=True
+            )
+        except Exception as e:
+            self.db.refreshQueue.release(JOB_SMWALLET_TOP_PNL_TOKENS, lease['entitykey'], str(e))
+            raise
+        self.db.refreshQueue.complete(JOB_SMWALLET_TOP_PNL_TOKENS, lease['entitykey'])
+
     def handlePersistAllSmWalletTokens(self):
         # This method is mentioned in the original file but not implemented in the new version
         # It's left unchanged as it's mentioned in the original file
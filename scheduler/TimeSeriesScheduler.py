@@ -0,0 +1,41 @@
+"""
+Folds new token history snapshots into the time-series rollups and applies retention
+
+Runs every few minutes
+"""
+
+from database.operations.PortfolioDB import PortfolioDB
+from database.timeseries.TimeSeriesStore import SOURCES
+from logs.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TimeSeriesScheduler:
+    """Maintains 1m/5m/1h rollups of every history source"""
+
+    def __init__(self):
+        self.db = PortfolioDB()
+        logger.info("Time-series scheduler initialized using database configuration")
+
+    def handleRollupFromJob(self) -> bool:
+        """Roll up every source, then prune data past its retention window"""
+        success = True
+        for source in SOURCES:
+            try:
+                folded = self.db.timeseries.rollup(source)
+                if folded:
+                    logger.info(f"Folded {folded} {source} history rows into rollups")
+            except Exception as e:
+                logger.error(f"Failed to roll up {source} history: {e}")
+                success = False
+
+        try:
+            deleted = self.db.timeseries.applyRetention()
+            if any(deleted.values()):
+                logger.info(f"Time-series retention removed rows: {deleted}")
+        except Exception as e:
+            logger.error(f"Failed to apply time-series retention: {e}")
+            success = False
+
+        return success
@@ -2,6 +2,7 @@ from config.Config import get_config
 from typing import List, Dict
 from database.operations.PortfolioDB import PortfolioDB
 from config.Security import COOKIE_MAP, isValidCookie
+from database.job.RefreshQueueHandler import JOB_WALLETS_INVESTED_DETAILS
 from logs.logger import get_logger
 from actions.WalletsInvestedInvestmentDetailsAction import WalletsInvestedInvestmentDetailsAction
 import time
@@ -46,40 +47,49 @@ class WalletsInvestedInvestmentDetailsScheduler:
         # Use provided threshold or default from action
         threshold = minSmartHolding or self.action.MIN_SMART_HOLDING
         
-        for cookie in validCookies:
-            try:
-                logger.info(f"Using cookie: {cookie[:15]}...")
-                
-                # Get all active token wallets with minimum smart holding for a specific token
-                walletsWithHighSMTokenHoldings = self.db.walletsInvested.getWalletsWithHighSMTokenHoldings(
-                    minBalance=threshold, 
-                    tokenId=None
+        try:
+            # Largest holdings / most active wallets first; see RefreshQueueHandler
+            queued = self.db.refreshQueue.syncJob(JOB_WALLETS_INVESTED_DETAILS, minBalance=threshold)
+            logger.info(f"Found {queued} active wallets for analysis with min holding {threshold}")
+
+            processed = 0
+            for batch in self.db.refreshQueue.leaseBatches(JOB_WALLETS_INVESTED_DETAILS, get_config().REFRESH_QUEUE_BATCH_SIZE):
+                for lease in batch:
+                    # Spread the calls evenly over the valid cookies
+                    self._refreshWalletInvestment(validCookies[processed % len(validCookies)], lease)
+                    processed += 1
+
+        except Exception as e:
+            logger.error(f"Failed to execute transaction analysis: {str(e)}")
+
+    def _refreshWalletInvestment(self, cookie: str, lease: Dict):
+        """Refresh one leased wallet / token pair; the transaction-count delta becomes its change score"""
+        wallet = lease['payload']
+        try:
+            logger.info(f"Processing transactions for wallet {wallet['walletaddress']} token {wallet['tokenid']}")
+            countBefore = self.db.walletsInvested.getTransactionsCountFromDB(wallet['walletinvestedid']) or 0
+            success = self.action.updateInvestmentData(
+                cookie=cookie,
+                walletAddress=wallet['walletaddress'],
+                tokenId=wallet['tokenid'],
+                walletInvestedId=wallet['walletinvestedid']
+            )
+            
+            if success:
+                logger.info(f"Successfully analyzed wallet {wallet['walletaddress']}")
+                countAfter = self.db.walletsInvested.getTransactionsCountFromDB(wallet['walletinvestedid']) or 0
+                self.db.refreshQueue.complete(
+                    JOB_WALLETS_INVESTED_DETAILS,
+                    lease['entitykey'],
+                    changeSignal=max(0, countAfter - countBefore)
                 )
-                
-                logger.info(f"Found {len(walletsWithHighSMTokenHoldings)} active wallets for analysis with min holding {threshold}")
-                
-                for wallet in walletsWithHighSMTokenHoldings:
-                    try:
-                        logger.info(f"Processing transactions for wallet {wallet['walletaddress']} token {wallet['tokenid']}")
-                        success = self.action.updateInvestmentData(
-                            cookie=cookie,
-                            walletAddress=wallet['walletaddress'],
-                            tokenId=wallet['tokenid'],
-                            walletInvestedId=wallet['walletinvestedid']
-                        )
-                        
-                        if success:
-                            logger.info(f"Successfully analyzed wallet {wallet['walletaddress']}")
-                        else:
-                            logger.warning(f"Failed to analyze wallet {wallet['walletaddress']}")
-                        
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process wallet {wallet['walletaddress']}: {str(e)}")
-                        continue
-                    
-            except Exception as e:
-                logger.error(f"Failed to execute transaction analysis: {str(e)}")
+            else:
+                logger.warning(f"Failed to analyze wallet {wallet['walletaddress']}")
+                self.db.refreshQueue.release(JOB_WALLETS_INVESTED_DETAILS, lease['entitykey'], "Investment analysis failed")
+            
+        except Exception as e:
+            logger.error(f"Failed to process wallet {wallet['walletaddress']}: {str(e)}")
+            self.db.refreshQueue.release(JOB_WALLETS_INVESTED_DETAILS, lease['entitykey'], str(e))
                 
     def handleInvestmentDetailsOfAllWalletsInvestedInAToken(self, tokenId: str, cookie: str = None):
         """
@@ -4,12 +4,12 @@ Takes all the wallets invested in a specific token and persists them to the data
 
 Scheduler not added till now
 """
+from actions.CrawlExecutor import CrawlExecutor
 from actions.WalletsInvestedAction import WalletsInvestedAction
 from config.Security import COOKIE_MAP, isValidCookie
+from database.job.RefreshQueueHandler import JOB_WALLETS_INVESTED
 from database.operations.PortfolioDB import PortfolioDB
 from logs.logger import get_logger
-import time
-import random
 
 logger = get_logger(__name__)
 
@@ -41,34 +41,40 @@ class WalletsInvestedScheduler:
             logger.warning("No valid cookies available for wallets invested actions")
             return
 
-        for cookie in validCookies:
-            try:
-                logger.info(f"Using cookie: {cookie[:15]}...")
-                
-                # Get active tokens using the new method
-                activeTokens = self.db.portfolio.getActivePortfolioTokens()
-                logger.info(f"Found {len(activeTokens)} active tokens for analysis")
-                
-                # Process each active token
-                for token in activeTokens:
-                    try:
-                        logger.info(f"Processing wallets invested analysis for {token['tokenid']} - {token['name']}")
-                        self.action.fetchAndPersistWalletsInvestedInASpecificToken(
-                            cookie=cookie,
-                            tokenId=token['tokenid'],
-                            portsummaryId=token['portsummaryid']
-                        )
-                        logger.info(f"Wallets invested analysis for {token['tokenid']} - {token['name']} completed")
-                        
-                        # Sleep between API calls
-                        delay = random.uniform(10,30)
-                        logger.info(f"Sleeping for {delay} seconds")
-                        time.sleep(delay)
-                        logger.info("Sleep completed")
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process token {token['tokenid']}: {str(e)}")
-                        continue
-                
-            except Exception as e:
-                logger.error(f"Failed to execute wallets invested analysis action: {str(e)}") 
\ No newline at end of file
+        try:
+            # Most valuable / most active tokens first; see RefreshQueueHandler
+            config = get_config()
+            queued = self.db.refreshQueue.syncJob(JOB_WALLETS_INVESTED)
+            logger.info(f"Found {queued} active tokens for analysis")
+
+            # Tokens are shared out across the cookies, each at its own request rate
+            executor = CrawlExecutor(
+                name="walletsinvested",
+                cookies=validCookies,
+                task=self._refreshToken,
+                intervalSeconds=config.WALLETS_INVESTED_CRAWL_INTERVAL_SECONDS,
+                maxAttempts=config.CRAWL_MAX_ATTEMPTS,
+                describe=lambda lease: f"{lease['payload']['tokenid']} - {lease['payload']['name']}"
+            )
+            batchSize = config.REFRESH_QUEUE_BATCH_SIZE * len(validCookies)
+            for batch in self.db.refreshQueue.leaseBatches(JOB_WALLETS_INVESTED, batchSize):
+                executor.run(batch)
+
+        except Exception as e:
+            logger.error(f"Failed to execute wallets invested analysis action: {str(e)}")
+
+    def _refreshToken(self, cookie: str, lease: dict):
+        """Crawl task: refresh one leased token and record it in the refresh queue"""
+        token = lease['payload']
+        try:
+            self.action.fetchAndPersistWalletsInvestedInASpecificToken(
+                cookie=cookie,
+                tokenId=token['tokenid'],
+                portsummaryId=token['portsummaryid'],
+                raiseOnThrottle=True,
+                raiseOnFailure=True
+            )
+        except Exception as e:
+            self.db.refreshQueue.release(JOB_WALLETS_INVESTED, lease['entitykey'], str(e))
+            raise
+        self.db.refreshQueue.complete(JOB_WALLETS_INVESTED, lease['entitykey'])
@@ -8,7 +8,8 @@ import time
 from decimal import Decimal
 from logs.logger import get_logger
 from database.operations.PortfolioDB import PortfolioDB
-from database.operations.schema import InvestmentDetails
+from database.operations.schema import CieloSwapSyncState, InvestmentDetails
+from database.auth.ApiKeyLedger import KEY_EXHAUSTED_STATUSES, ApiKeyExhaustedError, ApiKeyLedger
 from database.auth.ServiceCredentialsEnum import ServiceCredentials
 
 logger = get_logger(__name__)
@@ -20,24 +21,55 @@ class CieloServiceHandler:
         self.baseUrl = self.service.metadata['base_url']
         self.creditsPerCall = self.service.metadata.get('credits_per_call', 3)
         self.session = requests.Session()
+        self.keyLedger = ApiKeyLedger.shared() if get_config().API_KEY_LEDGER_ENABLED else None
         
-    def getInvestmentDetails(self, walletAddress: str, tokenId: str) -> Optional[InvestmentDetails]:
+    def getInvestmentDetails(self, walletAddress: str, tokenId: str, fullResync: bool = False) -> Optional[InvestmentDetails]:
         """
-       Calculate investment details
+        Calculate investment details
+        
+        Only swaps newer than the pair's stored sync state are downloaded; they are
+        folded into the stored aggregates. The first sync of a pair, and any sync with
+        fullResync, pages through the whole history and rebuilds the aggregates.
         
         Args:
             walletAddress (str): Wallet address to analyze
             tokenAddress (str): Token address to analyze
+            fullResync (bool): Ignore the stored sync state and rebuild it
             
         Returns:
             Optional[InvestmentDetails]: Calculated investment details or None if failed
         """
         try:
-            transactions = self.getAllTransactions(walletAddress, tokenId)
-            # logger.info(f"Transactions for {walletAddress} and token {tokenId}: {transactions}")
-            if not transactions:
+            state = None if fullResync else self.db.cieloSyncState.getSyncState(walletAddress, tokenId)
+            isFullSync = state is None
+
+            transactions = self.getNewTransactions(walletAddress, tokenId, state)
+            if transactions is None:
+                # A page could not be fetched; the stored state stays as it was
                 return None
-            return self.calculateInvestmentDetails(transactions, tokenId)
+            # logger.info(f"Transactions for {walletAddress} and token {tokenId}: {transactions}")
+
+            if not self.isTrackable(transactions):
+                # Without timestamps / hashes the newest swap cannot be told apart from older ones
+                logger.warning(f"Cielo swaps of {walletAddress} / {tokenId} lack sync markers, falling back to a full recount")
+                if state is not None:
+                    self.db.cieloSyncState.resetSyncState(walletAddress, tokenId)
+                    transactions = self.getAllTransactions(walletAddress, tokenId)
+                if not transactions:
+                    return None
+                return self.calculateInvestmentDetails(transactions, tokenId)
+
+            if isFullSync:
+                if not transactions:
+                    return None
+                state = CieloSwapSyncState(walletaddress=walletAddress, tokenid=tokenId)
+
+            if transactions:
+                self.foldTransactions(state, transactions, tokenId)
+                self.db.cieloSyncState.saveSyncState(state, fullSync=isFullSync)
+                logger.info(f"Folded {len(transactions)} new Cielo swaps into {walletAddress} / {tokenId} ({state.swapcount} in total)")
+
+            return self.toInvestmentDetails(state)
             
         except Exception as e:
             logger.error(f"Failed to get transaction details: {e}")
@@ -54,39 +86,70 @@ class CieloServiceHandler:
         Returns:
             Optional[List[Dict]]: List of all transactions or None if failed
         """
-        allTransactions = []
+        return self.getNewTransactions(walletAddress, tokenId, None)
+
+    def getNewTransactions(self, walletAddress: str, tokenId: str,
+                           state: Optional[CieloSwapSyncState]) -> Optional[List[Dict]]:
+        """
+        Get the transactions newer than a sync state, newest first
+        
+        The feed is ordered newest first, so paging stops at the first page
+        holding a swap the state already counts.
+        
+        Args:
+            walletAddress: Wallet address to analyze
+            tokenId: Token address to analyze
+            state: Sync state of the pair; None fetches the whole history
+            
+        Returns:
+            Optional[List[Dict]]: New transactions, or None if any page failed
+        """
+        newTransactions = []
         startFrom = None
         
         while True:
-            apiKeyData = self.db.credentials.getNextValidApiKey(
-                serviceName=self.service.service_name, 
-                requiredCredits=self.creditsPerCall
-            )
+            apiKeyData = self.acquireApiKey()
             if not apiKeyData:
                 logger.error("No valid API key available")
                 return None
                 
             # Get page of transactions
             # logger.info(f"Getting transactions for {walletAddress} and token {tokenId} with API key {apiKeyData['apikey']}")
-            result = self.getSwaps(
-                apiKey=apiKeyData['apikey'],
-                walletAddress=walletAddress,
-                tokenId=tokenId,
-                startFrom=startFrom
-            )
+            try:
+                result = self.getSwaps(
+                    apiKey=apiKeyData['apikey'],
+                    walletAddress=walletAddress,
+                    tokenId=tokenId,
+                    startFrom=startFrom
+                )
+            except ApiKeyExhaustedError as e:
+                if not self.keyLedger:
+                    if e.status == 402:
+                        self.db.credentials.markApiKeyExhausted(apiKeyData['id'])
+                    return None
+                # The rejected call is not billed; retry the same page with the next key
+                self.refundApiKey(apiKeyData)
+                self.keyLedger.markExhausted(self.service.service_name, apiKeyData['id'], e.status)
+                continue
             
             if not result:
-                break
+                self.refundApiKey(apiKeyData)
+                # Folding a partial page run would leave a gap behind the new marker
+                return None
                 
             # Unpack response
             items = result.get('data', {}).get('items', [])
             paging = result.get('data', {}).get('paging', {})
             
-            # Update API key credits
-            self.db.credentials.deductAPIKeyCredits(apiKeyData['id'], self.creditsPerCall)
+            # Update API key credits (the ledger charged them when handing out the key)
+            if not self.keyLedger:
+                self.db.credentials.deductAPIKeyCredits(apiKeyData['id'], self.creditsPerCall)
             
-            # Add transactions to list
-            allTransactions.extend(items)
+            # Keep the swaps not counted yet; an already counted one means the rest is older
+            unseen = [tx for tx in items if not self.isSeen(tx, state)]
+            newTransactions.extend(unseen)
+            if len(unseen) < len(items):
+                break
             
             # Check if more pages exist
             hasNextPage = paging.get('has_next_page', False)
@@ -97,8 +160,37 @@ class CieloServiceHandler:
             startFrom = paging.get('next_cursor')
             time.sleep(1)  # Rate limiting
             
-        return allTransactions
-         
+        return newTransactions
+
+    def acquireApiKey(self) -> Optional[Dict]:
+        """Next API key with enough credits for one call, from the ledger when enabled"""
+        if self.keyLedger:
+            return self.keyLedger.acquire(self.service.service_name, self.creditsPerCall)
+        return self.db.credentials.getNextValidApiKey(
+            serviceName=self.service.service_name, 
+            requiredCredits=self.creditsPerCall
+        )
+
+    def refundApiKey(self, apiKeyData: Dict) -> None:
+        """Hand the credits the ledger reserved for a failed call back to the key"""
+        if self.keyLedger:
+            self.keyLedger.refund(self.service.service_name, apiKeyData['id'], self.creditsPerCall)
+
+    @staticmethod
+    def isSeen(tx: Dict, state: Optional[CieloSwapSyncState]) -> bool:
+        """Whether a swap is already counted in the sync state"""
+        if state is None or state.lastswaptimestamp is None or tx.get('timestamp') is None:
+            return False
+        timestamp = int(tx['timestamp'])
+        if timestamp != state.lastswaptimestamp:
+            return timestamp < state.lastswaptimestamp
+        return tx.get('tx_hash') in state.lastswaphashes
+
+    @staticmethod
+    def isTrackable(transactions: List[Dict]) -> bool:
+        """Whether every swap carries the timestamp and hash the sync marker is made of"""
+        return all(tx.get('timestamp') is not None and tx.get('tx_hash') for tx in transactions)
+
     def getSwaps(self, apiKey: str, walletAddress: str, 
                              tokenId: str, startFrom: Optional[str] = None) -> Optional[Dict]:
         """
@@ -112,6 +204,9 @@ class CieloServiceHandler:
             
         Returns:
             Optional[Dict]: Raw API response or None if failed
+
+        Raises:
+            ApiKeyExhaustedError: If the key was rejected for credits or rate (402 / 429)
         """
         params = {
             'wallet': walletAddress,
@@ -133,12 +228,16 @@ class CieloServiceHandler:
                 params=params,
                 timeout=60
             )
+            if response.status_code in KEY_EXHAUSTED_STATUSES:
+                raise ApiKeyExhaustedError(response.status_code)
             response.raise_for_status()
             data = response.json()
             
             if data.get('status') == 'ok':
                 return data
                 
+        except ApiKeyExhaustedError:
+            raise
         except Exception as e:
             logger.error(f"Failed to get transactions page: {e}")
             
@@ -151,20 +250,28 @@ class CieloServiceHandler:
         Args:
             transactions: List of transactions to analyze
             tokenAddress: Token address to track
+            
+        Returns:
+            InvestmentDetails: Calculated investment metrics
+        """
+        state = CieloSwapSyncState(walletaddress='', tokenid=tokenAddress)
+        self.foldTransactions(state, transactions, tokenAddress)
+        return self.toInvestmentDetails(state)
+
+    def foldTransactions(self, state: CieloSwapSyncState, transactions: List[Dict], tokenAddress: str) -> None:
+        """
+        Add transactions to a sync state's aggregates and move its marker to the newest one
+        
+        Args:
+            state: Sync state updated in place
+            transactions: Transactions not counted in the state yet
+            tokenAddress: Token address to track
 
         # If the token0_address is the same as the token address we get from the parameter,
         # then to find the amount, use token0_amount. To find the value, use 'token1_amount_usd'.
         # If the token1_address is the same as the token address we get from the parameter,
         # then to find the amount, use token1_amount. To find the value, use 'token0_amount_usd'.
-            
-        Returns:
-            InvestmentDetails: Calculated investment metrics
         """
-        totalInvested = Decimal('0')
-        totalTakenOut = Decimal('0')
-        totalCoins = Decimal('0')
-        totalTokensBought = Decimal('0')
-        
         for tx in transactions:
             try:
                 isToken0 = tx.get('token0_address') == tokenAddress #if token0_address is the same as the token address, then the wallet is selling the token
@@ -178,20 +285,37 @@ class CieloServiceHandler:
                     # Token we're tracking is token0
                     coinsSold = Decimal(str(tx.get('token0_amount', 0)))
                     usdAmount = Decimal(str(tx.get('token1_amount_usd', 0)))
-                    totalTakenOut += usdAmount
-                    totalCoins -= coinsSold
+                    state.totaltakenout += usdAmount
+                    state.totalcoins -= coinsSold
                 else:
                     # Token we're tracking is token1
                     coinsBought = Decimal(str(tx.get('token1_amount', 0)))
                     usdAmount = Decimal(str(tx.get('token0_amount_usd', 0)))
-                    totalInvested += usdAmount
-                    totalCoins += coinsBought
-                    totalTokensBought += coinsBought
+                    state.totalinvested += usdAmount
+                    state.totalcoins += coinsBought
+                state.swapcount += 1
                     
             except Exception as e:
                 logger.error(f"Failed to process transaction: {e}")
                 continue
-                
+
+        timestamps = [int(tx['timestamp']) for tx in transactions if tx.get('timestamp') is not None]
+        if not timestamps:
+            return
+        newest = max(timestamps)
+        newestHashes = [tx.get('tx_hash') for tx in transactions
+                        if tx.get('timestamp') is not None and int(tx['timestamp']) == newest]
+        if state.lastswaptimestamp is None or newest > state.lastswaptimestamp:
+            state.lastswaptimestamp = newest
+            state.lastswaphashes = newestHashes
+        elif newest == state.lastswaptimestamp:
+            state.lastswaphashes = list(dict.fromkeys(state.lastswaphashes + newestHashes))
+
+    @staticmethod
+    def toInvestmentDetails(state: CieloSwapSyncState) -> InvestmentDetails:
+        totalInvested = state.totalinvested
+        totalTakenOut = state.totaltakenout
+        totalCoins = state.totalcoins
         avgEntry = ((totalInvested - totalTakenOut)/totalCoins) if totalCoins > 0 else Decimal('0')
         
         return InvestmentDetails(
@@ -199,4 +323,4 @@ class CieloServiceHandler:
             totalTakenOut=totalTakenOut,
             totalCoins=totalCoins,
             avgEntry=avgEntry
-        ) 
\ No newline at end of file
+        ) 